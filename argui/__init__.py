@@ -0,0 +1,6 @@
+from .utilities import tracing
+
+with tracing.span("import", module="argui"):
+    from .parser import ArgumentParser
+    from .utilities.conversion import cpu_bound
+    from .utilities.providers import ChoiceProvider
@@ -0,0 +1,329 @@
+"""
+The command line for ArgUI itself, such as `python -m argui generate package.module:build_parser -o entry_point.py`
+"""
+from __future__ import annotations
+
+import sys
+import typing
+import contextlib
+import pathlib
+import argparse
+
+from argui.parser import ArgumentParser
+
+
+def generate(arguments: argparse.Namespace) -> int:
+    """
+    Write a standalone entry point for a parser or workflow config
+
+    Args:
+        arguments: The parsed arguments for the `generate` command
+
+    Returns:
+        The exit code for the command
+    """
+    from argui.generator import load_workflow
+    from argui.generator import generate_entry_point
+
+    source_code: str = generate_entry_point(load_workflow(arguments.source), prog=arguments.prog)
+
+    if arguments.output is None:
+        sys.stdout.write(source_code)
+    else:
+        arguments.output.write_text(source_code, encoding="utf-8")
+
+    return 0
+
+
+def batch(arguments: argparse.Namespace) -> int:
+    """
+    Run a parser's handler over every set of arguments in a JSON lines file
+
+    Args:
+        arguments: The parsed arguments for the `batch` command
+
+    Returns:
+        The exit code for the command - `1` if any set of arguments failed
+    """
+    from argui.batch import BatchSummary
+    from argui.batch import load_parser
+    from argui.batch import run_batch
+
+    with contextlib.ExitStack() as stack:
+        lines: typing.TextIO = (
+            sys.stdin if arguments.input == "-" else stack.enter_context(open(arguments.input, encoding="utf-8"))
+        )
+        output: typing.TextIO = (
+            sys.stdout if arguments.output is None else stack.enter_context(open(arguments.output, "w", encoding="utf-8"))
+        )
+        summary: BatchSummary = run_batch(
+            load_parser(arguments.source),
+            lines,
+            output,
+            workers=arguments.workers,
+            backlog=arguments.backlog,
+            use_threads=arguments.threads,
+            handler_destination=arguments.handler
+        )
+
+    return 1 if summary.failed else 0
+
+
+def serve(arguments: argparse.Namespace) -> int:
+    """
+    Keep a parser loaded and run it for clients until it sits idle
+
+    Args:
+        arguments: The parsed arguments for the `serve` command
+
+    Returns:
+        The exit code for the command
+    """
+    from argui.daemon import DaemonServer
+
+    server = DaemonServer(
+        arguments.source,
+        socket_path=arguments.socket,
+        idle_timeout=arguments.idle_timeout,
+        handler_destination=arguments.handler
+    )
+    return server.serve()
+
+
+def run(arguments: argparse.Namespace) -> int:
+    """
+    Parse arguments with a parser and call the handler bound to them, the way the program itself would
+
+    Args:
+        arguments: The parsed arguments for the `run` command
+
+    Returns:
+        The exit code for the command
+    """
+    from argui.batch import load_parser
+    from argui.daemon import dispatch
+
+    return dispatch(load_parser(arguments.source), arguments.arguments, handler_destination=arguments.handler)
+
+
+def dev(arguments: argparse.Namespace) -> int:
+    """
+    Show the TUI for a parser, patching it whenever the parser's files change, and print what was submitted
+
+    Args:
+        arguments: The parsed arguments for the `dev` command
+
+    Returns:
+        The exit code for the command
+    """
+    import shlex
+
+    from argui.reload import ParserReloader
+    from argui.model import WorkflowSpec
+    from argui.interface import run_workflow
+
+    reloader = ParserReloader(arguments.source)
+    entered_arguments: typing.Optional[typing.List[str]] = run_workflow(
+        WorkflowSpec.from_parser(reloader.parser),
+        validator=reloader.check_arguments,
+        reloader=reloader
+    )
+
+    if entered_arguments is not None:
+        print(shlex.join(entered_arguments))
+
+    return 0
+
+
+def completion(arguments: argparse.Namespace) -> int:
+    """
+    Write the completion index for a parser and print the shim that completes it, or rebuild a stale index
+
+    Args:
+        arguments: The parsed arguments for the `completion` command
+
+    Returns:
+        The exit code for the command
+    """
+    from argui.completion import prepare_completion
+    from argui.completion import refresh_completion
+
+    if arguments.refresh:
+        if arguments.index is None:
+            print("--refresh needs the --index to rebuild", file=sys.stderr)
+            return 2
+
+        refresh_completion(arguments.source, arguments.index)
+        return 0
+
+    try:
+        shim: str = prepare_completion(arguments.source, arguments.shell, index_path=arguments.index, program=arguments.program)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    print(shim)
+    return 0
+
+
+def build_parser() -> ArgumentParser:
+    """
+    Build the parser for ArgUI's command line
+    """
+    parser = ArgumentParser(prog="argui", description="Bind together or create a TUI for your Python CLI application")
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Time each stage of the command and write the spans to PATH as Chrome trace events"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser(
+        "generate",
+        help="Write a standalone entry point for a parser or workflow config",
+        description="Write a module that builds a parser without introspection and carries its workflow pre-built"
+    )
+    generate_parser.add_argument(
+        "source",
+        help="A 'package.module:attribute' reference to a parser, a workflow, or a function returning one, "
+             "or the path to a JSON workflow config"
+    )
+    generate_parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        help="Where to write the entry point. The entry point is printed if not given"
+    )
+    generate_parser.add_argument("--prog", help="The name of the program. The name of the workflow is used if not given")
+    generate_parser.set_defaults(func=generate)
+
+    batch_parser = commands.add_parser(
+        "batch",
+        help="Run a parser's handler over every set of arguments in a JSON lines file",
+        description="Parse each line of the input and call the function bound with set_defaults(func=...) on a pool "
+                    "of workers, writing each result or error as a JSON line in the order of the input"
+    )
+    batch_parser.add_argument(
+        "source",
+        help="A 'package.module:attribute' reference to a parser or a function returning one"
+    )
+    batch_parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="A file with a JSON list of arguments or a JSON object of values on each line. Read from stdin if '-'"
+    )
+    batch_parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        help="Where to write the results. They are printed if not given"
+    )
+    batch_parser.add_argument("--workers", type=int, help="How many handlers may run at once. Defaults to the number of CPUs")
+    batch_parser.add_argument(
+        "--backlog",
+        type=int,
+        help="How many sets of arguments may wait to finish before no more are read. Defaults to four per worker"
+    )
+    batch_parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="Call handlers on threads instead of in other processes. Whatever they print is not captured"
+    )
+    batch_parser.add_argument("--handler", default="func", help="The name of the parsed value holding the function to call")
+    batch_parser.set_defaults(func=batch)
+
+    serve_parser = commands.add_parser(
+        "serve",
+        help="Keep a parser loaded so that 'python -m argui.daemon' may run it without starting up",
+        description="Load a parser and its handlers once and run them for clients over a Unix socket"
+    )
+    serve_parser.add_argument(
+        "source",
+        help="A 'package.module:attribute' reference to a parser or a function returning one"
+    )
+    serve_parser.add_argument(
+        "--socket",
+        type=pathlib.Path,
+        help="Where to listen. Defaults to the socket that clients for the same source look for"
+    )
+    serve_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=600.0,
+        help="How many seconds to wait for a run before stopping"
+    )
+    serve_parser.add_argument("--handler", default="func", help="The name of the parsed value holding the function to call")
+    serve_parser.set_defaults(func=serve)
+
+    run_parser = commands.add_parser(
+        "run",
+        help="Run a parser's handler in this process, such as to trace it",
+        description="Parse arguments with a parser and call the handler bound to them with set_defaults(func=...)"
+    )
+    run_parser.add_argument(
+        "source",
+        help="A 'package.module:attribute' reference to a parser or a function returning one"
+    )
+    run_parser.add_argument("arguments", nargs=argparse.REMAINDER, help="The arguments to parse")
+    run_parser.add_argument("--handler", default="func", help="The name of the parsed value holding the function to call")
+    run_parser.set_defaults(func=run)
+
+    dev_parser = commands.add_parser(
+        "dev",
+        help="Show the TUI for a parser and patch it in place whenever the parser's source changes",
+        description="Show the TUI for a parser, reloading the parser whenever its files change, and print the submitted arguments"
+    )
+    dev_parser.add_argument(
+        "source",
+        help="A 'package.module:attribute' reference to a parser or a function returning one"
+    )
+    dev_parser.set_defaults(func=dev)
+
+    completion_parser = commands.add_parser(
+        "completion",
+        help="Print a shell script that completes a parser's arguments without importing it",
+        description="Write an index of a parser's commands, flags, and choices and print the shell code that completes from it"
+    )
+    completion_parser.add_argument(
+        "source",
+        help="A 'package.module:attribute' reference to a parser or a function returning one"
+    )
+    completion_parser.add_argument("--shell", choices=("bash", "zsh", "fish"), default="bash", help="The shell to complete in")
+    completion_parser.add_argument(
+        "--index",
+        type=pathlib.Path,
+        help="Where to keep the index. Defaults to the cache directory"
+    )
+    completion_parser.add_argument("--program", help="The name of the command to complete. Defaults to the parser's prog")
+    completion_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Only rebuild the index if the parser changed, as shims do in the background"
+    )
+    completion_parser.set_defaults(func=completion)
+
+    return parser
+
+
+def main(args: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """
+    Run ArgUI's command line
+
+    Args:
+        args: The arguments to parse. The arguments passed to the process are used if not given
+
+    Returns:
+        The exit code for the process
+    """
+    parsed_arguments: argparse.Namespace = build_parser().parse_args(args)
+
+    if parsed_arguments.trace:
+        from argui.utilities import tracing
+        tracing.enable(parsed_arguments.trace)
+
+    return parsed_arguments.func(parsed_arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,470 @@
+"""
+Runs a parser's handler over many sets of arguments in a single launch
+
+Each line of the input is a JSON list of CLI arguments or a JSON object of values mapped to the names
+of the workflow's fields, where an object nested under the name of a command holds the values for
+that command. Every set is parsed in this process, then the handler bound with
+`set_defaults(func=...)` is called with the parsed namespace on a pool of worker processes. The pool
+is started once, so nothing is imported again for each set of arguments.
+
+Sets are only read from the input while fewer than `backlog` of them are waiting to finish, so an
+enormous input never sits in memory at once. Results are written as JSON lines in the order of the
+input no matter which worker finishes first. A handler that calls `sys.exit` only ends its own set,
+whose exit status is reported in place of a result:
+
+```
+{"line": 1, "result": 0, "output": "File 'a.txt' created successfully\\n"}
+{"line": 2, "error": "argument type: invalid choice: 'link' (choose from 'file', 'dir')"}
+{"line": 3, "exit_code": 3, "error": "Exited with status 3"}
+```
+"""
+from __future__ import annotations
+
+import io
+import os
+import sys
+import json
+import typing
+import argparse
+import importlib
+import contextlib
+import collections
+import concurrent.futures
+
+from argui.parser import ArgumentParser
+from argui.parser import ArgumentCheckError
+from argui.utilities import tracing
+
+if typing.TYPE_CHECKING:
+    from argui.model import WorkflowBehavior
+
+DEFAULT_HANDLER_DESTINATION: typing.Final[str] = "func"
+"""The name of the parsed value holding the function to call, as set through `set_defaults(func=...)`"""
+
+BACKLOG_PER_WORKER: typing.Final[int] = 4
+"""The number of argument sets that may wait on each worker before no more are read from the input"""
+
+
+class BatchRecordError(ValueError):
+    """Raised when a line of input can't be turned into CLI arguments"""
+
+
+class HandlerExit(Exception):
+    """Raised in place of `SystemExit` when a handler exits, so that only its own set of arguments ends"""
+    def __init__(self, code: typing.Any, output: typing.Optional[str] = None):
+        """
+        Args:
+            code: What the handler passed to `sys.exit`
+            output: What the handler printed before exiting, if that was captured
+        """
+        super().__init__(code, output)
+        self.code: typing.Any = code
+        self.output: typing.Optional[str] = output
+
+    @property
+    def status(self) -> int:
+        """
+        The exit status that the process would have ended with
+        """
+        if self.code is None:
+            return 0
+
+        # `sys.exit("message")` prints the message and exits with a status of 1
+        return self.code if isinstance(self.code, int) else 1
+
+
+class BatchSummary(typing.NamedTuple):
+    """
+    How many sets of arguments were handled
+    """
+    succeeded: int
+    """The number of sets whose handler returned"""
+
+    failed: int
+    """The number of sets that couldn't be parsed or whose handler raised an error"""
+
+
+def load_parser(source: str) -> argparse.ArgumentParser:
+    """
+    Load the parser to run a batch through
+
+    Args:
+        source: A 'package.module:attribute' reference to a parser or to a function without arguments that returns one
+
+    Returns:
+        The referenced parser
+    """
+    module_name, _, attribute_path = source.partition(":")
+
+    if not attribute_path:
+        raise ValueError(f"'{source}' must be written as 'package.module:attribute'")
+
+    loaded: typing.Any = importlib.import_module(module_name)
+
+    for attribute_name in attribute_path.split("."):
+        loaded = getattr(loaded, attribute_name)
+
+    if callable(loaded) and not isinstance(loaded, argparse.ArgumentParser):
+        loaded = loaded()
+
+    if not isinstance(loaded, argparse.ArgumentParser):
+        raise TypeError(f"'{source}' does not refer to an argument parser")
+
+    return loaded
+
+
+def build_record_arguments(workflow: WorkflowBehavior, record: typing.Mapping[str, typing.Any]) -> typing.List[str]:
+    """
+    Convert values given for a workflow's fields into the CLI arguments that would provide them
+
+    Args:
+        workflow: The workflow the values were given for
+        record: Values mapped to the names of fields. An object mapped to the name of a command holds
+            the values for that command
+
+    Returns:
+        The arguments to parse
+
+    Raises:
+        BatchRecordError: If a value doesn't belong to any field or more than one command was given
+    """
+    arguments: typing.List[str] = []
+    values: typing.Mapping[str, typing.Any] = record
+
+    while True:
+        commands: typing.List[str] = [
+            name
+            for name, value in values.items()
+            if name in workflow.subworkflows and isinstance(value, typing.Mapping)
+        ]
+        field_names: typing.Set[str] = {field.name for field in workflow.fields}
+        unknown_names: typing.List[str] = [
+            name
+            for name in values
+            if name not in field_names and name not in commands
+        ]
+
+        if unknown_names:
+            raise BatchRecordError(f"'{workflow.name}' has no fields named {', '.join(map(repr, unknown_names))}")
+
+        if len(commands) > 1:
+            raise BatchRecordError(f"Only one command may be given, not {', '.join(map(repr, commands))}")
+
+        arguments.extend(workflow.to_arguments({name: value for name, value in values.items() if name in field_names}))
+
+        if not commands:
+            return arguments
+
+        arguments.append(commands[0])
+        workflow = workflow.subworkflows[commands[0]]
+        values = values[commands[0]]
+
+
+def parse_arguments(parser: argparse.ArgumentParser, arguments: typing.Sequence[str]) -> argparse.Namespace:
+    """
+    Parse a set of arguments without letting a failure exit the process
+
+    Args:
+        parser: The parser to parse the arguments with
+        arguments: The arguments to parse
+
+    Returns:
+        The parsed arguments
+
+    Raises:
+        ArgumentCheckError: If the arguments could not be parsed
+    """
+    if isinstance(parser, ArgumentParser):
+        return parser.parse_checked(arguments)
+
+    # Plain argparse parsers print their complaint before exiting, so it is caught on its way out
+    complaint = io.StringIO()
+
+    try:
+        with contextlib.redirect_stderr(complaint):
+            return parser.parse_args(list(arguments))
+    except SystemExit as error:
+        complaint_lines: typing.List[str] = complaint.getvalue().strip().splitlines()
+        raise ArgumentCheckError(complaint_lines[-1] if complaint_lines else "The arguments could not be parsed") from error
+
+
+def call_handler(
+    handler: typing.Callable[[argparse.Namespace], typing.Any],
+    namespace: argparse.Namespace,
+    capture_output: bool = True
+) -> typing.Tuple[typing.Any, typing.Optional[str]]:
+    """
+    Call a handler with parsed arguments, running it to completion if it is a coroutine function
+
+    Args:
+        handler: The function bound to the parsed arguments
+        namespace: The parsed arguments
+        capture_output: Whether to collect whatever the handler prints rather than letting it reach stdout
+
+    Returns:
+        What the handler returned and what it printed, if that was captured
+
+    Raises:
+        HandlerExit: If the handler called `sys.exit`
+    """
+    printed = io.StringIO()
+
+    try:
+        with (
+            tracing.span("handler", handler=getattr(handler, "__qualname__", handler)),
+            contextlib.redirect_stdout(printed) if capture_output else contextlib.nullcontext()
+        ):
+            result: typing.Any = handler(namespace)
+
+            if hasattr(result, "__await__"):
+                import asyncio
+
+                async def wait_for(awaitable: typing.Awaitable[typing.Any]) -> typing.Any:
+                    return await awaitable
+
+                result = asyncio.run(wait_for(result))
+    except SystemExit as error:
+        raise HandlerExit(error.code, printed.getvalue() if capture_output else None) from None
+
+    return result, printed.getvalue() if capture_output else None
+
+
+def failed_future(error: BaseException) -> concurrent.futures.Future:
+    """
+    Create a future for a set of arguments that never reached a worker
+    """
+    future: concurrent.futures.Future = concurrent.futures.Future()
+    future.set_exception(error)
+    return future
+
+
+class BatchRunner:
+    """
+    Parses sets of arguments and hands each to the parser's handler on a pool of workers
+    """
+    def __init__(
+        self,
+        parser: argparse.ArgumentParser,
+        workers: typing.Optional[int] = None,
+        backlog: typing.Optional[int] = None,
+        use_threads: bool = False,
+        handler_destination: str = DEFAULT_HANDLER_DESTINATION
+    ):
+        """
+        Args:
+            parser: The parser that every set of arguments is parsed with
+            workers: The largest number of handlers that may run at once. Defaults to the number of CPUs
+            backlog: The largest number of sets that may be waiting to finish. Defaults to four per worker
+            use_threads: Whether to call handlers on threads rather than in other processes. Whatever
+                they print is not captured
+            handler_destination: The name of the parsed value holding the function to call
+        """
+        self.parser: argparse.ArgumentParser = parser
+        self.workers: int = workers or os.cpu_count() or 1
+        self.backlog: int = backlog or self.workers * BACKLOG_PER_WORKER
+        self.use_threads: bool = use_threads
+        self.handler_destination: str = handler_destination
+        self._workflow: typing.Optional[WorkflowBehavior] = None
+
+    @property
+    def workflow(self) -> WorkflowBehavior:
+        """
+        The workflow that values given as objects are checked against, built the first time one is read
+        """
+        if self._workflow is None:
+            from argui.model import WorkflowSpec
+
+            if isinstance(self.parser, ArgumentParser):
+                self._workflow = self.parser.to_model()
+            else:
+                self._workflow = WorkflowSpec.from_parser(self.parser)
+
+        return self._workflow
+
+    def read_record(self, line: str) -> argparse.Namespace:
+        """
+        Parse a line of input
+
+        Args:
+            line: A JSON list of CLI arguments or a JSON object of values for the workflow's fields
+
+        Returns:
+            The parsed arguments
+
+        Raises:
+            BatchRecordError: If the line isn't a list of arguments or an object of values
+            ArgumentCheckError: If the arguments could not be parsed
+        """
+        try:
+            record: typing.Any = json.loads(line)
+        except ValueError as error:
+            raise BatchRecordError(f"Not valid JSON: {error}") from error
+
+        if isinstance(record, dict):
+            arguments: typing.List[str] = build_record_arguments(self.workflow, record)
+        elif isinstance(record, list) and all(isinstance(argument, str) for argument in record):
+            arguments = record
+        else:
+            raise BatchRecordError("Each line must be a list of CLI arguments or an object of values")
+
+        return parse_arguments(self.parser, arguments)
+
+    def submit(self, executor: concurrent.futures.Executor, line: str) -> concurrent.futures.Future:
+        """
+        Parse a line of input and start its handler
+
+        Args:
+            executor: The pool to call the handler on
+            line: The line to handle
+
+        Returns:
+            What the handler returns and prints, or whatever went wrong along the way
+        """
+        try:
+            namespace: argparse.Namespace = self.read_record(line)
+        except (BatchRecordError, ArgumentCheckError) as error:
+            return failed_future(error)
+
+        handler: typing.Any = getattr(namespace, self.handler_destination, None)
+
+        if not callable(handler):
+            return failed_future(
+                BatchRecordError(f"No handler was bound with set_defaults({self.handler_destination}=...)")
+            )
+
+        return executor.submit(call_handler, handler, namespace, not self.use_threads)
+
+    @staticmethod
+    def describe_outcome(line_number: int, future: concurrent.futures.Future) -> typing.Dict[str, typing.Any]:
+        """
+        Wait for a set of arguments to finish and describe how it went
+
+        Args:
+            line_number: Where the set was in the input, starting at 1
+            future: The outcome of the set
+
+        Returns:
+            The line number along with the result and output of the handler, or the error
+        """
+        try:
+            result, output = future.result()
+        except (BatchRecordError, ArgumentCheckError) as error:
+            return {"line": line_number, "error": str(error)}
+        except SystemExit as error:
+            return BatchRunner.describe_exit(line_number, HandlerExit(error.code))
+        except HandlerExit as error:
+            return BatchRunner.describe_exit(line_number, error)
+        except Exception as error:
+            return {"line": line_number, "error": f"{type(error).__name__}: {error}"}
+
+        outcome: typing.Dict[str, typing.Any] = {"line": line_number, "result": result}
+
+        if output:
+            outcome["output"] = output
+
+        return outcome
+
+    @staticmethod
+    def describe_exit(line_number: int, exit: HandlerExit) -> typing.Dict[str, typing.Any]:
+        """
+        Describe a set of arguments whose handler called `sys.exit`
+
+        Args:
+            line_number: Where the set was in the input, starting at 1
+            exit: How the handler exited
+
+        Returns:
+            The line number and exit status, along with an error if the status isn't 0
+        """
+        outcome: typing.Dict[str, typing.Any] = {"line": line_number, "exit_code": exit.status}
+
+        if exit.status != 0:
+            outcome["error"] = exit.code if isinstance(exit.code, str) else f"Exited with status {exit.status}"
+
+        if exit.output:
+            outcome["output"] = exit.output
+
+        return outcome
+
+    def run(self, lines: typing.Iterable[str], output: typing.TextIO) -> BatchSummary:
+        """
+        Handle every set of arguments in the input, writing each outcome in the order of the input
+
+        Args:
+            lines: The input, one set of arguments per line. Blank lines are skipped
+            output: Where to write the outcomes
+
+        Returns:
+            How many sets were handled and how many failed
+        """
+        pending: typing.Deque[typing.Tuple[int, concurrent.futures.Future]] = collections.deque()
+        succeeded: int = 0
+        failed: int = 0
+
+        def write_next() -> None:
+            nonlocal succeeded, failed
+            line_number, future = pending.popleft()
+
+            # Everything written so far should be visible while waiting on a slow handler
+            if not future.done():
+                output.flush()
+
+            outcome: typing.Dict[str, typing.Any] = self.describe_outcome(line_number, future)
+
+            try:
+                encoded: str = json.dumps(outcome, default=str)
+            except ValueError as error:
+                outcome = {"line": line_number, "error": f"The result could not be written: {error}"}
+                encoded = json.dumps(outcome)
+
+            if "error" in outcome:
+                failed += 1
+            else:
+                succeeded += 1
+
+            output.write(encoded + "\n")
+
+        if self.use_threads:
+            executor: concurrent.futures.Executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="argui-batch"
+            )
+        else:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+
+        with executor:
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+
+                pending.append((line_number, self.submit(executor, line)))
+
+                while len(pending) >= self.backlog:
+                    write_next()
+
+            while pending:
+                write_next()
+
+        output.flush()
+        return BatchSummary(succeeded, failed)
+
+
+def run_batch(
+    parser: argparse.ArgumentParser,
+    lines: typing.Iterable[str],
+    output: typing.TextIO = sys.stdout,
+    **kwargs
+) -> BatchSummary:
+    """
+    Handle every set of arguments in an input, writing each outcome as a JSON line in the order of the input
+
+    Args:
+        parser: The parser that every set of arguments is parsed with
+        lines: The input, one JSON list of arguments or object of values per line
+        output: Where to write the outcomes
+        **kwargs: How to run the handlers, as accepted by `BatchRunner`
+
+    Returns:
+        How many sets were handled and how many failed
+    """
+    return BatchRunner(parser, **kwargs).run(lines, output)
@@ -0,0 +1,607 @@
+"""
+Completes a program's arguments in bash, zsh, and fish without importing the program
+
+`python -m argui completion package.module:build_parser --shell bash` writes a completion index for
+the parser's workflow and prints a shim to load into the shell. The index holds each command's
+subcommands and flags, every option's choices, and which values are paths. The shim hands the words
+typed so far to a short awk program that reads the index, so pressing tab costs a few milliseconds
+no matter how large the program is.
+
+The index also lists the files the parser was loaded from. When any of them is newer than the index,
+the shim rebuilds it in the background. If the parser's fingerprint didn't change, the rebuild only
+marks the index as fresh.
+
+Each line of the index is a record of tab separated fields:
+
+```
+V  <format>  <fingerprint>
+S  <source file>
+C  <command path>  <subcommand>
+O  <command path>  <flag>  <arity>  <hint>  <choices>
+P  <command path>  <first position>  <last position>  <hint>  <choices>
+```
+
+The command path is the names of the commands leading to a workflow separated by spaces, empty for the
+root. An arity is `0` for flags without a value, `1` for flags with one, and `n` for flags with any
+number of them. A last position of `-1` means every remaining position. Hints are `file`, `dir`,
+`choice`, or `-`, and choices are separated by the unit separator character.
+"""
+from __future__ import annotations
+
+import os
+import re
+import sys
+import shlex
+import typing
+import pathlib
+import argparse
+
+from argui.model import FieldBehavior
+from argui.model import WorkflowBehavior
+from argui.model import WorkflowSpec
+from argui.model.field import SelectionBehavior
+from argui.model.workflow import HelpAction
+from argui.model.workflow import VersionAction
+from argui.model.cache import get_cache_directory
+from argui.model.cache import get_program_key
+from argui.model.cache import write_atomically
+from argui.parser import is_interactive_action
+from argui.utilities.fingerprint import fingerprint_parser
+from argui.utilities.fingerprint import get_loaded_source_files
+
+COMPLETION_FORMAT_VERSION: typing.Final[str] = "1"
+"""Changes whenever the layout of completion indices changes"""
+
+SHELLS: typing.Final[typing.Tuple[str, ...]] = ("bash", "zsh", "fish")
+"""The shells that shims may be generated for"""
+
+CHOICE_SEPARATOR: typing.Final[str] = "\x1f"
+"""Separates the choices within a record and the words handed to the awk program"""
+
+UNBOUNDED_POSITION: typing.Final[int] = -1
+"""Marks a positional argument that takes every remaining position"""
+
+DIRECTORY_NAME_PATTERN: typing.Final[re.Pattern] = re.compile(r"(^|_)(dir|directory|folder)s?$")
+"""Matches the names of path fields that should only be completed with directories"""
+
+COMPLETION_PROGRAM: typing.Final[str] = r"""
+function emit(list, prefix, separator,    parts, total, k) {
+    total = split(list, parts, separator)
+    for (k = 1; k <= total; k++) {
+        if (parts[k] != "" && index(parts[k], prefix) == 1) {
+            print parts[k]
+        }
+    }
+}
+function suggest(hint, choices, prefix) {
+    if (hint == "file" || hint == "dir") {
+        print "\037" hint
+    } else if (hint == "choice") {
+        emit(choices, prefix, "\037")
+    }
+}
+BEGIN {
+    FS = "\t"
+    total_words = split(ENVIRON["ARGUI_COMPLETION_WORDS"], words, "\037")
+    current = ENVIRON["ARGUI_COMPLETION_CURRENT"]
+}
+$1 == "C" { commands[$2, $3] = 1; command_list[$2] = command_list[$2] "\037" $3; next }
+$1 == "O" { arity[$2, $3] = $4; hints[$2, $3] = $5; choices[$2, $3] = $6; flag_list[$2] = flag_list[$2] "\037" $3; next }
+$1 == "P" {
+    positional_count[$2]++
+    first[$2, positional_count[$2]] = $3
+    last[$2, positional_count[$2]] = $4
+    positional_hints[$2, positional_count[$2]] = $5
+    positional_choices[$2, positional_count[$2]] = $6
+    next
+}
+END {
+    path = ""
+    position = 0
+    pending = ""
+
+    for (i = 1; i <= total_words; i++) {
+        word = words[i]
+
+        if (pending != "") {
+            if (word !~ /^-/) {
+                if (arity[pending] == "1") {
+                    pending = ""
+                }
+                continue
+            }
+            pending = ""
+        }
+
+        if (word ~ /^-/) {
+            flag = word
+            sub(/=.*/, "", flag)
+            if (((path, flag) in arity) && arity[path, flag] != "0" && word !~ /=/) {
+                pending = path SUBSEP flag
+            }
+            continue
+        }
+
+        if ((path, word) in commands) {
+            path = (path == "" ? word : path " " word)
+            position = 0
+            continue
+        }
+
+        position++
+    }
+
+    if (current ~ /^-/) {
+        emit(flag_list[path], current, "\037")
+        exit
+    }
+
+    if (pending != "") {
+        suggest(hints[pending], choices[pending], current)
+        exit
+    }
+
+    emit(command_list[path], current, "\037")
+
+    for (k = 1; k <= positional_count[path]; k++) {
+        if (position >= first[path, k] && (last[path, k] < 0 || position <= last[path, k])) {
+            suggest(positional_hints[path, k], positional_choices[path, k], current)
+        }
+    }
+}
+"""
+"""Reads an index and prints the candidates for the word being completed, one per line. A candidate of the
+unit separator followed by `file` or `dir` asks the shell to complete paths instead"""
+
+
+def is_path_type(value_type: typing.Any) -> bool:
+    """
+    Whether a field's values are paths
+    """
+    if isinstance(value_type, argparse.FileType):
+        return True
+
+    return isinstance(value_type, type) and issubclass(value_type, pathlib.PurePath)
+
+
+def is_safe_word(word: str) -> bool:
+    """
+    Whether a word may be stored within a record without breaking it apart
+    """
+    return not any(character in word for character in ("\t", "\n", "\r", CHOICE_SEPARATOR))
+
+
+def get_value_hint(field: FieldBehavior) -> typing.Tuple[str, str]:
+    """
+    Describe how the values of a field should be completed
+
+    Args:
+        field: The field to describe
+
+    Returns:
+        The hint and the choices, separated by `CHOICE_SEPARATOR`
+    """
+    if isinstance(field, SelectionBehavior) and field.provider is None and field.options:
+        values: typing.List[str] = [str(value) for _, value in field.labeled_options]
+        return "choice", CHOICE_SEPARATOR.join(value for value in values if is_safe_word(value))
+
+    if is_path_type(field.type):
+        return ("dir" if DIRECTORY_NAME_PATTERN.search(field.name.lower()) else "file"), ""
+
+    return "-", ""
+
+
+def get_arity(field: FieldBehavior) -> str:
+    """
+    Describe how many values follow a field's flag
+
+    Returns:
+        `0` if none do, `1` if exactly one does, otherwise `n`
+    """
+    if field.is_switch or field.action in ("count", "help", "version") or field.nargs == 0:
+        return "0"
+
+    if field.nargs in (None, 1, "?"):
+        return "1"
+
+    return "n"
+
+
+def get_positions(field: FieldBehavior, start: int) -> typing.Tuple[int, int]:
+    """
+    Determine which positions a positional field takes
+
+    Args:
+        field: The positional field
+        start: The first position that isn't taken by an earlier field
+
+    Returns:
+        The first and last positions of the field. The last is `UNBOUNDED_POSITION` if it takes every remaining one
+    """
+    if isinstance(field.nargs, int):
+        return start, start + max(field.nargs, 1) - 1
+
+    if field.nargs in (None, "?"):
+        return start, start
+
+    return start, UNBOUNDED_POSITION
+
+
+def describe_workflow(
+    workflow: WorkflowBehavior,
+    extra_flags: typing.Sequence[str] = (),
+    path: typing.Tuple[str, ...] = ()
+) -> typing.Iterator[str]:
+    """
+    Describe a workflow and all of its subworkflows as index records
+
+    Args:
+        workflow: The workflow to describe
+        extra_flags: Flags without values that every workflow accepts but that aren't fields, like `--help`
+        path: The commands leading to the workflow
+
+    Returns:
+        Each record, without a line ending
+    """
+    command_path: str = " ".join(path)
+    position: int = 0
+
+    for flag in extra_flags:
+        yield "\t".join(["O", command_path, flag, "0", "-", ""])
+
+    for field in workflow.fields:
+        hint, choices = get_value_hint(field)
+
+        if field.flags:
+            for flag in field.flags:
+                yield "\t".join(["O", command_path, flag, get_arity(field), hint, choices])
+            continue
+
+        first, last = get_positions(field, position)
+        yield "\t".join(["P", command_path, str(first), str(last), hint, choices])
+        position = last + 1 if last != UNBOUNDED_POSITION else position
+
+    for command_name, subworkflow in workflow.subworkflows.items():
+        for name in [command_name, *workflow.subworkflows.get_aliases(command_name)]:
+            if not is_safe_word(name) or " " in name:
+                continue
+
+            yield "\t".join(["C", command_path, name])
+            yield from describe_workflow(subworkflow, extra_flags, path + (name,))
+
+
+def get_extra_flags(parser: argparse.ArgumentParser) -> typing.List[str]:
+    """
+    Find the flags a parser accepts that workflows leave out, such as those for help and interactive mode
+    """
+    extra_flags: typing.List[str] = []
+
+    for action in parser._actions:
+        if is_interactive_action(action) or isinstance(action, (HelpAction, VersionAction)):
+            extra_flags.extend(action.option_strings)
+
+    return extra_flags
+
+
+def build_completion_index(
+    workflow: WorkflowBehavior,
+    fingerprint: str = "",
+    source_files: typing.Sequence[str] = (),
+    extra_flags: typing.Sequence[str] = ()
+) -> str:
+    """
+    Describe everything needed to complete a workflow's arguments
+
+    Args:
+        workflow: The workflow whose arguments should be completed
+        fingerprint: The fingerprint of the parser the workflow was built from
+        source_files: The files whose changes should rebuild the index
+        extra_flags: Flags without values that every workflow accepts but that aren't fields
+
+    Returns:
+        The contents of the index
+    """
+    lines: typing.List[str] = ["\t".join(["V", COMPLETION_FORMAT_VERSION, fingerprint])]
+    lines.extend("\t".join(["S", path]) for path in source_files if is_safe_word(path))
+    lines.extend(describe_workflow(workflow, extra_flags))
+    return "\n".join(lines) + "\n"
+
+
+def get_index_path(parser: argparse.ArgumentParser) -> pathlib.Path:
+    """
+    Get where a parser's completion index is kept by default
+
+    Raises:
+        ValueError: If caching is disabled, so there is nowhere to keep it
+    """
+    cache_directory: typing.Optional[pathlib.Path] = get_cache_directory()
+
+    if cache_directory is None:
+        raise ValueError("Caching is disabled, so the completion index needs an explicit path")
+
+    return cache_directory / "completion" / f"{get_program_key(parser)}.index"
+
+
+def read_index_fingerprint(path: pathlib.Path) -> typing.Optional[str]:
+    """
+    Read the fingerprint of the parser that an index was built from
+
+    Returns:
+        The fingerprint, `None` if there is no index or it was built by another version of ArgUI
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            header: typing.List[str] = file.readline().rstrip("\n").split("\t")
+    except OSError:
+        return None
+
+    if len(header) != 3 or header[:2] != ["V", COMPLETION_FORMAT_VERSION]:
+        return None
+
+    return header[2]
+
+
+def write_completion_index(parser: argparse.ArgumentParser, path: pathlib.Path, source_files: typing.Sequence[str] = ()) -> bool:
+    """
+    Write the completion index for a parser unless the one already there describes the same parser
+
+    An index that is kept is still marked as fresh so that shims stop asking for it to be rebuilt
+
+    Args:
+        parser: The parser to describe
+        path: Where to write the index
+        source_files: The files whose changes should rebuild the index
+
+    Returns:
+        True if the index was written
+    """
+    fingerprint: str = fingerprint_parser(parser, salt=f"completion-{COMPLETION_FORMAT_VERSION}")
+
+    if read_index_fingerprint(path) == fingerprint:
+        os.utime(path)
+        return False
+
+    # Generated entry points load their serialized workflow rather than converting the parser
+    workflow: WorkflowBehavior = parser.to_model() if hasattr(parser, "to_model") else WorkflowSpec.from_parser(parser)
+    content: str = build_completion_index(workflow, fingerprint, source_files, get_extra_flags(parser))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomically(path, content.encode("utf-8"))
+    return True
+
+
+def fish_quote(text: str) -> str:
+    """
+    Quote text for fish, which only treats backslashes and single quotes specially within single quotes
+    """
+    return "'" + text.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def get_function_name(program: str) -> str:
+    """
+    Get a name for a program's completion function that every shell accepts
+    """
+    return "_argui_complete_" + re.sub(r"\W", "_", program)
+
+
+def generate_shim(
+    shell: str,
+    program: str,
+    index_path: pathlib.Path,
+    refresh_command: typing.Sequence[str],
+    working_directory: str
+) -> str:
+    """
+    Write the shell code that completes a program's arguments from its index
+
+    Args:
+        shell: One of the `SHELLS`
+        program: The name of the command that is completed
+        index_path: Where the index is kept
+        refresh_command: The command that rebuilds the index
+        working_directory: Where the refresh command has to run for the parser to be importable
+
+    Returns:
+        The code to load into the shell
+    """
+    function_name: str = get_function_name(program)
+
+    if shell == "fish":
+        refresh: str = " ".join(fish_quote(part) for part in refresh_command)
+        return FISH_SHIM.format(
+            function=function_name,
+            program=fish_quote(program),
+            index=fish_quote(str(index_path)),
+            directory=fish_quote(working_directory),
+            refresh=refresh,
+            script=fish_quote(COMPLETION_PROGRAM)
+        )
+
+    template: str = BASH_SHIM if shell == "bash" else ZSH_SHIM
+    return template.format(
+        function=function_name,
+        program=shlex.quote(program),
+        index=shlex.quote(str(index_path)),
+        directory=shlex.quote(working_directory),
+        refresh=shlex.join(refresh_command),
+        script=shlex.quote(COMPLETION_PROGRAM)
+    )
+
+
+REFRESH_FUNCTION: typing.Final[str] = """
+{function}_refresh() {{
+    local kind source_file
+    while IFS=$'\\t' read -r kind source_file; do
+        [ "$kind" = V ] && continue
+        [ "$kind" = S ] || break
+        if [ "$source_file" -nt {index} ]; then
+            touch {index}
+            ( cd {directory} && {refresh} >/dev/null 2>&1 & )
+            break
+        fi
+    done < {index}
+}}
+"""
+"""Rebuilds the index in the background when the parser's files are newer than it, for bash and zsh"""
+
+BASH_SHIM: typing.Final[str] = REFRESH_FUNCTION + """
+{function}() {{
+    local index={index}
+    [ -r "$index" ] || return 0
+    {function}_refresh
+
+    local IFS=$'\\037'
+    local typed="${{COMP_WORDS[*]:1:COMP_CWORD-1}}"
+    local current="${{COMP_WORDS[COMP_CWORD]}}"
+    local candidate entry
+    COMPREPLY=()
+
+    while IFS= read -r candidate; do
+        case "$candidate" in
+            $'\\037file'|$'\\037dir')
+                compopt -o filenames 2>/dev/null
+                while IFS= read -r entry; do
+                    COMPREPLY+=("$entry")
+                done < <(if [ "$candidate" = $'\\037dir' ]; then compgen -d -- "$current"; else compgen -f -- "$current"; fi)
+                ;;
+            *)
+                COMPREPLY+=("$candidate")
+                ;;
+        esac
+    done < <(ARGUI_COMPLETION_WORDS="$typed" ARGUI_COMPLETION_CURRENT="$current" awk {script} "$index")
+}}
+
+complete -F {function} {program}
+"""
+"""Completes a program in bash"""
+
+ZSH_SHIM: typing.Final[str] = REFRESH_FUNCTION + """
+{function}() {{
+    local index={index}
+    [ -r "$index" ] || return 0
+    {function}_refresh
+
+    local typed="${{(pj:\\037:)words[2,CURRENT-1]}}"
+    local current="${{words[CURRENT]}}"
+    local -a candidates
+    local candidate
+
+    for candidate in "${{(@f)$(ARGUI_COMPLETION_WORDS="$typed" ARGUI_COMPLETION_CURRENT="$current" awk {script} "$index")}}"; do
+        case "$candidate" in
+            $'\\037file') _files ;;
+            $'\\037dir') _files -/ ;;
+            ?*) candidates+=("$candidate") ;;
+        esac
+    done
+
+    (( ${{#candidates}} )) && compadd -- "${{candidates[@]}}"
+}}
+
+compdef {function} {program}
+"""
+"""Completes a program in zsh"""
+
+FISH_SHIM: typing.Final[str] = """
+function {function}_refresh
+    set -l sources
+    while read --delimiter \\t -l kind source_file
+        test "$kind" = V; and continue
+        test "$kind" = S; or break
+        set -a sources $source_file
+    end < {index}
+
+    test (count $sources) -gt 0; or return
+    set -l newer (command find $sources -newer {index} -print -quit 2>/dev/null)
+
+    if set -q newer[1]
+        touch {index}
+        fish -c 'cd $argv[1]; and $argv[2..-1] >/dev/null 2>&1' {directory} {refresh} &
+        disown 2>/dev/null
+    end
+end
+
+function {function}
+    set -l index {index}
+    test -r $index; or return 0
+    {function}_refresh
+
+    set -l tokens (commandline -opc)
+    set -e tokens[1]
+    set -l current (commandline -ct)
+
+    for candidate in (env ARGUI_COMPLETION_WORDS=(string join \\x1f -- $tokens) ARGUI_COMPLETION_CURRENT=$current awk {script} $index)
+        switch $candidate
+            case \\x1ffile
+                __fish_complete_path $current
+            case \\x1fdir
+                __fish_complete_directories $current
+            case '*'
+                echo $candidate
+        end
+    end
+end
+
+complete -c {program} -f -a '({function})'
+"""
+"""Completes a program in fish"""
+
+
+def get_refresh_command(source: str, index_path: pathlib.Path) -> typing.List[str]:
+    """
+    Get the command that rebuilds the index for a parser
+
+    Args:
+        source: The 'package.module:attribute' reference to the parser
+        index_path: Where the index is kept
+    """
+    return [sys.executable, "-m", "argui", "completion", source, "--index", str(index_path), "--refresh"]
+
+
+def prepare_completion(
+    source: str,
+    shell: str = "bash",
+    index_path: typing.Optional[pathlib.Path] = None,
+    program: typing.Optional[str] = None
+) -> str:
+    """
+    Write the completion index for a parser and create the shim that reads it
+
+    Args:
+        source: The 'package.module:attribute' reference to the parser
+        shell: One of the `SHELLS`
+        index_path: Where to keep the index. Defaults to the cache directory
+        program: The name of the command to complete. Defaults to the parser's `prog`
+
+    Returns:
+        The code to load into the shell
+    """
+    from argui.batch import load_parser
+
+    parser: argparse.ArgumentParser = load_parser(source)
+    index_path = pathlib.Path(index_path or get_index_path(parser)).absolute()
+    write_completion_index(parser, index_path, get_loaded_source_files(source.partition(":")[0]))
+
+    return generate_shim(
+        shell,
+        program or parser.prog,
+        index_path,
+        get_refresh_command(source, index_path),
+        os.getcwd()
+    )
+
+
+def refresh_completion(source: str, index_path: pathlib.Path) -> bool:
+    """
+    Rebuild the completion index for a parser if the parser changed
+
+    Args:
+        source: The 'package.module:attribute' reference to the parser
+        index_path: Where the index is kept
+
+    Returns:
+        True if the index was rewritten
+    """
+    from argui.batch import load_parser
+
+    parser: argparse.ArgumentParser = load_parser(source)
+    return write_completion_index(parser, pathlib.Path(index_path), get_loaded_source_files(source.partition(":")[0]))
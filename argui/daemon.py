@@ -0,0 +1,608 @@
+"""
+Keeps a parser, its workflow, and its handlers loaded in a resident process so that repeated runs skip startup
+
+`python -m argui serve package.module:build_parser` loads the parser once and listens on a Unix
+socket that only the current user may reach. `python -m argui.daemon package.module:build_parser ARGS...`
+is the client: it starts the daemon if none is listening, then hands it the arguments, environment,
+working directory, and the client's own stdin, stdout, and stderr. The daemon forks for each run, so
+every run starts from the same warm state and runs with the client's terminal, environment, and
+working directory. The client exits with whatever the run exited with.
+
+The daemon stops once it has been idle for `--idle-timeout` seconds. Before each run it checks whether
+the source files it loaded have changed; if they have, it stops and the client starts a fresh one.
+
+The client never imports the parser, its handlers, the workflow model, or the interface, so starting
+it costs little more than starting the interpreter.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import json
+import socket
+import typing
+
+SOCKET_DIRECTORY_VARIABLE: typing.Final[str] = "ARGUI_DAEMON_DIR"
+"""The environment variable that may set where daemon sockets are kept"""
+
+IDLE_TIMEOUT_VARIABLE: typing.Final[str] = "ARGUI_DAEMON_IDLE_TIMEOUT"
+"""The environment variable that may set how long a daemon started by a client waits for its next run"""
+
+DEFAULT_IDLE_TIMEOUT: typing.Final[float] = 600.0
+"""The number of seconds a daemon waits for its next run before stopping"""
+
+STARTUP_TIMEOUT: typing.Final[float] = 10.0
+"""The number of seconds a client waits for a daemon it started to begin listening"""
+
+FORWARDED_DESCRIPTORS: typing.Final[typing.Tuple[int, int, int]] = (0, 1, 2)
+"""The client's stdin, stdout, and stderr, which every run uses as its own"""
+
+MAXIMUM_REQUEST_SIZE: typing.Final[int] = 16 * 1024 * 1024
+"""The largest request a daemon will read, in bytes"""
+
+
+class DaemonRestart(Exception):
+    """Raised in a client when the daemon it reached stopped because its source changed"""
+
+
+def get_identity(source: str) -> str:
+    """
+    Describe what a daemon for a parser would load. Another interpreter or search path could load an
+    entirely different module under the same name
+
+    Args:
+        source: The 'package.module:attribute' reference to the parser
+
+    Returns:
+        The source along with the interpreter and search path it is loaded with
+    """
+    return "\0".join([source, sys.executable, os.environ.get("PYTHONPATH", "")])
+
+
+def get_socket_path(source: str) -> str:
+    """
+    Get where the daemon for a parser listens, within a directory only the current user may use
+
+    Args:
+        source: The 'package.module:attribute' reference to the parser
+
+    Returns:
+        The path of the daemon's socket
+
+    Raises:
+        PermissionError: If the socket directory belongs to someone else or others may use it
+    """
+    import zlib
+
+    directory: str
+
+    if os.environ.get(SOCKET_DIRECTORY_VARIABLE):
+        directory = os.environ[SOCKET_DIRECTORY_VARIABLE]
+    elif os.environ.get("XDG_RUNTIME_DIR"):
+        directory = os.path.join(os.environ["XDG_RUNTIME_DIR"], "argui")
+    else:
+        import tempfile
+        directory = os.path.join(tempfile.gettempdir(), f"argui-{os.getuid()}")
+
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    status: os.stat_result = os.stat(directory)
+
+    if status.st_uid != os.getuid() or status.st_mode & 0o077:
+        raise PermissionError(f"'{directory}' must belong to the current user and be private to them")
+
+    # Socket paths are short on most platforms, so the identity is hashed rather than spelled out. Loading
+    # hashlib would cost more than the rest of the client, and daemons turn away clients whose identity
+    # differs from their own, so a checksum is enough
+    key: int = zlib.crc32(get_identity(source).encode("utf-8"))
+    return os.path.join(directory, f"{key:08x}.sock")
+
+
+def get_source_fingerprint(source: str) -> str:
+    """
+    Describe the files that a parser was loaded from, so that a daemon can tell when they change
+
+    Every loaded module within the package that the source belongs to is included, or just the
+    module itself if it isn't part of a package
+
+    Args:
+        source: The 'package.module:attribute' reference to the parser
+
+    Returns:
+        A digest of the path, size, and modification time of each file
+    """
+    from argui.utilities.fingerprint import fingerprint_files
+    from argui.utilities.fingerprint import get_loaded_source_files
+
+    return fingerprint_files(get_loaded_source_files(source.partition(":")[0]))
+
+
+def get_exit_code(result: typing.Any) -> int:
+    """
+    Interpret what a handler returned as an exit code
+
+    Args:
+        result: What the handler returned
+
+    Returns:
+        The result if it is an integer, otherwise `0`
+    """
+    return result if isinstance(result, int) and not isinstance(result, bool) else 0
+
+
+def dispatch(
+    parser: typing.Any,
+    arguments: typing.Sequence[str],
+    handler_destination: str = "func",
+    workflow: typing.Optional[typing.Any] = None
+) -> int:
+    """
+    Parse arguments and call the handler bound to them, the way the program itself would
+
+    Args:
+        parser: The parser to parse the arguments with
+        arguments: The arguments to parse
+        handler_destination: The name of the parsed value holding the function to call
+        workflow: The workflow already built from an ArgUI parser, shown instead of building it again
+            if the arguments ask for the TUI
+
+    Returns:
+        The exit code for the run
+    """
+    from argui.batch import HandlerExit
+    from argui.batch import call_handler
+
+    try:
+        namespace: typing.Any
+
+        if workflow is not None and parser.wants_interactive(arguments):
+            namespace = parser.parse_interactively(workflow=workflow)
+        else:
+            namespace = parser.parse_args(list(arguments))
+
+        handler: typing.Any = getattr(namespace, handler_destination, None)
+
+        if not callable(handler):
+            sys.stderr.write(f"{parser.prog}: nothing to run - no handler was bound with set_defaults({handler_destination}=...)\n")
+            return 2
+
+        result, _ = call_handler(handler, namespace, capture_output=False)
+        return get_exit_code(result)
+    except (SystemExit, HandlerExit) as exit_request:
+        code: typing.Any = exit_request.code
+
+        if code is None or isinstance(code, int):
+            return code or 0
+
+        sys.stderr.write(f"{code}\n")
+        return 1
+
+
+def send_message(connection: socket.socket, message: typing.Mapping[str, typing.Any]) -> None:
+    """
+    Send a line of JSON over a connection
+    """
+    connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def read_request(connection: socket.socket) -> typing.Tuple[typing.Dict[str, typing.Any], typing.List[int]]:
+    """
+    Read a client's request along with the descriptors passed with it
+
+    Args:
+        connection: The connection to the client
+
+    Returns:
+        The request and the client's stdin, stdout, and stderr
+    """
+    data, descriptors, _, _ = socket.recv_fds(connection, 64 * 1024, len(FORWARDED_DESCRIPTORS))
+
+    try:
+        size: int = int.from_bytes(data[:8], "big")
+
+        if size > MAXIMUM_REQUEST_SIZE:
+            raise ValueError(f"A request of {size} bytes is too large")
+
+        body: bytearray = bytearray(data[8:])
+
+        while len(body) < size:
+            chunk: bytes = connection.recv(size - len(body))
+
+            if not chunk:
+                raise ValueError("The client disconnected before finishing its request")
+
+            body.extend(chunk)
+
+        return json.loads(body), descriptors
+    except BaseException:
+        for descriptor in descriptors:
+            os.close(descriptor)
+        raise
+
+
+class DaemonServer:
+    """
+    Serves runs of a parser from a process that has already loaded it
+    """
+    def __init__(
+        self,
+        source: str,
+        socket_path: typing.Optional[str] = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        handler_destination: str = "func"
+    ):
+        """
+        Args:
+            source: The 'package.module:attribute' reference to the parser
+            socket_path: Where to listen. Defaults to the socket that clients look for
+            idle_timeout: The number of seconds to wait for a run before stopping
+            handler_destination: The name of the parsed value holding the function to call
+        """
+        from argui.batch import load_parser
+        from argui.parser import ArgumentParser
+
+        self.source: str = source
+        self.socket_path: str = str(socket_path or get_socket_path(source))
+        self.identity: str = get_identity(source)
+        self.idle_timeout: float = idle_timeout
+        self.handler_destination: str = handler_destination
+        self.parser: typing.Any = load_parser(source)
+        self._listener: typing.Optional[socket.socket] = None
+
+        # The workflow is only needed for interactive runs, but building it here saves every one of them from doing so
+        self.workflow: typing.Optional[typing.Any] = (
+            self.parser.to_model() if isinstance(self.parser, ArgumentParser) else None
+        )
+
+        self.fingerprint: str = get_source_fingerprint(source)
+
+    def is_stale(self) -> bool:
+        """
+        Whether the files the parser was loaded from have changed since
+        """
+        return get_source_fingerprint(self.source) != self.fingerprint
+
+    def bind(self) -> typing.Optional[socket.socket]:
+        """
+        Start listening, unless another daemon already is
+
+        Returns:
+            The listening socket, `None` if another daemon is listening on the same path
+        """
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+            try:
+                probe.connect(self.socket_path)
+                return None
+            except OSError:
+                # Left behind by a daemon that didn't stop cleanly
+                try:
+                    os.unlink(self.socket_path)
+                except FileNotFoundError:
+                    pass
+            finally:
+                probe.close()
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        listener.listen()
+        return listener
+
+    def serve(self) -> int:
+        """
+        Serve runs until the daemon is idle for too long or its source changes
+
+        Returns:
+            The exit code for the daemon
+        """
+        import signal
+
+        listener: typing.Optional[socket.socket] = self.bind()
+
+        if listener is None:
+            return 0
+
+        self._listener = listener
+
+        # Runs are never waited on, so they are reaped as soon as they finish
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        listener.settimeout(self.idle_timeout)
+
+        try:
+            while True:
+                try:
+                    connection, _ = listener.accept()
+                except socket.timeout:
+                    return 0
+
+                with connection:
+                    if not self.start_run(connection):
+                        return 0
+        finally:
+            self.stop_listening()
+
+    def stop_listening(self) -> None:
+        """
+        Stop accepting clients and remove the socket
+        """
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+
+    def start_run(self, connection: socket.socket) -> bool:
+        """
+        Fork a process that runs a client's request with the client's stdio, environment, and working directory
+
+        Args:
+            connection: The connection to the client
+
+        Returns:
+            False if the daemon should stop because its source changed
+        """
+        # Only the current user may connect, but a client that stalls shouldn't hold up everyone else
+        connection.settimeout(STARTUP_TIMEOUT)
+
+        try:
+            request, descriptors = read_request(connection)
+        except (OSError, ValueError) as error:
+            send_message(connection, {"error": str(error)})
+            return True
+
+        if request.get("identity") != self.identity:
+            for descriptor in descriptors:
+                os.close(descriptor)
+
+            send_message(connection, {"error": f"This daemon serves '{self.source}' rather than what was asked for"})
+            return True
+
+        if self.is_stale():
+            for descriptor in descriptors:
+                os.close(descriptor)
+
+            # Clients retrying right away must not reach this daemon again
+            self.stop_listening()
+            send_message(connection, {"restart": True})
+            return False
+
+        try:
+            process_id: int = os.fork()
+        except OSError as error:
+            send_message(connection, {"error": str(error)})
+            process_id = -1
+
+        if process_id == 0:
+            self.run_request(connection, request, descriptors)
+
+        for descriptor in descriptors:
+            os.close(descriptor)
+
+        return True
+
+    def run_request(self, connection: socket.socket, request: typing.Mapping[str, typing.Any], descriptors: typing.List[int]) -> typing.NoReturn:
+        """
+        Run a request within a forked process and report how it exited. Never returns
+
+        Args:
+            connection: The connection to the client
+            request: The arguments, environment, and working directory to run with
+            descriptors: The client's stdin, stdout, and stderr
+        """
+        import signal
+
+        exit_code: int = 1
+
+        try:
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+            if self._listener is not None:
+                self._listener.close()
+
+            connection.settimeout(None)
+            send_message(connection, {"pid": os.getpid()})
+
+            for target, descriptor in zip(FORWARDED_DESCRIPTORS, descriptors):
+                os.dup2(descriptor, target)
+                os.close(descriptor)
+
+            os.chdir(request["cwd"])
+            os.environ.clear()
+            os.environ.update(request["env"])
+            sys.argv = [self.parser.prog, *request["argv"]]
+
+            exit_code = dispatch(self.parser, request["argv"], self.handler_destination, self.workflow)
+        except BaseException as error:
+            sys.stderr.write(f"{self.parser.prog}: {type(error).__name__}: {error}\n")
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                send_message(connection, {"exit_code": exit_code})
+            finally:
+                os._exit(exit_code)
+
+
+def start_daemon(source: str, socket_path: str) -> socket.socket:
+    """
+    Start a daemon in the background and wait for it to begin listening
+
+    Args:
+        source: The 'package.module:attribute' reference to the parser
+        socket_path: Where the daemon should listen
+
+    Returns:
+        A connection to the daemon
+
+    Raises:
+        TimeoutError: If the daemon didn't begin listening in time
+    """
+    import time
+    import subprocess
+
+    command: typing.List[str] = [sys.executable, "-m", "argui", "serve", source, "--socket", socket_path]
+
+    if os.environ.get(IDLE_TIMEOUT_VARIABLE):
+        command.extend(["--idle-timeout", os.environ[IDLE_TIMEOUT_VARIABLE]])
+
+    daemon = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    deadline: float = time.monotonic() + STARTUP_TIMEOUT
+
+    while time.monotonic() < deadline:
+        # Another client may have started a daemon at the same time, and whichever listens first serves both
+        connection: typing.Optional[socket.socket] = connect(socket_path)
+
+        if connection is not None:
+            return connection
+
+        if daemon.poll() is not None and not os.path.exists(socket_path):
+            raise RuntimeError(f"The daemon for '{source}' stopped with code {daemon.returncode} before listening")
+
+        time.sleep(0.01)
+
+    raise TimeoutError(f"The daemon for '{source}' didn't begin listening within {STARTUP_TIMEOUT} seconds")
+
+
+def connect(socket_path: str) -> typing.Optional[socket.socket]:
+    """
+    Connect to a daemon if one is listening
+
+    Returns:
+        The connection, `None` if nothing is listening
+    """
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        connection.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        connection.close()
+        return None
+
+    return connection
+
+
+def request_run(connection: socket.socket, identity: str, arguments: typing.Sequence[str]) -> int:
+    """
+    Hand a run to a daemon and wait for it to finish
+
+    Interrupting the client interrupts the run
+
+    Args:
+        connection: The connection to the daemon
+        identity: What the daemon should have loaded, as described by `get_identity`
+        arguments: The arguments for the run
+
+    Returns:
+        The exit code of the run
+
+    Raises:
+        DaemonRestart: If the daemon stopped because its source changed
+    """
+    import signal
+
+    body: bytes = json.dumps({
+        "identity": identity,
+        "argv": list(arguments),
+        "env": dict(os.environ),
+        "cwd": os.getcwd()
+    }).encode("utf-8")
+    payload: bytes = len(body).to_bytes(8, "big") + body
+    sent: int = socket.send_fds(connection, [payload], list(FORWARDED_DESCRIPTORS))
+
+    if sent < len(payload):
+        connection.sendall(payload[sent:])
+
+    reader: typing.BinaryIO = connection.makefile("rb")
+    process_id: typing.Optional[int] = None
+
+    while True:
+        try:
+            line: bytes = reader.readline()
+        except KeyboardInterrupt:
+            if process_id is not None:
+                os.kill(process_id, signal.SIGINT)
+            continue
+
+        if not line:
+            raise ConnectionError("The daemon disconnected before the run finished")
+
+        message: typing.Dict[str, typing.Any] = json.loads(line)
+
+        if message.get("restart"):
+            raise DaemonRestart()
+
+        if "error" in message:
+            raise ConnectionError(message["error"])
+
+        if "pid" in message:
+            process_id = message["pid"]
+        elif "exit_code" in message:
+            return message["exit_code"]
+
+
+def run_client(source: str, arguments: typing.Sequence[str]) -> int:
+    """
+    Run a parser's handler through its daemon, starting the daemon if needed
+
+    Runs in this process instead if daemons aren't supported here
+
+    Args:
+        source: The 'package.module:attribute' reference to the parser
+        arguments: The arguments to run with
+
+    Returns:
+        The exit code of the run
+    """
+    if not hasattr(socket, "AF_UNIX") or not hasattr(socket, "send_fds"):
+        from argui.batch import load_parser
+        return dispatch(load_parser(source), arguments)
+
+    socket_path: str = get_socket_path(source)
+
+    # A second attempt covers a daemon that stopped for a changed source or while idle
+    for _ in range(2):
+        connection: typing.Optional[socket.socket] = connect(socket_path)
+
+        if connection is None:
+            connection = start_daemon(source, socket_path)
+
+        try:
+            with connection:
+                return request_run(connection, get_identity(source), arguments)
+        except DaemonRestart:
+            continue
+
+    raise ConnectionError(f"Unable to reach a daemon for '{source}'")
+
+
+def main(args: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """
+    Run the client
+
+    Args:
+        args: The reference to the parser followed by the arguments for the run. Defaults to the process's arguments
+
+    Returns:
+        The exit code of the run
+    """
+    args = list(sys.argv[1:] if args is None else args)
+
+    if not args or args[0] in ("-h", "--help"):
+        sys.stderr.write("usage: python -m argui.daemon package.module:build_parser [ARGUMENTS...]\n")
+        return 2
+
+    return run_client(args[0], args[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
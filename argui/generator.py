@@ -0,0 +1,491 @@
+"""
+Generates standalone entry point modules from workflows
+
+A generated module spells out the construction of its parser as plain `add_argument` calls and
+carries a serialized copy of its workflow. Launching it never inspects a parser: arguments on the
+command line are parsed by the parser it builds and interactive mode loads the serialized workflow
+rather than converting the parser's actions. Handlers are only imported once they are called.
+Custom action classes are written as the closest built-in action since workflows only record action names.
+"""
+from __future__ import annotations
+
+import enum
+import math
+import typing
+import keyword
+import pathlib
+import argparse
+import importlib
+
+from argui.model import Workflow
+from argui.model import WorkflowSpec
+from argui.model import FieldBehavior
+from argui.model import WorkflowBehavior
+from argui.model.field import SelectionBehavior
+from argui.model.field import WidgetIdAllocator
+from argui.model.workflow import HANDLER_DESTINATION
+from argui.model.workflow import is_literal
+from argui.utilities import actions
+from argui.utilities.common import resolve_name
+from argui.utilities.providers import ChoiceProvider
+
+MAXIMUM_LINE_LENGTH: typing.Final[int] = 110
+"""The longest that a generated call may be before its arguments are split onto their own lines"""
+
+SERIALIZED_CHUNK_SIZE: typing.Final[int] = 96
+"""The number of characters of the serialized workflow to write on each line of the generated module"""
+
+ENTRY_POINT_TEMPLATE: typing.Final[str] = '''"""
+Entry point for {prog}
+
+Generated by `python -m argui generate` - regenerate it rather than editing it by hand
+"""
+from __future__ import annotations
+
+import sys
+import typing
+import importlib
+{imports}
+from argui import ArgumentParser
+
+if typing.TYPE_CHECKING:
+    from argui.model import Workflow
+
+SERIALIZED_WORKFLOW: typing.Final[str] = (
+{serialized_workflow}
+)
+"""The workflow for the parser, serialized ahead of time so that it never has to be built from the parser"""
+
+
+class LazyHandler:
+    """Imports a handler when it is first called so that parsing never imports the modules that handle commands"""
+    __slots__ = ("module_name", "qualified_name")
+
+    def __init__(self, module_name: str, qualified_name: str):
+        self.module_name = module_name
+        self.qualified_name = qualified_name
+
+    def __call__(self, *args, **kwargs):
+        handler = importlib.import_module(self.module_name)
+
+        for attribute_name in self.qualified_name.split("."):
+            handler = getattr(handler, attribute_name)
+
+        return handler(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<{{self.__class__.__name__}}: {{self.module_name}}.{{self.qualified_name}}>"
+
+
+class GeneratedArgumentParser(ArgumentParser):
+    """A parser that loads its workflow from `SERIALIZED_WORKFLOW` instead of inspecting its own actions"""
+    def to_model(self) -> Workflow:
+        from argui.model import Workflow
+        return Workflow.from_json(SERIALIZED_WORKFLOW)
+
+
+def build_parser() -> GeneratedArgumentParser:
+    """
+    Build the parser for {prog}
+    """
+{parser_construction}
+    return parser
+
+
+def main(args: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """
+    Parse the command line and pass the parsed arguments to their handler
+    """
+    parser = build_parser()
+    parsed_arguments = parser.parse_args(args)
+    handler = getattr(parsed_arguments, "{handler_destination}", None)
+
+    if handler is None:
+        parser.print_help()
+        return 0
+
+    result = handler(parsed_arguments)
+    return result if isinstance(result, int) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+"""The layout of a generated entry point module"""
+
+
+def load_workflow(source: str) -> WorkflowBehavior:
+    """
+    Load the workflow to generate an entry point for
+
+    Args:
+        source: Either the path to a JSON workflow config or a 'package.module:attribute' reference to
+            a parser, a workflow, or a function without arguments that returns one of them
+
+    Returns:
+        The workflow described by the source
+    """
+    if source.lower().endswith(".json") or ":" not in source:
+        return Workflow.from_json(pathlib.Path(source).read_bytes())
+
+    module_name, _, attribute_path = source.partition(":")
+    loaded: typing.Any = importlib.import_module(module_name)
+
+    for attribute_name in attribute_path.split("."):
+        loaded = getattr(loaded, attribute_name)
+
+    if callable(loaded) and not isinstance(loaded, (argparse.ArgumentParser, WorkflowBehavior)):
+        loaded = loaded()
+
+    if isinstance(loaded, argparse.ArgumentParser):
+        return WorkflowSpec.from_parser(loaded)
+
+    if isinstance(loaded, WorkflowBehavior):
+        return loaded
+
+    raise TypeError(f"'{source}' does not refer to a parser or workflow - received {type(loaded).__name__}")
+
+
+class EntryPointGenerator:
+    """
+    Writes the source code of a module that builds the parser described by a workflow
+    """
+    def __init__(self, workflow: WorkflowBehavior, prog: typing.Optional[str] = None):
+        """
+        Args:
+            workflow: The workflow to generate an entry point for
+            prog: The name of the program. The name of the workflow is used if not given
+        """
+        self.workflow: WorkflowBehavior = workflow
+        self.prog: typing.Optional[str] = prog or workflow.name
+        self._imports: typing.Set[str] = set()
+        self._variables: WidgetIdAllocator = WidgetIdAllocator(prefix="parser")
+
+    @staticmethod
+    def get_import_path(value: typing.Any) -> typing.Tuple[str, str]:
+        """
+        Find where a class or function may be imported from
+
+        Args:
+            value: The class or function, or the name that it may be imported by
+
+        Returns:
+            The name of the module holding the value and the qualified name of the value within it
+        """
+        if isinstance(value, str):
+            try:
+                value = resolve_name(value)
+            except KeyError as error:
+                raise ValueError(f"'{value}' cannot be imported and may not be used in a generated entry point") from error
+
+        module_name: typing.Optional[str] = getattr(value, "__module__", None)
+        qualified_name: typing.Optional[str] = getattr(value, "__qualname__", None)
+
+        if not module_name or not qualified_name or "<" in qualified_name or module_name == "__main__":
+            raise ValueError(f"'{value}' cannot be imported by name and may not be used in a generated entry point")
+
+        return module_name, qualified_name
+
+    def reference(self, value: typing.Any) -> str:
+        """
+        Get the expression that refers to an importable class or function, recording the import it needs
+
+        Args:
+            value: The class or function, or the name that it may be imported by
+
+        Returns:
+            An expression that evaluates to the value within the generated module
+        """
+        module_name, qualified_name = self.get_import_path(value)
+
+        if module_name == "builtins":
+            return qualified_name
+
+        self._imports.add(module_name)
+        return f"{module_name}.{qualified_name}"
+
+    def reference_handler(self, handler: typing.Any) -> str:
+        """
+        Get the expression for a handler that is only imported once it is called
+
+        Args:
+            handler: The handler function, or the name that it may be imported by
+
+        Returns:
+            An expression that evaluates to a stand-in for the handler within the generated module
+        """
+        module_name, qualified_name = self.get_import_path(handler)
+        return f"LazyHandler({module_name!r}, {qualified_name!r})"
+
+    def render_value(self, value: typing.Any) -> str:
+        """
+        Get the expression that recreates a value within the generated module
+
+        Args:
+            value: The value to write
+
+        Returns:
+            Python source that evaluates to the value
+        """
+        if isinstance(value, float) and not math.isfinite(value):
+            return f"float({str(value)!r})"
+
+        if isinstance(value, enum.Enum):
+            return f"{self.reference(type(value))}.{value.name}"
+
+        if is_literal(value):
+            return repr(value)
+
+        if isinstance(value, pathlib.PurePath):
+            path_type: type = pathlib.Path if isinstance(value, pathlib.Path) else pathlib.PurePath
+            return f"{self.reference(path_type)}({str(value)!r})"
+
+        if isinstance(value, type) or callable(value):
+            return self.reference(value)
+
+        raise ValueError(f"'{value!r}' cannot be written as source code and may not be used in a generated entry point")
+
+    def render_call(
+        self,
+        function: str,
+        arguments: typing.Sequence[str] = (),
+        keywords: typing.Optional[typing.Mapping[str, str]] = None,
+        indent: str = "    "
+    ) -> typing.List[str]:
+        """
+        Write a call to a function, splitting its arguments across lines if it would be too long
+
+        Args:
+            function: The expression for the function to call
+            arguments: The source for each positional argument
+            keywords: The source for each keyword argument mapped to the name of the keyword
+            indent: The indentation of the call
+
+        Returns:
+            The lines of source code for the call
+        """
+        parameters: typing.List[str] = list(arguments)
+        extra_keywords: typing.Dict[str, str] = {}
+
+        for name, value in (keywords or {}).items():
+            if name.isidentifier() and not keyword.iskeyword(name):
+                parameters.append(f"{name}={value}")
+            else:
+                extra_keywords[name] = value
+
+        if extra_keywords:
+            parameters.append("**{" + ", ".join(f"{name!r}: {value}" for name, value in extra_keywords.items()) + "}")
+
+        single_line: str = f"{indent}{function}({', '.join(parameters)})"
+
+        if len(single_line) <= MAXIMUM_LINE_LENGTH:
+            return [single_line]
+
+        return [
+            f"{indent}{function}(",
+            ",\n".join(f"{indent}    {parameter}" for parameter in parameters),
+            f"{indent})"
+        ]
+
+    def get_argument_keywords(self, field: FieldBehavior) -> typing.Dict[str, str]:
+        """
+        Get the keyword arguments for the `add_argument` call that creates a field's action
+
+        Args:
+            field: The field to recreate
+
+        Returns:
+            The source for each keyword argument mapped to the name of the keyword
+        """
+        keywords: typing.Dict[str, str] = {}
+
+        if field.flags:
+            keywords["dest"] = repr(field.name)
+
+        if field.action == actions.BOOLEAN_OPTIONAL_ACTION:
+            keywords["action"] = self.reference(actions.BooleanOptionalAction)
+        elif field.action != "store":
+            keywords["action"] = repr(field.action)
+
+        if field.action in ("store", "append", "extend"):
+            if field.nargs is not None:
+                keywords["nargs"] = repr(field.nargs)
+            if field.const is not None:
+                keywords["const"] = self.render_value(field.const)
+            if field.type is not str and field.type != "str":
+                keywords["type"] = self.reference(field.type)
+            if isinstance(field, SelectionBehavior) and field.provider is not None:
+                keywords["choices"] = (
+                    f"{self.reference(ChoiceProvider)}({self.reference(field.provider.source)}, "
+                    f"ttl={field.provider.ttl!r}, first_batch_size={field.provider.first_batch_size!r})"
+                )
+                keywords.setdefault("metavar", repr(field.name.upper()))
+            elif isinstance(field, SelectionBehavior):
+                keywords["choices"] = self.render_value([option for _, option in field.labeled_options])
+        elif field.action in ("store_const", "append_const"):
+            keywords["const"] = self.render_value(field.const)
+
+        implied_default: typing.Any = {"store_true": False, "store_false": True}.get(field.action)
+
+        if field.default is not None and field.default != implied_default:
+            keywords["default"] = self.render_value(field.default)
+
+        if field.flags and field.required:
+            keywords["required"] = "True"
+
+        if field.help:
+            keywords["help"] = repr(field.help)
+
+        return keywords
+
+    def build_parser_lines(self, workflow: WorkflowBehavior, variable: str) -> typing.List[str]:
+        """
+        Write the statements that add a workflow's fields, defaults, and commands to an already created parser
+
+        Args:
+            workflow: The workflow whose parser is being built
+            variable: The name of the variable holding the parser
+
+        Returns:
+            The lines of source code that finish building the parser
+        """
+        lines: typing.List[str] = []
+        group_variables: typing.Dict[int, str] = {}
+
+        for group_index, group in enumerate(workflow.exclusive_groups):
+            group_variable: str = f"{variable}_group_{group_index}"
+            lines.extend(
+                self.render_call(
+                    f"{group_variable} = {variable}.add_mutually_exclusive_group",
+                    keywords={"required": "True"} if group.required else {}
+                )
+            )
+            group_variables.update((position, group_variable) for position in group.fields)
+
+        for position, field in enumerate(workflow.fields):
+            lines.extend(
+                self.render_call(
+                    f"{group_variables.get(position, variable)}.add_argument",
+                    # argparse adds the `--no-flag` options of a BooleanOptionalAction itself
+                    [repr(flag) for flag in field.flags if flag not in field.negative_flags] or [repr(field.name)],
+                    self.get_argument_keywords(field)
+                )
+            )
+
+        defaults: typing.Dict[str, str] = {
+            name: self.render_value(value)
+            for name, value in workflow.defaults.items()
+        }
+
+        if workflow.action:
+            defaults[HANDLER_DESTINATION] = self.reference_handler(workflow.action)
+
+        if defaults:
+            lines.extend(self.render_call(f"{variable}.set_defaults", keywords=defaults))
+
+        if not workflow.subworkflows:
+            return lines
+
+        commands_variable: str = f"{variable}_commands"
+        command_keywords: typing.Dict[str, str] = {"parser_class": "ArgumentParser"}
+
+        if workflow.command_destination:
+            command_keywords["dest"] = repr(workflow.command_destination)
+        if workflow.command_required:
+            command_keywords["required"] = "True"
+
+        lines.append("")
+        lines.extend(self.render_call(f"{commands_variable} = {variable}.add_subparsers", keywords=command_keywords))
+
+        for command_name, subworkflow in workflow.subworkflows.items():
+            subworkflow_variable: str = self._variables.allocate(command_name)
+            subparser_keywords: typing.Dict[str, str] = {
+                name: repr(value)
+                for name, value in (
+                    ("help", subworkflow.help),
+                    ("description", subworkflow.description),
+                    ("epilog", subworkflow.epilog),
+                )
+                if value
+            }
+            aliases: typing.List[str] = workflow.subworkflows.get_aliases(command_name)
+
+            if aliases:
+                subparser_keywords["aliases"] = repr(aliases)
+
+            lines.append("")
+            lines.extend(
+                self.render_call(
+                    f"{subworkflow_variable} = {commands_variable}.add_parser",
+                    [repr(command_name)],
+                    subparser_keywords
+                )
+            )
+            lines.extend(self.build_parser_lines(subworkflow, subworkflow_variable))
+
+        return lines
+
+    def serialize_workflow(self) -> str:
+        """
+        Write the serialized workflow as a series of string literals that python joins back together
+
+        Returns:
+            The lines of source code holding the serialized workflow
+        """
+        workflow: Workflow = self.workflow.to_model().materialize_all()
+
+        if self.prog and self.prog != workflow.name:
+            workflow = workflow.model_copy(update={"name": self.prog})
+
+        serialized_workflow: str = workflow.dump_json_lazily()
+
+        return "\n".join(
+            f"    {serialized_workflow[start:start + SERIALIZED_CHUNK_SIZE]!r}"
+            for start in range(0, len(serialized_workflow), SERIALIZED_CHUNK_SIZE)
+        ) or "    ''"
+
+    def generate(self) -> str:
+        """
+        Write the entry point module
+
+        Returns:
+            The source code of the module
+        """
+        self._imports.clear()
+        self._variables = WidgetIdAllocator(prefix="parser")
+
+        root_keywords: typing.Dict[str, str] = {
+            name: repr(value)
+            for name, value in (
+                ("prog", self.prog),
+                ("description", self.workflow.description),
+                ("epilog", self.workflow.epilog),
+            )
+            if value
+        }
+
+        parser_lines: typing.List[str] = self.render_call("parser = GeneratedArgumentParser", keywords=root_keywords)
+        parser_lines.extend(self.build_parser_lines(self.workflow, "parser"))
+        serialized_workflow: str = self.serialize_workflow()
+
+        return ENTRY_POINT_TEMPLATE.format(
+            prog=(self.prog or "an ArgUI application").replace('"""', "'''"),
+            imports="".join(f"import {module_name}\n" for module_name in sorted(self._imports)),
+            serialized_workflow=serialized_workflow,
+            parser_construction="\n".join(parser_lines),
+            handler_destination=HANDLER_DESTINATION,
+        )
+
+
+def generate_entry_point(workflow: WorkflowBehavior, prog: typing.Optional[str] = None) -> str:
+    """
+    Write the source code of a standalone module that builds the parser for a workflow
+
+    Args:
+        workflow: The workflow to generate an entry point for
+        prog: The name of the program. The name of the workflow is used if not given
+
+    Returns:
+        The source code of the entry point module
+    """
+    return EntryPointGenerator(workflow, prog=prog).generate()
@@ -0,0 +1,6 @@
+"""
+Defines the terminal user interface used to enter values for a workflow
+"""
+from .application import WorkflowApplication
+from .application import WorkflowScreen
+from .application import run_workflow
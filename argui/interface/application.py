@@ -0,0 +1,857 @@
+"""
+Defines the textual application that collects the values for a workflow and turns them into CLI arguments
+"""
+from __future__ import annotations
+
+import typing
+
+from textual import widgets
+from textual.app import App
+from textual.app import ComposeResult
+from textual.screen import Screen
+from textual.timer import Timer
+from textual.widget import Widget
+from textual.containers import Horizontal
+
+from argui.model import FieldBehavior
+from argui.model import WorkflowBehavior
+from argui.model.field import sanitize_name
+from argui.model.values import FieldValues
+from argui.model.constraints import ConstraintGraph
+from argui.model.constraints import ConstraintState
+from argui.model.history import HistoryIndex
+from argui.model.history import HistoryStore
+from argui.model.diff import WorkflowDiff
+from argui.model.diff import diff_workflows
+from argui.model.diff import get_field_keys
+from argui.model.diff import graft_unchanged
+from argui.utilities import tracing
+from argui.utilities.conversion import ConversionPool
+from argui.reload import ParserReloader
+from argui.reload import RELOAD_INTERVAL
+
+from .fields import VirtualFieldList
+from .screens import ScreenCache
+from .items import ItemListEditor
+from .search import SearchableSelect
+from .history import RecallScreen
+
+WorkflowPath = typing.Tuple[str, ...]
+"""The names of the commands that lead from the root workflow to a subworkflow"""
+
+ArgumentValidator = typing.Callable[[typing.List[str]], typing.Optional[str]]
+"""A function that returns a description of what is wrong with a set of CLI arguments, if anything"""
+
+VALIDATION_DELAY: typing.Final[float] = 0.15
+"""How many seconds to wait after the last edit before checking the workflow's constraints again"""
+
+
+def get_widget_value(widget: Widget) -> typing.Any:
+    """
+    Read the value that was entered into an input widget
+
+    Args:
+        widget: The widget that a value was entered into
+
+    Returns:
+        The value of the widget, `None` if nothing has been entered
+    """
+    if isinstance(widget, widgets.SelectionList):
+        return list(widget.selected)
+
+    if isinstance(widget, widgets.Select):
+        return None if widget.is_blank() else widget.value
+
+    return getattr(widget, "value", None)
+
+
+def shows_default(field: FieldBehavior, value: typing.Any) -> bool:
+    """
+    Determine if a widget's value is just the default of its field, as it will be when the widget is first mounted
+
+    Args:
+        field: The field that the widget belongs to
+        value: The value read from the widget
+
+    Returns:
+        True if the value only reflects the default of the field
+    """
+    if field.default is None:
+        return value is None or value == "" or value == []
+
+    return value == field.default or value == str(field.default)
+
+
+class WorkflowScreen(Screen):
+    """Displays the fields for a single workflow along with the commands that may be run from it"""
+    BINDINGS = [
+        ("ctrl+r", "recall", "Previous values"),
+    ]
+
+    def __init__(self, workflow: WorkflowBehavior, path: WorkflowPath = ()):
+        super().__init__()
+        self.workflow: WorkflowBehavior = workflow
+        self.path: WorkflowPath = path
+        self.index_fields()
+        self._pending_validation: typing.Set[str] = set()
+        self._validation_timer: typing.Optional[Timer] = None
+        self._ancestors_satisfied: bool = True
+        self._mount_span = tracing.span("mount", screen=" ".join(path) or workflow.name)
+
+    def index_fields(self) -> None:
+        """
+        Look up the workflow's fields by the ids of their widgets and by their names
+        """
+        self._fields_by_input_id: typing.Dict[str, FieldBehavior] = {
+            field.input_id: field
+            for field in self.workflow.fields
+        }
+        self._fields_by_name: typing.Dict[str, FieldBehavior] = {
+            field.name: field
+            for field in self.workflow.fields
+        }
+        self._fields_by_widget_id: typing.Dict[str, FieldBehavior] = {
+            field.widget_id: field
+            for field in self.workflow.fields
+        }
+
+    @property
+    def values(self) -> FieldValues:
+        """
+        The values entered for the workflow's fields, including those whose widgets are not mounted
+        """
+        return self.app.get_values(self.path)
+
+    @property
+    def constraints(self) -> ConstraintState:
+        """
+        Which of the workflow's constraints are broken by the values entered so far
+        """
+        return self.app.get_constraints(self.path)
+
+    def compose(self) -> ComposeResult:
+        self._mount_span.begin()
+        yield widgets.Header()
+
+        if self.workflow.description:
+            yield widgets.Static(self.workflow.description.strip(), classes="description")
+
+        yield VirtualFieldList(self.workflow.fields, self.values, id="fields")
+
+        if self.workflow.subworkflows:
+            yield self.build_commands()
+
+        with Horizontal(id="controls"):
+            yield widgets.Button("Submit", id="submit", variant="primary")
+            if self.path:
+                yield widgets.Button("Back", id="back")
+            yield widgets.Button("Quit", id="quit", variant="error")
+
+        yield widgets.Footer()
+
+    def build_commands(self) -> Horizontal:
+        """
+        Build the row of buttons that lead to the workflow's subworkflows
+        """
+        return Horizontal(
+            *(
+                widgets.Button(
+                    command_name,
+                    name=command_name,
+                    id=f"command_{sanitize_name(command_name)}",
+                    classes="command"
+                )
+                for command_name in self.workflow.subworkflows
+            ),
+            id="commands"
+        )
+
+    def on_mount(self) -> None:
+        self.sub_title = " ".join(self.path)
+        self.check_ancestors()
+        self.refresh_submit()
+        self._mount_span.finish()
+
+    def on_screen_resume(self) -> None:
+        # Cached screens are shown again without being mounted again, so whatever changed meanwhile is checked here
+        if self.is_mounted:
+            self.check_ancestors()
+            self.refresh_submit()
+
+    def on_screen_suspend(self) -> None:
+        self.app.screen_cache.release(self)
+
+    def check_ancestors(self) -> None:
+        """
+        Check the values entered along the path to this screen
+
+        Values leading to this screen can't be changed from it, so they are only checked when the screen
+        is mounted or its workflows are reloaded
+        """
+        self._ancestors_satisfied = all(
+            self.app.get_constraints(self.path[:depth]).is_satisfied(command_chosen=True)
+            and not self.app.get_conversion_problems(self.path[:depth])
+            for depth in range(len(self.path))
+        )
+
+    async def replace_workflow(self, workflow: WorkflowBehavior, diff: typing.Optional[WorkflowDiff] = None) -> None:
+        """
+        Show a new version of the workflow, only touching the widgets for what changed
+
+        Args:
+            workflow: The new version of the workflow
+            diff: What changed within the workflow itself. Only references are updated if nothing did
+        """
+        self.workflow = workflow
+        self.index_fields()
+        self._pending_validation.intersection_update(self._fields_by_name)
+
+        if diff is not None and diff.attributes_changed:
+            await self.replace_description()
+
+        if diff is not None and diff.fields_changed:
+            fields_by_key: typing.Dict[str, FieldBehavior] = dict(zip(get_field_keys(workflow.fields), workflow.fields))
+            stale_widget_ids: typing.Set[str] = {
+                fields_by_key[key].widget_id
+                for key in diff.added_fields + diff.changed_fields
+            }
+            await self.query_one(VirtualFieldList).replace_fields(workflow.fields, stale_widget_ids)
+
+            for key in diff.changed_fields:
+                self.check_conversion(fields_by_key[key])
+
+        if diff is not None and diff.commands_changed:
+            for commands in self.query("#commands"):
+                await commands.remove()
+
+            if workflow.subworkflows:
+                await self.mount(self.build_commands(), before=self.query_one("#controls"))
+
+        self.check_ancestors()
+        self.refresh_submit()
+
+    async def replace_description(self) -> None:
+        """
+        Show the workflow's current description in place of the one it had
+        """
+        for description in self.query(".description"):
+            await description.remove()
+
+        if self.workflow.description:
+            await self.mount(
+                widgets.Static(self.workflow.description.strip(), classes="description"),
+                before=self.query_one(VirtualFieldList)
+            )
+
+    def schedule_validation(self, field_name: str) -> None:
+        """
+        Check the constraints that depend on a field once editing pauses
+
+        Args:
+            field_name: The name of the field whose value changed
+        """
+        self._pending_validation.add(field_name)
+
+        if self._validation_timer is None:
+            self._validation_timer = self.set_timer(VALIDATION_DELAY, self.validate_pending)
+        else:
+            self._validation_timer.reset()
+
+    def validate_pending(self) -> None:
+        """
+        Check the constraints that depend on every field edited since the last check
+        """
+        if self._validation_timer is not None:
+            self._validation_timer.stop()
+            self._validation_timer = None
+
+        constraints: ConstraintState = self.constraints
+
+        with tracing.span("validation", fields=len(self._pending_validation)):
+            for field_name in self._pending_validation:
+                constraints.update(field_name, self.values.get(field_name))
+                self.check_conversion(self._fields_by_name[field_name])
+
+        self._pending_validation.clear()
+        self.refresh_submit()
+
+    def refresh_submit(self) -> None:
+        """
+        Mark the submit button as incomplete if the constraints along the path to this screen aren't satisfied
+        or an entered value can't be converted
+        """
+        is_complete: bool = (
+            self._ancestors_satisfied
+            and self.constraints.is_satisfied()
+            and not self.app.get_conversion_problems(self.path)
+        )
+        self.query_one("#submit", widgets.Button).set_class(not is_complete, "incomplete")
+
+    def check_conversion(self, field: FieldBehavior) -> None:
+        """
+        Check that the value entered for a field converts through its type, on a worker so the screen stays responsive
+
+        Any check still running for the field's previous value is cancelled
+
+        Args:
+            field: The field whose value changed
+        """
+        conversion: typing.Optional[typing.Callable[[str], typing.Any]] = field.conversion
+
+        if conversion is None:
+            return
+
+        group: str = f"conversion_{field.widget_id}"
+        self.app.workers.cancel_group(self, group)
+
+        value: typing.Any = self.values.get(field.name)
+
+        if value is None or value == "" or value == []:
+            self.record_conversion(field, None)
+            return
+
+        was_checked, problem = self.app.conversions.get_cached((self.path, field.name), value)
+
+        if was_checked:
+            self.record_conversion(field, problem)
+            return
+
+        self.query_one(VirtualFieldList).set_row_state(field.name, "pending")
+        self.run_worker(self.convert_value(field, conversion, value), group=group, exclusive=True)
+
+    async def convert_value(self, field: FieldBehavior, conversion: typing.Callable[[str], typing.Any], value: typing.Any):
+        """
+        Convert a field's value on one of the application's pools and mark the field with the outcome
+
+        Args:
+            field: The field that the value was entered for
+            conversion: The field's type
+            value: The value to convert
+        """
+        try:
+            problem: typing.Optional[str] = await self.app.conversions.check((self.path, field.name), conversion, value)
+        except Exception:
+            # The parser will still convert the value once submitted, so a failed check only goes unreported here
+            problem = None
+
+        if self.values.get(field.name) == value:
+            self.record_conversion(field, problem)
+
+    def record_conversion(self, field: FieldBehavior, problem: typing.Optional[str]) -> None:
+        """
+        Mark a field with whatever was wrong with its value
+
+        Args:
+            field: The field whose value was checked
+            problem: What went wrong when converting the value, `None` if nothing did
+        """
+        problems: typing.Dict[str, str] = self.app.get_conversion_problems(self.path)
+
+        if problem is None:
+            problems.pop(field.name, None)
+        else:
+            problems[field.name] = problem
+
+        self.query_one(VirtualFieldList).set_row_state(field.name, "invalid" if problem else None, problem)
+        self.refresh_submit()
+
+    def record_value(self, widget: Widget) -> None:
+        """
+        Store the value of an input widget if it belongs to one of the workflow's fields
+
+        Args:
+            widget: The widget whose value changed
+        """
+        field: typing.Optional[FieldBehavior] = self._fields_by_input_id.get(widget.id)
+
+        if field is None:
+            return
+
+        value: typing.Any = get_widget_value(widget)
+
+        # Widgets announce their initial values when mounted - those shouldn't count as entered values
+        if field.name in self.values or not shows_default(field, value):
+            self.values.set(field.name, value)
+            self.schedule_validation(field.name)
+
+    def on_input_changed(self, event: widgets.Input.Changed) -> None:
+        self.record_value(event.input)
+
+    def on_switch_changed(self, event: widgets.Switch.Changed) -> None:
+        self.record_value(event.switch)
+
+    def on_select_changed(self, event: widgets.Select.Changed) -> None:
+        self.record_value(event.select)
+
+    def on_selection_list_selected_changed(self, event: widgets.SelectionList.SelectedChanged) -> None:
+        self.record_value(event.selection_list)
+
+    def on_searchable_select_changed(self, event: SearchableSelect.Changed) -> None:
+        self.record_value(event.searchable_select)
+
+    def on_item_list_editor_changed(self, event: ItemListEditor.Changed) -> None:
+        self.record_value(event.item_list_editor)
+        field: typing.Optional[FieldBehavior] = self._fields_by_input_id.get(event.item_list_editor.id)
+
+        # Items are checked by the editor as they are added, so whatever is wrong with them is recorded as it is
+        if field is not None:
+            self.record_conversion(field, event.item_list_editor.problem)
+
+    def get_focused_field(self) -> typing.Optional[FieldBehavior]:
+        """
+        Find the field whose row holds the focused widget
+
+        Returns:
+            The field being edited, `None` if focus is elsewhere
+        """
+        node = self.focused
+
+        while node is not None and node is not self:
+            field: typing.Optional[FieldBehavior] = self._fields_by_widget_id.get(node.id or "")
+
+            if field is not None:
+                return field
+
+            node = node.parent
+
+        return None
+
+    def action_recall(self) -> None:
+        """
+        Search the values previously submitted for the focused field
+        """
+        field: typing.Optional[FieldBehavior] = self.get_focused_field()
+
+        if field is None or not self.app.history.enabled:
+            return
+
+        self.app.push_screen(
+            RecallScreen(self.app.load_history_index, self.path, field.name),
+            lambda value: self.recall_value(field, value)
+        )
+
+    async def recall_value(self, field: FieldBehavior, value: typing.Any) -> None:
+        """
+        Enter a value recalled from the history into a field
+
+        Args:
+            field: The field to enter the value into
+            value: The recalled value, `None` if nothing was chosen
+        """
+        if value is None:
+            return
+
+        self.values.set(field.name, value)
+        self.schedule_validation(field.name)
+        await self.query_one(VirtualFieldList).rebuild_row(field.name)
+
+    def on_button_pressed(self, event: widgets.Button.Pressed) -> None:
+        if event.button.id == "quit":
+            self.app.exit(None)
+        elif event.button.id == "back":
+            self.app.pop_screen()
+        elif event.button.id == "submit":
+            self.validate_pending()
+            self.app.submit(self.path)
+        elif event.button.name in self.workflow.subworkflows:
+            self.app.open_workflow(self.path + (event.button.name,))
+
+
+class WorkflowApplication(App[typing.Optional[typing.List[str]]]):
+    """
+    A TUI that walks through a workflow and its subworkflows
+
+    Exits with the CLI arguments that describe the submitted values or `None` if the user quit
+    """
+    CSS = """
+    .description {
+        padding: 1 2;
+    }
+
+    .field {
+        padding: 0 2;
+    }
+
+    #commands, #controls {
+        height: auto;
+        padding: 0 2;
+    }
+
+    #submit.incomplete {
+        text-style: dim;
+    }
+    """
+
+    def __init__(
+        self,
+        workflow: WorkflowBehavior,
+        validator: typing.Optional[ArgumentValidator] = None,
+        history: typing.Optional[HistoryStore] = None,
+        reloader: typing.Optional[ParserReloader] = None
+    ):
+        """
+        Args:
+            workflow: The workflow to show
+            validator: A function that describes what is wrong with the submitted arguments, if anything
+            history: Where submitted values are remembered and prefilled from. Nothing is remembered if `None`
+            reloader: Rebuilds the workflow when its parser's files change, so that the screens may be patched
+        """
+        super().__init__()
+        self.workflow: WorkflowBehavior = workflow
+        self.validator: typing.Optional[ArgumentValidator] = validator
+        self.history: HistoryStore = history or HistoryStore(None)
+        self._history_index: typing.Optional[HistoryIndex] = None
+        self.values: typing.Dict[WorkflowPath, FieldValues] = {}
+        self.constraints: typing.Dict[WorkflowPath, ConstraintState] = {}
+        self._constraint_graphs: typing.Dict[WorkflowPath, ConstraintGraph] = {}
+        self.conversion_problems: typing.Dict[WorkflowPath, typing.Dict[str, str]] = {}
+        self.conversions: ConversionPool = ConversionPool()
+        self.reloader: typing.Optional[ParserReloader] = reloader
+        self.screen_cache: ScreenCache = ScreenCache(self)
+        self.title = workflow.name or "ArgUI"
+
+    def on_mount(self) -> None:
+        self.push_screen(WorkflowScreen(self.workflow))
+
+        if self.reloader is not None:
+            self.set_interval(RELOAD_INTERVAL, self.check_for_changes)
+
+    def open_workflow(self, path: WorkflowPath) -> None:
+        """
+        Show the screen for a subworkflow, reusing the one that was left earlier if it is still cached
+
+        Args:
+            path: The commands leading to the subworkflow
+        """
+        screen: typing.Optional[Screen] = self.screen_cache.get(path)
+
+        if screen is None:
+            screen = WorkflowScreen(self.get_workflow(path), path)
+            self.screen_cache.add(path, screen)
+
+        self.push_screen(screen)
+
+    def check_for_changes(self) -> None:
+        """
+        Reload the parser on a worker if its files changed
+        """
+        self.run_worker(self.reload_parser(), group="reload", exclusive=True)
+
+    async def reload_parser(self) -> None:
+        """
+        Load the new version of the parser off of the screen's thread, then patch the screens to match it
+        """
+        try:
+            workflow: typing.Optional[WorkflowBehavior] = await self.conversions.run(self.reloader.poll)
+        except Exception as error:
+            self.notify(f"{type(error).__name__}: {error}", title="Unable to reload", severity="error")
+            return
+
+        if workflow is None:
+            return
+
+        diff: WorkflowDiff = await self.replace_workflow(workflow)
+
+        if not diff.is_empty:
+            self.notify(diff.describe(), title="Reloaded")
+
+    def has_workflow(self, path: WorkflowPath) -> bool:
+        """
+        Whether a path of commands still leads to a workflow
+        """
+        workflow: WorkflowBehavior = self.workflow
+
+        for command_name in path:
+            if command_name not in workflow.subworkflows:
+                return False
+
+            workflow = workflow.subworkflows[command_name]
+
+        return True
+
+    async def replace_workflow(self, workflow: WorkflowBehavior) -> WorkflowDiff:
+        """
+        Switch to a new version of the workflow, patching only the screens and state for what changed
+
+        Values entered for fields that still exist are kept, as is every screen whose command still exists
+
+        Args:
+            workflow: The new version of the workflow
+
+        Returns:
+            What changed
+        """
+        diff: WorkflowDiff = diff_workflows(self.workflow, workflow)
+
+        if diff.is_empty:
+            return diff
+
+        self.workflow = graft_unchanged(self.workflow, workflow, diff)
+        self.title = self.workflow.name or "ArgUI"
+        changes: typing.Dict[WorkflowPath, WorkflowDiff] = {
+            change.path: change
+            for change in diff.walk()
+            if change.is_local_change
+        }
+
+        for path in set(self.values) | set(self.constraints) | set(self._constraint_graphs) | set(self.conversion_problems):
+            if not self.has_workflow(path):
+                self.forget_state(path)
+            elif path in changes and changes[path].fields_changed:
+                self.prune_state(path, changes[path])
+
+        while any(
+            isinstance(screen, WorkflowScreen) and not self.has_workflow(screen.path)
+            for screen in self.screen_stack
+        ):
+            await self.pop_screen()
+
+        for path, screen in self.screen_cache.items():
+            if not self.has_workflow(path):
+                self.screen_cache.discard(path)
+
+        shown_screens: typing.List[Screen] = list(self.screen_stack)
+        cached_screens: typing.List[Screen] = [
+            screen
+            for path, screen in self.screen_cache.items()
+            if screen not in shown_screens and screen.is_mounted
+        ]
+
+        for screen in shown_screens + cached_screens:
+            if isinstance(screen, WorkflowScreen):
+                current_workflow: WorkflowBehavior = self.get_workflow(screen.path)
+
+                if current_workflow is not screen.workflow:
+                    await screen.replace_workflow(current_workflow, changes.get(screen.path))
+
+        return diff
+
+    def forget_state(self, path: WorkflowPath) -> None:
+        """
+        Forget everything about the workflow at the end of a path of commands
+        """
+        for state in (self.values, self.constraints, self._constraint_graphs, self.conversion_problems):
+            state.pop(path, None)
+
+    def prune_state(self, path: WorkflowPath, diff: WorkflowDiff) -> None:
+        """
+        Forget the values of fields that no longer exist and anything derived from the workflow's old fields
+
+        Args:
+            path: The commands leading to a workflow whose fields changed
+            diff: What changed within the workflow
+        """
+        fields: typing.Sequence[FieldBehavior] = self.get_workflow(path).fields
+        field_names: typing.Set[str] = {field.name for field in fields}
+        fields_by_key: typing.Dict[str, FieldBehavior] = dict(zip(get_field_keys(fields), fields))
+        changed_names: typing.Set[str] = {fields_by_key[key].name for key in diff.changed_fields}
+
+        self.constraints.pop(path, None)
+        self._constraint_graphs.pop(path, None)
+        self.conversions.forget({(path, field_name) for field_name in changed_names})
+
+        problems: typing.Dict[str, str] = self.get_conversion_problems(path)
+
+        for field_name in [field_name for field_name in problems if field_name not in field_names or field_name in changed_names]:
+            del problems[field_name]
+
+        if path in self.values:
+            for field_name in [field_name for field_name in self.values[path] if field_name not in field_names]:
+                self.values[path].set(field_name, None)
+
+    def on_unmount(self) -> None:
+        self.conversions.shutdown()
+
+    def get_values(self, path: WorkflowPath) -> FieldValues:
+        """
+        Get the values entered for the workflow at the end of a path of commands
+
+        Args:
+            path: The commands leading to the workflow
+
+        Returns:
+            The values entered for the workflow's fields, starting with those submitted for it last time
+        """
+        if path not in self.values:
+            workflow: WorkflowBehavior = self.get_workflow(path)
+            field_names: typing.Set[str] = {field.name for field in workflow.fields}
+            previous_values: typing.Dict[str, typing.Any] = self.history.latest(path) or {}
+
+            self.values[path] = FieldValues({
+                field_name: value
+                for field_name, value in previous_values.items()
+                if field_name in field_names
+            })
+
+        return self.values[path]
+
+    def load_history_index(self) -> HistoryIndex:
+        """
+        Get the index over every remembered submission, reading the history the first time
+
+        Returns:
+            The past values of every field
+        """
+        if self._history_index is None:
+            self._history_index = self.history.load_index()
+
+        return self._history_index
+
+    def record_history(self, path: WorkflowPath) -> None:
+        """
+        Remember the values submitted along a path of workflows
+
+        Args:
+            path: The commands leading to the workflow that was submitted
+        """
+        self.history.append(path, [self.get_values(path[:depth]).as_dict() for depth in range(len(path) + 1)])
+
+    def get_workflow(self, path: WorkflowPath) -> WorkflowBehavior:
+        """
+        Get the workflow at the end of a path of commands
+
+        Args:
+            path: The commands leading to the workflow
+
+        Returns:
+            The workflow that the last command leads to
+        """
+        workflow: WorkflowBehavior = self.workflow
+
+        for command_name in path:
+            workflow = workflow.subworkflows[command_name]
+
+        return workflow
+
+    def get_constraints(self, path: WorkflowPath) -> ConstraintState:
+        """
+        Get the state of the constraints for the workflow at the end of a path of commands
+
+        The constraint graph for each workflow is only built once
+
+        Args:
+            path: The commands leading to the workflow
+
+        Returns:
+            Which of the workflow's constraints are broken by the values entered for it
+        """
+        if path not in self.constraints:
+            if path not in self._constraint_graphs:
+                self._constraint_graphs[path] = ConstraintGraph(self.get_workflow(path))
+
+            self.constraints[path] = ConstraintState(self._constraint_graphs[path], self.get_values(path))
+
+        return self.constraints[path]
+
+    def get_conversion_problems(self, path: WorkflowPath) -> typing.Dict[str, str]:
+        """
+        Get what went wrong when converting the values entered for the workflow at the end of a path of commands
+
+        Args:
+            path: The commands leading to the workflow
+
+        Returns:
+            A description of each value that couldn't be converted, mapped to the name of its field
+        """
+        return self.conversion_problems.setdefault(path, {})
+
+    def describe_problems(self, path: WorkflowPath) -> typing.List[str]:
+        """
+        Describe every constraint broken along a path of workflows
+
+        Args:
+            path: The commands leading to the workflow that is being submitted
+
+        Returns:
+            A description of each broken constraint
+        """
+        problems: typing.List[str] = []
+
+        for depth in range(len(path) + 1):
+            problems.extend(self.get_constraints(path[:depth]).describe_problems(command_chosen=depth < len(path)))
+            problems.extend(self.get_conversion_problems(path[:depth]).values())
+
+        return problems
+
+    def build_arguments(self, path: WorkflowPath) -> typing.List[str]:
+        """
+        Build the CLI arguments that represent the values entered along a path of workflows
+
+        Args:
+            path: The commands leading to the workflow that is being submitted
+
+        Returns:
+            The arguments to pass to `parse_args`
+        """
+        arguments: typing.List[str] = []
+        workflow: WorkflowBehavior = self.workflow
+
+        for depth, command_name in enumerate(path):
+            arguments.extend(workflow.to_arguments(self.get_values(path[:depth])))
+            arguments.append(command_name)
+            workflow = workflow.subworkflows[command_name]
+
+        arguments.extend(workflow.to_arguments(self.get_values(path)))
+        return arguments
+
+    def submit(self, path: WorkflowPath) -> None:
+        """
+        Exit with the arguments for a workflow if they are valid, announce the problem otherwise
+
+        Broken constraints are announced right away. Arguments that satisfy them are checked by the
+        validator on a worker so that slow types don't freeze the screen
+
+        Args:
+            path: The commands leading to the workflow that is being submitted
+        """
+        problems: typing.List[str] = self.describe_problems(path)
+
+        if problems:
+            self.notify("\n".join(problems), title="Incomplete input", severity="error")
+            return
+
+        arguments: typing.List[str] = self.build_arguments(path)
+
+        if self.validator is None:
+            self.record_history(path)
+            self.exit(arguments)
+        else:
+            self.run_worker(self.validate_submission(path, arguments), group="submission", exclusive=True)
+
+    async def validate_submission(self, path: WorkflowPath, arguments: typing.List[str]) -> None:
+        """
+        Check submitted arguments on a worker thread, since parsing them runs every field's type, and exit
+        with them if they are valid
+
+        Args:
+            path: The commands leading to the workflow that was submitted
+            arguments: The arguments that were submitted
+        """
+        problem: typing.Optional[str] = await self.conversions.run(self.validator, arguments)
+
+        if problem:
+            self.notify(problem, title="Invalid input", severity="error")
+        else:
+            self.record_history(path)
+            self.exit(arguments)
+
+
+def run_workflow(
+    workflow: WorkflowBehavior,
+    validator: typing.Optional[ArgumentValidator] = None,
+    history: typing.Optional[HistoryStore] = None,
+    reloader: typing.Optional[ParserReloader] = None
+) -> typing.Optional[typing.List[str]]:
+    """
+    Launch the TUI for a workflow and wait for it to be submitted
+
+    Args:
+        workflow: The workflow to show
+        validator: A function that describes what is wrong with the submitted arguments, if anything
+        history: Where submitted values are remembered and prefilled from
+        reloader: Rebuilds the workflow when its parser's files change
+
+    Returns:
+        The CLI arguments that describe the submitted values, `None` if the user quit
+    """
+    return WorkflowApplication(workflow, validator=validator, history=history, reloader=reloader).run()
@@ -0,0 +1,374 @@
+"""
+Defines a scrolling list of fields that only mounts the widgets for fields in or near the viewport
+
+Workflows may have hundreds of fields. Rather than mounting a container, label, and input for
+every one of them, each field is given a fixed height and only the rows within the viewport
+(plus a few on either side) are mounted. Spacers above and below the mounted rows stand in for
+everything else so that the scrollbar still reflects the full list.
+
+Rows that leave the window are hidden and parked rather than removed, so scrolling back to them
+doesn't rebuild them. Only the least recently parked rows beyond a fixed pool size are removed.
+"""
+from __future__ import annotations
+
+import typing
+import collections
+
+from textual.widget import Widget
+from textual.containers import VerticalScroll
+
+from argui.model import FieldBehavior
+from argui.model.values import FieldValues
+
+FIELD_ROW_HEIGHT: typing.Final[int] = 5
+"""The number of lines given to every field - a label followed by an input"""
+
+DEFAULT_OVERSCAN: typing.Final[int] = 4
+"""The number of rows to keep mounted beyond either edge of the viewport so that scrolling doesn't show gaps"""
+
+ROW_STATES: typing.Final[typing.Tuple[str, ...]] = ("pending", "invalid")
+"""The classes that may mark a row, such as while its value is being checked or once it has been rejected"""
+
+ROW_POOL_SIZE: typing.Final[int] = 32
+"""The number of rows kept hidden after leaving the window so that scrolling back to them doesn't rebuild them"""
+
+RowState = typing.Tuple[str, typing.Optional[str]]
+"""One of the `ROW_STATES` along with the message to show for it"""
+
+
+class FieldSpacer(Widget):
+    """Takes up the space of rows that are not mounted"""
+    DEFAULT_CSS = """
+    FieldSpacer {
+        height: 0;
+    }
+    """
+
+
+class VirtualFieldList(VerticalScroll):
+    """
+    A scrolling list of fields that only mounts the rows that may be seen
+
+    Values entered into a row are kept in a `FieldValues` instance, so a row that is scrolled away
+    and back is rebuilt with whatever had been entered into it if it was dropped from the pool of parked rows
+    """
+    DEFAULT_CSS = f"""
+    VirtualFieldList > .field {{
+        height: {FIELD_ROW_HEIGHT};
+        overflow: hidden;
+    }}
+
+    VirtualFieldList > .field SelectionList {{
+        height: {FIELD_ROW_HEIGHT - 1};
+    }}
+
+    VirtualFieldList > .field.pending {{
+        border-left: thick $warning;
+    }}
+
+    VirtualFieldList > .field.invalid {{
+        border-left: thick $error;
+    }}
+    """
+
+    def __init__(
+        self,
+        fields: typing.Sequence[FieldBehavior],
+        values: FieldValues,
+        overscan: int = DEFAULT_OVERSCAN,
+        pool_size: int = ROW_POOL_SIZE,
+        **kwargs
+    ):
+        """
+        Args:
+            fields: The fields to show
+            values: The values that have been entered for the fields
+            overscan: The number of rows to keep mounted beyond either edge of the viewport
+            pool_size: The number of rows to keep hidden once they leave the window
+        """
+        super().__init__(**kwargs)
+        self.fields: typing.Sequence[FieldBehavior] = fields
+        self.values: FieldValues = values
+        self.overscan: int = overscan
+        self.pool_size: int = pool_size
+        self._rows: typing.Dict[int, Widget] = {}
+        self._parked: typing.OrderedDict[str, Widget] = collections.OrderedDict()
+        self._row_states: typing.Dict[str, RowState] = {}
+        self._window: range = range(0)
+        self._top_spacer = FieldSpacer(classes="top-spacer")
+        self._bottom_spacer = FieldSpacer(classes="bottom-spacer")
+
+    @property
+    def mounted_indices(self) -> typing.List[int]:
+        """
+        The positions of the fields whose rows are currently mounted
+        """
+        return sorted(self._rows)
+
+    def compose(self):
+        yield self._top_spacer
+        yield self._bottom_spacer
+
+    def on_mount(self) -> None:
+        self.refresh_window()
+
+    def on_resize(self) -> None:
+        self.refresh_window()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        self.refresh_window()
+
+    def get_window(self) -> range:
+        """
+        Determine which rows should be mounted based on the current scroll position
+
+        Returns:
+            The positions of the fields whose rows should be mounted
+        """
+        viewport_height: int = self.scrollable_content_region.height or self.app.size.height
+        first_visible: int = int(self.scroll_y) // FIELD_ROW_HEIGHT
+        last_visible: int = (int(self.scroll_y) + viewport_height) // FIELD_ROW_HEIGHT + 1
+
+        return range(
+            max(0, first_visible - self.overscan),
+            min(len(self.fields), last_visible + self.overscan)
+        )
+
+    @property
+    def parked_count(self) -> int:
+        """
+        The number of rows that are hidden, waiting to be shown again
+        """
+        return len(self._parked)
+
+    def park_row(self, widget_id: str, row: Widget) -> None:
+        """
+        Hide a row that left the window, removing the least recently parked rows beyond the pool size
+
+        Args:
+            widget_id: The widget id of the row's field
+            row: The row to hide
+        """
+        if self.pool_size <= 0:
+            row.remove()
+            return
+
+        row.display = False
+        self._parked[widget_id] = row
+
+        while len(self._parked) > self.pool_size:
+            self._parked.popitem(last=False)[1].remove()
+
+    def unpark_row(self, index: int) -> typing.Optional[Widget]:
+        """
+        Show the parked row for a field again
+
+        Args:
+            index: The position of the field in the list
+
+        Returns:
+            The row, `None` if there wasn't one parked for the field
+        """
+        field: FieldBehavior = self.fields[index]
+        row: typing.Optional[Widget] = self._parked.pop(field.widget_id, None)
+
+        if row is not None:
+            self.apply_row_state(row, self._row_states.get(field.name))
+            row.display = True
+
+        return row
+
+    async def clear_parked_rows(self) -> None:
+        """
+        Remove every parked row
+        """
+        parked: typing.List[Widget] = list(self._parked.values())
+        self._parked.clear()
+
+        if parked:
+            await self.remove_children(parked)
+
+    def build_row(self, index: int) -> Widget:
+        """
+        Build the row for a field, showing whatever value was last entered into it
+
+        Args:
+            index: The position of the field in the list
+
+        Returns:
+            The widget to mount for the field
+        """
+        field: FieldBehavior = self.fields[index]
+        row: Widget = field.build_widget(self.values.get(field.name))
+
+        if field.name in self._row_states:
+            self.apply_row_state(row, self._row_states[field.name])
+
+        return row
+
+    @staticmethod
+    def apply_row_state(row: Widget, state: typing.Optional[RowState]) -> None:
+        """
+        Mark a row with a state, clearing whatever state it had before
+
+        Args:
+            row: The row to mark
+            state: The state to give the row. The row is left unmarked if `None`
+        """
+        row_class, message = state or (None, None)
+
+        for possible_class in ROW_STATES:
+            row.set_class(possible_class == row_class, possible_class)
+
+        row.tooltip = message
+
+    def set_row_state(self, field_name: str, state: typing.Optional[str], message: typing.Optional[str] = None) -> None:
+        """
+        Mark the row for a field, remembering the state so that a row built later is marked too
+
+        Args:
+            field_name: The name of the field whose row should be marked
+            state: One of the `ROW_STATES`, or `None` to clear the row's state
+            message: What to show when the row is hovered
+        """
+        if state is None:
+            self._row_states.pop(field_name, None)
+        else:
+            self._row_states[field_name] = (state, message)
+
+        for index, row in self._rows.items():
+            if self.fields[index].name == field_name:
+                self.apply_row_state(row, self._row_states.get(field_name))
+
+    async def rebuild_row(self, field_name: str) -> None:
+        """
+        Replace the row for a field, if it is mounted, so that it shows the value now recorded for it
+
+        Args:
+            field_name: The name of the field whose value was changed elsewhere
+        """
+        # Parked rows would show the old value once scrolled back to, so they are built again instead
+        for field in self.fields:
+            if field.name == field_name and field.widget_id in self._parked:
+                await self._parked.pop(field.widget_id).remove()
+
+        for index, row in list(self._rows.items()):
+            if self.fields[index].name == field_name:
+                # The replacement shares the row's ids, so the row has to be gone before it is mounted
+                position: int = self.children.index(row)
+                await row.remove()
+
+                # The row may have been scrolled out of the window while it was being removed
+                if self._rows.get(index) is not row:
+                    continue
+
+                replacement: Widget = self.build_row(index)
+                self._rows[index] = replacement
+                await self.mount(replacement, before=position)
+
+    async def replace_fields(self, fields: typing.Sequence[FieldBehavior], stale_widget_ids: typing.Collection[str]) -> None:
+        """
+        Show a new version of the fields, only rebuilding the rows of fields that are new or changed
+
+        Rows are matched to fields by widget id, so mounted rows keep whatever is focused or typed within them
+
+        Args:
+            fields: The fields to show now
+            stale_widget_ids: The widget ids of fields whose rows can't be kept, even if they are mounted
+        """
+        widget_ids: typing.Set[str] = {field.widget_id for field in fields}
+        kept_rows: typing.Dict[str, Widget] = {}
+
+        # Parked rows may belong to fields that changed, so they are rebuilt if they're needed again
+        await self.clear_parked_rows()
+
+        for index, row in self._rows.items():
+            widget_id: str = self.fields[index].widget_id
+
+            if widget_id in widget_ids and widget_id not in stale_widget_ids:
+                kept_rows[widget_id] = row
+            else:
+                # Replacements share the ids of the rows they replace, so these have to be gone first
+                await row.remove()
+
+        self.fields = fields
+        self._rows = {}
+        self._row_states = {
+            field.name: self._row_states[field.name]
+            for field in fields
+            if field.name in self._row_states and field.widget_id not in stale_widget_ids
+        }
+
+        window: range = self.get_window()
+        previous: Widget = self._top_spacer
+
+        for index in window:
+            row: typing.Optional[Widget] = kept_rows.pop(fields[index].widget_id, None)
+
+            if row is None:
+                row = self.build_row(index)
+                await self.mount(row, after=previous)
+            elif self.children.index(row) != self.children.index(previous) + 1:
+                self.move_child(row, after=previous)
+
+            self._rows[index] = row
+            previous = row
+
+        for row in kept_rows.values():
+            await row.remove()
+
+        self._top_spacer.styles.height = window.start * FIELD_ROW_HEIGHT
+        self._bottom_spacer.styles.height = (len(self.fields) - window.stop) * FIELD_ROW_HEIGHT
+        self._window = window
+
+    def refresh_window(self) -> None:
+        """
+        Mount the rows that have come into view and park the ones that have left it
+        """
+        window: range = self.get_window()
+
+        if window == self._window:
+            return
+
+        leaving: typing.Dict[int, Widget] = {
+            index: self._rows.pop(index)
+            for index in [index for index in self._rows if index not in window]
+        }
+
+        # Rows are placed in order after the last row placed so that recycled rows land between new ones
+        previous: Widget = self._top_spacer
+        unmounted: typing.List[Widget] = []
+
+        for index in window:
+            row: typing.Optional[Widget] = self._rows.get(index) or self.unpark_row(index)
+
+            if row is None:
+                row = self.build_row(index)
+                self._rows[index] = row
+                unmounted.append(row)
+                continue
+
+            self._rows[index] = row
+
+            # New rows are mounted together, up to the next row that already exists
+            if unmounted:
+                self.mount(*unmounted, after=previous)
+                previous = unmounted[-1]
+                unmounted = []
+
+            if self.children.index(row) != self.children.index(previous) + 1:
+                self.move_child(row, after=previous)
+
+            previous = row
+
+        if unmounted:
+            self.mount(*unmounted, after=previous)
+
+        # Rows are only parked once the window has taken what it needs from the pool, so none of those are evicted
+        for index, row in leaving.items():
+            self.park_row(self.fields[index].widget_id, row)
+
+        self._top_spacer.styles.height = window.start * FIELD_ROW_HEIGHT
+        self._bottom_spacer.styles.height = (len(self.fields) - window.stop) * FIELD_ROW_HEIGHT
+        self._window = window
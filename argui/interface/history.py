@@ -0,0 +1,143 @@
+"""
+Defines a popup that searches the values previously submitted for a field
+
+The whole history is read into a `HistoryIndex` on a worker thread the first time a field's past
+values are recalled. The application keeps the index, so recalling values for other fields after
+that searches memory alone.
+"""
+from __future__ import annotations
+
+import typing
+
+from textual import widgets
+from textual.app import ComposeResult
+from textual.screen import ModalScreen
+from textual.content import Content
+from textual.containers import Vertical
+from textual.widgets.option_list import Option
+
+from argui.model.history import HistoryIndex
+from argui.model.history import HistoryPath
+from argui.utilities.search import SearchResult
+from argui.utilities.search import SearchSession
+
+
+class RecallScreen(ModalScreen[typing.Optional[typing.Any]]):
+    """
+    Lists the past values of a field, newest first, narrowed down by whatever is typed
+
+    Dismisses with the chosen value, or `None` if nothing was chosen
+    """
+    DEFAULT_CSS = """
+    RecallScreen {
+        align: center middle;
+    }
+
+    RecallScreen > Vertical {
+        width: 60%;
+        height: auto;
+        max-height: 80%;
+        border: round $accent;
+        background: $surface;
+    }
+
+    RecallScreen #recall_matches {
+        height: auto;
+        max-height: 16;
+    }
+    """
+
+    BINDINGS = [
+        ("escape", "cancel", "Cancel"),
+        ("down", "focus_matches", "Show matches"),
+    ]
+
+    def __init__(self, load_index: typing.Callable[[], HistoryIndex], path: HistoryPath, field_name: str):
+        """
+        Args:
+            load_index: Gets the index over the history, reading it if needed. Called on a worker thread
+            path: The commands leading to the workflow that the field belongs to
+            field_name: The name of the field whose values should be recalled
+        """
+        super().__init__()
+        self.load_index: typing.Callable[[], HistoryIndex] = load_index
+        self.path: HistoryPath = path
+        self.field_name: str = field_name
+        self.session: typing.Optional[SearchSession] = None
+        self._shown: typing.List[int] = []
+
+    def compose(self) -> ComposeResult:
+        with Vertical() as container:
+            container.border_title = f"Previous values for {self.field_name}"
+            yield widgets.Input(placeholder="Loading history...", id="recall_query")
+            yield widgets.OptionList(id="recall_matches")
+
+    def on_mount(self) -> None:
+        self.run_worker(self.read_history, thread=True, group="history", exclusive=True, exit_on_error=False)
+
+    def read_history(self) -> None:
+        """
+        Read the history on a worker thread and start searching the field's values once it is ready
+        """
+        session: SearchSession = self.load_index().get_session(self.path, self.field_name)
+        self.app.call_from_thread(self.set_session, session)
+
+    def set_session(self, session: SearchSession) -> None:
+        """
+        Start searching the field's past values, catching up with anything typed while they were read
+
+        Args:
+            session: A search over the field's past values
+        """
+        self.session = session
+        query_input: widgets.Input = self.query_one("#recall_query", widgets.Input)
+        query_input.placeholder = f"Search {len(session.index.labels)} previous values"
+        self.search(query_input.value)
+
+    def search(self, query: str) -> None:
+        """
+        Show the past values that best match a query
+
+        Args:
+            query: The text to search for
+        """
+        if self.session is None:
+            return
+
+        result: SearchResult = self.session.search(query)
+        self._shown = list(result.indices)
+
+        option_list: widgets.OptionList = self.query_one("#recall_matches", widgets.OptionList)
+        option_list.clear_options()
+        option_list.add_options([Option(Content(self.session.index.labels[index])) for index in self._shown])
+
+        if self._shown:
+            option_list.highlighted = 0
+
+    def choose(self, position: int) -> None:
+        """
+        Finish with one of the shown values
+
+        Args:
+            position: Where the value is among the shown matches
+        """
+        if self.session is not None and position < len(self._shown):
+            self.dismiss(self.session.index.values[self._shown[position]])
+
+    def on_input_changed(self, event: widgets.Input.Changed) -> None:
+        event.stop()
+        self.search(event.value)
+
+    def on_input_submitted(self, event: widgets.Input.Submitted) -> None:
+        event.stop()
+        self.choose(self.query_one("#recall_matches", widgets.OptionList).highlighted or 0)
+
+    def on_option_list_option_selected(self, event: widgets.OptionList.OptionSelected) -> None:
+        event.stop()
+        self.choose(event.option_index)
+
+    def action_focus_matches(self) -> None:
+        self.query_one("#recall_matches", widgets.OptionList).focus()
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
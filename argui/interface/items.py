@@ -0,0 +1,410 @@
+"""
+Defines an editor for arguments that take long lists of values, such as thousands of IDs or paths
+
+Values are typed or pasted into a text box, which splits them into items by line, and a line of the
+form '@path' imports every item in a file. Items are checked against the field's type and added to
+an `ItemStore` a batch at a time from a worker thread, skipping any that were already entered, so
+typing carries on while a large paste or file is imported. The items are drawn a line at a time by
+an `ItemView`, which only renders the lines in view however many items there are.
+"""
+from __future__ import annotations
+
+import typing
+import functools
+
+from rich.segment import Segment
+from textual import events
+from textual import widgets
+from textual.app import ComposeResult
+from textual.geometry import Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.worker import get_current_worker
+from textual.containers import Vertical
+
+from argui.utilities.items import ItemStore
+from argui.utilities.items import CheckedItem
+from argui.utilities.items import batch_items
+from argui.utilities.items import check_items
+from argui.utilities.items import read_items
+from argui.utilities.items import split_items
+
+FILE_PREFIX: typing.Final[str] = "@"
+"""Starts a line that names a file to import items from, just like an argument file"""
+
+
+class ItemInput(widgets.Input):
+    """
+    A text box that hands text pasted across several lines to its editor rather than keeping the first line
+    """
+    class Pasted(Message):
+        """
+        Posted when text holding several lines is pasted
+        """
+        def __init__(self, text: str):
+            super().__init__()
+            self.text: str = text
+
+    def _on_paste(self, event: events.Paste) -> None:
+        if "\n" in event.text.strip() or "\r" in event.text.strip():
+            event.prevent_default()
+            event.stop()
+            self.post_message(self.Pasted(event.text))
+
+
+class ItemView(ScrollView, can_focus=True):
+    """
+    Draws the items of a store a line at a time, marking invalid items, and lets them be removed
+    """
+    COMPONENT_CLASSES = {"item-view--cursor", "item-view--invalid"}
+    DEFAULT_CSS = """
+    ItemView > .item-view--cursor {
+        background: $accent 40%;
+    }
+
+    ItemView > .item-view--invalid {
+        color: $error;
+    }
+    """
+    BINDINGS = [
+        ("up", "move_cursor(-1)", "Previous item"),
+        ("down", "move_cursor(1)", "Next item"),
+        ("pageup", "move_cursor(-10)", "Previous page"),
+        ("pagedown", "move_cursor(10)", "Next page"),
+        ("delete,backspace", "delete_item", "Remove item"),
+    ]
+
+    cursor: reactive[int] = reactive(0)
+
+    class Deleted(Message):
+        """
+        Posted when an item is removed
+        """
+
+    def __init__(self, store: ItemStore, **kwargs):
+        """
+        Args:
+            store: The items to show
+            **kwargs: Extra parameters for the view
+        """
+        super().__init__(**kwargs)
+        self.store: ItemStore = store
+
+    def refresh_items(self) -> None:
+        """
+        Resize the view to the number of items and draw them again
+        """
+        self.virtual_size = Size(self.size.width, len(self.store))
+        self.cursor = min(self.cursor, max(len(self.store) - 1, 0))
+        self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        index: int = scroll_y + y
+        width: int = self.scrollable_content_region.width
+
+        if index >= len(self.store):
+            return Strip.blank(width, self.rich_style)
+
+        problem: typing.Optional[str] = self.store.problems.get(index)
+        style = self.rich_style
+
+        if problem is not None:
+            style += self.get_component_rich_style("item-view--invalid")
+
+        if index == self.cursor and self.has_focus:
+            style += self.get_component_rich_style("item-view--cursor")
+
+        text: str = f"{'✗' if problem else ' '} {self.store[index]}"
+        return Strip([Segment(text, style)]).crop_extend(scroll_x, scroll_x + width, style)
+
+    def watch_cursor(self, new_cursor: int) -> None:
+        height: int = self.scrollable_content_region.height
+
+        if new_cursor < self.scroll_y:
+            self.scroll_to(y=new_cursor, animate=False, immediate=True)
+        elif height and new_cursor >= self.scroll_y + height:
+            self.scroll_to(y=new_cursor - height + 1, animate=False, immediate=True)
+
+        self.refresh()
+
+    def on_focus(self) -> None:
+        self.refresh()
+
+    def on_blur(self) -> None:
+        self.refresh()
+
+    def action_move_cursor(self, distance: int) -> None:
+        self.cursor = max(0, min(self.cursor + distance, len(self.store) - 1))
+
+    def action_delete_item(self) -> None:
+        if not self.store:
+            return
+
+        self.store.delete(self.cursor)
+        self.refresh_items()
+        self.post_message(self.Deleted())
+
+
+class ItemListEditor(Vertical):
+    """
+    Collects a list of unique items for an argument that takes any number of values
+
+    The editor's value is its `ItemStore`, which stands in for a list of the items
+    """
+    DEFAULT_CSS = """
+    ItemListEditor {
+        height: auto;
+    }
+
+    ItemListEditor > ItemView {
+        display: none;
+        height: 12;
+        overlay: screen;
+        constrain: none inside;
+        border: tall $border-blurred;
+        background: $surface;
+    }
+
+    ItemListEditor.-expanded > ItemView {
+        display: block;
+    }
+    """
+    BINDINGS = [
+        ("down", "focus_items", "Show items"),
+        ("escape", "collapse", "Hide items"),
+    ]
+
+    class Changed(Message):
+        """
+        Posted when items are added or removed
+        """
+        def __init__(self, item_list_editor: ItemListEditor):
+            super().__init__()
+            self.item_list_editor: ItemListEditor = item_list_editor
+
+        @property
+        def control(self) -> ItemListEditor:
+            return self.item_list_editor
+
+    def __init__(
+        self,
+        value: typing.Any = None,
+        placeholder: str = "",
+        conversion: typing.Optional[typing.Callable[[str], typing.Any]] = None,
+        delimiter: typing.Optional[str] = None,
+        id: typing.Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Args:
+            value: The items to start with - either a store to keep editing or a list of items to check
+            placeholder: What to show while nothing has been typed
+            conversion: The field's type, which every item is checked against
+            delimiter: What else separates items within a line, such as ',', if anything
+            id: The id of the editor
+            **kwargs: Extra parameters for the container
+        """
+        super().__init__(id=id, **kwargs)
+        self.conversion: typing.Optional[typing.Callable[[str], typing.Any]] = conversion
+        self.delimiter: typing.Optional[str] = delimiter
+        self.placeholder: str = placeholder
+        self.duplicates: int = 0
+        self.importing: int = 0
+        self._initial_items: typing.List[str] = []
+
+        if isinstance(value, ItemStore):
+            self.store: ItemStore = value
+        else:
+            self.store = ItemStore()
+
+            if isinstance(value, (list, tuple)):
+                self._initial_items = [str(item) for item in value]
+            elif value is not None and value != "":
+                self._initial_items = split_items(str(value), delimiter)
+
+        self.input = ItemInput(placeholder=self.describe_items(), id=f"{id}_entry" if id else None)
+        self.items = ItemView(self.store, id=f"{id}_items" if id else None)
+
+    @property
+    def value(self) -> ItemStore:
+        """
+        The items entered so far
+        """
+        return self.store
+
+    @property
+    def problem(self) -> typing.Optional[str]:
+        """
+        What is wrong with the invalid items, `None` if there aren't any
+        """
+        return self.store.problem
+
+    def describe_items(self) -> str:
+        """
+        Describe what has been entered for the text box's placeholder
+        """
+        if not self.store and not self.importing:
+            return self.placeholder or f"Type or paste items, or {FILE_PREFIX}file to import one"
+
+        description: str = f"{len(self.store):,} items"
+
+        if self.store.problems:
+            description += f", {len(self.store.problems):,} invalid"
+
+        if self.duplicates:
+            description += f", {self.duplicates:,} repeats skipped"
+
+        if self.importing:
+            description += " - importing..."
+
+        return description
+
+    def compose(self) -> ComposeResult:
+        yield self.input
+        yield self.items
+
+    def on_mount(self) -> None:
+        if self._initial_items:
+            self.import_items(self._initial_items)
+            self._initial_items = []
+
+    def refresh_description(self) -> None:
+        """
+        Show how many items there are, in the text box and above the items
+        """
+        description: str = self.describe_items()
+        self.input.placeholder = description
+        self.items.border_title = description
+
+    def import_items(self, items: typing.Iterable[str], describe_failure: str = "Unable to import items") -> None:
+        """
+        Check and add items on a worker thread, a batch at a time
+
+        Args:
+            items: The items to add. Only read on the worker, so this may read a file lazily
+            describe_failure: The title of the notification shown if reading the items fails
+        """
+        self.importing += 1
+        self.refresh_description()
+        self.run_worker(
+            functools.partial(self.check_batches, items, describe_failure),
+            thread=True,
+            group="import",
+            exit_on_error=False
+        )
+
+    def check_batches(self, items: typing.Iterable[str], describe_failure: str) -> None:
+        """
+        Check items a batch at a time on a worker thread, handing each batch over to be added
+
+        Args:
+            items: The items to check
+            describe_failure: The title of the notification shown if reading the items fails
+        """
+        worker = get_current_worker()
+
+        try:
+            for batch in batch_items(items):
+                checked: typing.List[CheckedItem] = check_items(batch, self.conversion)
+
+                # The editor may have been removed, along with the application, while the batch was checked
+                if worker.is_cancelled:
+                    return
+
+                self.app.call_from_thread(self.add_batch, checked, len(batch) - len(checked))
+        except Exception as error:
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self.notify, str(error), title=describe_failure, severity="error")
+
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self.finish_import)
+
+    def add_batch(self, checked: typing.List[CheckedItem], repeats: int) -> None:
+        """
+        Add a batch of checked items, skipping those that were already entered
+
+        Args:
+            checked: The items of the batch along with what is wrong with them
+            repeats: How many items the batch repeated within itself
+        """
+        added: int = self.store.extend(checked)
+        self.duplicates += repeats + len(checked) - added
+        self.items.refresh_items()
+        self.refresh_description()
+
+        if added:
+            self.post_message(self.Changed(self))
+
+    def finish_import(self) -> None:
+        """
+        Note that an import finished, successfully or not
+        """
+        self.importing -= 1
+        self.refresh_description()
+
+    def add_text(self, text: str) -> None:
+        """
+        Add the items within typed or pasted text, importing any files named by '@path' lines
+
+        Args:
+            text: The text to split into items
+        """
+        items: typing.List[str] = []
+
+        for line in text.splitlines():
+            if line.strip().startswith(FILE_PREFIX):
+                path: str = line.strip()[len(FILE_PREFIX):]
+                self.import_items(read_items(path, self.delimiter), describe_failure=f"Unable to import {path}")
+            else:
+                items.extend(split_items(line, self.delimiter))
+
+        if items:
+            self.import_items(items)
+
+    def on_item_input_pasted(self, event: ItemInput.Pasted) -> None:
+        event.stop()
+        self.add_text(event.text)
+
+    def on_input_changed(self, event: widgets.Input.Changed) -> None:
+        # The text box only holds an item until it is added, so the screen shouldn't hear about it
+        event.stop()
+
+    def on_input_submitted(self, event: widgets.Input.Submitted) -> None:
+        event.stop()
+        self.add_text(event.value)
+        self.input.value = ""
+
+    def on_item_view_deleted(self, event: ItemView.Deleted) -> None:
+        event.stop()
+        self.refresh_description()
+        self.post_message(self.Changed(self))
+
+    def set_expanded(self, expanded: bool) -> None:
+        """
+        Show or hide the items
+
+        Args:
+            expanded: Whether the items should be shown
+        """
+        self.set_class(expanded, "-expanded")
+
+        if expanded:
+            self.items.refresh_items()
+
+    def on_descendant_focus(self) -> None:
+        self.set_expanded(True)
+
+    def on_descendant_blur(self) -> None:
+        # Focus moves between the text box and the items without hiding them
+        self.call_after_refresh(lambda: self.set_expanded(self.has_focus_within))
+
+    def action_focus_items(self) -> None:
+        self.set_expanded(True)
+        self.items.focus()
+
+    def action_collapse(self) -> None:
+        self.set_expanded(False)
+        self.input.focus()
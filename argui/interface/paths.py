@@ -0,0 +1,322 @@
+"""
+Defines a text box for paths that may also browse for them
+
+The browser lists a directory on a worker thread and shows its entries a chunk at a time, so the
+first entries appear right away even in enormous directories on slow filesystems. Opening another
+directory cancels the scan of the last one. Finished listings are shared through a
+`DirectoryListingCache`, so returning to a directory that hasn't changed doesn't read it again.
+"""
+from __future__ import annotations
+
+import typing
+import asyncio
+import pathlib
+
+from textual import widgets
+from textual.app import ComposeResult
+from textual.screen import ModalScreen
+from textual.worker import get_current_worker
+from textual.containers import Vertical
+from textual.containers import Horizontal
+from textual.widgets.option_list import Option
+
+from argui.utilities.listing import DirectoryEntry
+from argui.utilities.listing import DirectoryListingCache
+from argui.utilities.listing import DIRECTORY_LISTINGS
+from argui.utilities.listing import LISTING_CHUNK_SIZE
+from argui.utilities.listing import scan_directory
+from argui.utilities.listing import get_modification_time
+
+PARENT_ENTRY: typing.Final[DirectoryEntry] = DirectoryEntry("..", True)
+"""The entry at the top of every listing that leads to the parent directory"""
+
+
+def get_start_directory(text: typing.Optional[str]) -> pathlib.Path:
+    """
+    Decide which directory to start browsing from based on what has been typed
+
+    Args:
+        text: The path typed into the text box, if any
+
+    Returns:
+        The typed directory, the directory holding the typed path, or the working directory
+    """
+    if text:
+        typed_path = pathlib.Path(text).expanduser().absolute()
+
+        for candidate in (typed_path, typed_path.parent):
+            if candidate.is_dir():
+                return candidate
+
+    return pathlib.Path.cwd()
+
+
+class PathBrowser(ModalScreen[typing.Optional[str]]):
+    """
+    Lists the entries of a directory so that one may be chosen
+
+    Dismisses with the chosen path, or `None` if browsing was cancelled
+    """
+    DEFAULT_CSS = """
+    PathBrowser {
+        align: center middle;
+    }
+
+    PathBrowser > Vertical {
+        width: 80%;
+        height: 80%;
+        border: round $accent;
+        background: $surface;
+    }
+
+    PathBrowser #browser_entries {
+        height: 1fr;
+    }
+
+    PathBrowser #browser_controls {
+        height: auto;
+    }
+    """
+
+    BINDINGS = [
+        ("escape", "cancel", "Cancel"),
+        ("backspace", "open_parent", "Parent directory"),
+    ]
+
+    def __init__(
+        self,
+        directory: pathlib.Path,
+        listings: DirectoryListingCache = DIRECTORY_LISTINGS,
+        chunk_size: int = LISTING_CHUNK_SIZE
+    ):
+        """
+        Args:
+            directory: The directory to start in
+            listings: Where finished listings are remembered
+            chunk_size: The number of entries to show at a time while a directory is being read
+        """
+        super().__init__()
+        self.directory: pathlib.Path = directory
+        self.listings: DirectoryListingCache = listings
+        self.chunk_size: int = chunk_size
+        self._entries: typing.List[DirectoryEntry] = []
+
+    @property
+    def entries(self) -> typing.Sequence[DirectoryEntry]:
+        """
+        The entries shown so far, starting with the one for the parent directory
+        """
+        return self._entries
+
+    def compose(self) -> ComposeResult:
+        with Vertical():
+            yield widgets.Static(id="browser_location")
+            yield widgets.OptionList(id="browser_entries")
+
+            with Horizontal(id="browser_controls"):
+                yield widgets.Button("Choose", id="browser_choose", variant="primary")
+                yield widgets.Button("Cancel", id="browser_cancel")
+
+    def on_mount(self) -> None:
+        self.open_directory(self.directory)
+
+    def open_directory(self, directory: pathlib.Path) -> None:
+        """
+        Show the entries of a directory, cancelling the scan of whatever directory was shown before
+
+        Args:
+            directory: The directory to show
+        """
+        self.directory = directory
+        self._entries = [PARENT_ENTRY]
+        self.query_one("#browser_location", widgets.Static).update(str(directory))
+
+        option_list = self.query_one("#browser_entries", widgets.OptionList)
+        option_list.clear_options()
+        option_list.add_option(Option(f"{PARENT_ENTRY.name}/"))
+        option_list.highlighted = 0
+
+        cached_entries: typing.Optional[typing.Sequence[DirectoryEntry]] = self.listings.get(directory)
+
+        if cached_entries is None:
+            self.run_worker(
+                lambda: self.scan(directory),
+                thread=True,
+                group="listing",
+                exclusive=True,
+                exit_on_error=False
+            )
+        else:
+            self.run_worker(self.show_cached(directory, cached_entries), group="listing", exclusive=True)
+
+    async def show_cached(self, directory: pathlib.Path, entries: typing.Sequence[DirectoryEntry]) -> None:
+        """
+        Show a remembered listing a chunk at a time, letting the screen draw between chunks
+
+        Args:
+            directory: The directory that was listed
+            entries: The remembered entries of the directory
+        """
+        for start in range(0, len(entries), self.chunk_size):
+            self.add_entries(directory, entries[start:start + self.chunk_size])
+            await asyncio.sleep(0)
+
+    def scan(self, directory: pathlib.Path) -> None:
+        """
+        Read a directory on a worker thread, handing each chunk of entries to the screen as it is read
+
+        Waiting for each chunk to be shown keeps a fast scan from flooding the screen
+
+        Args:
+            directory: The directory to read
+        """
+        worker = get_current_worker()
+        modification_time: typing.Optional[int] = get_modification_time(directory)
+        entries: typing.List[DirectoryEntry] = []
+
+        try:
+            for chunk in scan_directory(directory, self.chunk_size, lambda: worker.is_cancelled):
+                entries.extend(chunk)
+                self.app.call_from_thread(self.add_entries, directory, chunk)
+        except OSError as error:
+            self.app.call_from_thread(self.notify, str(error), title="Unable to list directory", severity="error")
+            return
+
+        if not worker.is_cancelled:
+            self.listings.put(directory, modification_time, entries)
+
+    def add_entries(self, directory: pathlib.Path, entries: typing.Sequence[DirectoryEntry]) -> None:
+        """
+        Show more entries of a directory, unless another directory has been opened since
+
+        Args:
+            directory: The directory that the entries belong to
+            entries: The entries to show
+        """
+        if directory != self.directory:
+            return
+
+        self._entries.extend(entries)
+        self.query_one("#browser_entries", widgets.OptionList).add_options(
+            [Option(f"{entry.name}/" if entry.is_directory else entry.name) for entry in entries]
+        )
+
+    def get_highlighted_entry(self) -> typing.Optional[DirectoryEntry]:
+        """
+        Get the entry that is currently highlighted, if any
+        """
+        highlighted: typing.Optional[int] = self.query_one("#browser_entries", widgets.OptionList).highlighted
+
+        if highlighted is None or highlighted >= len(self._entries):
+            return None
+
+        return self._entries[highlighted]
+
+    def choose_entry(self, entry: DirectoryEntry) -> None:
+        """
+        Open an entry if it's a directory or finish browsing with it if it isn't
+
+        Args:
+            entry: The entry that was chosen
+        """
+        if entry is PARENT_ENTRY:
+            self.action_open_parent()
+        elif entry.is_directory:
+            self.open_directory(self.directory / entry.name)
+        else:
+            self.dismiss(str(self.directory / entry.name))
+
+    def on_option_list_option_selected(self, event: widgets.OptionList.OptionSelected) -> None:
+        event.stop()
+
+        if event.option_index < len(self._entries):
+            self.choose_entry(self._entries[event.option_index])
+
+    def on_button_pressed(self, event: widgets.Button.Pressed) -> None:
+        event.stop()
+
+        if event.button.id == "browser_cancel":
+            self.action_cancel()
+            return
+
+        # Choosing with a directory highlighted finishes with that directory rather than opening it
+        entry: typing.Optional[DirectoryEntry] = self.get_highlighted_entry()
+
+        if entry is None or entry is PARENT_ENTRY:
+            self.dismiss(str(self.directory))
+        else:
+            self.dismiss(str(self.directory / entry.name))
+
+    def action_open_parent(self) -> None:
+        self.open_directory(self.directory.parent)
+
+    def action_cancel(self) -> None:
+        self.app.workers.cancel_group(self, "listing")
+        self.dismiss(None)
+
+
+class PathPicker(Horizontal):
+    """
+    A text box for a path alongside a button that browses for one
+
+    The text box is given the picker's id, so the value is read and announced just like a plain text box
+    """
+    DEFAULT_CSS = """
+    PathPicker {
+        height: auto;
+    }
+
+    PathPicker > Input {
+        width: 1fr;
+    }
+
+    PathPicker > Button {
+        width: auto;
+        min-width: 10;
+    }
+    """
+
+    def __init__(
+        self,
+        value: typing.Optional[str] = None,
+        placeholder: str = "",
+        id: typing.Optional[str] = None,
+        listings: DirectoryListingCache = DIRECTORY_LISTINGS,
+        **kwargs
+    ):
+        """
+        Args:
+            value: The path to start with
+            placeholder: What to show while no path has been entered
+            id: The id of the text box
+            listings: Where the browser remembers finished listings
+            **kwargs: Extra parameters for the text box
+        """
+        super().__init__(id=f"{id}_picker" if id else None, classes="path-picker")
+        self.listings: DirectoryListingCache = listings
+        self.input = widgets.Input(value=value, placeholder=placeholder, id=id, **kwargs)
+
+    @property
+    def value(self) -> str:
+        """
+        The path that has been entered
+        """
+        return self.input.value
+
+    def compose(self) -> ComposeResult:
+        yield self.input
+        yield widgets.Button("Browse", id=f"{self.input.id}_browse" if self.input.id else None)
+
+    def on_button_pressed(self, event: widgets.Button.Pressed) -> None:
+        event.stop()
+        self.app.push_screen(PathBrowser(get_start_directory(self.input.value), self.listings), self.choose)
+
+    def choose(self, path: typing.Optional[str]) -> None:
+        """
+        Enter the path picked in the browser
+
+        Args:
+            path: The picked path, `None` if browsing was cancelled
+        """
+        if path is not None:
+            self.input.value = path
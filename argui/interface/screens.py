@@ -0,0 +1,137 @@
+"""
+Defines the cache of screens kept alive for workflows that were left, so that returning to one is instant
+
+Moving between sibling commands would otherwise tear down and rebuild every row and input of a
+screen each time. Screens in the cache are installed on the application, which keeps Textual from
+removing them when they are popped, and whatever was typed or focused within them is still there
+when they are shown again. The least recently shown screens are removed once the cache is full.
+"""
+from __future__ import annotations
+
+import typing
+import collections
+
+from textual.app import App
+from textual.screen import Screen
+
+WorkflowPath = typing.Tuple[str, ...]
+"""The names of the commands that lead from the root workflow to a subworkflow"""
+
+SCREEN_CACHE_SIZE: typing.Final[int] = 8
+"""The number of screens kept alive for workflows that aren't being shown"""
+
+SCREEN_NAME_PREFIX: typing.Final[str] = "argui-workflow:"
+"""Placed before the path of a cached screen to form the name it is installed under"""
+
+
+class ScreenCache:
+    """
+    Keeps the screens for recently shown workflows installed, evicting the least recently shown first
+
+    Screens on the application's stack are never evicted, so the cache may briefly hold more than its capacity
+    """
+    def __init__(self, app: App, capacity: int = SCREEN_CACHE_SIZE):
+        """
+        Args:
+            app: The application the screens are installed on
+            capacity: The number of screens to keep. Nothing is kept if `0`
+        """
+        self.app: App = app
+        self.capacity: int = capacity
+        self._screens: typing.OrderedDict[WorkflowPath, Screen] = collections.OrderedDict()
+        self._released: typing.Set[Screen] = set()
+
+    @staticmethod
+    def get_name(path: WorkflowPath) -> str:
+        """
+        Get the name that the screen for a workflow is installed under
+        """
+        return SCREEN_NAME_PREFIX + "\x1f".join(path)
+
+    def get(self, path: WorkflowPath) -> typing.Optional[Screen]:
+        """
+        Get the cached screen for a workflow, marking it as the most recently shown
+
+        Args:
+            path: The commands leading to the workflow
+
+        Returns:
+            The screen, `None` if it isn't cached
+        """
+        screen: typing.Optional[Screen] = self._screens.get(path)
+
+        if screen is not None:
+            self._screens.move_to_end(path)
+
+        return screen
+
+    def add(self, path: WorkflowPath, screen: Screen) -> None:
+        """
+        Keep a screen alive once it is left, evicting the least recently shown screens beyond the capacity
+
+        Args:
+            path: The commands leading to the workflow the screen shows
+            screen: The screen to keep
+        """
+        if self.capacity <= 0:
+            return
+
+        self.discard(path)
+        self.app.install_screen(screen, self.get_name(path))
+        self._screens[path] = screen
+
+        for evicted_path in list(self._screens):
+            if len(self._screens) <= self.capacity:
+                break
+
+            if not self.is_shown(self._screens[evicted_path]):
+                self.discard(evicted_path)
+
+    def discard(self, path: WorkflowPath) -> typing.Optional[Screen]:
+        """
+        Stop keeping the screen for a workflow, removing it unless it is on the stack
+
+        Args:
+            path: The commands leading to the workflow
+
+        Returns:
+            The screen that was kept, `None` if there wasn't one
+        """
+        screen: typing.Optional[Screen] = self._screens.pop(path, None)
+
+        if screen is None:
+            return None
+
+        # Screens on the stack can't be uninstalled, so they are removed once they leave it instead
+        self._released.add(screen)
+        self.release(screen)
+        return screen
+
+    def release(self, screen: Screen) -> None:
+        """
+        Remove a discarded screen if it is no longer on the stack. Screens call this whenever they are suspended
+        """
+        if screen not in self._released or self.is_shown(screen):
+            return
+
+        self._released.discard(screen)
+        self.app.uninstall_screen(screen)
+        screen.remove()
+
+    def is_shown(self, screen: Screen) -> bool:
+        """
+        Whether a screen is on the application's stack
+        """
+        return screen in self.app.screen_stack
+
+    def items(self) -> typing.List[typing.Tuple[WorkflowPath, Screen]]:
+        """
+        Get every cached screen along with the path of its workflow, least recently shown first
+        """
+        return list(self._screens.items())
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._screens
+
+    def __len__(self) -> int:
+        return len(self._screens)
@@ -0,0 +1,414 @@
+"""
+Defines a selector that finds options by searching rather than scrolling
+
+Arguments may choose from thousands of regions, tables, or hosts. Mounting an option for each of
+them is slow and scrolling through them is hopeless, so this selector shows a text box that searches
+a prebuilt `SearchIndex` as the user types and only shows the best matches. The index is built on a
+worker thread the first time a set of options is shown and is shared from then on. Searches that
+run out of time in one frame carry on in the next, adding matches as they are found. Options from a
+`ChoiceProvider` are added to the index a batch at a time as they are loaded.
+"""
+from __future__ import annotations
+
+import typing
+
+from textual import widgets
+from textual.app import ComposeResult
+from textual.content import Content
+from textual.message import Message
+from textual.containers import Vertical
+from textual.widgets.option_list import Option
+
+from argui.utilities.search import OptionValue
+from argui.utilities.search import SearchIndex
+from argui.utilities.search import SearchResult
+from argui.utilities.search import SearchSession
+from argui.utilities.search import SearchIndexCache
+from argui.utilities.search import SEARCH_INDICES
+from argui.utilities.search import SEARCH_RESULT_LIMIT
+from argui.utilities.search import Option as SelectionOption
+from argui.utilities.search import split_options
+from argui.utilities.providers import ChoiceProvider
+
+
+def get_option_label(options: typing.Iterable[SelectionOption], value: typing.Any) -> typing.Optional[str]:
+    """
+    Find the text shown for a value
+
+    Args:
+        options: The options the value may be one of
+        value: The value to find
+
+    Returns:
+        The label of the value, `None` if it isn't one of the options
+    """
+    for option in options:
+        label, option_value = option if isinstance(option, tuple) else (str(option), option)
+
+        if option_value == value:
+            return label
+
+    return None
+
+
+class SearchableSelect(Vertical):
+    """
+    A text box that searches a large set of options, showing the best matches beneath it
+
+    With `multiple`, choosing a match toggles it and the value is every chosen option, like a
+    `SelectionList`. Otherwise choosing a match makes it the value, like a `Select`
+    """
+    DEFAULT_CSS = """
+    SearchableSelect {
+        height: auto;
+    }
+
+    SearchableSelect > OptionList {
+        display: none;
+        height: auto;
+        max-height: 12;
+        overlay: screen;
+        constrain: none inside;
+        border: tall $border-blurred;
+        background: $surface;
+    }
+
+    SearchableSelect.-expanded > OptionList {
+        display: block;
+    }
+    """
+
+    BINDINGS = [
+        ("down", "focus_matches", "Show matches"),
+        ("escape", "collapse", "Hide matches"),
+    ]
+
+    class Changed(Message):
+        """
+        Posted when the chosen options change
+        """
+        def __init__(self, searchable_select: SearchableSelect):
+            super().__init__()
+            self.searchable_select: SearchableSelect = searchable_select
+
+        @property
+        def control(self) -> SearchableSelect:
+            return self.searchable_select
+
+    def __init__(
+        self,
+        options: typing.Sequence[SelectionOption],
+        value: typing.Any = None,
+        multiple: bool = False,
+        placeholder: str = "",
+        id: typing.Optional[str] = None,
+        indices: SearchIndexCache = SEARCH_INDICES,
+        limit: int = SEARCH_RESULT_LIMIT,
+        provider: typing.Optional[ChoiceProvider] = None,
+        **kwargs
+    ):
+        """
+        Args:
+            options: Values, or the text for a value paired with it. Should not change once shown
+            value: The value to start with - a list of them if `multiple`
+            multiple: Whether any number of options may be chosen rather than just one
+            placeholder: What to show while nothing has been typed
+            id: The id of the selector
+            indices: Where the index over the options is kept
+            limit: The largest number of matches to show
+            provider: Where to load the options from if they aren't given. They are loaded once mounted
+            **kwargs: Extra parameters for the container
+        """
+        super().__init__(id=id, **kwargs)
+
+        if provider is not None:
+            cached_options: typing.Optional[typing.Sequence[SelectionOption]] = provider.get_cached()
+
+            if cached_options is not None:
+                options = cached_options
+                provider = None
+            else:
+                options = []
+
+        self.options: typing.Sequence[SelectionOption] = options
+        self.provider: typing.Optional[ChoiceProvider] = provider
+        self.multiple: bool = multiple
+        self.placeholder: str = placeholder
+        self.indices: SearchIndexCache = indices
+        self.limit: int = limit
+        self.session: typing.Optional[SearchSession] = None
+        self._selected: typing.List[OptionValue] = []
+        self._shown: typing.List[int] = []
+        self._chosen_label: str = ""
+        self._search_generation: int = 0
+
+        if multiple:
+            self._selected = list(value) if isinstance(value, (list, tuple)) else []
+        elif value is not None:
+            label: typing.Optional[str] = get_option_label(options, value)
+
+            # A value can't be checked against options that haven't been loaded yet
+            if label is None and provider is not None:
+                label = str(value)
+
+            if label is not None:
+                self._selected = [value]
+                self._chosen_label = label
+
+        self.input = widgets.Input(
+            value=self._chosen_label,
+            placeholder=self.describe_selection(),
+            id=f"{id}_query" if id else None
+        )
+        self.matches = widgets.OptionList(id=f"{id}_matches" if id else None)
+
+    @property
+    def value(self) -> typing.Any:
+        """
+        The chosen options if `multiple`, otherwise the chosen option or `None`
+        """
+        if self.multiple:
+            return list(self._selected)
+
+        return self._selected[0] if self._selected else None
+
+    @property
+    def index(self) -> typing.Optional[SearchIndex]:
+        """
+        The index over the options, once it has been built
+        """
+        return None if self.session is None else self.session.index
+
+    def describe_selection(self) -> str:
+        """
+        Describe what has been chosen for the text box's placeholder
+        """
+        if self.multiple and self._selected:
+            return f"{len(self._selected)} selected: {', '.join(str(value) for value in self._selected)}"
+
+        if self.provider is not None:
+            return f"Loading options... ({len(self.options)} so far)"
+
+        return self.placeholder or f"Search {len(self.options)} options"
+
+    def compose(self) -> ComposeResult:
+        yield self.input
+        yield self.matches
+
+    def on_mount(self) -> None:
+        if self.provider is not None:
+            self.set_index(SearchIndex([]))
+            self.run_worker(self.load_options(self.provider), group="choices", exclusive=True, exit_on_error=False)
+        elif self.options in self.indices:
+            self.set_index(self.indices.get(self.options))
+        else:
+            self.run_worker(self.build_index, thread=True, group="search_index", exclusive=True, exit_on_error=False)
+
+    def build_index(self) -> None:
+        """
+        Build the index over the options on a worker thread and start searching it once it is ready
+        """
+        index: SearchIndex = self.indices.get(self.options)
+        self.app.call_from_thread(self.set_index, index)
+
+    async def load_options(self, provider: ChoiceProvider) -> None:
+        """
+        Stream options in from a provider, searching them as each batch arrives
+
+        Args:
+            provider: Where the options come from
+        """
+        try:
+            async for batch in provider.stream():
+                self.add_options(batch)
+        except Exception as error:
+            self.notify(str(error), title="Unable to load choices", severity="error")
+
+        self.provider = None
+        self.input.placeholder = self.describe_selection()
+
+    def add_options(self, options: typing.Sequence[SelectionOption]) -> None:
+        """
+        Add a batch of loaded options and search again if matches are being shown
+
+        Args:
+            options: The options to add
+        """
+        index: SearchIndex = typing.cast(SearchIndex, self.index)
+        typing.cast(typing.List[SelectionOption], self.options).extend(options)
+        index.extend(*split_options(options))
+
+        # The last search's matches no longer cover every option, so they can't be narrowed
+        self.set_index(index)
+        self.input.placeholder = self.describe_selection()
+
+    def set_index(self, index: SearchIndex) -> None:
+        """
+        Start searching an index, catching up with anything typed while it was being built
+
+        Args:
+            index: The index over the options
+        """
+        self.session = SearchSession(index, self.limit)
+
+        if self.has_class("-expanded"):
+            self.search(self.get_query())
+
+    def get_query(self) -> str:
+        """
+        Get the text to search for - nothing while the text box just shows the chosen option
+        """
+        query: str = self.input.value
+        return "" if query == self._chosen_label else query
+
+    def search(self, query: str) -> None:
+        """
+        Show the best matches for a query, carrying on in later frames if the search runs out of time
+
+        Args:
+            query: The text to search for
+        """
+        if self.session is None:
+            return
+
+        self._search_generation += 1
+        self.show_matches(self.session.search(query))
+
+        if self.session.can_resume:
+            self.call_after_refresh(self.resume_search, self._search_generation)
+
+    def resume_search(self, generation: int) -> None:
+        """
+        Carry on with a search that ran out of time, unless another search has started since
+
+        Args:
+            generation: Which search should be carried on
+        """
+        if self.session is None or generation != self._search_generation:
+            return
+
+        result: typing.Optional[SearchResult] = self.session.resume()
+
+        if result is not None:
+            self.show_matches(result)
+
+        if self.session.can_resume:
+            self.call_after_refresh(self.resume_search, generation)
+
+    def get_prompt(self, index: int) -> Content:
+        """
+        Get what to show for a match
+
+        Args:
+            index: The position of the option
+
+        Returns:
+            The label of the option, marked if it has been chosen and many may be
+        """
+        search_index: SearchIndex = typing.cast(SearchIndex, self.index)
+        label: str = search_index.labels[index]
+
+        if self.multiple:
+            label = f"{'☑' if search_index.values[index] in self._selected else '☐'} {label}"
+
+        return Content(label)
+
+    def show_matches(self, result: SearchResult) -> None:
+        """
+        Replace the shown matches, keeping the highlight where it was if possible
+
+        Args:
+            result: The best matches for the current query
+        """
+        self.matches.border_title = f"{len(result.matches)}{'' if result.complete else '+'} matches"
+
+        if result.indices == self._shown:
+            return
+
+        highlighted: typing.Optional[int] = self.matches.highlighted
+        self._shown = list(result.indices)
+
+        self.matches.clear_options()
+        self.matches.add_options([Option(self.get_prompt(index)) for index in self._shown])
+
+        if self._shown:
+            self.matches.highlighted = min(highlighted or 0, len(self._shown) - 1)
+
+    def set_expanded(self, expanded: bool) -> None:
+        """
+        Show or hide the matches
+
+        Args:
+            expanded: Whether the matches should be shown
+        """
+        if expanded and not self.has_class("-expanded"):
+            self.set_class(True, "-expanded")
+            self.search(self.get_query())
+        elif not expanded:
+            self.set_class(False, "-expanded")
+
+    def choose(self, index: int) -> None:
+        """
+        Choose an option, or unchoose it if many may be chosen and it already was
+
+        Args:
+            index: The position of the option
+        """
+        search_index: SearchIndex = typing.cast(SearchIndex, self.index)
+        option_value: OptionValue = search_index.values[index]
+
+        if not self.multiple:
+            self._selected = [option_value]
+            self._chosen_label = search_index.labels[index]
+            self.input.value = self._chosen_label
+            self.set_expanded(False)
+            self.input.focus()
+        else:
+            if option_value in self._selected:
+                self._selected.remove(option_value)
+            else:
+                self._selected.append(option_value)
+
+            position: int = self._shown.index(index)
+            self.matches.replace_option_prompt_at_index(position, self.get_prompt(index))
+            self.input.placeholder = self.describe_selection()
+
+        self.post_message(self.Changed(self))
+
+    def on_input_changed(self, event: widgets.Input.Changed) -> None:
+        # The query isn't a value of its own, so the screen shouldn't hear about it
+        event.stop()
+
+        if not self.multiple and self._selected and not event.value:
+            self._selected = []
+            self._chosen_label = ""
+            self.post_message(self.Changed(self))
+
+        # Showing the chosen option's label isn't a search
+        if self.input.has_focus and (self.multiple or event.value != self._chosen_label):
+            self.set_expanded(True)
+            self.search(self.get_query())
+
+    def on_input_submitted(self, event: widgets.Input.Submitted) -> None:
+        event.stop()
+
+        if self._shown and self.matches.highlighted is not None:
+            self.choose(self._shown[self.matches.highlighted])
+
+    def on_option_list_option_selected(self, event: widgets.OptionList.OptionSelected) -> None:
+        event.stop()
+
+        if event.option_index < len(self._shown):
+            self.choose(self._shown[event.option_index])
+
+    def on_descendant_blur(self) -> None:
+        # Focus moves between the text box and the matches without hiding them
+        self.call_after_refresh(lambda: self.set_expanded(self.has_focus_within))
+
+    def action_focus_matches(self) -> None:
+        self.set_expanded(True)
+        self.matches.focus()
+
+    def action_collapse(self) -> None:
+        self.set_expanded(False)
+        self.input.focus()
@@ -1,2 +1,13 @@
 from .field import Field
-from .field import SelectionField
\ No newline at end of file
+from .field import FieldSpec
+from .field import FieldBehavior
+from .field import SelectionField
+from .field import SelectionFieldSpec
+from .workflow import Workflow
+from .workflow import WorkflowSpec
+from .workflow import WorkflowBehavior
+from .workflow import ExclusiveGroup
+from .history import HistoryStore
+from .history import HistoryIndex
+from .constraints import ConstraintGraph
+from .constraints import ConstraintState
@@ -0,0 +1,81 @@
+"""
+Defines where ArgUI keeps the data it stores between launches, such as history and completion indices,
+and how that data is written and named
+"""
+from __future__ import annotations
+
+import os
+import sys
+import types
+import typing
+import hashlib
+import pathlib
+import argparse
+import tempfile
+
+CACHE_DIRECTORY_VARIABLE: typing.Final[str] = "ARGUI_CACHE_DIR"
+"""The environment variable that may point to where ArgUI should store cached data. Caching is disabled if empty"""
+
+
+def get_cache_directory() -> typing.Optional[pathlib.Path]:
+    """
+    Get the directory that ArgUI should store cached data in for the current user
+
+    Returns:
+        The path to the cache directory, `None` if caching has been disabled
+    """
+    configured_directory: typing.Optional[str] = os.environ.get(CACHE_DIRECTORY_VARIABLE)
+
+    if configured_directory is not None:
+        return pathlib.Path(configured_directory).expanduser() if configured_directory else None
+
+    if sys.platform.startswith("win"):
+        base_directory = pathlib.Path(os.environ.get("LOCALAPPDATA", pathlib.Path.home() / "AppData" / "Local"))
+        return base_directory / "argui" / "Cache"
+
+    if sys.platform == "darwin":
+        return pathlib.Path.home() / "Library" / "Caches" / "argui"
+
+    return pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache") / "argui"
+
+
+def write_atomically(path: pathlib.Path, content: bytes) -> None:
+    """
+    Write a file so that readers see either the old contents or the complete new contents
+
+    Args:
+        path: Where to write the file
+        content: What to write
+    """
+    file_descriptor, temporary_path = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+
+    try:
+        with os.fdopen(file_descriptor, "wb") as temporary_file:
+            temporary_file.write(content)
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        pathlib.Path(temporary_path).unlink(missing_ok=True)
+        raise
+
+
+def get_program_key(parser: argparse.ArgumentParser) -> str:
+    """
+    Get a short, filesystem safe key identifying the program that a parser belongs to
+
+    Programs are told apart by the script that was run as well as by their names, so two programs
+    that happen to share a name don't overwrite each other's stored data
+
+    Args:
+        parser: The parser to identify
+
+    Returns:
+        A key shared by every version of the parser
+    """
+    main_module: typing.Optional[types.ModuleType] = sys.modules.get("__main__")
+    source_path: typing.Optional[str] = getattr(main_module, "__file__", None)
+    source: str = os.path.abspath(source_path) if source_path else ""
+
+    program: bytes = f"{source}\x1f{parser.prog}".encode("utf-8", errors="surrogatepass")
+    return hashlib.blake2b(program, digest_size=8).hexdigest()
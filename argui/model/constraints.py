@@ -0,0 +1,259 @@
+"""
+Defines the constraints that must hold before a workflow may be submitted and tracks them as values are entered
+
+A `ConstraintGraph` is built once per workflow. Every field is given a bit and every constraint is a
+bitset over those bits: required fields and required exclusive groups need at least one of their bits
+set, while exclusive groups allow no more than one. Each field knows which constraints depend on it, so
+a `ConstraintState` only has to reevaluate those constraints when a value changes. Which constraints are
+broken is itself kept as a bitset, so checking whether a workflow may be submitted is a single comparison.
+"""
+from __future__ import annotations
+
+import typing
+
+from .field import FieldBehavior
+from .workflow import WorkflowBehavior
+
+AT_LEAST_ONE: typing.Final[int] = 0
+"""The kind of constraint that needs at least one of its fields to be given"""
+
+AT_MOST_ONE: typing.Final[int] = 1
+"""The kind of constraint that allows no more than one of its fields to be given"""
+
+
+def get_flag_names(field: FieldBehavior) -> str:
+    """
+    Describe a field the way argparse does in its error messages
+
+    Args:
+        field: The field to describe
+
+    Returns:
+        The field's flags joined by slashes, or its name if it is positional
+    """
+    return "/".join(field.flags) if field.flags else field.name
+
+
+class Constraint(typing.NamedTuple):
+    """
+    A rule over a set of fields
+    """
+    kind: int
+    """Either `AT_LEAST_ONE` or `AT_MOST_ONE`"""
+
+    mask: int
+    """The bits of the fields that the rule covers"""
+
+    description: str
+    """What is wrong when the rule is broken"""
+
+    def is_broken(self, given: int) -> bool:
+        """
+        Determine if the rule is broken
+
+        Args:
+            given: The bits of every field that has been given
+
+        Returns:
+            True if the rule is broken
+        """
+        covered: int = given & self.mask
+
+        if self.kind == AT_LEAST_ONE:
+            return covered == 0
+
+        # Clearing the lowest set bit leaves something behind only if more than one bit was set
+        return covered & (covered - 1) != 0
+
+
+class ConstraintGraph:
+    """
+    The constraints for a single workflow along with which constraints depend on each field
+
+    Fields that share a name share a value on the screen, so they also share a bit
+    """
+    __slots__ = ("workflow", "fields", "bits", "constraints", "dependents")
+
+    def __init__(self, workflow: WorkflowBehavior):
+        """
+        Args:
+            workflow: The workflow whose constraints should be tracked
+        """
+        self.workflow: WorkflowBehavior = workflow
+        self.fields: typing.Dict[str, FieldBehavior] = {}
+        self.bits: typing.Dict[str, int] = {}
+        self.constraints: typing.List[Constraint] = []
+        self.dependents: typing.Dict[str, typing.Tuple[int, ...]] = {}
+
+        for field in workflow.fields:
+            if field.name not in self.bits:
+                self.bits[field.name] = 1 << len(self.bits)
+                self.fields[field.name] = field
+
+        for field in workflow.fields:
+            if field.required:
+                self.add_constraint(
+                    AT_LEAST_ONE,
+                    [field.name],
+                    f"the following arguments are required: {get_flag_names(field)}"
+                )
+
+        for group in workflow.exclusive_groups:
+            group_fields: typing.List[FieldBehavior] = [workflow.fields[position] for position in group.fields]
+            group_names: typing.List[str] = [field.name for field in group_fields]
+            flag_names: str = " ".join(get_flag_names(field) for field in group_fields)
+
+            self.add_constraint(AT_MOST_ONE, group_names, f"only one of these arguments may be given: {flag_names}")
+
+            if group.required:
+                self.add_constraint(AT_LEAST_ONE, group_names, f"one of the arguments {flag_names} is required")
+
+    def add_constraint(self, kind: int, field_names: typing.Iterable[str], description: str) -> None:
+        """
+        Add a rule and make it depend on each of its fields
+
+        Args:
+            kind: Either `AT_LEAST_ONE` or `AT_MOST_ONE`
+            field_names: The names of the fields that the rule covers
+            description: What is wrong when the rule is broken
+        """
+        mask: int = 0
+
+        for field_name in field_names:
+            mask |= self.bits[field_name]
+
+        constraint_index: int = len(self.constraints)
+        self.constraints.append(Constraint(kind=kind, mask=mask, description=description))
+
+        for field_name in field_names:
+            dependents: typing.Tuple[int, ...] = self.dependents.get(field_name, ())
+
+            if constraint_index not in dependents:
+                self.dependents[field_name] = dependents + (constraint_index,)
+
+    def is_given(self, field_name: str, value: typing.Any) -> bool:
+        """
+        Determine if a value would put its field on the command line
+
+        Args:
+            field_name: The name of the field
+            value: The value entered for the field
+
+        Returns:
+            True if the value would be passed as an argument
+        """
+        return value is not None and bool(self.fields[field_name].to_arguments(value))
+
+    def get_broken(self, given: int) -> int:
+        """
+        Evaluate every rule
+
+        Args:
+            given: The bits of every field that has been given
+
+        Returns:
+            The bits of every rule that is broken
+        """
+        broken: int = 0
+
+        for constraint_index, constraint in enumerate(self.constraints):
+            if constraint.is_broken(given):
+                broken |= 1 << constraint_index
+
+        return broken
+
+    def __len__(self) -> int:
+        return len(self.constraints)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.workflow.name} - {len(self)} constraints>"
+
+
+class ConstraintState:
+    """
+    Tracks which of a workflow's constraints are broken as the values of its fields change
+    """
+    __slots__ = ("graph", "given", "broken")
+
+    def __init__(self, graph: ConstraintGraph, values: typing.Optional[typing.Mapping[str, typing.Any]] = None):
+        """
+        Args:
+            graph: The constraints to track
+            values: The values that have already been entered, mapped to the names of their fields
+        """
+        self.graph: ConstraintGraph = graph
+        self.given: int = 0
+
+        for field_name, value in (values or {}).items():
+            if field_name in graph.bits and graph.is_given(field_name, value):
+                self.given |= graph.bits[field_name]
+
+        self.broken: int = graph.get_broken(self.given)
+
+    def update(self, field_name: str, value: typing.Any) -> bool:
+        """
+        Record a new value for a field and reevaluate only the constraints that depend on it
+
+        Args:
+            field_name: The name of the field whose value changed
+            value: The new value of the field. `None` means that nothing is entered
+
+        Returns:
+            True if whether the constraints are satisfied changed
+        """
+        bit: typing.Optional[int] = self.graph.bits.get(field_name)
+
+        if bit is None:
+            return False
+
+        given: int = self.given | bit if self.graph.is_given(field_name, value) else self.given & ~bit
+
+        if given == self.given:
+            return False
+
+        was_satisfied: bool = self.broken == 0
+        self.given = given
+
+        for constraint_index in self.graph.dependents.get(field_name, ()):
+            if self.graph.constraints[constraint_index].is_broken(given):
+                self.broken |= 1 << constraint_index
+            else:
+                self.broken &= ~(1 << constraint_index)
+
+        return was_satisfied != (self.broken == 0)
+
+    def is_satisfied(self, command_chosen: bool = False) -> bool:
+        """
+        Determine if the workflow's values may be submitted
+
+        Args:
+            command_chosen: Whether one of the workflow's commands has been chosen
+
+        Returns:
+            True if no constraint is broken and a command has been chosen if one is required
+        """
+        return self.broken == 0 and (command_chosen or not self.graph.workflow.command_required)
+
+    def describe_problems(self, command_chosen: bool = False) -> typing.List[str]:
+        """
+        Describe every broken constraint
+
+        Args:
+            command_chosen: Whether one of the workflow's commands has been chosen
+
+        Returns:
+            A description of each broken constraint
+        """
+        problems: typing.List[str] = [
+            constraint.description
+            for constraint_index, constraint in enumerate(self.graph.constraints)
+            if self.broken >> constraint_index & 1
+        ]
+
+        if not command_chosen and self.graph.workflow.command_required:
+            problems.append("a command must be chosen")
+
+        return problems
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {bin(self.broken).count('1')} broken of {len(self.graph)}>"
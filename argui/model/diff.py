@@ -0,0 +1,242 @@
+"""
+Provides a structural diff between two versions of a workflow, such as before and after its parser's source changed
+
+Fields are matched by name within each workflow and subworkflows by their command names. Only
+subworkflows that were converted in the old tree are compared, since nothing can depend on the
+others yet, so the cost of a diff follows what was visited and what changed rather than the size of
+the whole command line.
+"""
+from __future__ import annotations
+
+import typing
+
+from argui.utilities.fingerprint import describe_value
+
+from .field import FieldBehavior
+from .workflow import WorkflowBehavior
+
+WorkflowPath = typing.Tuple[str, ...]
+"""The names of the commands that lead from the root workflow to a subworkflow"""
+
+FIELD_ATTRIBUTES: typing.Final[typing.Tuple[str, ...]] = (
+    "help",
+    "default",
+    "flags",
+    "type",
+    "required",
+    "nargs",
+    "action",
+    "const",
+    "widget",
+    "widget_parameters",
+    "exclusive",
+    "options",
+    "provider",
+)
+"""The attributes of a field that change how it is shown or what may be entered into it"""
+
+WORKFLOW_ATTRIBUTES: typing.Final[typing.Tuple[str, ...]] = (
+    "name",
+    "description",
+    "epilog",
+    "help",
+    "command_destination",
+    "command_required",
+    "defaults",
+    "exclusive_groups",
+)
+"""The attributes of a workflow, other than its fields and subworkflows, that a screen or its constraints depend on"""
+
+
+class WorkflowDiff(typing.NamedTuple):
+    """
+    What changed within a workflow and the subworkflows that were compared beneath it
+    """
+    path: WorkflowPath
+    """The commands leading to the workflow"""
+
+    added_fields: typing.Tuple[str, ...] = ()
+    """The names of fields that only the new workflow has"""
+
+    removed_fields: typing.Tuple[str, ...] = ()
+    """The names of fields that only the old workflow has"""
+
+    changed_fields: typing.Tuple[str, ...] = ()
+    """The names of fields that both workflows have but describe differently"""
+
+    reordered: bool = False
+    """Whether the fields both workflows have are in a different order"""
+
+    attributes_changed: bool = False
+    """Whether anything other than the fields and commands of the workflow changed, such as its description"""
+
+    added_commands: typing.Tuple[str, ...] = ()
+    """The commands that only the new workflow has"""
+
+    removed_commands: typing.Tuple[str, ...] = ()
+    """The commands that only the old workflow has"""
+
+    children: typing.Tuple[WorkflowDiff, ...] = ()
+    """The diffs of the subworkflows both workflows have that were converted in the old one"""
+
+    @property
+    def fields_changed(self) -> bool:
+        """
+        Whether the workflow's own fields differ
+        """
+        return bool(self.added_fields or self.removed_fields or self.changed_fields or self.reordered)
+
+    @property
+    def commands_changed(self) -> bool:
+        """
+        Whether the workflow leads to a different set of commands
+        """
+        return bool(self.added_commands or self.removed_commands)
+
+    @property
+    def is_local_change(self) -> bool:
+        """
+        Whether anything about the workflow itself changed, ignoring its subworkflows
+        """
+        return self.fields_changed or self.commands_changed or self.attributes_changed
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Whether nothing changed within the workflow or anything beneath it
+        """
+        return not self.is_local_change and all(child.is_empty for child in self.children)
+
+    def walk(self) -> typing.Iterator[WorkflowDiff]:
+        """
+        Visit this diff and every diff beneath it, parents first
+        """
+        yield self
+
+        for child in self.children:
+            yield from child.walk()
+
+    def describe(self) -> str:
+        """
+        Summarize what changed, such as for a notification
+        """
+        parts: typing.List[str] = []
+
+        for diff in self.walk():
+            location: str = " ".join(diff.path) or "top level"
+            changes: typing.List[str] = [
+                f"{description} {', '.join(names)}"
+                for description, names in (
+                    ("added", diff.added_fields + diff.added_commands),
+                    ("removed", diff.removed_fields + diff.removed_commands),
+                    ("changed", diff.changed_fields),
+                )
+                if names
+            ]
+
+            if diff.reordered:
+                changes.append("reordered fields")
+            if diff.attributes_changed:
+                changes.append("changed details")
+            if changes:
+                parts.append(f"{location}: {'; '.join(changes)}")
+
+        return "\n".join(parts) or "Nothing changed"
+
+
+def describe_field(field: FieldBehavior) -> typing.Tuple[str, ...]:
+    """
+    Describe what a field looks like and accepts in a way that survives reloading the modules that define it
+    """
+    return (type(field).__name__, *(describe_value(getattr(field, name, None)) for name in FIELD_ATTRIBUTES))
+
+
+def get_field_keys(fields: typing.Sequence[FieldBehavior]) -> typing.List[str]:
+    """
+    Key fields by name, numbering the repeats of a name so that each key is unique
+    """
+    keys: typing.List[str] = []
+    counts: typing.Dict[str, int] = {}
+
+    for field in fields:
+        count: int = counts.get(field.name, 0)
+        counts[field.name] = count + 1
+        keys.append(field.name if count == 0 else f"{field.name}#{count}")
+
+    return keys
+
+
+def diff_workflows(old: WorkflowBehavior, new: WorkflowBehavior, path: WorkflowPath = ()) -> WorkflowDiff:
+    """
+    Compare two versions of a workflow
+
+    Subworkflows of the new workflow are only converted if their counterpart in the old one was
+
+    Args:
+        old: The workflow as it was
+        new: The workflow as it is now
+        path: The commands leading to the workflows
+
+    Returns:
+        What changed
+    """
+    old_fields: typing.Dict[str, FieldBehavior] = dict(zip(get_field_keys(old.fields), old.fields))
+    new_fields: typing.Dict[str, FieldBehavior] = dict(zip(get_field_keys(new.fields), new.fields))
+    shared_fields: typing.List[str] = [key for key in old_fields if key in new_fields]
+
+    changed_fields: typing.Tuple[str, ...] = tuple(
+        key
+        for key in shared_fields
+        if describe_field(old_fields[key]) != describe_field(new_fields[key])
+    )
+
+    attributes_changed: bool = any(
+        describe_value(getattr(old, name, None)) != describe_value(getattr(new, name, None))
+        for name in WORKFLOW_ATTRIBUTES
+    ) or old.subworkflows.aliases != new.subworkflows.aliases
+
+    children: typing.List[WorkflowDiff] = [
+        diff_workflows(old.subworkflows[command_name], new.subworkflows[command_name], path + (command_name,))
+        for command_name in old.subworkflows
+        if command_name in new.subworkflows and old.subworkflows.is_materialized(command_name)
+    ]
+
+    return WorkflowDiff(
+        path=path,
+        added_fields=tuple(key for key in new_fields if key not in old_fields),
+        removed_fields=tuple(key for key in old_fields if key not in new_fields),
+        changed_fields=changed_fields,
+        reordered=shared_fields != [key for key in new_fields if key in old_fields],
+        attributes_changed=attributes_changed,
+        added_commands=tuple(command_name for command_name in new.subworkflows if command_name not in old.subworkflows),
+        removed_commands=tuple(command_name for command_name in old.subworkflows if command_name not in new.subworkflows),
+        children=tuple(children)
+    )
+
+
+def graft_unchanged(old: WorkflowBehavior, new: WorkflowBehavior, diff: WorkflowDiff) -> WorkflowBehavior:
+    """
+    Carry every subworkflow that didn't change from the old tree into the new one
+
+    Whatever refers to an unchanged subworkflow, such as a screen showing it, may then keep doing so
+
+    Args:
+        old: The workflow as it was
+        new: The workflow as it is now
+        diff: What changed between them
+
+    Returns:
+        The old workflow if nothing changed at all, otherwise the new one
+    """
+    if diff.is_empty:
+        return old
+
+    for child in diff.children:
+        command_name: str = child.path[-1]
+        new.subworkflows[command_name] = graft_unchanged(
+            old.subworkflows[command_name],
+            new.subworkflows[command_name],
+            child
+        )
+
+    return new
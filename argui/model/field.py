@@ -1,11 +1,20 @@
 """
 Defines the basic models used to demonstrate a field on the screen in a way that 
 is easier for the library to understand than just the ArgumentParser
+
+Fields come in two forms that behave the same way: validated pydantic models for configs and
+exports, and compact slotted specs for parsers converted within the running application
 """
+from __future__ import annotations
+
+import abc
+import sys
+import types
 import typing
-import re
 import string
-import pathlib
+import argparse
+import functools
+import dataclasses
 
 from textual import widgets
 from textual.widget import Widget
@@ -14,14 +23,344 @@ from textual.containers import Container
 import pydantic
 
 from argui.utilities import actions
+from argui.utilities.common import resolve_name
+from argui.utilities.items import ItemStore
+from argui.utilities.providers import ChoiceProvider
+from argui.utilities.fingerprint import get_qualified_name
+from argui.utilities import tracing
+
+SWITCH_ACTIONS: typing.Final[typing.FrozenSet[str]] = frozenset({
+    "store_true", "store_false", "store_const", "append_const", actions.BOOLEAN_OPTIONAL_ACTION
+})
+"""The names of argparse actions whose values are determined by whether their flag is present"""
 
-INVALID_CHARACTER_PATTERN: re.Pattern = re.compile(f"[{string.whitespace + string.punctuation}]+")
+DEFAULTED_SWITCH_ACTIONS: typing.Final[typing.FrozenSet[str]] = frozenset({
+    "store_false", actions.BOOLEAN_OPTIONAL_ACTION
+})
+"""The names of switch actions whose switches start out showing the default rather than off"""
+
+CONVERTED_ACTIONS: typing.Final[typing.FrozenSet[str]] = frozenset({"store", "append", "extend"})
+"""The names of argparse actions that pass entered text through the field's type"""
 
 
 class CompoundWidget(pydantic.BaseModel):
     """Represents a widget that my be constructed by combining other widgets"""
 
-class Field(pydantic.BaseModel):
+class FieldBehavior(abc.ABC):
+    """
+    What every field can do, regardless of how its attributes are stored
+
+    Fields are either validated pydantic models, used for configs and exports, or slotted specs,
+    used when a parser is converted within the running application
+    """
+    __slots__ = ()
+
+    index: int
+    name: str
+    help: typing.Optional[str]
+    default: typing.Any
+    flags: typing.Sequence[str]
+    type: typing.Any
+    required: bool
+    nargs: typing.Optional[typing.Union[int, str]]
+    action: str
+    const: typing.Any
+    widget: typing.Any
+    widget_parameters: typing.Mapping[str, typing.Any]
+    _widget_id: typing.Optional[str]
+
+    @abc.abstractmethod
+    def to_model(self) -> Field:
+        """
+        Get a validated model of the field that may be serialized
+        """
+
+    @property
+    def safe_name(self) -> str:
+        """
+        A name that may be used for the field that does not contain illegal characters for id purposes
+        """
+        return sanitize_name(self.name)
+
+    @property
+    def widget_id(self) -> str:
+        """
+        The id of the container that holds the field on the screen
+
+        Workflows assign ids to all of their fields at once so that they are unique on a screen
+        """
+        if self._widget_id is None:
+            self._widget_id = f"field_{self.index}_{self.safe_name}"
+        return self._widget_id
+
+    @widget_id.setter
+    def widget_id(self, widget_id: str) -> None:
+        self._widget_id = widget_id
+
+    @property
+    def input_id(self) -> str:
+        """
+        The id of the widget on the screen that the value of the field is entered into
+        """
+        return f"{self.widget_id}_input"
+
+    @property
+    def is_switch(self) -> bool:
+        """
+        Whether the value for the field is determined by the presence of its flag
+        """
+        return self.action in SWITCH_ACTIONS
+
+    @property
+    def negative_flags(self) -> typing.Tuple[str, ...]:
+        """
+        The `--no-flag` options that argparse adds alongside each `--flag` of a `BooleanOptionalAction`
+        """
+        if self.action != actions.BOOLEAN_OPTIONAL_ACTION:
+            return ()
+
+        return tuple(
+            flag
+            for flag in self.flags
+            if flag.startswith("--no-") and "--" + flag[len("--no-"):] in self.flags
+        )
+
+    @property
+    def accepts_multiple_values(self) -> bool:
+        """
+        Whether more than one value may be entered for this field
+        """
+        return self.action in ("append", "extend") or actions.accepts_multiple_values(self.nargs)
+
+    @property
+    def uses_item_editor(self) -> bool:
+        """
+        Whether values for this field are entered as a list of items, since it takes any number of them
+        """
+        return (
+            self.widget is None
+            and self.nargs in actions.LIST_NARGS
+            and issubclass(actions.get_action_type(self.action), actions.ITEM_ACTIONS)
+        )
+
+    @property
+    def type_conversion(self) -> typing.Optional[typing.Callable[[str], typing.Any]]:
+        """
+        The function that each entered value is passed through when parsed, if it needs to be checked
+        """
+        if self.action not in CONVERTED_ACTIONS or self.type is str or not callable(self.type):
+            return None
+
+        return self.type
+
+    @property
+    def conversion(self) -> typing.Optional[typing.Callable[[str], typing.Any]]:
+        """
+        The function that entered text is passed through when parsed, if the screen needs to check it
+
+        Lists of items are checked by their editor as items are added, so the screen leaves them alone
+        """
+        if self.uses_item_editor:
+            return None
+
+        return self.type_conversion
+
+    def get_input_builder(self) -> typing.Union[typing.Type[Widget], actions.WidgetBuilder]:
+        """
+        Find what builds the widget that values for the field are entered into
+
+        Returns:
+            The widget class or builder, called with the value, placeholder, and id of the input
+        """
+        action_type: typing.Type[argparse.Action] = actions.get_action_type(self.action)
+
+        # Switches are always built by the widget registered for their action
+        if self.is_switch:
+            return actions.get_widget_for(action_type, bool)
+
+        if isinstance(self.widget, str):
+            return resolve_name(self.widget)
+
+        if self.widget is not None:
+            return self.widget
+
+        return actions.get_widget_for(action_type, self.type, self.nargs)
+
+    def get_initial_value(self, value: typing.Any = None) -> typing.Any:
+        """
+        Get the value that the input for the field starts out with
+
+        Args:
+            value: A value that was already entered for the field. The default is shown if `None`
+
+        Returns:
+            The value to build the input with
+        """
+        if self.is_switch:
+            if value is None:
+                return self.default if self.action in DEFAULTED_SWITCH_ACTIONS else False
+            return value
+
+        if value is None:
+            value = self.default
+
+        # Lists of items are edited as they are rather than as text
+        if self.uses_item_editor:
+            return value
+
+        return str(value) if value is not None and not isinstance(value, (list, tuple)) else None
+
+    def build_input(self, value: typing.Any = None) -> Widget:
+        """
+        Build the widget that a value for the field will be entered into
+
+        Args:
+            value: A value that was already entered for the field. The default is shown if `None`
+
+        Returns:
+            A widget instance that values will be entered into
+        """
+        return self.get_input_builder()(
+            value=self.get_initial_value(value),
+            placeholder=self.help or "",
+            id=self.input_id,
+            **self.widget_parameters
+        )
+
+    def build_widget(self, value: typing.Any = None) -> Container:
+        """
+        Build the element that represents the field on the screen
+
+        Args:
+            value: A value that was already entered for the field. The default is shown if `None`
+
+        Returns:
+            A widget instance to place on the screen
+        """
+        with tracing.span("build_widget", field=self.name):
+            container_elements: typing.List[Widget] = [
+                widgets.Label(self.name, id=f"{self.widget_id}_label"),
+                self.build_input(value)
+            ]
+
+            container = Container(
+                *container_elements,
+                name=self.safe_name,
+                id=self.widget_id,
+                classes="field"
+            )
+        return container
+
+    def to_arguments(self, value: typing.Any) -> typing.List[str]:
+        """
+        Convert a value entered on the screen into the CLI arguments that would have provided it
+
+        Args:
+            value: The value that was entered for the field
+
+        Returns:
+            The arguments to pass to `parse_args` in order to get the value
+        """
+        if self.action == actions.BOOLEAN_OPTIONAL_ACTION:
+            # Leaving the switch as the default is the same as leaving both flags out
+            if bool(value) == bool(self.default):
+                return []
+
+            negative_flags: typing.Tuple[str, ...] = self.negative_flags
+            chosen_flags: typing.List[str] = [
+                flag
+                for flag in self.flags
+                if (flag in negative_flags) != bool(value)
+            ]
+            return [max(chosen_flags, key=len)] if chosen_flags else []
+
+        flag: typing.Optional[str] = max(self.flags, key=len) if self.flags else None
+
+        if self.is_switch:
+            flag_is_present: bool = not value if self.action == "store_false" else bool(value)
+            return [flag] if flag and flag_is_present else []
+
+        if self.action == "count":
+            return [flag] * int(value or 0) if flag else []
+
+        if value is None or value == "" or value == []:
+            return []
+
+        values: typing.List[str] = [
+            str(entry)
+            for entry in (value if isinstance(value, (list, tuple, ItemStore)) else [value])
+        ]
+
+        if flag is None:
+            return values
+
+        if self.action == "append":
+            return [argument for entry in values for argument in (flag, entry)]
+
+        return [flag, *values]
+
+
+class SelectionBehavior(FieldBehavior):
+    """What every field that chooses values from a set of options can do"""
+    __slots__ = ()
+
+    exclusive: bool
+    options: typing.Sequence[typing.Union[str, int, typing.Tuple[str, typing.Union[str, int]]]]
+    provider: typing.Optional[ChoiceProvider]
+
+    @property
+    def labeled_options(self) -> typing.List[typing.Tuple[str, typing.Union[str, int]]]:
+        """
+        The options for the field paired with the text used to display them
+        """
+        return [
+            option if isinstance(option, tuple) else (str(option), option)
+            for option in self.options
+        ]
+
+    @property
+    def uses_item_editor(self) -> bool:
+        """
+        Options are chosen from the selector rather than entered as items
+        """
+        return False
+
+    @property
+    def conversion(self) -> typing.Optional[typing.Callable[[str], typing.Any]]:
+        """
+        Options are chosen rather than typed, so they never need to be checked
+        """
+        return None
+
+    def get_input_builder(self) -> typing.Union[typing.Type[Widget], actions.WidgetBuilder]:
+        """
+        Find what builds the selector that values for the field are chosen from
+
+        Returns:
+            The selector's builder, called with the value, placeholder, and id of the input
+        """
+        return actions.get_widget_for(
+            actions.get_action_type(self.action),
+            self.type,
+            self.nargs,
+            choices=self.provider if self.provider is not None else self.options,
+            multiple=not self.exclusive
+        )
+
+    def get_initial_value(self, value: typing.Any = None) -> typing.Any:
+        """
+        Get the value that the selector starts out with. Options are selected as they are, not as text
+
+        Args:
+            value: A value that was already selected for the field. The default is shown if `None`
+
+        Returns:
+            The value to build the selector with
+        """
+        return self.default if value is None else value
+
+
+class Field(FieldBehavior, pydantic.BaseModel):
     """Represents a field on the screen"""
     index: int = pydantic.Field(description="The index of the field on the screen", ge=0)
     name: str = pydantic.Field(description="The name of the field")
@@ -36,48 +375,67 @@ class Field(pydantic.BaseModel):
         description="The type that this value should be within the python application"
     )
     required: bool = pydantic.Field(False)
-    widget: typing.Union[str, typing.Type[Widget], CompoundWidget] = pydantic.Field(
-        "textual.widgets.Input",
-        description="What core widget to use to render the field"
+    nargs: typing.Optional[typing.Union[int, str]] = pydantic.Field(
+        None,
+        description="The number of values that the field accepts, using the same notation as argparse"
+    )
+    action: str = pydantic.Field(
+        "store",
+        description="The name of the argparse action that stores the value of the field"
+    )
+    const: typing.Any = pydantic.Field(
+        None,
+        description="The value stored by actions like 'store_const' when the flag is present"
+    )
+    widget: typing.Optional[typing.Union[str, typing.Type[Widget], CompoundWidget]] = pydantic.Field(
+        None,
+        description="What core widget to use to render the field. Determined by the type of the field if not given"
     )
     widget_parameters: typing.Dict[str, typing.Any] = pydantic.Field(
-        default_factory={},
+        default_factory=dict,
         description="Specialized parameters needed to express how to build the final widget"
     )
+    _widget_id: typing.Optional[str] = pydantic.PrivateAttr(None)
 
-    @property
-    def safe_name(self) -> str:
+    @pydantic.field_serializer("type", "widget", when_used="json")
+    def serialize_importable(self, value: typing.Any) -> typing.Any:
         """
-        A name that may be used for the field that does not contain illegal characters for id purposes
+        Store classes and functions by the name that they may be imported by
+
+        Args:
+            value: The class or function to serialize
+
+        Returns:
+            The name that the value may be imported by
         """
+        if value is None or isinstance(value, (str, CompoundWidget)):
+            return value
+
+        qualified_name: typing.Optional[str] = get_qualified_name(value)
 
+        if qualified_name is None:
+            raise ValueError(f"'{value}' cannot be imported by name and may not be serialized")
 
-    def build_widget(self) -> Container:
+        return qualified_name
+
+    @classmethod
+    def from_action(cls, action: argparse.Action, index: int) -> Field:
         """
-        Build the element that represents the field on the screen
+        Create a validated field that represents an argparse action
+
+        Args:
+            action: The argparse action that will be represented on the screen
+            index: The index of the field on the screen
 
         Returns:
-            A widget instance to place on the screen
+            A field that may be used to enter a value for the action
         """
-        sanitized_name: str = sanitize_name(self.name)
-        widget_id: str = f"{self.index}_{sanitized_name}"
-        container_elements: typing.List[Widget] = [
-            widgets.Label(self.name, id=f"{widget_id}_label")
-        ]
-        
-        if self.type == pathlib.Path:
-            pass
-        else:
-            input_class = actions.get_
+        return FieldSpec.from_action(action, index).to_model()
 
-        container = Container(
-            *container_elements,
-            name=sanitized_name,
-            id=f"{self.index}_{sanitized_name}"
-        )
-        return container
+    def to_model(self) -> Field:
+        return self
 
-class SelectionField(Field):
+class SelectionField(SelectionBehavior, Field):
     """Represents a field on the screen that acts a selector for more than one value"""
     exclusive: bool = pydantic.Field(True, description="Shows that only one of the values may be selected")
     options: typing.Union[
@@ -86,6 +444,244 @@ class SelectionField(Field):
             typing.Tuple[str, typing.Union[str, int]]
         ]
     ] = pydantic.Field(default_factory=list, description="The values available to select")
+    provider: typing.Optional[typing.Any] = pydantic.Field(
+        None,
+        description="Where the values available to select are loaded from once they are needed"
+    )
+
+    @pydantic.field_validator("provider", mode="before")
+    @classmethod
+    def validate_provider(cls, value: typing.Any) -> typing.Optional[ChoiceProvider]:
+        """
+        Recreate a provider that was stored by name
+
+        Args:
+            value: A provider, a stored provider, or `None`
+
+        Returns:
+            The provider
+        """
+        if isinstance(value, typing.Mapping):
+            return ChoiceProvider.from_data(value)
+
+        if value is not None and not isinstance(value, ChoiceProvider):
+            raise ValueError(f"'{value}' is not a ChoiceProvider")
+
+        return value
+
+    @pydantic.field_serializer("provider", when_used="json")
+    def serialize_provider(self, value: typing.Optional[ChoiceProvider]) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """
+        Store a provider by the name of its source
+        """
+        return None if value is None else value.to_data()
+
+EMPTY_MAPPING: typing.Final[typing.Mapping[str, typing.Any]] = types.MappingProxyType({})
+"""An empty mapping shared by every spec without widget parameters or defaults so that none need a dictionary of their own"""
+
+
+def intern_text(text: typing.Optional[str]) -> typing.Optional[str]:
+    """
+    Share a single copy of text that many fields are likely to repeat, such as help text or names
+
+    Args:
+        text: The text to share
+
+    Returns:
+        The shared copy of the text
+    """
+    return sys.intern(text) if type(text) is str else text
+
+
+@dataclasses.dataclass(slots=True)
+class FieldSpec(FieldBehavior):
+    """
+    A compact field built from a parser within the running application
+
+    Specs carry the same attributes as `Field` in slots rather than a validated model, sharing their
+    text and empty containers. The parser that they come from has already enforced its own rules,
+    so nothing is validated until `to_model` is called for an export.
+    """
+    index: int
+    name: str
+    help: typing.Optional[str] = None
+    default: typing.Any = None
+    flags: typing.Tuple[str, ...] = ()
+    type: typing.Any = str
+    required: bool = False
+    nargs: typing.Optional[typing.Union[int, str]] = None
+    action: str = "store"
+    const: typing.Any = None
+    widget: typing.Any = None
+    widget_parameters: typing.Mapping[str, typing.Any] = dataclasses.field(default_factory=lambda: EMPTY_MAPPING)
+    _widget_id: typing.Optional[str] = dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_action(cls, action: argparse.Action, index: int) -> FieldSpec:
+        """
+        Create a field spec that represents an argparse action
+
+        Args:
+            action: The argparse action that will be represented on the screen
+            index: The index of the field on the screen
+
+        Returns:
+            A field spec that may be used to enter a value for the action
+        """
+        action_name: str = actions.get_action_name(action)
+
+        if action_name in SWITCH_ACTIONS:
+            value_type: typing.Any = bool
+        elif action_name == "count":
+            value_type = int
+        elif action.type is not None:
+            value_type = action.type
+        else:
+            value_type = str
+
+        field_parameters: typing.Dict[str, typing.Any] = {
+            "index": index,
+            "name": intern_text(action.dest),
+            "help": intern_text(action.help) if action.help != argparse.SUPPRESS else None,
+            "default": action.default if action.default != argparse.SUPPRESS else None,
+            "flags": tuple(intern_text(flag) for flag in action.option_strings),
+            "type": value_type,
+            "required": action.required,
+            "nargs": action.nargs,
+            "action": action_name,
+            "const": action.const,
+        }
+
+        if isinstance(action.choices, ChoiceProvider):
+            return SelectionFieldSpec(
+                exclusive=not actions.accepts_multiple_values(action.nargs),
+                provider=action.choices,
+                **field_parameters
+            )
+
+        if action.choices:
+            return SelectionFieldSpec(
+                exclusive=not actions.accepts_multiple_values(action.nargs),
+                options=tuple(
+                    choice if isinstance(choice, (str, int)) else str(choice)
+                    for choice in action.choices
+                ),
+                **field_parameters
+            )
+
+        return cls(**field_parameters)
+
+    def to_model(self) -> Field:
+        return Field(**{name: getattr(self, name) for name in Field.model_fields})
+
+
+@dataclasses.dataclass(slots=True)
+class SelectionFieldSpec(SelectionBehavior, FieldSpec):
+    """A compact field that chooses values from a set of options"""
+    exclusive: bool = True
+    options: typing.Tuple[typing.Union[str, int, typing.Tuple[str, typing.Union[str, int]]], ...] = ()
+    provider: typing.Optional[ChoiceProvider] = None
+
+    def to_model(self) -> SelectionField:
+        return SelectionField(**{name: getattr(self, name) for name in SelectionField.model_fields})
+
+
+def get_field_kind(value: typing.Any) -> str:
+    """
+    Determine which type of field a value describes so that serialized fields come back as the right class
+
+    Args:
+        value: A field or the serialized data for a field
+
+    Returns:
+        The tag for the type of field
+    """
+    if isinstance(value, typing.Mapping):
+        return "selection" if "options" in value else "field"
+
+    return "selection" if isinstance(value, SelectionBehavior) else "field"
+
+
+FieldType = typing.Annotated[
+    typing.Union[
+        typing.Annotated[SelectionField, pydantic.Tag("selection")],
+        typing.Annotated[Field, pydantic.Tag("field")],
+    ],
+    pydantic.Discriminator(get_field_kind)
+]
+"""Any sort of field, keeping its specific class through serialization"""
+
+
+class _SanitizingTable(typing.Dict[int, str]):
+    """
+    A translation table that marks every character that may not appear in an id
+
+    Punctuation and whitespace are entered up front. Any other character is judged the first time
+    it is seen and remembered from then on, so the table only ever grows to the set of characters
+    that have actually been sanitized.
+    """
+    def __missing__(self, character: int) -> str:
+        translation: str = chr(character) if chr(character) in VALID_CHARACTERS else _INVALID_MARKER
+        self[character] = translation
+        return translation
+
+
+_INVALID_MARKER: typing.Final[str] = "\x00"
+"""What invalid characters are translated to before runs of them are collapsed"""
+
+VALID_CHARACTERS: typing.Final[typing.FrozenSet[str]] = frozenset(string.ascii_letters + string.digits)
+"""Characters that may be kept within a sanitized name"""
+
+INVALID_CHARACTERS: typing.Final[str] = (string.punctuation + string.whitespace).replace("_", "")
+"""Characters that may never be used as a replacement for invalid characters"""
+
+_SANITIZING_TABLE: _SanitizingTable = _SanitizingTable({
+    ord(character): _INVALID_MARKER
+    for character in string.punctuation + string.whitespace + _INVALID_MARKER
+})
+
+SANITIZED_NAME_CACHE_SIZE: typing.Final[int] = 8192
+"""The number of sanitized names to remember"""
+
+
+@functools.lru_cache(maxsize=SANITIZED_NAME_CACHE_SIZE)
+def _sanitize(name: str, replacement: str) -> str:
+    """
+    Replace every run of invalid characters in a name in a single pass
+
+    Args:
+        name: The name to sanitize
+        replacement: The characters to use to replace invalid characters
+
+    Returns:
+        The name that is safe to use as an id
+    """
+    translated_name: str = name.translate(_SANITIZING_TABLE)
+
+    if _INVALID_MARKER in translated_name:
+        # A string like:
+        #     ? this+ -?\ /. is # a    ____ string
+        # becomes:
+        #     _this_is_a_string
+        parts: typing.List[str] = translated_name.split(_INVALID_MARKER)
+        clean_name: str = replacement.join(part for part in parts if part)
+
+        if not clean_name:
+            clean_name = replacement
+        else:
+            if not parts[0]:
+                clean_name = replacement + clean_name
+            if not parts[-1]:
+                clean_name = clean_name + replacement
+    else:
+        clean_name = translated_name
+
+    # A leading digit isn't valid in some situations - prepend it with the replacement to
+    if clean_name[0] in string.digits:
+        clean_name = replacement + clean_name
+
+    return sys.intern(clean_name)
+
 
 def sanitize_name(name: str, replacement: str = "_") -> str:
     """
@@ -98,32 +694,76 @@ def sanitize_name(name: str, replacement: str = "_") -> str:
     Returns:
         The name that is safe to use as an id
     """
-    invalid_characters: str = (string.punctuation + string.whitespace).replace("_", "")
-    if replacement != "_" and replacement in invalid_characters:
+    if replacement != "_" and (
+        not replacement or any(character not in VALID_CHARACTERS and character != "_" for character in replacement)
+    ):
         raise ValueError(
             f"Cannot use '{replacement}' as a replacement character - it is not a sanitary character. "
-            f"Please choose a character that is not one of the following: {invalid_characters}"
+            f"Please choose a character that is not one of the following: {INVALID_CHARACTERS}"
         )
 
     if not name:
         raise ValueError("Cannot sanitize an empty name")
 
-    # Repeatedly replace invalid characters
-    #   A string like:
-    #       ? this+ -?\ /. is # a    ____ string
-    #   will become:
-    #       __this________is___a________string
-    #   keep running it until it becomes an acceptable:
-    #       _this_is_a_string
-    clean_name: str = name
-    while re.search(f"[{invalid_characters}]+", clean_name):
-        clean_name = INVALID_CHARACTER_PATTERN.sub(
-            replacement,
-            name
-        )
+    return _sanitize(name, replacement)
 
-    # A leading digit isn't valid in some situations - prepend it with the replacement to 
-    if clean_name[0] in string.digits:
-        clean_name = replacement + clean_name
 
-    return clean_name
\ No newline at end of file
+class WidgetIdAllocator:
+    """
+    Hands out unique widget ids derived from names
+
+    Ids only depend on the order in which names are allocated, so allocating the same names in the
+    same order always produces the same ids. A name that has already been used gets a numbered suffix.
+    """
+    def __init__(self, prefix: str = "field"):
+        """
+        Args:
+            prefix: Text placed before every id so that ids never start with a digit
+        """
+        self.prefix: str = sanitize_name(prefix)
+        self._used_ids: typing.Set[str] = set()
+        self._next_suffix: typing.Dict[str, int] = {}
+
+    def allocate(self, name: str) -> str:
+        """
+        Get a unique id for a name
+
+        Args:
+            name: The name that the id should resemble
+
+        Returns:
+            An id that has not been handed out by this allocator before
+        """
+        base_id: str = f"{self.prefix}_{sanitize_name(name)}" if name else self.prefix
+        widget_id: str = base_id
+
+        if widget_id in self._used_ids:
+            suffix: int = self._next_suffix.get(base_id, 1)
+            widget_id = f"{base_id}_{suffix}"
+
+            while widget_id in self._used_ids:
+                suffix += 1
+                widget_id = f"{base_id}_{suffix}"
+
+            self._next_suffix[base_id] = suffix + 1
+
+        self._used_ids.add(widget_id)
+        return widget_id
+
+    def allocate_all(self, fields: typing.Iterable[FieldBehavior]) -> typing.List[str]:
+        """
+        Assign unique ids to a collection of fields in a single pass
+
+        Args:
+            fields: The fields to assign ids to
+
+        Returns:
+            The ids that were assigned, in the same order as the fields
+        """
+        assigned_ids: typing.List[str] = []
+
+        for field in fields:
+            field.widget_id = self.allocate(field.name)
+            assigned_ids.append(field.widget_id)
+
+        return assigned_ids
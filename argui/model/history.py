@@ -0,0 +1,415 @@
+"""
+Remembers the values submitted for each workflow so that a screen may start with what was entered last
+
+Every submission is appended to a JSON lines file named after the parser's program. Each line holds
+the commands that were chosen and the values entered for each workflow along the way. Changing the
+parser keeps its history, since values are only ever prefilled into fields that still exist. Appending
+never rewrites the file; once it has grown to twice its size after the last compaction, it is
+rewritten with only the newest value sets for each workflow. The file begins with a header recording that size.
+
+Prefilling a screen only needs the newest matching entry, so the file is read backwards a block at a
+time until one is found. Recalling the past values of a single field reads the whole history once
+into a `HistoryIndex` that is searched in memory.
+"""
+from __future__ import annotations
+
+import os
+import json
+import time
+import typing
+import pathlib
+import argparse
+import collections.abc
+
+from argui.utilities.search import SearchIndex
+from argui.utilities.search import SearchSession
+from argui.utilities.search import SEARCH_RESULT_LIMIT
+
+from .cache import get_program_key
+from .cache import get_cache_directory
+from .cache import write_atomically
+
+HISTORY_FORMAT_VERSION: typing.Final[str] = "1"
+"""Changes whenever the layout of history files changes so that old files are never read"""
+
+HISTORY_LIMIT_VARIABLE: typing.Final[str] = "ARGUI_HISTORY_SIZE"
+"""The environment variable that may set how many value sets to keep for each workflow. History is disabled if 0"""
+
+DEFAULT_HISTORY_LIMIT: typing.Final[int] = 20
+"""The number of value sets kept for each workflow when the history is compacted"""
+
+MINIMUM_COMPACTION_SIZE: typing.Final[int] = 64 * 1024
+"""The number of bytes a history file may reach before it is ever compacted"""
+
+TAIL_BLOCK_SIZE: typing.Final[int] = 8 * 1024
+"""The number of bytes read at a time while reading a history file backwards"""
+
+HISTORY_ENTRY_SUFFIX: typing.Final[str] = ".history.jsonl"
+"""The ending of the name of every history file"""
+
+HistoryPath = typing.Tuple[str, ...]
+"""The names of the commands that lead from the root workflow to a subworkflow"""
+
+
+class HistoryEntry(typing.NamedTuple):
+    """
+    The values of a single submission
+    """
+    path: HistoryPath
+    """The commands that were chosen"""
+
+    values: typing.Tuple[typing.Dict[str, typing.Any], ...]
+    """The values entered for each workflow along the path, starting with the root workflow"""
+
+    time: float
+    """When the values were submitted, in seconds since the epoch"""
+
+    def get_values(self, path: HistoryPath) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """
+        Get the values that were entered for a workflow, if the submission passed through it
+
+        Args:
+            path: The commands leading to the workflow
+
+        Returns:
+            The values entered for the workflow, `None` if it wasn't part of the submission
+        """
+        if len(path) >= len(self.values) or self.path[:len(path)] != path:
+            return None
+
+        return self.values[len(path)]
+
+    def to_line(self) -> bytes:
+        """
+        Serialize the entry as a single line of a history file
+        """
+        record: typing.Dict[str, typing.Any] = {"path": list(self.path), "values": list(self.values), "time": self.time}
+        return json.dumps(record, separators=(",", ":"), default=encode_value).encode("utf-8") + b"\n"
+
+    @classmethod
+    def from_line(cls, line: bytes) -> typing.Optional[HistoryEntry]:
+        """
+        Read an entry from a line of a history file
+
+        Args:
+            line: The line to read
+
+        Returns:
+            The entry, `None` if the line is the header or was only partially written
+        """
+        try:
+            record: typing.Any = json.loads(line)
+            return cls(tuple(record["path"]), tuple(record["values"]), float(record["time"]))
+        except (ValueError, TypeError, KeyError):
+            return None
+
+
+def read_lines_backwards(path: pathlib.Path, block_size: int = TAIL_BLOCK_SIZE) -> typing.Iterator[bytes]:
+    """
+    Read the lines of a file from the last to the first without reading any more of it than needed
+
+    Args:
+        path: The file to read
+        block_size: The number of bytes to read at a time
+
+    Returns:
+        Every non-empty line, last first
+    """
+    with open(path, "rb") as file:
+        position: int = file.seek(0, os.SEEK_END)
+        remainder: bytes = b""
+
+        while position > 0:
+            read_size: int = min(block_size, position)
+            position -= read_size
+            file.seek(position)
+            lines: typing.List[bytes] = (file.read(read_size) + remainder).split(b"\n")
+
+            # The first line may continue into the block before this one
+            remainder = lines[0]
+
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line
+
+        if remainder:
+            yield remainder
+
+
+def encode_value(value: typing.Any) -> typing.Any:
+    """
+    Turn a value that JSON can't hold into one it can, keeping lists of items as lists
+
+    Args:
+        value: The value to encode
+
+    Returns:
+        A list of the items in a sequence, or the text of anything else
+    """
+    if isinstance(value, collections.abc.Sequence) and not isinstance(value, (str, bytes)):
+        return list(value)
+
+    return str(value)
+
+
+def format_value(value: typing.Any) -> str:
+    """
+    Describe a past value the way it would be typed
+
+    Args:
+        value: The value to describe
+
+    Returns:
+        The value, with lists written as their entries separated by spaces
+    """
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(entry) for entry in value)
+
+    return str(value)
+
+
+class HistoryStore:
+    """
+    Stores the values submitted for a parser's workflows in an append-only file
+    """
+    def __init__(self, path: typing.Optional[typing.Union[str, pathlib.Path]], limit: int = DEFAULT_HISTORY_LIMIT):
+        """
+        Args:
+            path: The history file. Nothing is remembered if `None`
+            limit: The number of value sets to keep for each workflow when the file is compacted
+        """
+        self.path: typing.Optional[pathlib.Path] = pathlib.Path(path) if path else None
+        self.limit: int = limit
+
+    @classmethod
+    def default(cls, parser: argparse.ArgumentParser) -> HistoryStore:
+        """
+        Get the store for a parser within the current user's cache directory
+
+        Args:
+            parser: The parser whose submissions should be remembered
+
+        Returns:
+            The store for the parser. It remembers nothing if caching or history is disabled
+        """
+        cache_directory: typing.Optional[pathlib.Path] = get_cache_directory()
+
+        try:
+            limit: int = int(os.environ.get(HISTORY_LIMIT_VARIABLE, DEFAULT_HISTORY_LIMIT))
+        except ValueError:
+            limit = DEFAULT_HISTORY_LIMIT
+
+        if cache_directory is None or limit <= 0:
+            return cls(None, limit)
+
+        # The parser isn't described at all, so finding its history costs nothing however large it is
+        return cls(cache_directory / "history" / f"{get_program_key(parser)}{HISTORY_ENTRY_SUFFIX}", limit)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether submissions are remembered
+        """
+        return self.path is not None
+
+    def read_header(self) -> typing.Dict[str, typing.Any]:
+        """
+        Read what the first line of the history file says about it
+
+        Returns:
+            The header, empty if the file doesn't exist or doesn't start with one
+        """
+        if self.path is None:
+            return {}
+
+        try:
+            with open(self.path, "rb") as file:
+                header: typing.Any = json.loads(file.readline())
+        except (OSError, ValueError):
+            return {}
+
+        return header if isinstance(header, dict) and "format" in header else {}
+
+    def latest(self, path: HistoryPath = ()) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """
+        Get the values most recently submitted for a workflow, reading only as much of the file as needed
+
+        Args:
+            path: The commands leading to the workflow
+
+        Returns:
+            The values entered for the workflow the last time it was part of a submission, if ever
+        """
+        if self.path is None:
+            return None
+
+        try:
+            for line in read_lines_backwards(self.path):
+                entry: typing.Optional[HistoryEntry] = HistoryEntry.from_line(line)
+                values: typing.Optional[typing.Dict[str, typing.Any]] = entry and entry.get_values(path)
+
+                if values is not None:
+                    return values
+        except OSError:
+            pass
+
+        return None
+
+    def entries(self) -> typing.List[HistoryEntry]:
+        """
+        Read every entry in the history file
+
+        Returns:
+            Every submission that is still remembered, oldest first
+        """
+        if self.path is None:
+            return []
+
+        try:
+            with open(self.path, "rb") as file:
+                return [entry for entry in map(HistoryEntry.from_line, file) if entry is not None]
+        except OSError:
+            return []
+
+    def append(self, path: HistoryPath, values: typing.Sequence[typing.Mapping[str, typing.Any]]) -> bool:
+        """
+        Remember a submission, compacting the history file if it has grown too large
+
+        Args:
+            path: The commands that were chosen
+            values: The values entered for each workflow along the path, starting with the root workflow
+
+        Returns:
+            True if the submission was written
+        """
+        if self.path is None:
+            return False
+
+        line: bytes = HistoryEntry(tuple(path), tuple(dict(entry) for entry in values), time.time()).to_line()
+
+        try:
+            if not self.path.exists():
+                self.start_file()
+
+            with open(self.path, "ab") as file:
+                # A write that was cut short would otherwise swallow this entry
+                if file.tell() > 0:
+                    with open(self.path, "rb") as reader:
+                        reader.seek(-1, os.SEEK_END)
+                        if reader.read(1) != b"\n":
+                            file.write(b"\n")
+
+                file.write(line)
+                size: int = file.tell()
+
+            if size > max(MINIMUM_COMPACTION_SIZE, 2 * self.read_header().get("compacted_size", 0)):
+                self.compact()
+        except OSError:
+            return False
+
+        return True
+
+    def start_file(self) -> None:
+        """
+        Create an empty history file
+        """
+        path: pathlib.Path = typing.cast(pathlib.Path, self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomically(path, self.build_header(0))
+
+    @staticmethod
+    def build_header(compacted_size: int) -> bytes:
+        """
+        Create the first line of a history file
+
+        Args:
+            compacted_size: The size of the file right after it was last compacted
+        """
+        return json.dumps({"format": HISTORY_FORMAT_VERSION, "compacted_size": compacted_size}).encode("utf-8") + b"\n"
+
+    def compact(self) -> None:
+        """
+        Rewrite the history file with only the newest value sets for each workflow
+        """
+        if self.path is None:
+            return
+
+        kept: typing.List[HistoryEntry] = []
+        kept_counts: typing.Dict[HistoryPath, int] = {}
+
+        for entry in reversed(self.entries()):
+            if kept_counts.get(entry.path, 0) < self.limit:
+                kept_counts[entry.path] = kept_counts.get(entry.path, 0) + 1
+                kept.append(entry)
+
+        body: bytes = b"".join(entry.to_line() for entry in reversed(kept))
+        header: bytes = self.build_header(len(body))
+
+        # The header's own length is counted too so that the recorded size matches the file
+        write_atomically(self.path, self.build_header(len(header) + len(body)) + body)
+
+    def load_index(self) -> HistoryIndex:
+        """
+        Read the whole history into an index of the past values of every field
+        """
+        return HistoryIndex(self.entries())
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.path}>"
+
+
+class HistoryIndex:
+    """
+    The distinct past values of every field, newest first, searchable by how they would be typed
+    """
+    __slots__ = ("_values", "_search_indices")
+
+    def __init__(self, entries: typing.Iterable[HistoryEntry]):
+        """
+        Args:
+            entries: Every remembered submission, oldest first
+        """
+        self._values: typing.Dict[typing.Tuple[HistoryPath, str], typing.Dict[str, typing.Any]] = {}
+        self._search_indices: typing.Dict[typing.Tuple[HistoryPath, str], SearchIndex] = {}
+
+        for entry in reversed(list(entries)):
+            for depth, workflow_values in enumerate(entry.values):
+                for field_name, value in workflow_values.items():
+                    past_values: typing.Dict[str, typing.Any] = self._values.setdefault((entry.path[:depth], field_name), {})
+                    past_values.setdefault(format_value(value), value)
+
+    def get_values(self, path: HistoryPath, field_name: str) -> typing.List[typing.Any]:
+        """
+        Get every value that was submitted for a field
+
+        Args:
+            path: The commands leading to the workflow that the field belongs to
+            field_name: The name of the field
+
+        Returns:
+            The distinct past values of the field, newest first
+        """
+        return list(self._values.get((path, field_name), {}).values())
+
+    def get_session(self, path: HistoryPath, field_name: str, limit: int = SEARCH_RESULT_LIMIT) -> SearchSession:
+        """
+        Start searching the past values of a field
+
+        Args:
+            path: The commands leading to the workflow that the field belongs to
+            field_name: The name of the field
+            limit: The largest number of values to find
+
+        Returns:
+            A search over the past values. Each index's `values` holds the values themselves
+        """
+        key: typing.Tuple[HistoryPath, str] = (path, field_name)
+
+        if key not in self._search_indices:
+            past_values: typing.Dict[str, typing.Any] = self._values.get(key, {})
+            self._search_indices[key] = SearchIndex(list(past_values), list(past_values.values()))
+
+        return SearchSession(self._search_indices[key], limit)
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,66 @@
+"""
+Defines the plain container for values entered into the fields of a workflow
+"""
+from __future__ import annotations
+
+import typing
+
+
+class FieldValues(typing.Mapping[str, typing.Any]):
+    """
+    The values that have been entered for the fields of a workflow, mapped to the names of the fields
+
+    Values are kept apart from the widgets used to enter them so that they outlive widgets that are
+    unmounted, recycled, or rebuilt. A field without an entry will use its default.
+    """
+    __slots__ = ("_values",)
+
+    def __init__(self, values: typing.Optional[typing.Mapping[str, typing.Any]] = None):
+        self._values: typing.Dict[str, typing.Any] = dict(values or {})
+
+    def __getitem__(self, field_name: str) -> typing.Any:
+        return self._values[field_name]
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def set(self, field_name: str, value: typing.Any) -> None:
+        """
+        Record a value for a field. A value of `None` means that the field's default should be used
+
+        Args:
+            field_name: The name of the field
+            value: The value entered for the field
+        """
+        if value is None:
+            self._values.pop(field_name, None)
+        else:
+            self._values[field_name] = value
+
+    def update(self, values: typing.Mapping[str, typing.Any]) -> None:
+        """
+        Record values for several fields at once
+
+        Args:
+            values: The values to record, mapped to the names of their fields
+        """
+        for field_name, value in values.items():
+            self.set(field_name, value)
+
+    def clear(self) -> None:
+        """
+        Forget every entered value so that all fields use their defaults
+        """
+        self._values.clear()
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        Get a copy of every entered value
+        """
+        return dict(self._values)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._values!r})"
@@ -2,38 +2,448 @@
 Defines models that describe a specific operation
 """
 from __future__ import annotations
+import abc
+import json
+import operator
 import typing
 import argparse
+import functools
+import dataclasses
 
 import pydantic
+from pydantic_core import core_schema
 
-from .field import Field
+from argui.parser import is_interactive_action
+from argui.utilities.common import resolve_name
+from argui.utilities.fingerprint import get_qualified_name
+from argui.utilities.tracing import traced
+
+from .field import FieldSpec
+from .field import FieldType
+from .field import FieldBehavior
+from .field import EMPTY_MAPPING
+from .field import intern_text
+from .field import WidgetIdAllocator
 
 # Store references to important argparse action types 
 #   - this gets around warnings about private attribute access
 HelpAction: typing.Type[argparse.Action] = getattr(argparse, "_HelpAction")
 StoreAction: typing.Type[argparse.Action] = getattr(argparse, "_StoreAction")
-SubParserAction: typing.Type[argparse.Action] = getattr(argparse, "_SubParserAction")
+SubParserAction: typing.Type[argparse.Action] = getattr(argparse, "_SubParsersAction")
 StoreTrueAction: typing.Type[argparse.Action] = getattr(argparse, "_StoreTrueAction")
 StoreFalseAction: typing.Type[argparse.Action] = getattr(argparse, "_StoreFalseAction")
+VersionAction: typing.Type[argparse.Action] = getattr(argparse, "_VersionAction")
+
+HANDLER_DESTINATION: typing.Final[str] = "func"
+"""The name of the default that parsers conventionally use to route parsed arguments to their handler function"""
+
+ALIAS_KEY: typing.Final[str] = "alias_of"
+"""Marks a serialized subworkflow as another name for the subworkflow of the command it names"""
+
+SubworkflowBuilder = typing.Callable[..., "WorkflowBehavior"]
+"""Converts a subparser, along with the help given to its command, into a workflow"""
 
-def is_interactive_flag(action: argparse.Action) -> bool:
+
+def is_literal(value: typing.Any) -> bool:
     """
-    Determines if the given CLI action/parameter is used to indicate that the app should run 
-    in interactive mode
+    Determine if a value is made up of nothing but plain data that may be written as JSON or python source
 
     Args:
-        action: The CLI action/parameter to investigate
+        value: The value to check
 
     Returns:
-        True if the action/parameter is used for indicating that the app should run in interactive mode
+        True if the value is a string, number, boolean, None, or a list or dictionary of them
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+
+    if isinstance(value, (list, tuple)):
+        return all(is_literal(entry) for entry in value)
+
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and is_literal(entry) for key, entry in value.items())
+
+    return False
+
+
+class ExclusiveGroup(typing.NamedTuple):
+    """
+    Fields of a workflow that may not be given together, like those in an argparse mutually exclusive group
+    """
+    fields: typing.Tuple[int, ...]
+    """The positions of the fields within the workflow"""
+
+    required: bool = False
+    """Whether one of the fields must be given"""
+
+
+class LazyWorkflow:
+    """
+    A handle to a subworkflow that has not been converted from its parser or serialized data yet
+    """
+    __slots__ = ("source", "builder")
+
+    def __init__(self, source: typing.Any, builder: typing.Callable[[typing.Any], Workflow]):
+        """
+        Args:
+            source: The parser or serialized data that the workflow will be built from
+            builder: The function that converts the source into a workflow
+        """
+        self.source: typing.Any = source
+        self.builder: typing.Callable[[typing.Any], Workflow] = builder
+
+    def materialize(self) -> Workflow:
+        """
+        Convert the source into a workflow
+        """
+        return self.builder(self.source)
+
+    def __repr__(self) -> str:
+        if isinstance(self.source, argparse.ArgumentParser):
+            return f"<{self.__class__.__name__}: {self.source.prog}>"
+        if isinstance(self.source, typing.Mapping):
+            return f"<{self.__class__.__name__}: {self.source.get('name')}>"
+        return f"<{self.__class__.__name__}: {type(self.source).__name__}>"
+
+
+class SubworkflowMapping(typing.MutableMapping[str, "Workflow"]):
     """
-    if not isinstance(action, StoreTrueAction):
-        return False
-    
-    return not action.required and action.dest.lower() == "interactive"
+    Maps command names to subworkflows, converting each subparser or serialized subworkflow the first time
+    that it is accessed
+
+    Iterating over the command names or checking for membership never converts anything. Converted
+    workflows replace their handles so that each entry is only ever converted once. Serialized
+    subworkflows are therefore only validated once they are accessed.
 
-class Workflow(pydantic.BaseModel):
+    Aliases of a command lead to the same subworkflow. They may be looked up, but only the command
+    they stand for is iterated over, so the subworkflow is only ever built and stored once
+    """
+    def __init__(
+        self,
+        entries: typing.Optional[typing.Mapping[str, typing.Union[Workflow, LazyWorkflow]]] = None,
+        aliases: typing.Optional[typing.Mapping[str, str]] = None
+    ):
+        """
+        Args:
+            entries: Subworkflows, or handles to them, mapped to their command names
+            aliases: The commands that other names stand for, mapped to those names
+        """
+        self._entries: typing.Dict[str, typing.Union[Workflow, LazyWorkflow]] = dict(entries or {})
+        self._aliases: typing.Dict[str, str] = dict(aliases or {})
+
+    @classmethod
+    def from_subparsers(cls, action: argparse.Action, build_subworkflow: SubworkflowBuilder) -> SubworkflowMapping:
+        """
+        Map the commands of a subparsers action to handles that convert their subparsers when first accessed
+
+        Args:
+            action: The action created by `add_subparsers`
+            build_subworkflow: Converts a subparser, given the help of its command as `help`
+
+        Returns:
+            The subworkflows, with each alias leading to the subworkflow of the command it was added with
+        """
+        command_help: typing.Dict[str, typing.Optional[str]] = {
+            choice_action.dest: choice_action.help
+            for choice_action in getattr(action, "_choices_actions", [])
+        }
+        subworkflows: SubworkflowMapping = cls()
+        command_names: typing.Dict[int, str] = {}
+
+        # argparse maps a command's name before any of its aliases, all to the same parser
+        for command_name, command in action.choices.items():
+            if id(command) in command_names:
+                subworkflows.add_alias(command_name, command_names[id(command)])
+                continue
+
+            command_names[id(command)] = command_name
+            subworkflows[command_name] = LazyWorkflow(
+                command,
+                functools.partial(build_subworkflow, help=command_help.get(command_name))
+            )
+
+        return subworkflows
+
+    def add_alias(self, alias: str, command_name: str) -> None:
+        """
+        Let another name lead to the subworkflow of a command
+
+        Args:
+            alias: The other name
+            command_name: The command it stands for
+        """
+        self._aliases[alias] = self._aliases.get(command_name, command_name)
+
+    @property
+    def aliases(self) -> typing.Mapping[str, str]:
+        """
+        The commands that other names stand for, mapped to those names
+        """
+        return self._aliases
+
+    def get_aliases(self, command_name: str) -> typing.List[str]:
+        """
+        Get the other names of a command
+
+        Args:
+            command_name: The command
+
+        Returns:
+            Every alias of the command, in the order they were added
+        """
+        return [alias for alias, aliased_command in self._aliases.items() if aliased_command == command_name]
+
+    def __getitem__(self, command_name: str) -> Workflow:
+        command_name = self._aliases.get(command_name, command_name)
+        entry: typing.Union[Workflow, LazyWorkflow] = self._entries[command_name]
+
+        if isinstance(entry, LazyWorkflow):
+            entry = entry.materialize()
+            self._entries[command_name] = entry
+
+        return entry
+
+    def __setitem__(self, command_name: str, workflow: typing.Union[Workflow, LazyWorkflow]) -> None:
+        self._entries[self._aliases.get(command_name, command_name)] = workflow
+
+    def __delitem__(self, command_name: str) -> None:
+        if command_name in self._aliases:
+            del self._aliases[command_name]
+            return
+
+        del self._entries[command_name]
+        self._aliases = {
+            alias: aliased_command
+            for alias, aliased_command in self._aliases.items()
+            if aliased_command != command_name
+        }
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, command_name: object) -> bool:
+        return command_name in self._entries or command_name in self._aliases
+
+    def is_materialized(self, command_name: str) -> bool:
+        """
+        Whether the workflow for a command has already been converted from its parser or serialized data
+
+        Args:
+            command_name: The command to check
+
+        Returns:
+            True if accessing the command won't require any conversion
+        """
+        return not isinstance(self._entries[self._aliases.get(command_name, command_name)], LazyWorkflow)
+
+    def transform(self, function: typing.Callable[[WorkflowBehavior], WorkflowBehavior]) -> SubworkflowMapping:
+        """
+        Create a mapping holding the result of a function for each of these subworkflows
+
+        Subworkflows that haven't been converted yet are only converted and passed to the function once
+        they are accessed through the new mapping
+
+        Args:
+            function: What to call on each subworkflow
+
+        Returns:
+            A mapping of the results mapped to the same command names
+        """
+        return SubworkflowMapping(
+            {
+                command_name: (
+                    LazyWorkflow(command_name, functools.partial(self._transform_entry, function))
+                    if isinstance(entry, LazyWorkflow)
+                    else function(entry)
+                )
+                for command_name, entry in self._entries.items()
+            },
+            self._aliases
+        )
+
+    def _transform_entry(
+        self,
+        function: typing.Callable[[WorkflowBehavior], WorkflowBehavior],
+        command_name: str
+    ) -> WorkflowBehavior:
+        return function(self[command_name])
+
+    def materialize_all(self) -> None:
+        """
+        Convert every subworkflow in the tree beneath this mapping
+        """
+        for command_name in self._entries:
+            self[command_name].materialize_all()
+
+    def __repr__(self) -> str:
+        if self._aliases:
+            return f"{self._entries!r} (aliases {self._aliases!r})"
+
+        return repr(self._entries)
+
+    def serialize_aliases(self) -> typing.Dict[str, typing.Dict[str, str]]:
+        """
+        Describe each alias as a serialized entry that names the command it stands for
+        """
+        return {alias: {ALIAS_KEY: command_name} for alias, command_name in self._aliases.items()}
+
+    @staticmethod
+    def validate_entry(entry: typing.Any) -> typing.Union[Workflow, LazyWorkflow]:
+        """
+        Prepare a single subworkflow, deferring the validation of serialized data until it is accessed
+
+        Args:
+            entry: A workflow, a handle to one, the serialized data for one, or the JSON for one
+
+        Returns:
+            The workflow or a handle that will build it
+        """
+        if isinstance(entry, (Workflow, LazyWorkflow)):
+            return entry
+
+        if isinstance(entry, typing.Mapping):
+            return LazyWorkflow(entry, Workflow.from_data)
+
+        if isinstance(entry, (str, bytes)):
+            # JSON for a subworkflow isn't even parsed until the subworkflow is needed
+            return LazyWorkflow(entry, Workflow.from_json)
+
+        raise ValueError(f"Subworkflows must be workflows or serialized workflows - received {type(entry)}")
+
+    @classmethod
+    def validate(cls, value: typing.Any) -> SubworkflowMapping:
+        """
+        Convert data describing subworkflows into a mapping of subworkflows
+
+        Args:
+            value: An existing mapping or serialized workflows mapped to their command names
+
+        Returns:
+            A mapping of subworkflows
+        """
+        if isinstance(value, cls):
+            return value
+
+        if not isinstance(value, typing.Mapping):
+            raise ValueError(f"Subworkflows must be mapped to their command names - received {type(value)}")
+
+        entries: typing.Dict[str, typing.Union[Workflow, LazyWorkflow]] = {}
+        aliases: typing.Dict[str, str] = {}
+
+        for command_name, entry in value.items():
+            if isinstance(entry, typing.Mapping) and set(entry) == {ALIAS_KEY}:
+                aliases[str(command_name)] = str(entry[ALIAS_KEY])
+            else:
+                entries[str(command_name)] = cls.validate_entry(entry)
+
+        return cls(entries, aliases)
+
+    def serialize(self, info: core_schema.SerializationInfo) -> typing.Dict[str, typing.Any]:
+        """
+        Convert every subworkflow, then serialize them all
+
+        Args:
+            info: How the serialization was requested
+
+        Returns:
+            Serialized workflows mapped to their command names, followed by an entry naming the command of each alias
+        """
+        serialized: typing.Dict[str, typing.Any] = {
+            command_name: self[command_name].model_dump(mode=info.mode)
+            for command_name in self._entries
+        }
+        serialized.update(self.serialize_aliases())
+        return serialized
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: typing.Any, handler: pydantic.GetCoreSchemaHandler):
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(cls.serialize, info_arg=True)
+        )
+
+
+class WorkflowBehavior(abc.ABC):
+    """
+    What every workflow can do, regardless of how its attributes are stored
+
+    Workflows are either validated pydantic models, used for configs and exports, or slotted specs,
+    used when a parser is converted within the running application
+    """
+    __slots__ = ()
+
+    name: typing.Optional[str]
+    description: typing.Optional[str]
+    epilog: typing.Optional[str]
+    fields: typing.Sequence[FieldBehavior]
+    subworkflows: SubworkflowMapping
+    action: typing.Optional[str]
+    help: typing.Optional[str]
+    command_destination: typing.Optional[str]
+    command_required: bool
+    defaults: typing.Mapping[str, typing.Any]
+    exclusive_groups: typing.Sequence[ExclusiveGroup]
+
+    @abc.abstractmethod
+    def to_model(self) -> Workflow:
+        """
+        Get a validated model of the workflow that may be serialized
+        """
+
+    def assign_widget_ids(self) -> typing.List[str]:
+        """
+        Give every field a widget id that is unique within the workflow's screen, in one pass over the fields
+
+        Returns:
+            The ids that were assigned, in the same order as the fields
+        """
+        return WidgetIdAllocator().allocate_all(self.fields)
+
+    def materialize_all(self) -> WorkflowBehavior:
+        """
+        Convert every subworkflow in the tree so that nothing is left to build later, such as before an export
+
+        Returns:
+            This workflow
+        """
+        self.subworkflows.materialize_all()
+        return self
+
+    def to_arguments(self, values: typing.Mapping[str, typing.Any]) -> typing.List[str]:
+        """
+        Convert values entered on the screen into the CLI arguments that would have provided them
+
+        Args:
+            values: The values entered for the workflow's fields, mapped to the names of the fields
+
+        Returns:
+            The arguments to pass to `parse_args` in order to get the values
+        """
+        optional_arguments: typing.List[str] = []
+        positional_arguments: typing.List[str] = []
+
+        for field in self.fields:
+            if field.name not in values:
+                continue
+
+            arguments: typing.List[str] = field.to_arguments(values[field.name])
+
+            if field.flags:
+                optional_arguments.extend(arguments)
+            else:
+                positional_arguments.extend(arguments)
+
+        # Positional values go first so that optional values accepting any number of entries can't absorb them
+        return positional_arguments + optional_arguments
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}: {self.name or 'Untitled'}{': ' + self.description if self.description else ''}"
+
+
+class Workflow(WorkflowBehavior, pydantic.BaseModel):
     """
     Represents the fields and screen elements that will appear in the terminal
 
@@ -51,24 +461,172 @@ class Workflow(pydantic.BaseModel):
         None,
         description="Additional footnotes about the workflow"
     )
-    fields: typing.List[Field] = pydantic.Field(
+    fields: typing.List[FieldType] = pydantic.Field(
         default_factory=list,
-        description="The fields that should appear on the workflow screen",
-        min_length=1
+        description="The fields that should appear on the workflow screen"
     )
-    subworkflows: typing.Dict[str, Workflow] = pydantic.Field(
-        default_factory=dict,
+    subworkflows: SubworkflowMapping = pydantic.Field(
+        default_factory=SubworkflowMapping,
         description="Workflows that may be embedded within the workflow mapped to their name/command"
     )
     action: typing.Optional[str] = pydantic.Field(
         None,
         description="What the workflow should do when submitted"
     )
+    help: typing.Optional[str] = pydantic.Field(
+        None,
+        description="A short description of the workflow shown alongside the command that leads to it"
+    )
+    command_destination: typing.Optional[str] = pydantic.Field(
+        None,
+        description="The name of the parsed value that holds which subworkflow was chosen"
+    )
+    command_required: bool = pydantic.Field(
+        False,
+        description="Whether one of the subworkflows must be chosen"
+    )
+    defaults: typing.Dict[str, typing.Any] = pydantic.Field(
+        default_factory=dict,
+        description="Values that are always parsed for the workflow regardless of what is entered, besides its action"
+    )
+    exclusive_groups: typing.List[ExclusiveGroup] = pydantic.Field(
+        default_factory=list,
+        description="Groups of fields that may not be given together"
+    )
+
+    @classmethod
+    def from_parser(cls, parser: argparse.ArgumentParser, help: typing.Optional[str] = None) -> Workflow:
+        """
+        Creates a validated workflow from a built ArgumentParser, such as for an export
+
+        Subparsers are not converted until their workflows are first accessed - call `materialize_all`
+        if the entire tree is needed up front
+
+        Args:
+            parser: The parser to describe
+            help: The help text given to the command that leads to the parser, if it is a subparser
+
+        Returns:
+            A workflow covering what the parser intends to do
+        """
+        return WorkflowSpec.from_parser(parser, help=help).to_model()
+
+    @classmethod
+    def from_json(cls, serialized_workflow: typing.Union[str, bytes]) -> Workflow:
+        """
+        Load a workflow that was serialized with `model_dump_json`, importing the types and widgets it names
+
+        Subworkflows are validated when they are first accessed
+
+        Args:
+            serialized_workflow: The JSON that describes the workflow
+
+        Returns:
+            The deserialized workflow
+        """
+        return cls.model_validate_json(serialized_workflow).restore_importables()
 
     @classmethod
-    def from_parser(cls, parser: argparse.ArgumentParser) -> Workflow:
+    def from_data(cls, data: typing.Mapping[str, typing.Any]) -> Workflow:
+        """
+        Load a workflow from deserialized data, importing the types and widgets it names
+
+        Args:
+            data: The data that describes the workflow
+
+        Returns:
+            The deserialized workflow
+        """
+        return cls.model_validate(data).restore_importables()
+
+    def restore_importables(self) -> Workflow:
         """
-        Creates a workflow from a built ArgumentParser
+        Import the types and widgets that were stored by name when the workflow was serialized
+
+        Subworkflows that haven't been validated yet will do the same once they are
+
+        Returns:
+            This workflow
+        """
+        for field in self.fields:
+            try:
+                if isinstance(field.type, str):
+                    field.type = resolve_name(field.type)
+                if isinstance(field.widget, str):
+                    field.widget = resolve_name(field.widget)
+            except KeyError:
+                # Names that can't be found are left as names - the same as they would be in a handwritten config
+                pass
+
+        for command_name in self.subworkflows:
+            if self.subworkflows.is_materialized(command_name):
+                self.subworkflows[command_name].restore_importables()
+
+        return self
+
+    def model_post_init(self, context: typing.Any) -> None:
+        self.assign_widget_ids()
+
+    def dump_json_lazily(self) -> str:
+        """
+        Serialize the workflow so that each subworkflow is its own JSON document, nested within its parent as a string
+
+        Loading the result with `from_json` only parses the top level. Each subworkflow is parsed and
+        validated when it is first accessed.
+
+        Returns:
+            The JSON describing the workflow
+        """
+        data: typing.Dict[str, typing.Any] = self.model_dump(mode="json", exclude={"subworkflows"})
+        data["subworkflows"] = {
+            command_name: subworkflow.dump_json_lazily()
+            for command_name, subworkflow in self.subworkflows.items()
+        }
+        data["subworkflows"].update(self.subworkflows.serialize_aliases())
+        return json.dumps(data, separators=(",", ":"))
+
+    def to_model(self) -> Workflow:
+        return self
+
+
+@dataclasses.dataclass(slots=True)
+class WorkflowSpec(WorkflowBehavior):
+    """
+    A compact workflow built from a parser within the running application
+
+    Specs carry the same attributes as `Workflow` in slots and are never validated - call `to_model`
+    to get a validated `Workflow` for an export
+    """
+    name: typing.Optional[str] = None
+    description: typing.Optional[str] = None
+    epilog: typing.Optional[str] = None
+    fields: typing.Tuple[FieldSpec, ...] = ()
+    subworkflows: SubworkflowMapping = dataclasses.field(default_factory=SubworkflowMapping)
+    action: typing.Optional[str] = None
+    help: typing.Optional[str] = None
+    command_destination: typing.Optional[str] = None
+    command_required: bool = False
+    defaults: typing.Mapping[str, typing.Any] = dataclasses.field(default_factory=lambda: EMPTY_MAPPING)
+    exclusive_groups: typing.Tuple[ExclusiveGroup, ...] = ()
+
+    @classmethod
+    @traced("from_parser")
+    def from_parser(
+        cls,
+        parser: argparse.ArgumentParser,
+        help: typing.Optional[str] = None,
+        build_subworkflow: typing.Optional[SubworkflowBuilder] = None
+    ) -> WorkflowSpec:
+        """
+        Creates a workflow spec from a built ArgumentParser
+
+        Subparsers are not converted until their workflows are first accessed - call `materialize_all`
+        if the entire tree is needed up front
+
+        Args:
+            parser: The parser to describe
+            help: The help text given to the command that leads to the parser, if it is a subparser
+            build_subworkflow: Converts each subparser once it is needed. Converts them the same way as this parser if `None`
 
         Returns:
             A workflow covering what the parser intends to do
@@ -76,32 +634,83 @@ class Workflow(pydantic.BaseModel):
         name: str = parser.prog
         epilog: typing.Optional[str] = parser.epilog
         description: typing.Optional[str] = parser.description
-        fields: typing.List[Field] = []
-        subworkflows: typing.Dict[Workflow] = {}
+        fields: typing.List[FieldSpec] = []
+        subworkflows: SubworkflowMapping = SubworkflowMapping()
+        command_destination: typing.Optional[str] = None
+        command_required: bool = False
+        field_positions: typing.Dict[int, int] = {}
 
         for action in getattr(parser, "_actions", []):
-            if is_interactive_flag(action) or isinstance(action, HelpAction):
+            if is_interactive_action(action) or isinstance(action, (HelpAction, VersionAction)):
                 continue
 
-            if isinstance(action, StoreAction):
-                # Determine what sort of value is stored here - is it one or more values?
-                pass
-            elif isinstance(action, SubParserAction):
-                for command_name, command in action.choices.items():
-                    subworkflow = cls.from_parser(parser=command)
-                    subworkflows[command_name] = subworkflow
+            if isinstance(action, SubParserAction):
+                command_destination = action.dest if action.dest != argparse.SUPPRESS else None
+                command_required = action.required
+
+                # Subparsers are only converted once they are needed
+                subworkflows = SubworkflowMapping.from_subparsers(action, build_subworkflow or cls.from_parser)
+            else:
+                field_positions[id(action)] = len(fields)
+                fields.append(FieldSpec.from_action(action, index=len(fields)))
+
+        exclusive_groups: typing.List[ExclusiveGroup] = []
+
+        for group in getattr(parser, "_mutually_exclusive_groups", []):
+            group_fields: typing.Tuple[int, ...] = tuple(
+                field_positions[id(action)]
+                for action in getattr(group, "_group_actions", [])
+                if id(action) in field_positions
+            )
+
+            if group_fields:
+                exclusive_groups.append(ExclusiveGroup(fields=group_fields, required=group.required))
+
+        parser_defaults: typing.Dict[str, typing.Any] = dict(getattr(parser, "_defaults", {}))
+        handler: typing.Any = parser_defaults.pop(HANDLER_DESTINATION, None)
+
+        # Only plain data survives being stored, so anything else is left for the parser to provide
+        defaults: typing.Dict[str, typing.Any] = {
+            key: value
+            for key, value in parser_defaults.items()
+            if is_literal(value)
+        }
 
         new_workflow = cls(
-            name=name,
+            name=intern_text(name),
             epilog=epilog,
             description=description,
-            fields=fields,
-            subworkflows=subworkflows
+            fields=tuple(fields),
+            subworkflows=subworkflows,
+            action=get_qualified_name(handler) if callable(handler) else None,
+            help=intern_text(help),
+            command_destination=command_destination,
+            command_required=command_required,
+            defaults=defaults or EMPTY_MAPPING,
+            exclusive_groups=tuple(exclusive_groups)
         )
 
         return new_workflow
 
+    def __post_init__(self) -> None:
+        self.assign_widget_ids()
 
+    def to_model(self) -> Workflow:
+        """
+        Get a validated model of the workflow that may be serialized
 
-    def __str__(self) -> str:
-        return f"{self.__class__.__name__}: {self.name or 'Untitled'}{': ' + self.description if self.description else ''}"
+        Subworkflows that haven't been converted from their parsers yet are converted once accessed
+        """
+        return Workflow(
+            name=self.name,
+            description=self.description,
+            epilog=self.epilog,
+            fields=[field.to_model() for field in self.fields],
+            subworkflows=self.subworkflows.transform(operator.methodcaller("to_model")),
+            action=self.action,
+            help=self.help,
+            command_destination=self.command_destination,
+            command_required=self.command_required,
+            defaults=dict(self.defaults),
+            exclusive_groups=list(self.exclusive_groups)
+        )
@@ -1,20 +1,199 @@
 """
 Defines the overrides for the core ArgumentParser and the subparser classes
+
+Nothing in here may import `argui.model` or `argui.interface` at module level - both pull in
+`textual` and `pydantic`, which are only needed once the interactive flag has been found
 """
+from __future__ import annotations
+
+import sys
 import typing
 import argparse
+import threading
+
+from argui.utilities import tracing
+from argui.utilities.argfiles import ArgumentFile
+from argui.utilities.argfiles import ArgumentSequence
+from argui.utilities.argfiles import ArgumentFileReference
+from argui.utilities.options import OptionIndex
+
+if typing.TYPE_CHECKING:
+    import argui.model
+
+INTERACTIVE_DESTINATION: typing.Final[str] = "interactive"
+"""The name of the value on the parsed namespace that indicates that interactive mode was requested"""
+
+INTERACTIVE_FLAGS: typing.Final[typing.Tuple[str, ...]] = ("-i", "--interactive")
+"""The CLI flags that indicate that the application should run in interactive mode"""
 
-import argui.model
+STREAMED_NARGS: typing.Final[typing.Tuple[str, ...]] = (argparse.ZERO_OR_MORE, argparse.ONE_OR_MORE, argparse.REMAINDER)
+"""The kinds of `nargs` whose values may be read lazily from argument files"""
+
+_checking = threading.local()
+"""Marks the threads that are only checking arguments, where parse errors are raised instead of printed"""
+
+
+class ArgumentCheckError(Exception):
+    """Raised in place of exiting when arguments that are only being checked can't be parsed"""
+
+
+def get_interactive_flags(prefix_chars: str = "-") -> typing.Tuple[str, str]:
+    """
+    Get the interactive flags for a parser that may not use '-' to prefix its optional arguments
+
+    Args:
+        prefix_chars: The characters that may start an optional argument
+
+    Returns:
+        The short and long versions of the interactive flag
+    """
+    short_flag, long_flag = INTERACTIVE_FLAGS
+
+    if prefix_chars.startswith("-"):
+        return short_flag, long_flag
+
+    prefix: str = prefix_chars[0]
+    return prefix + short_flag.lstrip("-"), prefix * 2 + long_flag.lstrip("-")
+
+
+def interactive_requested(
+    args: typing.Sequence[str],
+    prefix_chars: str = "-",
+    allow_abbrev: bool = True,
+    option_strings: typing.Optional[OptionIndex] = None
+) -> bool:
+    """
+    Scan raw CLI arguments for the interactive flag without parsing them
+
+    Args:
+        args: The raw arguments passed to the application
+        prefix_chars: The characters that may start an optional argument
+        allow_abbrev: Whether unambiguous abbreviations of the long flag should count
+        option_strings: The option strings of the parser. If given, an abbreviation only counts when
+            the long flag is the only option string that it abbreviates
+
+    Returns:
+        True if the application was asked to run in interactive mode
+    """
+    short_flag, long_flag = get_interactive_flags(prefix_chars)
+
+    for argument in args:
+        if not isinstance(argument, str) or not argument or argument[0] not in prefix_chars:
+            continue
+
+        # Everything after a bare '--' is a positional value, not a flag
+        if argument == "--":
+            return False
+
+        if argument == short_flag or argument == long_flag:
+            return True
+
+        if allow_abbrev and len(argument) > 3 and long_flag.startswith(argument):
+            # An ambiguous abbreviation is left for argparse to report
+            if option_strings is None or option_strings.starting_with(argument) == [long_flag]:
+                return True
+
+    return False
+
+
+def describe_interactive_clash(
+    option_string: str,
+    prefix_chars: str = "-",
+    allow_abbrev: bool = True
+) -> typing.Optional[str]:
+    """
+    Explain why an option string can't be used alongside the interactive flag
+
+    The raw arguments are scanned for the interactive flag before they are parsed, so an option
+    string that is the flag, or that the scan takes as an abbreviation of it, would launch the TUI
+    rather than be parsed
+
+    Args:
+        option_string: The option string of an argument other than the interactive flag
+        prefix_chars: The characters that may start an optional argument of the root parser
+        allow_abbrev: Whether the root parser accepts abbreviations of the interactive flag
+
+    Returns:
+        Why the option string clashes with the interactive flag, `None` if it doesn't
+    """
+    short_flag, long_flag = get_interactive_flags(prefix_chars)
+
+    if option_string in (short_flag, long_flag):
+        return f"{option_string} is reserved by ArgUI for entering interactive mode"
+
+    if interactive_requested([option_string], prefix_chars=prefix_chars, allow_abbrev=allow_abbrev):
+        return f"{option_string} would be read as an abbreviation of {long_flag}, which enters interactive mode"
+
+    return None
+
+
+def is_interactive_action(action: argparse.Action) -> bool:
+    """
+    Check whether an action is the interactive flag that ArgUI adds to each of its parsers
+
+    The flag is recognized by what it stores rather than by argparse's private action classes
+    """
+    return action.dest == INTERACTIVE_DESTINATION and action.nargs == 0 and action.const is True
+
+
+def find_interactive_clashes(
+    parser: argparse.ArgumentParser,
+    prefix_chars: typing.Optional[str] = None,
+    allow_abbrev: typing.Optional[bool] = None
+) -> typing.List[typing.Tuple[argparse.Action, str]]:
+    """
+    Find every option string within a parser and all of its subparsers that clashes with the interactive flag
+
+    Subparsers are checked against the flag of the parser at the root of the tree, since that is the
+    parser that scans every raw argument for it
+
+    Args:
+        parser: The root of the tree of parsers to check
+        prefix_chars: The prefix characters of the root parser. Taken from `parser` if not given
+        allow_abbrev: Whether the root parser accepts abbreviations. Taken from `parser` if not given
+
+    Returns:
+        Each action with an option string that clashes along with why it clashes
+    """
+    if prefix_chars is None:
+        prefix_chars = parser.prefix_chars
+
+    if allow_abbrev is None:
+        allow_abbrev = parser.allow_abbrev
+
+    clashes: typing.List[typing.Tuple[argparse.Action, str]] = []
+
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            for subparser in dict.fromkeys(action.choices.values()):
+                clashes.extend(find_interactive_clashes(subparser, prefix_chars, allow_abbrev))
+            continue
+
+        if is_interactive_action(action):
+            continue
+
+        for option_string in action.option_strings:
+            clash: typing.Optional[str] = describe_interactive_clash(option_string, prefix_chars, allow_abbrev)
+
+            if clash is not None:
+                clashes.append((action, clash))
+
+    return clashes
 
-Fields = typing.List[argui.model.Field]
-WorkflowMapping = typing.Dict[str, Fields]
-Workflows = typing.Dict[str, typing.Union[Fields, WorkflowMapping]]
 
 class ArgumentParser(argparse.ArgumentParser):
     """
     The overridden ArgumentParser class. This allows for the drop-in replacement behavior,
     makes sure that the `interactive` flag is present, and ensures that the calls to
     create subparsers creates subparsers that support the ArgUI framework
+
+    Passing `stream_argfiles=True` along with `fromfile_prefix_chars` reads argument files lazily:
+    each '@file' supplies every value of a single argument that takes a list of them, which receives
+    an `ArgumentSequence` rather than a list
+
+    Option strings are kept in an `OptionIndex`, so abbreviations are resolved without visiting every
+    option string, and any option string that clashes with the interactive flag is rejected as soon
+    as it is added
     """
     def __init__(
         self,
@@ -22,7 +201,7 @@ class ArgumentParser(argparse.ArgumentParser):
         usage = None,
         description = None,
         epilog = None,
-        parents = ...,
+        parents = None,
         formatter_class = argparse.ArgumentDefaultsHelpFormatter,
         prefix_chars = "-",
         fromfile_prefix_chars = None,
@@ -30,14 +209,15 @@ class ArgumentParser(argparse.ArgumentParser):
         conflict_handler = "error",
         add_help = True,
         allow_abbrev = True,
-        exit_on_error = True
+        exit_on_error = True,
+        stream_argfiles: bool = False
     ):
         super().__init__(
             prog,
             usage,
             description,
             epilog,
-            parents,
+            parents or [],
             formatter_class,
             prefix_chars,
             fromfile_prefix_chars,
@@ -47,21 +227,300 @@ class ArgumentParser(argparse.ArgumentParser):
             allow_abbrev,
             exit_on_error
         )
+        self.stream_argfiles: bool = stream_argfiles
+        self._clashes_checked: bool = False
+        self.use_option_index(OptionIndex(self._option_string_actions, check_option=self.check_option))
         self.add_argument(
-            "-i",
-            "--interactive",
-            dest="interactive",
+            *get_interactive_flags(self.prefix_chars),
+            dest=INTERACTIVE_DESTINATION,
             action="store_true",
             help="Enter the script in interactive mode"
         )
 
-    def to_model(self) -> Workflows:
+    def use_option_index(self, option_index: OptionIndex) -> None:
+        """
+        Keep option strings in an index, sharing it with the argument groups that already share the parser's dictionary
+
+        Args:
+            option_index: The index holding every option string the parser has so far
+        """
+        for container in [self, *self._action_groups, *self._mutually_exclusive_groups]:
+            container._option_string_actions = option_index
+
+    def check_option(self, option_string: str, action: argparse.Action) -> None:
+        """
+        Reject an option string that clashes with the interactive flag as it is added
+
+        Args:
+            option_string: The option string being added
+            action: The argument it belongs to
+
+        Raises:
+            argparse.ArgumentError: If the option string clashes with the interactive flag
+        """
+        if is_interactive_action(action):
+            return
+
+        clash: typing.Optional[str] = describe_interactive_clash(option_string, self.prefix_chars, self.allow_abbrev)
+
+        if clash is not None:
+            raise argparse.ArgumentError(action, clash)
+
+    def check_interactive_clashes(self) -> None:
+        """
+        Check the whole tree of subparsers for option strings that clash with this parser's interactive flag
+
+        ArgUI subparsers reject clashing option strings as they are added, but subparsers of other
+        classes, or those with their own prefix characters, can only be checked once the tree is
+        built. This is done the first time arguments are parsed
+
+        Raises:
+            argparse.ArgumentError: If any option string clashes with the interactive flag
+        """
+        if self._clashes_checked:
+            return
+
+        clashes: typing.List[typing.Tuple[argparse.Action, str]] = find_interactive_clashes(self)
+
+        if clashes:
+            action, clash = clashes[0]
+            raise argparse.ArgumentError(action, clash)
+
+        self._clashes_checked = True
+
+    def parse_args(self, args=None, namespace=None):
+        """
+        Parse CLI arguments, launching the TUI first if the interactive flag was passed
+
+        The raw arguments are scanned for the interactive flag before anything else is done so that
+        the model and interface layers are only imported when they are going to be used
+
+        Args:
+            args: The arguments to parse. Defaults to `sys.argv`
+            namespace: An object to store parsed values on
+
+        Returns:
+            The parsed arguments
+
+        Raises:
+            argparse.ArgumentError: If an option string anywhere in the tree of subparsers clashes with the interactive flag
+        """
+        if args is None:
+            args = sys.argv[1:]
+        else:
+            args = list(args)
+
+        if self.wants_interactive(args):
+            return self.parse_interactively(namespace=namespace)
+
+        with tracing.span("parse", prog=self.prog):
+            return super().parse_args(args, namespace)
+
+    def _get_option_tuples(self, option_string):
+        """
+        Find the option strings an argument abbreviates, only visiting those that start the same way
+
+        `argparse` still decides which of the candidates match, so the result is exactly what it would
+        have found by visiting every option string
+
+        Args:
+            option_string: An argument that isn't exactly one of the parser's option strings
+
+        Returns:
+            The matching actions, in the form this version of `argparse` uses
+        """
+        option_index = self._option_string_actions
+
+        if not isinstance(option_index, OptionIndex) or len(option_string) < 2:
+            return super()._get_option_tuples(option_string)
+
+        with option_index.narrowed(option_string):
+            return super()._get_option_tuples(option_string)
+
+    def _read_args_from_files(self, arg_strings):
+        """
+        Replace '@file' arguments with references to their files rather than their lines if argument files are streamed
+
+        Parsers that change how lines are turned into arguments have their files read as `argparse` would
+
+        Args:
+            arg_strings: The raw arguments
+
+        Returns:
+            The arguments with every '@file' replaced
+        """
+        if not self.stream_argfiles or type(self).convert_arg_line_to_args is not argparse.ArgumentParser.convert_arg_line_to_args:
+            return super()._read_args_from_files(arg_strings)
+
+        new_arg_strings: typing.List[str] = []
+
+        for arg_string in arg_strings:
+            if isinstance(arg_string, ArgumentFileReference) or not arg_string or arg_string[0] not in self.fromfile_prefix_chars:
+                new_arg_strings.append(arg_string)
+                continue
+
+            try:
+                new_arg_strings.append(ArgumentFileReference(arg_string, ArgumentFile(arg_string[1:])))
+            except OSError as error:
+                self.error(str(error))
+
+        return new_arg_strings
+
+    def _get_values(self, action, arg_strings):
+        """
+        Convert the raw values of an argument, giving the lines of argument files lazily
+
+        Args:
+            action: The argument the values are for
+            arg_strings: The raw values
+
+        Returns:
+            What the argument should hold
+
+        Raises:
+            argparse.ArgumentError: If an argument file supplies an argument that doesn't take a list of values,
+                or a value can't be converted or isn't one of the argument's choices
+        """
+        if action.nargs == argparse.PARSER or not any(isinstance(value, ArgumentFileReference) for value in arg_strings):
+            return super()._get_values(action, arg_strings)
+
+        if action.nargs not in STREAMED_NARGS:
+            raise argparse.ArgumentError(action, "an argument file may only supply an argument that takes a list of values")
+
+        if action.nargs != argparse.REMAINDER:
+            arg_strings = [value for value in arg_strings if value != "--"]
+
+        values = ArgumentSequence(arg_strings, None if action.type is None else lambda value: self._get_value(action, value))
+
+        if action.nargs == argparse.ONE_OR_MORE and not values:
+            raise argparse.ArgumentError(action, "expected at least one argument")
+
+        # Every value is checked now, a line at a time, so that mistakes are still reported while parsing
+        if action.nargs != argparse.REMAINDER and (action.type is not None or action.choices is not None):
+            for value in values:
+                self._check_value(action, value)
+
+        return values
+
+    def wants_interactive(self, args: typing.Sequence[str]) -> bool:
+        """
+        Whether raw CLI arguments ask for the TUI
+
+        Args:
+            args: The raw arguments passed to the application
+
+        Returns:
+            True if the interactive flag was passed
+
+        Raises:
+            argparse.ArgumentError: If an option string anywhere in the tree of subparsers clashes with the interactive flag
+        """
+        self.check_interactive_clashes()
+        return interactive_requested(
+            args,
+            prefix_chars=self.prefix_chars,
+            allow_abbrev=self.allow_abbrev,
+            option_strings=self._option_string_actions
+        )
+
+    def parse_interactively(self, namespace=None, workflow: typing.Optional[argui.model.WorkflowBehavior] = None) -> argparse.Namespace:
+        """
+        Launch the TUI and parse whatever arguments were entered into it
+
+        Exits the application with a code of `0` if the user quits without submitting anything
+
+        Args:
+            namespace: An object to store parsed values on
+            workflow: The workflow built from this parser beforehand. Built from the parser if not given
+
+        Returns:
+            The arguments that were entered through the TUI
+        """
+        with tracing.span("import", module="argui.interface"):
+            from argui.interface import run_workflow
+            from argui.model.history import HistoryStore
+
+        entered_arguments: typing.Optional[typing.List[str]] = run_workflow(
+            workflow if workflow is not None else self.to_model(),
+            validator=self.check_arguments,
+            history=HistoryStore.default(self)
+        )
+
+        if entered_arguments is None:
+            self.exit(0)
+
+        parsed_arguments = super().parse_args(entered_arguments, namespace)
+        setattr(parsed_arguments, INTERACTIVE_DESTINATION, True)
+        return parsed_arguments
+
+    def error(self, message: str):
+        """
+        Report a parse error, raising it instead of exiting if the current thread is only checking arguments
+
+        Args:
+            message: What went wrong
+        """
+        if getattr(_checking, "active", False):
+            raise ArgumentCheckError(f"{self.prog}: error: {message}")
+
+        super().error(message)
+
+    def check_arguments(self, args: typing.Sequence[str]) -> typing.Optional[str]:
+        """
+        Try to parse arguments without letting a failure exit the application
+
+        Nothing is written to stderr, so arguments may be checked on a worker thread while the TUI is running
+
+        Args:
+            args: The arguments to check
+
+        Returns:
+            A description of why the arguments could not be parsed, `None` if they are valid
+        """
+        try:
+            self.parse_checked(args)
+        except ArgumentCheckError as error:
+            return str(error)
+
+        return None
+
+    @tracing.traced("validation")
+    def parse_checked(self, args: typing.Sequence[str]) -> argparse.Namespace:
+        """
+        Parse arguments, raising instead of exiting if they can't be parsed
+
+        The interactive flag is not acted upon and nothing is written to stderr
+
+        Args:
+            args: The arguments to parse
+
+        Returns:
+            The parsed arguments
+
+        Raises:
+            ArgumentCheckError: If the arguments could not be parsed
+        """
+        was_checking: bool = getattr(_checking, "active", False)
+        _checking.active = True
+
+        try:
+            return super().parse_args(list(args))
+        except argparse.ArgumentError as error:
+            raise ArgumentCheckError(str(error)) from error
+        except SystemExit as error:
+            # Subparsers that aren't ArgUI parsers still exit on their own
+            raise ArgumentCheckError("The entered values could not be parsed") from error
+        finally:
+            _checking.active = was_checking
+
+    def to_model(self) -> argui.model.WorkflowBehavior:
         """
         Interpret the parser as a series of fields for the terminal
 
         Returns:
-            Fields that should appear on the screen, organized by workflow name
+            A workflow containing the fields that should appear on the screen
         """
-        workflows: Workflows = {}
+        with tracing.span("import", module="argui.model"):
+            from argui.model import WorkflowSpec
 
-        return workflows
\ No newline at end of file
+        return WorkflowSpec.from_parser(self)
@@ -0,0 +1,128 @@
+"""
+Rebuilds a parser's workflow whenever the files it was loaded from change, for `python -m argui dev`
+
+The modules of the parser's package are unloaded and imported again, so a change to any of them is
+picked up. The TUI then compares the new workflow with the one it is showing and only patches the
+fields and commands that changed, keeping whatever was entered into the others.
+"""
+from __future__ import annotations
+
+import sys
+import typing
+import argparse
+import importlib
+
+from argui.utilities.fingerprint import fingerprint_files
+from argui.utilities.fingerprint import get_loaded_source_files
+
+if typing.TYPE_CHECKING:
+    from argui.model import WorkflowBehavior
+
+RELOAD_INTERVAL: typing.Final[float] = 0.5
+"""How many seconds to wait between checks for changes to a parser's files"""
+
+
+def unload_package(module_name: str) -> typing.List[str]:
+    """
+    Remove every loaded module within the same top-level package as a module so that importing them reads them again
+
+    Args:
+        module_name: The dotted name of the module
+
+    Returns:
+        The names of the modules that were removed
+    """
+    top_level_name: str = module_name.split(".")[0]
+
+    if top_level_name == "argui":
+        raise ValueError("ArgUI can't reload itself")
+
+    unloaded: typing.List[str] = [
+        loaded_name
+        for loaded_name in list(sys.modules)
+        if loaded_name == top_level_name or loaded_name.startswith(top_level_name + ".")
+    ]
+
+    for loaded_name in unloaded:
+        del sys.modules[loaded_name]
+
+    importlib.invalidate_caches()
+    return unloaded
+
+
+class ParserReloader:
+    """
+    Watches the files a parser was loaded from and loads the parser again once they change
+    """
+    def __init__(self, source: str):
+        """
+        Args:
+            source: The 'package.module:attribute' reference to the parser
+        """
+        from argui.batch import load_parser
+
+        self.source: str = source
+        self.module_name: str = source.partition(":")[0]
+        self.parser: argparse.ArgumentParser = load_parser(source)
+        self.paths: typing.List[str] = get_loaded_source_files(self.module_name)
+        self.fingerprint: str = fingerprint_files(self.paths)
+
+    def has_changed(self) -> bool:
+        """
+        Whether any file the parser was last loaded from changed since
+        """
+        return fingerprint_files(self.paths) != self.fingerprint
+
+    def reload(self) -> WorkflowBehavior:
+        """
+        Load the parser from its files again and build its workflow
+
+        The files are watched for their next change even if they can't be loaded, so a broken edit is
+        only reported once
+
+        Returns:
+            The workflow for the new version of the parser
+
+        Raises:
+            Exception: Whatever importing the parser's modules or building the parser raised
+        """
+        from argui.batch import load_parser
+        from argui.model import WorkflowSpec
+
+        self.fingerprint = fingerprint_files(self.paths)
+        unload_package(self.module_name)
+        parser: argparse.ArgumentParser = load_parser(self.source)
+
+        self.parser = parser
+        self.paths = get_loaded_source_files(self.module_name)
+        self.fingerprint = fingerprint_files(self.paths)
+        return WorkflowSpec.from_parser(parser)
+
+    def poll(self) -> typing.Optional[WorkflowBehavior]:
+        """
+        Reload the parser if its files changed
+
+        Returns:
+            The workflow for the new version of the parser, `None` if nothing changed
+        """
+        if not self.has_changed():
+            return None
+
+        return self.reload()
+
+    def check_arguments(self, args: typing.Sequence[str]) -> typing.Optional[str]:
+        """
+        Check arguments against the latest version of the parser
+
+        Args:
+            args: The arguments to check
+
+        Returns:
+            A description of why the arguments could not be parsed, `None` if they are valid
+        """
+        check_arguments: typing.Optional[typing.Callable] = getattr(self.parser, "check_arguments", None)
+
+        if check_arguments is None:
+            return None
+
+        return check_arguments(args)
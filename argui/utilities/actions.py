@@ -1,6 +1,7 @@
 """
 Provides functions, classes, and constants used to interpret argparse actions
 """
+import enum
 import typing
 import argparse
 import pathlib
@@ -10,10 +11,19 @@ from functools import partial
 from textual.widget import Widget
 from textual import widgets
 
-from .common import get_element_by_name
+from .common import resolve_name
+from .registry import WidgetBuilder
+from .registry import WidgetRegistry
+from .registry import ENTRY_POINT_GROUP
+from .search import SEARCHABLE_OPTION_THRESHOLD
+from .providers import ChoiceProvider
+from .items import ItemStore
+from .tracing import traced
 
 WidgetType = typing.Type[Widget]
-WidgetBuilder = typing.Callable[[typing.Any], Widget]
+
+LIST_NARGS: typing.Final[typing.Tuple[str, ...]] = ("*", "+")
+"""The kinds of `nargs` that take any number of values, which are entered as a list of items"""
 
 # Store references to important argparse action types 
 #   - this gets around warnings about private attribute access
@@ -30,6 +40,71 @@ StoreTrueAction: typing.Type[argparse.Action] = getattr(argparse, "_StoreTrueAct
 """The ArgumentParser's parameter class whose presence indicates a `True` value"""
 StoreFalseAction: typing.Type[argparse.Action] = getattr(argparse, "_StoreFalseAction")
 """The ArgumentParser's parameter class whose precence indicates a `False` value"""
+BooleanOptionalAction: typing.Type[argparse.Action] = argparse.BooleanOptionalAction
+"""The ArgumentParser's parameter class that adds both a `--flag` and a `--no-flag` option"""
+VersionAction: typing.Type[argparse.Action] = getattr(argparse, "_VersionAction")
+"""The ArgumentParser's action indicating that the version of the application should be displayed"""
+StoreConstAction: typing.Type[argparse.Action] = getattr(argparse, "_StoreConstAction")
+"""The ArgumentParser's parameter class whose presence stores a constant, which `StoreTrueAction` builds on"""
+AppendConstAction: typing.Type[argparse.Action] = getattr(argparse, "_AppendConstAction")
+"""The ArgumentParser's parameter class whose presence appends a constant to a list"""
+ExtendAction: typing.Type[argparse.Action] = getattr(argparse, "_ExtendAction")
+"""The ArgumentParser's parameter class that adds every value given to a list"""
+
+ITEM_ACTIONS: typing.Final[typing.Tuple[typing.Type[argparse.Action], ...]] = (StoreAction, ExtendAction)
+"""The actions whose values are entered as a list of items when they take any number of them"""
+
+BOOLEAN_OPTIONAL_ACTION: typing.Final[str] = "boolean_optional"
+"""
+The name that workflows record for a `BooleanOptionalAction`. argparse has no name for it,
+so it must be passed to `add_argument` as the class itself
+"""
+
+ACTION_NAMES: typing.Dict[typing.Type[argparse.Action], str] = {
+    **{
+        action_type: action_name
+        for action_name, action_type in argparse.ArgumentParser()._registries["action"].items()
+        if action_name is not None
+    },
+    BooleanOptionalAction: BOOLEAN_OPTIONAL_ACTION,
+}
+"""The names that may be passed to `add_argument(action=...)` mapped to the classes they create"""
+
+ACTION_TYPES: typing.Dict[str, typing.Type[argparse.Action]] = {
+    action_name: action_type
+    for action_type, action_name in ACTION_NAMES.items()
+}
+"""The classes of the built-in actions mapped to the names that workflows record for them"""
+
+
+def get_action_name(action: argparse.Action) -> str:
+    """
+    Get the name that would be passed to `add_argument(action=...)` in order to create the given action
+
+    Args:
+        action: The argparse action to name
+
+    Returns:
+        The name of the closest built-in action, `"store"` if the action is entirely custom
+    """
+    for action_type in type(action).__mro__:
+        if action_type in ACTION_NAMES:
+            return ACTION_NAMES[action_type]
+
+    return "store"
+
+
+def get_action_type(action_name: str) -> typing.Type[argparse.Action]:
+    """
+    Get the class of the built-in action that a workflow records by name
+
+    Args:
+        action_name: The name of the action, as given by `get_action_name`
+
+    Returns:
+        The class of the action, `StoreAction` if the name is unknown
+    """
+    return ACTION_TYPES.get(action_name, StoreAction)
 
 
 def value_is_of_type(value_type: typing.Type, expected_type: typing.Type) -> bool:
@@ -46,13 +121,13 @@ def value_is_of_type(value_type: typing.Type, expected_type: typing.Type) -> boo
         True if values of `value_type` may be treated as values of `expected_type`
     """
     if not isinstance(expected_type, typing.Type):
-        return TypeError(
+        raise TypeError(
             "The type to compare against must by a type - received "
             f"'{expected_type}' (type={type(expected_type)})"
         )
     
     if not isinstance(value_type, typing.Type):
-        return TypeError(
+        raise TypeError(
             f"The type to check must be a type - received {value_type} (type={type(value_type)})"
         )
 
@@ -62,6 +137,150 @@ def value_is_of_type(value_type: typing.Type, expected_type: typing.Type) -> boo
     return issubclass(value_type, expected_type)
 
 
+VALUE_WIDGETS: WidgetRegistry = WidgetRegistry(entry_point_group=ENTRY_POINT_GROUP)
+"""The widgets used to enter values of each type. Add to this to support types that ArgUI doesn't know about"""
+
+ACTION_WIDGETS: WidgetRegistry = WidgetRegistry()
+"""Widgets used for argparse actions whose values don't depend on what the user types, like flags"""
+
+VALUE_WIDGETS.register(object, widgets.Input)
+# Make sure that 'type' is the correct parameter
+VALUE_WIDGETS.register(int, partial(widgets.Input, type="integer"))
+VALUE_WIDGETS.register(float, partial(widgets.Input, type="number"))
+
+
+@VALUE_WIDGETS.register(bool)
+def build_switch(value: typing.Any = None, placeholder: str = "", **kwargs) -> widgets.Switch:
+    """
+    Create a switch that may be built like any other input
+
+    Switches have no placeholder and only hold `True` or `False`, so the placeholder is dropped and
+    the value is treated as whether the switch is on
+    """
+    return widgets.Switch(value=bool(value), **kwargs)
+
+
+# `StoreTrueAction` and `StoreFalseAction` are found through `StoreConstAction`
+ACTION_WIDGETS.register(StoreConstAction, build_switch)
+ACTION_WIDGETS.register(AppendConstAction, build_switch)
+ACTION_WIDGETS.register(BooleanOptionalAction, build_switch)
+
+
+@VALUE_WIDGETS.register(pathlib.PurePath)
+def build_path_picker(**kwargs) -> Widget:
+    """
+    Create a text box for a path that may also browse for one
+
+    The picker is imported when first built since the interface imports this module
+    """
+    from argui.interface.paths import PathPicker
+    return PathPicker(**kwargs)
+
+
+@VALUE_WIDGETS.register(ItemStore)
+def build_item_list_editor(**kwargs) -> Widget:
+    """
+    Create an editor for long lists of values, for arguments that take any number of them without choices
+
+    The editor is imported when first built since the interface imports this module. Register a
+    builder for `ItemStore` to enter lists of items differently
+    """
+    from argui.interface.items import ItemListEditor
+    return ItemListEditor(**kwargs)
+
+
+def build_searchable_select(options: typing.Sequence[typing.Any], **kwargs) -> Widget:
+    """
+    Create a selector that finds options by searching them, for sets of options too large to scroll through
+
+    The selector is imported when first built since the interface imports this module
+    """
+    from argui.interface.search import SearchableSelect
+    return SearchableSelect(options, **kwargs)
+
+
+@VALUE_WIDGETS.register(ChoiceProvider)
+def build_provided_select(provider: ChoiceProvider, **kwargs) -> Widget:
+    """
+    Create a selector whose options are loaded from a provider once it is shown
+
+    Provided options may be any number of values, so they are always searched. Register a builder for
+    a subclass of `ChoiceProvider` to show its options differently
+    """
+    return build_searchable_select((), provider=provider, **kwargs)
+
+
+def build_select(
+    options: typing.Sequence[typing.Any],
+    value: typing.Any = None,
+    placeholder: str = "",
+    multiple: bool = False,
+    **kwargs
+) -> Widget:
+    """
+    Create a selector that shows every option, for sets of options small enough to scroll through
+
+    Options may be plain values or the text for a value paired with it. The placeholder is dropped
+    since neither selector shows one
+    """
+    labeled_options: typing.List[typing.Tuple[str, typing.Any]] = [
+        option if isinstance(option, tuple) else (str(option), option)
+        for option in options
+    ]
+
+    if multiple:
+        selected_values: typing.Sequence[typing.Any] = value if isinstance(value, (list, tuple)) else []
+        return widgets.SelectionList(
+            *[(label, option, option in selected_values) for label, option in labeled_options],
+            **kwargs
+        )
+
+    if value is not None and any(option == value for _, option in labeled_options):
+        kwargs["value"] = value
+
+    return widgets.Select(labeled_options, **kwargs)
+
+
+def accepts_multiple_values(nargs: typing.Optional[typing.Union[int, str]]) -> bool:
+    """
+    Determine if an argparse `nargs` value means that more than one value may be given
+
+    Args:
+        nargs: The `nargs` value of an argparse action
+
+    Returns:
+        True if a list of values will be stored
+    """
+    return isinstance(nargs, int) and nargs > 1 or nargs in LIST_NARGS
+
+
+@VALUE_WIDGETS.register_factory(enum.Enum)
+def get_enum_select_builder(enum_type: typing.Type[enum.Enum]) -> WidgetBuilder:
+    """
+    Create a builder for a select populated by the names and values of an enum
+
+    Args:
+        enum_type: The enum whose members may be selected
+
+    Returns:
+        A function that creates the select
+    """
+    options: typing.List[typing.Tuple[str, str]] = [(member.name, str(member.value)) for member in enum_type]
+    known_values: typing.Dict[str, str] = {
+        text: str(member.value)
+        for member in enum_type
+        for text in (str(member), member.name, str(member.value))
+    }
+
+    def build_enum_select(value: typing.Optional[str] = None, placeholder: str = "", **kwargs) -> widgets.Select:
+        if value in known_values:
+            kwargs["value"] = known_values[value]
+        return widgets.Select(options, prompt=placeholder or "Select", **kwargs)
+
+    return build_enum_select
+
+
+@traced("dispatch")
 def get_widget_by_value_type(
     value_type: typing.Union[str, typing.Type]
 ) -> typing.Union[WidgetType, WidgetBuilder]:
@@ -75,34 +294,86 @@ def get_widget_by_value_type(
         The type of widget to use to represent the type of value and 
         specific values needed to represent it in the constructor
     """
+    # argparse leaves the type as `None` when values are to be kept as strings
+    if value_type is None:
+        value_type = str
+
     # If this is a str, we're assuming that we need to reach out and 
     # get this or a collection of widgets based on its name
     if isinstance(value_type, str):
-        value_type = get_element_by_name(name=value_type)
+        value_type = resolve_name(value_type)
 
     if not isinstance(value_type, typing.Type):
+        # Conversion functions like `int` are classes, but custom ones are typically plain functions.
+        # All that may be said about their values is that they start out as text
+        if callable(value_type):
+            return VALUE_WIDGETS.resolve(str)
+
         raise TypeError(
             "Cannot determine what widget to use based off of "
             f"'{value_type}' (type={type(value_type)}). Only a type of "
             "value or the name of a type of value is allowed"
         )
-    
-    if value_is_of_type(value_type=value_type, expected_type=bool):
-        return widgets.Switch
-    
-    # Make sure that 'type' is the correct parameter
-    if value_is_of_type(value_type=value_type, expected_type=int):
-        return partial(widgets.Input, type="integer")
-    
-    if value_is_of_type(value_type=value_type, expected_type=float):
-        return partial(widgets.Input, type="number")
 
-    if value_is_of_type(value_type=value_type, expected_type=pathlib.Path):
-        # This needs to be something that indicates multiple widgets - a textbox and file selector
-        raise NotImplementedError("Path input has not been implemented yet")
+    return VALUE_WIDGETS.resolve(value_type)
+
+@traced("dispatch")
+def get_widget_for(
+    action_type: typing.Type[argparse.Action],
+    value_type: typing.Union[str, typing.Type, None] = None,
+    nargs: typing.Optional[typing.Union[int, str]] = None,
+    choices: typing.Optional[typing.Iterable[typing.Any]] = None,
+    multiple: typing.Optional[bool] = None
+) -> typing.Union[WidgetType, WidgetBuilder]:
+    """
+    Get the widget for an argument. This is where every widget shown for an argument is chosen
+
+    Widgets registered for the kind of action come first, then selectors for arguments with choices,
+    then the editor registered for `ItemStore` for arguments that take any number of values, then
+    the widget registered for the type of value
+
+    Args:
+        action_type: The class of the argparse action
+        value_type: The type of value that the action stores
+        nargs: The number of values that the action takes
+        choices: The options that values are chosen from, if any. A `ChoiceProvider` is shown by the widget
+            registered for its class
+        multiple: Whether more than one option may be chosen. Decided by `nargs` if not given
 
-    return widgets.Input
+    Returns:
+        The type of widget to use or a function that will create it properly
+    """
+    action_widget: typing.Optional[WidgetBuilder] = ACTION_WIDGETS.get(action_type)
 
+    if action_widget is not None:
+        return action_widget
+
+    if multiple is None:
+        multiple = accepts_multiple_values(nargs)
+
+    # Provided options are only loaded once the selector is shown, so there's no telling how many there are
+    if isinstance(choices, ChoiceProvider):
+        return partial(VALUE_WIDGETS.resolve(type(choices)), choices, multiple=multiple)
+
+    if choices:
+        options: typing.Tuple[typing.Any, ...] = tuple(choices)
+
+        if len(options) >= SEARCHABLE_OPTION_THRESHOLD:
+            return partial(build_searchable_select, options, multiple=multiple)
+
+        return partial(build_select, options, multiple=multiple)
+
+    if nargs in LIST_NARGS and issubclass(action_type, ITEM_ACTIONS):
+        # Entered text is kept as it is if the value type can't convert it
+        conversion: typing.Optional[typing.Callable[[str], typing.Any]] = (
+            value_type if callable(value_type) and value_type is not str else None
+        )
+        return partial(VALUE_WIDGETS.resolve(ItemStore), conversion=conversion)
+
+    return get_widget_by_value_type(value_type)
+
+
+@traced("dispatch")
 def get_widget_by_action(action: argparse.Action) -> typing.Union[WidgetType, WidgetBuilder]:
     """
     Get the appropriate widget for an argparse action
@@ -116,20 +387,10 @@ def get_widget_by_action(action: argparse.Action) -> typing.Union[WidgetType, Wi
     if isinstance(action, HelpAction):
         raise TypeError("The help command is not an appropriate screen element")
 
-    if not isinstance(action, StoreAction):
+    if not isinstance(action, StoreAction) and ACTION_WIDGETS.get(type(action)) is None:
         raise TypeError(
             "Only actions that may store a value may be represented on the screen. "
             f"Received {action} (type={type(action)})"
         )
 
-    if isinstance(action, (StoreTrueAction, StoreFalseAction)):
-        return widgets.Switch
-
-    if action.choices:
-        if isinstance(action.nargs, int) and action.nargs > 1 or action.nargs in ("+", "*"):
-            return widgets.SelectionList
-        return widgets.Select
-
-    constructor = get_widget_by_value_type(action.type)
-
-    return constructor
+    return get_widget_for(type(action), action.type, action.nargs, action.choices)
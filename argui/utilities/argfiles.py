@@ -0,0 +1,290 @@
+"""
+Reads argument files lazily so that manifests of millions of values never have to be held in memory
+
+`argparse` reads an '@file' whole and splices every line into the arguments before parsing them.
+An `ArgumentFile` instead maps the file into memory and decodes lines only as they are asked for,
+releasing the pages it has read so that memory stays flat however large the file is. The values of
+an argument that takes a list of them are given as an `ArgumentSequence`, which chains the values
+entered directly with the lines of any argument files and converts each one as it is reached.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import mmap
+import array
+import typing
+import bisect
+import collections.abc
+
+READ_CHUNK_SIZE: typing.Final[int] = 1 << 20
+"""The number of bytes decoded at a time while lines are read from an argument file"""
+
+CHECKPOINT_INTERVAL: typing.Final[int] = 4096
+"""How many lines apart the offsets remembered for looking up lines by position are"""
+
+ENCODING: typing.Final[str] = sys.getfilesystemencoding()
+"""The encoding of argument files, which matches what newer versions of `argparse` read them with"""
+
+ENCODING_ERRORS: typing.Final[str] = sys.getfilesystemencodeerrors()
+"""How bytes that can't be decoded are handled, which matches what newer versions of `argparse` do"""
+
+
+class ArgumentFile(collections.abc.Sequence):
+    """
+    The lines of an argument file, each of which is a single argument
+
+    Lines end with '\\n' or '\\r\\n'. Unlike `argparse`, lines within the file that start with a
+    fromfile prefix are taken as they are rather than read as further files
+    """
+    def __init__(self, path: typing.Union[str, os.PathLike]):
+        """
+        Args:
+            path: The file to read
+
+        Raises:
+            OSError: If the file can't be opened
+        """
+        self.path: str = os.fspath(path)
+        self._size: int = os.path.getsize(self.path)
+        self._map: typing.Optional[mmap.mmap] = None
+        self._length: typing.Optional[int] = None
+        self._checkpoints: typing.Optional[array.array] = None
+
+        if self._size:
+            with open(self.path, "rb") as file:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                self._map.madvise(mmap.MADV_SEQUENTIAL)
+
+    def close(self) -> None:
+        """
+        Unmap the file. Nothing more may be read from it afterward
+        """
+        if self._map is not None:
+            self._map.close()
+
+    def __enter__(self) -> ArgumentFile:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+    def __bool__(self) -> bool:
+        # Any byte at all makes at least one line, even if it is an empty one
+        return self._size > 0
+
+    def release(self, start: int, stop: int) -> None:
+        """
+        Let go of the memory holding a part of the file that has been read. The part may still be read again later
+
+        Args:
+            start: The offset of the first byte that was read
+            stop: The offset just past the last byte that was read
+        """
+        if not hasattr(mmap, "MADV_DONTNEED"):
+            return
+
+        start -= start % mmap.PAGESIZE
+
+        if stop > start:
+            self._map.madvise(mmap.MADV_DONTNEED, start, stop - start)
+
+    def iterate_lines(self, offset: int = 0) -> typing.Iterator[typing.Tuple[int, str]]:
+        """
+        Read the lines of the file a chunk at a time
+
+        Args:
+            offset: Where to start reading. Must be the start of a line
+
+        Returns:
+            The offset of each line along with the line itself
+        """
+        if self._map is None:
+            return
+
+        remainder: bytes = b""
+        remainder_offset: int = offset
+
+        while offset < self._size:
+            stop: int = min(offset + READ_CHUNK_SIZE, self._size)
+            chunk: bytes = remainder + self._map[offset:stop]
+            self.release(offset, stop)
+            line_offset: int = remainder_offset
+            lines: typing.List[bytes] = chunk.split(b"\n")
+            remainder = lines.pop()
+
+            for line in lines:
+                yield line_offset, self.decode(line)
+                line_offset += len(line) + 1
+
+            remainder_offset = line_offset
+            offset = stop
+
+        if remainder:
+            yield remainder_offset, self.decode(remainder)
+
+    @staticmethod
+    def decode(line: bytes) -> str:
+        """
+        Turn the bytes of a line into an argument
+        """
+        if line.endswith(b"\r"):
+            line = line[:-1]
+
+        return line.decode(ENCODING, ENCODING_ERRORS)
+
+    def index_lines(self) -> None:
+        """
+        Count the lines of the file, remembering where every `CHECKPOINT_INTERVAL`th one starts
+        """
+        if self._length is not None:
+            return
+
+        checkpoints: array.array = array.array("q")
+        length: int = 0
+
+        for line_offset, _ in self.iterate_lines():
+            if length % CHECKPOINT_INTERVAL == 0:
+                checkpoints.append(line_offset)
+
+            length += 1
+
+        self._checkpoints = checkpoints
+        self._length = length
+
+    def __iter__(self) -> typing.Iterator[str]:
+        for _, line in self.iterate_lines():
+            yield line
+
+    def __len__(self) -> int:
+        self.index_lines()
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        length: int = len(self)
+
+        if index < 0:
+            index += length
+
+        if not 0 <= index < length:
+            raise IndexError("argument file index out of range")
+
+        checkpoint, skipped = divmod(index, CHECKPOINT_INTERVAL)
+
+        for _, line in self.iterate_lines(self._checkpoints[checkpoint]):
+            if not skipped:
+                return line
+
+            skipped -= 1
+
+        raise IndexError("argument file index out of range")
+
+
+class ArgumentFileReference(str):
+    """
+    An '@file' argument that stands in for every line of its file while the arguments are parsed
+    """
+    argument_file: ArgumentFile
+    """The lines of the file"""
+
+    def __new__(cls, argument: str, argument_file: ArgumentFile) -> ArgumentFileReference:
+        reference: ArgumentFileReference = super().__new__(cls, argument)
+        reference.argument_file = argument_file
+        return reference
+
+
+class ArgumentSequence(collections.abc.Sequence):
+    """
+    The values of an argument that takes a list of them, read from argument files as they are reached
+
+    Values are converted each time they are read, so code that reads them more than once may want to
+    keep what it reads
+    """
+    def __init__(
+        self,
+        parts: typing.Sequence[typing.Union[str, ArgumentFile]],
+        convert: typing.Optional[typing.Callable[[str], typing.Any]] = None
+    ):
+        """
+        Args:
+            parts: The values that were entered directly and the files that were referenced, in order
+            convert: Turns each raw value into what the argument holds. Values are left as they are if `None`
+        """
+        self.parts: typing.List[typing.Union[str, ArgumentFile]] = [
+            part.argument_file if isinstance(part, ArgumentFileReference) else part
+            for part in parts
+        ]
+        self.convert: typing.Optional[typing.Callable[[str], typing.Any]] = convert
+        self._offsets: typing.Optional[typing.List[int]] = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.parts!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ArgumentSequence, list, tuple)):
+            return len(self) == len(other) and all(left == right for left, right in zip(self, other))
+
+        return NotImplemented
+
+    def __bool__(self) -> bool:
+        return any(isinstance(part, str) or bool(part) for part in self.parts)
+
+    def iterate_raw(self) -> typing.Iterator[str]:
+        """
+        Read every value as it was written, before it is converted
+        """
+        for part in self.parts:
+            if isinstance(part, str):
+                yield part
+            else:
+                yield from part
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        if self.convert is None:
+            return self.iterate_raw()
+
+        return map(self.convert, self.iterate_raw())
+
+    def get_offsets(self) -> typing.List[int]:
+        """
+        Get the position of the first value of each part
+        """
+        if self._offsets is None:
+            offsets: typing.List[int] = [0]
+
+            for part in self.parts:
+                offsets.append(offsets[-1] + (1 if isinstance(part, str) else len(part)))
+
+            self._offsets = offsets
+
+        return self._offsets
+
+    def __len__(self) -> int:
+        return self.get_offsets()[-1]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        length: int = len(self)
+
+        if index < 0:
+            index += length
+
+        if not 0 <= index < length:
+            raise IndexError("argument sequence index out of range")
+
+        offsets: typing.List[int] = self.get_offsets()
+        part_index: int = bisect.bisect_right(offsets, index) - 1
+        part: typing.Union[str, ArgumentFile] = self.parts[part_index]
+        value: str = part if isinstance(part, str) else part[index - offsets[part_index]]
+
+        return value if self.convert is None else self.convert(value)
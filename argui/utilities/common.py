@@ -3,6 +3,9 @@ Contains common functions and constants that don't necessary have an obvious hom
 """
 import typing
 import types
+import threading
+import importlib
+import collections
 
 _SENTINEL = object()
 """Representative of 'null' for when 'None' is a valid value"""
@@ -100,3 +103,147 @@ def get_element_by_name(
         raise KeyError(f"There are no objects within the given context with a key of '{name}'")
 
     return found_value
+
+
+def import_element(name: str) -> typing.Any:
+    """
+    Import an object by its full dotted name, like 'pathlib.Path' or 'textual.widgets.Input'
+
+    Args:
+        name: The module path to the object followed by the path to the object within that module
+
+    Returns:
+        The imported object
+    """
+    if not name:
+        raise ValueError("Cannot import an element if its name was not supplied")
+
+    module_name, _, attribute_path = name.partition(".")
+
+    while True:
+        try:
+            found_value: typing.Any = importlib.import_module(module_name)
+        except ImportError:
+            found_value = _SENTINEL
+
+        if found_value is not _SENTINEL:
+            try:
+                for attribute in filter(None, attribute_path.split(".")):
+                    found_value = getattr(found_value, attribute)
+                return found_value
+            except AttributeError:
+                pass
+
+        if not attribute_path:
+            raise KeyError(f"There are no importable elements named '{name}'")
+
+        next_name, _, attribute_path = attribute_path.partition(".")
+        module_name = f"{module_name}.{next_name}"
+
+
+class NameResolver:
+    """
+    Finds objects by name, remembering what each name resolved to within each context
+
+    Names that can't be found within the given context are imported if they look like a dotted
+    module path or looked up within the builtins otherwise. Failed lookups are never remembered
+    since the element may appear later.
+    """
+    def __init__(self, maximum_size: int = 1024):
+        """
+        Args:
+            maximum_size: The number of resolved names to remember before forgetting the least recently used
+        """
+        self.maximum_size: int = maximum_size
+        self._entries: collections.OrderedDict[
+            typing.Tuple[str, int],
+            typing.Tuple[typing.Any, typing.Any]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(
+        self,
+        name: str,
+        context: typing.Union[typing.Dict[str, typing.Any], types.ModuleType] = None
+    ) -> typing.Any:
+        """
+        Find an object by its name
+
+        Args:
+            name: The name of the element to find. Names with '.' will be used to help traverse a nested context
+            context: Where to look. Defaults to globals
+
+        Returns:
+            The object if it could be found
+        """
+        if not name:
+            raise ValueError("Cannot find an element if its name was not supplied")
+
+        key: typing.Tuple[str, int] = (name, id(context))
+
+        with self._lock:
+            entry = self._entries.get(key, None)
+
+            # The context is stored along with the value since the id of a dead context may be reused
+            if entry is not None and entry[0] is context:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        try:
+            found_value: typing.Any = get_element_by_name(name, context)
+        except KeyError:
+            # Bare names like 'int' are most likely builtins, dotted ones most likely belong to a module
+            found_value = import_element(name if "." in name else f"builtins.{name}")
+
+        with self._lock:
+            self._entries[key] = (context, found_value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maximum_size:
+                self._entries.popitem(last=False)
+
+        return found_value
+
+    def invalidate(
+        self,
+        name: typing.Optional[str] = None,
+        context: typing.Union[typing.Dict[str, typing.Any], types.ModuleType] = _SENTINEL
+    ) -> None:
+        """
+        Forget what names resolved to
+
+        Args:
+            name: The name to forget. Every name is forgotten if not given
+            context: Only forget names that were resolved within this context
+        """
+        with self._lock:
+            for key, (entry_context, _) in list(self._entries.items()):
+                if name is not None and key[0] != name:
+                    continue
+                if context is not _SENTINEL and entry_context is not context:
+                    continue
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+NAME_RESOLVER: NameResolver = NameResolver()
+"""The resolver shared by everything that needs to find widgets and types by name"""
+
+
+def resolve_name(
+    name: str,
+    context: typing.Union[typing.Dict[str, typing.Any], types.ModuleType] = None
+) -> typing.Any:
+    """
+    Find an object by its name with the shared resolver, importing it if needed
+
+    Args:
+        name: The name of the element to find
+        context: Where to look. Defaults to globals
+
+    Returns:
+        The object if it could be found
+    """
+    return NAME_RESOLVER.resolve(name, context)
@@ -0,0 +1,235 @@
+"""
+Runs the conversions that turn entered text into typed values away from the thread drawing the TUI
+
+A field's `type` may be any callable, including ones that stat files, parse large documents, or look up
+hosts. Checking a value runs its conversion on a bounded thread pool, or on a process pool if the
+conversion was marked with `cpu_bound`, and remembers the outcome for each field and value. Awaiting a
+check that is cancelled, such as when the value changes again, cancels the conversion if it hasn't started.
+
+Nothing here imports `asyncio` or `concurrent.futures` until a value is checked, so `cpu_bound` may be
+used in modules that are imported by non-interactive launches.
+"""
+from __future__ import annotations
+
+import typing
+import argparse
+import collections
+
+from .tracing import traced
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+CONVERSION_WORKERS: typing.Final[int] = 4
+"""The largest number of conversions that may run at once in each pool"""
+
+CONVERSION_CACHE_SIZE: typing.Final[int] = 512
+"""The number of checked values to remember before the least recently used ones are forgotten"""
+
+_T = typing.TypeVar("_T")
+
+_cpu_bound_conversions: typing.Set[typing.Callable] = set()
+"""The conversions that should be checked in another process"""
+
+
+def cpu_bound(conversion: _T) -> _T:
+    """
+    Mark a conversion as one that keeps the CPU busy, such as parsing a large document, so that it is
+    checked in another process rather than a thread
+
+    The conversion must be importable, such as a function defined at the top level of a module or
+    `json.loads`, so that it may be pickled. It may be used as a decorator
+
+    Args:
+        conversion: The conversion to mark
+
+    Returns:
+        The same conversion
+    """
+    _cpu_bound_conversions.add(conversion)
+    return conversion
+
+
+def is_cpu_bound(conversion: typing.Callable) -> bool:
+    """
+    Determine if a conversion was marked with `cpu_bound`
+    """
+    try:
+        return conversion in _cpu_bound_conversions
+    except TypeError:
+        # Conversions that can't be hashed can't have been marked
+        return False
+
+
+def freeze_value(value: typing.Any) -> typing.Hashable:
+    """
+    Get a form of an entered value that may be used as a dictionary key
+
+    Args:
+        value: The value that was entered
+
+    Returns:
+        The value with every list replaced by a tuple
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(entry) for entry in value)
+
+    return value
+
+
+@traced("validation")
+def check_conversion(conversion: typing.Callable[[str], typing.Any], value: typing.Any) -> typing.Optional[str]:
+    """
+    Convert an entered value the way argparse would and describe what went wrong, if anything
+
+    Only the description is returned so that the outcome may always be sent back from another process
+
+    Args:
+        conversion: The field's type
+        value: The entered value, or a list of them for fields that take many values
+
+    Returns:
+        The message argparse would give for the value, `None` if it converts cleanly
+    """
+    conversion_name: str = getattr(conversion, "__name__", repr(conversion))
+
+    for entry in value if isinstance(value, (list, tuple)) else (value,):
+        try:
+            conversion(entry)
+        except argparse.ArgumentTypeError as error:
+            return str(error)
+        except (TypeError, ValueError):
+            return f"invalid {conversion_name} value: {entry!r}"
+        except Exception as error:
+            # argparse would let this escape, but a broken conversion shouldn't bring down the TUI
+            return f"{conversion_name} failed for {entry!r}: {error}"
+
+    return None
+
+
+class ConversionPool:
+    """
+    Checks entered values on worker threads or processes and remembers the outcome for each field and value
+    """
+    def __init__(self, max_workers: int = CONVERSION_WORKERS, cache_size: int = CONVERSION_CACHE_SIZE):
+        """
+        Args:
+            max_workers: The largest number of conversions that may run at once in each pool
+            cache_size: The number of checked values to remember
+        """
+        self.max_workers: int = max_workers
+        self.cache_size: int = cache_size
+        self._outcomes: typing.OrderedDict[typing.Hashable, typing.Optional[str]] = collections.OrderedDict()
+        self._threads: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._processes: typing.Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    def get_executor(self, cpu_bound: bool = False) -> concurrent.futures.Executor:
+        """
+        Get the pool that work should run on, starting it if it hasn't been used yet
+
+        Args:
+            cpu_bound: Whether the work should run in another process
+
+        Returns:
+            The thread or process pool
+        """
+        import concurrent.futures
+
+        if cpu_bound:
+            if self._processes is None:
+                self._processes = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._processes
+
+        if self._threads is None:
+            self._threads = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="argui-conversion"
+            )
+        return self._threads
+
+    async def run(self, function: typing.Callable[..., _T], *arguments: typing.Any, cpu_bound: bool = False) -> _T:
+        """
+        Call a function on one of the pools without blocking the event loop
+
+        Args:
+            function: The function to call
+            arguments: What to pass to the function
+            cpu_bound: Whether the function should be called in another process
+
+        Returns:
+            Whatever the function returns
+        """
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(self.get_executor(cpu_bound), function, *arguments)
+
+    def get_cached(self, key: typing.Hashable, value: typing.Any) -> typing.Tuple[bool, typing.Optional[str]]:
+        """
+        Look up the outcome of an earlier check
+
+        Args:
+            key: What identifies the field that the value was entered for
+            value: The entered value
+
+        Returns:
+            Whether the value was checked before and what went wrong with it, if anything
+        """
+        cache_key: typing.Hashable = (key, freeze_value(value))
+
+        if cache_key not in self._outcomes:
+            return False, None
+
+        self._outcomes.move_to_end(cache_key)
+        return True, self._outcomes[cache_key]
+
+    def forget(self, keys: typing.Collection[typing.Hashable]) -> None:
+        """
+        Forget the outcome of every check for some fields, such as after their types changed
+
+        Args:
+            keys: What identifies each field
+        """
+        for cache_key in [cache_key for cache_key in self._outcomes if cache_key[0] in keys]:
+            del self._outcomes[cache_key]
+
+    async def check(
+        self,
+        key: typing.Hashable,
+        conversion: typing.Callable[[str], typing.Any],
+        value: typing.Any
+    ) -> typing.Optional[str]:
+        """
+        Convert an entered value off of the event loop, reusing the outcome if the value was checked before
+
+        Args:
+            key: What identifies the field that the value was entered for
+            conversion: The field's type
+            value: The entered value
+
+        Returns:
+            The message argparse would give for the value, `None` if it converts cleanly
+        """
+        was_checked, problem = self.get_cached(key, value)
+
+        if was_checked:
+            return problem
+
+        problem = await self.run(check_conversion, conversion, value, cpu_bound=is_cpu_bound(conversion))
+
+        self._outcomes[(key, freeze_value(value))] = problem
+
+        while len(self._outcomes) > self.cache_size:
+            self._outcomes.popitem(last=False)
+
+        return problem
+
+    def shutdown(self) -> None:
+        """
+        Stop both pools without waiting for conversions that are still running
+        """
+        for executor in (self._threads, self._processes):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        self._threads = None
+        self._processes = None
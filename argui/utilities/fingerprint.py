@@ -0,0 +1,216 @@
+"""
+Provides functions used to describe the structure of an ArgumentParser as a stable digest
+
+A fingerprint only changes when something that would change the generated interface changes -
+the flags, types, choices, defaults, and commands of a parser and its subparsers
+"""
+import os
+import sys
+import typing
+import hashlib
+import argparse
+
+FINGERPRINT_SIZE: typing.Final[int] = 16
+"""The number of bytes in a fingerprint digest"""
+
+_PRIMITIVE_TYPES: typing.Tuple[typing.Type, ...] = (str, int, float, bool, type(None))
+
+# Only attributes that change what the interface looks like or how values are parsed are described
+_PARSER_ATTRIBUTES: typing.Tuple[str, ...] = (
+    "prog",
+    "usage",
+    "description",
+    "epilog",
+    "prefix_chars",
+    "fromfile_prefix_chars",
+    "argument_default",
+    "allow_abbrev",
+)
+
+_ACTION_ATTRIBUTES: typing.Tuple[str, ...] = (
+    "option_strings",
+    "dest",
+    "nargs",
+    "const",
+    "default",
+    "type",
+    "required",
+    "help",
+    "metavar",
+)
+
+
+def get_qualified_name(value: typing.Any) -> typing.Optional[str]:
+    """
+    Get the importable name of a class or function
+
+    Args:
+        value: The object to name
+
+    Returns:
+        A name like 'pathlib.Path', `None` if the object may not be imported by name
+    """
+    module_name: typing.Optional[str] = getattr(value, "__module__", None)
+    qualified_name: typing.Optional[str] = getattr(value, "__qualname__", None)
+
+    if not module_name or not qualified_name or "<" in qualified_name:
+        return None
+
+    return f"{module_name}.{qualified_name}"
+
+
+def describe_value(value: typing.Any) -> str:
+    """
+    Describe a value in a way that stays the same between interpreter runs
+
+    Args:
+        value: The value to describe
+
+    Returns:
+        A stable description of the value
+    """
+    if isinstance(value, _PRIMITIVE_TYPES):
+        return repr(value)
+
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{','.join(describe_value(entry) for entry in value)}]"
+
+    if isinstance(value, (set, frozenset)):
+        return f"set[{','.join(sorted(describe_value(entry) for entry in value))}]"
+
+    if isinstance(value, typing.Mapping):
+        return "{" + ",".join(
+            f"{describe_value(key)}:{describe_value(entry)}"
+            for key, entry in value.items()
+        ) + "}"
+
+    if isinstance(value, type) or callable(value):
+        return get_qualified_name(value) or getattr(value, "__qualname__", type(value).__qualname__)
+
+    description: str = repr(value)
+
+    # Default object representations include memory addresses, which change on every run
+    if " at 0x" in description:
+        return get_qualified_name(type(value)) or type(value).__qualname__
+
+    return description
+
+
+def _update_digest(digest: hashlib.blake2b, parser: argparse.ArgumentParser, recursive: bool = True) -> None:
+    """
+    Add the structure of a parser and all of its subparsers to a digest
+
+    Args:
+        digest: The digest to update
+        parser: The parser to describe
+        recursive: Whether to describe what is within each subparser rather than just the commands leading to them
+    """
+    def write(*parts: str) -> None:
+        digest.update("\x1f".join(parts).encode("utf-8", errors="surrogatepass"))
+        digest.update(b"\x1e")
+
+    write("parser", *(describe_value(getattr(parser, name, None)) for name in _PARSER_ATTRIBUTES))
+    write("defaults", describe_value(getattr(parser, "_defaults", {})))
+
+    for group in getattr(parser, "_mutually_exclusive_groups", []):
+        write(
+            "exclusive",
+            describe_value(group.required),
+            *(action.dest for action in getattr(group, "_group_actions", []))
+        )
+
+    for action in getattr(parser, "_actions", []):
+        write(
+            "action",
+            get_qualified_name(type(action)) or type(action).__qualname__,
+            *(describe_value(getattr(action, name, None)) for name in _ACTION_ATTRIBUTES)
+        )
+
+        if isinstance(action.choices, typing.Mapping):
+            command_help: typing.Dict[str, typing.Any] = {
+                choice_action.dest: choice_action.help
+                for choice_action in getattr(action, "_choices_actions", [])
+            }
+
+            command_names: typing.Dict[int, str] = {}
+
+            for command_name, subparser in action.choices.items():
+                write("command", str(command_name), describe_value(command_help.get(command_name)))
+
+                if not recursive:
+                    # Only which command each alias leads to is described, not what the subparsers hold
+                    write("alias of", command_names.setdefault(id(subparser), str(command_name)))
+                elif isinstance(subparser, argparse.ArgumentParser):
+                    _update_digest(digest, subparser)
+                else:
+                    write(describe_value(subparser))
+
+            write("end commands")
+        else:
+            write("choices", describe_value(action.choices))
+
+
+def fingerprint_parser(parser: argparse.ArgumentParser, salt: str = "", recursive: bool = True) -> str:
+    """
+    Create a digest that describes the structure of a parser and all of its subparsers
+
+    Args:
+        parser: The parser to describe
+        salt: Extra text to mix into the digest, such as the version of a format built from the parser
+        recursive: Whether to describe what is within each subparser. If not, only the names of the
+            commands leading to them are described, so the digest is quick to make however large the tree is
+
+    Returns:
+        A hexadecimal digest that only changes when the structure of the parser changes
+    """
+    digest = hashlib.blake2b(salt.encode("utf-8"), digest_size=FINGERPRINT_SIZE)
+    _update_digest(digest, parser, recursive)
+    return digest.hexdigest()
+
+
+def get_loaded_source_files(module_name: str) -> typing.List[str]:
+    """
+    List the files of every loaded module within the same top-level package as a module
+
+    Args:
+        module_name: The dotted name of the module
+
+    Returns:
+        The path of each loaded module's file, sorted by the name of the module
+    """
+    top_level_name: str = module_name.split(".")[0]
+    paths: typing.List[str] = []
+
+    for loaded_name, module in sorted(sys.modules.items(), key=lambda item: item[0]):
+        if loaded_name != top_level_name and not loaded_name.startswith(top_level_name + "."):
+            continue
+
+        path: typing.Optional[str] = getattr(module, "__file__", None)
+
+        if path:
+            paths.append(path)
+
+    return paths
+
+
+def fingerprint_files(paths: typing.Iterable[str]) -> str:
+    """
+    Create a digest that changes whenever any of a set of files is written, replaced, or deleted
+
+    Args:
+        paths: The files to describe
+
+    Returns:
+        A hexadecimal digest of the path, size, and modification time of each file
+    """
+    digest = hashlib.blake2b(digest_size=FINGERPRINT_SIZE)
+
+    for path in paths:
+        try:
+            status: os.stat_result = os.stat(path)
+        except OSError:
+            digest.update(f"{path}:missing\n".encode("utf-8", errors="surrogatepass"))
+        else:
+            digest.update(f"{path}:{status.st_size}:{status.st_mtime_ns}\n".encode("utf-8", errors="surrogatepass"))
+
+    return digest.hexdigest()
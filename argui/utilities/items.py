@@ -0,0 +1,380 @@
+"""
+Keeps long lists of entered items compactly and turns pasted text or files into items
+
+Arguments with `nargs="*"` or `"+"` may be given thousands of IDs or paths at once. An `ItemStore`
+keeps them encoded back to back in a single buffer with arrays of offsets, rather than as a list
+of string objects, and knows which of them have already been entered so that duplicates are
+skipped in constant time. Removing an item only drops its offsets, and the buffer is compacted
+once most of it belongs to removed items. Pasted text and files are split into items here and checked against the
+field's type in batches, so that the work may be done away from the thread drawing the TUI.
+"""
+from __future__ import annotations
+
+import os
+import array
+import bisect
+import typing
+import operator
+import itertools
+import collections.abc
+
+from .argfiles import ArgumentFile
+from .conversion import check_conversion
+
+ITEM_ENCODING: typing.Final[str] = "utf-8"
+"""How items are encoded within a store"""
+
+ITEM_ENCODING_ERRORS: typing.Final[str] = "surrogatepass"
+"""Keeps items that were decoded with escaped bytes, such as paths, intact within a store"""
+
+COMPACTION_RATIO: typing.Final[float] = 0.5
+"""The share of a store's buffer that removed items may take up before the buffer is compacted"""
+
+IMPORT_BATCH_SIZE: typing.Final[int] = 2000
+"""The number of items checked and handed over at a time while text or a file is imported"""
+
+CheckedItem = typing.Tuple[str, typing.Optional[str]]
+"""An item along with what is wrong with it, if anything"""
+
+
+class ItemStore(collections.abc.Sequence):
+    """
+    An ordered list of unique strings, kept in one buffer, along with what is wrong with any of them
+
+    Stores compare equal to lists and tuples with the same items so that they may stand in for them
+    as a field's value
+    """
+    def __init__(self, items: typing.Iterable[str] = ()):
+        """
+        Args:
+            items: The items to start with. Duplicates are skipped
+        """
+        self._data: bytearray = bytearray()
+        self._starts: array.array = array.array("q")
+        self._stops: array.array = array.array("q")
+        self._removed_bytes: int = 0
+
+        # Items are found by a serial number that never changes rather than by their position, which
+        # does, so removing an item never renumbers the index. Serial numbers only ever increase, so
+        # the position of one is found by a binary search
+        self._serials: array.array = array.array("q")
+        self._next_serial: int = 0
+        self._positions: typing.Dict[int, int] = {}
+        self._colliding: typing.Dict[str, int] = {}
+        self.problems: typing.Dict[int, str] = {}
+        """What is wrong with each invalid item, mapped to the position of the item"""
+
+        self.extend(items)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Roughly how much memory the items take up, not counting the index used to find duplicates
+        """
+        offset_arrays: typing.Tuple[array.array, ...] = (self._starts, self._stops, self._serials)
+        return len(self._data) + sum(offsets.itemsize * len(offsets) for offsets in offset_arrays)
+
+    @property
+    def problem(self) -> typing.Optional[str]:
+        """
+        A description of every invalid item, `None` if all of them are valid
+        """
+        if not self.problems:
+            return None
+
+        first_problem: str = self.problems[min(self.problems)]
+
+        if len(self.problems) == 1:
+            return first_problem
+
+        return f"{len(self.problems)} invalid items, starting with {first_problem}"
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("item index out of range")
+
+        return self._data[self._starts[index]:self._stops[index]].decode(ITEM_ENCODING, ITEM_ENCODING_ERRORS)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        data: bytes = bytes(self._data)
+
+        for start, stop in zip(self._starts, self._stops):
+            yield data[start:stop].decode(ITEM_ENCODING, ITEM_ENCODING_ERRORS)
+
+    def __contains__(self, item: object) -> bool:
+        return isinstance(item, str) and self.find(item) is not None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ItemStore, list, tuple)):
+            return len(self) == len(other) and all(left == right for left, right in zip(self, other))
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} items)"
+
+    def find(self, item: str) -> typing.Optional[int]:
+        """
+        Find where an item is in constant time
+
+        Args:
+            item: The item to find
+
+        Returns:
+            The position of the item, `None` if it hasn't been added
+        """
+        position: typing.Optional[int] = self.locate(self._positions.get(hash(item)))
+
+        if position is not None and self[position] == item:
+            return position
+
+        return self.locate(self._colliding.get(item))
+
+    def locate(self, serial: typing.Optional[int]) -> typing.Optional[int]:
+        """
+        Find the position of the item with a serial number
+
+        Args:
+            serial: The serial number given to the item when it was added
+
+        Returns:
+            The position of the item, `None` if there is no serial number or the item was removed
+        """
+        if serial is None:
+            return None
+
+        position: int = bisect.bisect_left(self._serials, serial)
+
+        if position < len(self._serials) and self._serials[position] == serial:
+            return position
+
+        return None
+
+    def add(self, item: str, problem: typing.Optional[str] = None) -> bool:
+        """
+        Add an item unless it was already added
+
+        Args:
+            item: The item to add
+            problem: What is wrong with the item, if anything
+
+        Returns:
+            True if the item was added, False if it was a duplicate
+        """
+        if self.find(item) is not None:
+            return False
+
+        index: int = len(self)
+        self.index_item(item, self._next_serial)
+        self._serials.append(self._next_serial)
+        self._next_serial += 1
+        self._starts.append(len(self._data))
+        self._data += item.encode(ITEM_ENCODING, ITEM_ENCODING_ERRORS)
+        self._stops.append(len(self._data))
+
+        if problem is not None:
+            self.problems[index] = problem
+
+        return True
+
+    def extend(self, items: typing.Iterable[typing.Union[str, CheckedItem]]) -> int:
+        """
+        Add items, skipping those that were already added
+
+        Args:
+            items: The items to add, or the items paired with what is wrong with them
+
+        Returns:
+            The number of items that were added
+        """
+        added: int = 0
+
+        for item in items:
+            if isinstance(item, tuple):
+                added += self.add(*item)
+            else:
+                added += self.add(item)
+
+        return added
+
+    def index_item(self, item: str, serial: int) -> None:
+        """
+        Remember an item's serial number so that duplicates of it are found
+        """
+        key: int = hash(item)
+
+        if self.locate(self._positions.get(key)) is not None:
+            self._colliding[item] = serial
+        else:
+            self._positions[key] = serial
+
+    def delete(self, index: int) -> str:
+        """
+        Remove the item at a position, moving every later item up
+
+        The item's bytes are left in the buffer until enough of it belongs to removed items
+
+        Args:
+            index: The position of the item
+
+        Returns:
+            The item that was removed
+        """
+        item: str = self[index]
+        serial: int = self._serials[index]
+        self._removed_bytes += self._stops[index] - self._starts[index]
+
+        del self._starts[index]
+        del self._stops[index]
+        del self._serials[index]
+
+        key: int = hash(item)
+
+        if self._positions.get(key) == serial:
+            del self._positions[key]
+        elif self._colliding.get(item) == serial:
+            del self._colliding[item]
+
+        if self.problems:
+            self.problems = {
+                position if position < index else position - 1: problem
+                for position, problem in self.problems.items()
+                if position != index
+            }
+
+        if self._removed_bytes > len(self._data) * COMPACTION_RATIO:
+            self.compact()
+
+        return item
+
+    def compact(self) -> None:
+        """
+        Drop the bytes of removed items from the buffer
+        """
+        data: memoryview = memoryview(self._data)
+        compacted: bytearray = bytearray().join(data[start:stop] for start, stop in zip(self._starts, self._stops))
+        data.release()
+
+        lengths: typing.Iterator[int] = map(operator.sub, self._stops, self._starts)
+        stops: array.array = array.array("q", itertools.accumulate(lengths))
+
+        self._starts = array.array("q", [0]) + stops[:-1] if stops else array.array("q")
+        self._stops = stops
+        self._data = compacted
+        self._removed_bytes = 0
+
+    def clear(self) -> None:
+        """
+        Remove every item
+        """
+        self._data.clear()
+        self._starts = array.array("q")
+        self._stops = array.array("q")
+        self._serials = array.array("q")
+        self._removed_bytes = 0
+        self._positions.clear()
+        self._colliding.clear()
+        self.problems.clear()
+
+
+def split_items(text: str, delimiter: typing.Optional[str] = None) -> typing.List[str]:
+    """
+    Split pasted text into items, one per line
+
+    Args:
+        text: The text to split
+        delimiter: What else separates items within a line, if anything
+
+    Returns:
+        Every item with surrounding whitespace removed, leaving out the empty ones
+    """
+    pieces: typing.Iterable[str] = text.splitlines()
+
+    if delimiter:
+        pieces = (piece for line in pieces for piece in line.split(delimiter))
+
+    return [piece.strip() for piece in pieces if piece.strip()]
+
+
+def read_items(
+    path: typing.Union[str, os.PathLike],
+    delimiter: typing.Optional[str] = None
+) -> typing.Iterator[str]:
+    """
+    Read the items within a file a line at a time, without reading the whole file into memory
+
+    Args:
+        path: The file to read
+        delimiter: What else separates items within a line, if anything
+
+    Returns:
+        Every item with surrounding whitespace removed, leaving out the empty ones
+
+    Raises:
+        OSError: If the file can't be read
+    """
+    with ArgumentFile(path) as argument_file:
+        for line in argument_file:
+            yield from split_items(line, delimiter)
+
+
+def check_items(
+    items: typing.Iterable[str],
+    conversion: typing.Optional[typing.Callable[[str], typing.Any]] = None
+) -> typing.List[CheckedItem]:
+    """
+    Check items against a field's type, skipping repeats within the batch
+
+    Args:
+        items: The items to check
+        conversion: The field's type. Every item is valid if `None`
+
+    Returns:
+        Each distinct item along with the message argparse would give for it, if it can't be converted
+    """
+    seen: typing.Set[str] = set()
+    checked: typing.List[CheckedItem] = []
+
+    for item in items:
+        if item in seen:
+            continue
+
+        seen.add(item)
+        checked.append((item, None if conversion is None else check_conversion(conversion, item)))
+
+    return checked
+
+
+def batch_items(items: typing.Iterable[str], size: int = IMPORT_BATCH_SIZE) -> typing.Iterator[typing.List[str]]:
+    """
+    Group items into batches
+
+    Args:
+        items: The items to group
+        size: The largest number of items in a batch
+
+    Returns:
+        Lists of up to `size` items, in order
+    """
+    batch: typing.List[str] = []
+
+    for item in items:
+        batch.append(item)
+
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
@@ -0,0 +1,189 @@
+"""
+Lists directories in chunks and remembers the listings until the directories change
+
+Directories on network filesystems may hold hundreds of thousands of entries. `scan_directory` reads
+them with `os.scandir`, which usually knows whether an entry is a directory without another call,
+and hands them over in chunks so that the first entries may be shown while the rest are still being
+read. Checking whether a scan was cancelled between entries lets a scan stop as soon as nobody is
+waiting for it. Finished listings are kept in a `DirectoryListingCache` alongside the modification
+time of the directory, so a directory is only read again once something has been added or removed.
+"""
+from __future__ import annotations
+
+import os
+import typing
+import threading
+import collections
+
+LISTING_CHUNK_SIZE: typing.Final[int] = 500
+"""The number of entries handed over at a time while a directory is being scanned"""
+
+MAXIMUM_CACHED_ENTRIES: typing.Final[int] = 250_000
+"""The number of entries, across every cached listing, to remember before the oldest listings are forgotten"""
+
+
+class DirectoryEntry(typing.NamedTuple):
+    """
+    Something found within a directory
+    """
+    name: str
+    """The name of the file or directory"""
+
+    is_directory: bool
+    """Whether the entry may be opened as a directory"""
+
+
+def get_modification_time(path: typing.Union[str, os.PathLike]) -> typing.Optional[int]:
+    """
+    Get when a directory was last changed
+
+    Args:
+        path: The directory to check
+
+    Returns:
+        The modification time in nanoseconds, `None` if the directory can't be read
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def scan_directory(
+    path: typing.Union[str, os.PathLike],
+    chunk_size: int = LISTING_CHUNK_SIZE,
+    is_cancelled: typing.Callable[[], bool] = lambda: False
+) -> typing.Iterator[typing.List[DirectoryEntry]]:
+    """
+    Read the entries of a directory a chunk at a time
+
+    Args:
+        path: The directory to read
+        chunk_size: The largest number of entries to hand over at once
+        is_cancelled: Checked before each entry is read - the scan stops once it returns True
+
+    Returns:
+        The entries of the directory in the order that the filesystem gives them
+    """
+    chunk: typing.List[DirectoryEntry] = []
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if is_cancelled():
+                return
+
+            try:
+                is_directory: bool = entry.is_dir()
+            except OSError:
+                is_directory = False
+
+            chunk.append(DirectoryEntry(entry.name, is_directory))
+
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
+
+
+class DirectoryListingCache:
+    """
+    Remembers the entries of recently listed directories, forgetting a listing once its directory changes
+
+    Safe to use from scanning threads and the event loop at the same time
+    """
+    def __init__(self, maximum_entries: int = MAXIMUM_CACHED_ENTRIES):
+        """
+        Args:
+            maximum_entries: The number of entries, across every listing, to remember
+        """
+        self.maximum_entries: int = maximum_entries
+        self._listings: typing.OrderedDict[str, typing.Tuple[int, typing.Tuple[DirectoryEntry, ...]]] = (
+            collections.OrderedDict()
+        )
+        self._entry_count: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, path: typing.Union[str, os.PathLike]) -> typing.Optional[typing.Tuple[DirectoryEntry, ...]]:
+        """
+        Get the remembered entries of a directory if it hasn't changed since it was listed
+
+        Args:
+            path: The directory to look up
+
+        Returns:
+            The entries of the directory, `None` if it has to be listed again
+        """
+        key: str = os.fspath(path)
+        modification_time: typing.Optional[int] = get_modification_time(key)
+
+        with self._lock:
+            listing = self._listings.get(key)
+
+            if listing is None:
+                return None
+
+            if listing[0] != modification_time:
+                self._forget(key)
+                return None
+
+            self._listings.move_to_end(key)
+            return listing[1]
+
+    def put(
+        self,
+        path: typing.Union[str, os.PathLike],
+        modification_time: typing.Optional[int],
+        entries: typing.Sequence[DirectoryEntry]
+    ) -> None:
+        """
+        Remember the entries of a directory
+
+        Args:
+            path: The directory that was listed
+            modification_time: When the directory was last changed, read before it was listed
+            entries: Everything found in the directory
+        """
+        if modification_time is None or len(entries) > self.maximum_entries:
+            return
+
+        key: str = os.fspath(path)
+
+        with self._lock:
+            self._forget(key)
+            self._listings[key] = (modification_time, tuple(entries))
+            self._entry_count += len(entries)
+
+            while self._entry_count > self.maximum_entries:
+                self._forget(next(iter(self._listings)))
+
+    def _forget(self, key: str) -> None:
+        """
+        Drop a listing. The lock must already be held
+
+        Args:
+            key: The directory whose listing should be dropped
+        """
+        listing = self._listings.pop(key, None)
+
+        if listing is not None:
+            self._entry_count -= len(listing[1])
+
+    def clear(self) -> None:
+        """
+        Forget every listing
+        """
+        with self._lock:
+            self._listings.clear()
+            self._entry_count = 0
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def __contains__(self, path: object) -> bool:
+        return isinstance(path, (str, os.PathLike)) and os.fspath(path) in self._listings
+
+
+DIRECTORY_LISTINGS: DirectoryListingCache = DirectoryListingCache()
+"""The listings shared by every path picker in the process"""
@@ -0,0 +1,142 @@
+"""
+Finds the option strings that an optional argument may abbreviate without scanning every one of them
+
+`argparse` keeps a parser's option strings in a dictionary and, for every argument that isn't
+exactly one of them, loops over all of them looking for the ones it starts. Parsers generated from
+schemas may have thousands of flags, so parsing a long command line against one of them becomes
+quadratic. An `OptionIndex` takes the place of that dictionary. It keeps the option strings sorted
+as well, so the ones starting with a prefix are found by bisecting, and while an argument is being
+resolved it only hands the loop the option strings that could possibly match it. `argparse` still
+decides which of them match, so abbreviations, ambiguity and the errors reported stay exactly as
+they are in every version of Python.
+"""
+from __future__ import annotations
+
+import bisect
+import typing
+import argparse
+import threading
+import contextlib
+
+OptionCheck = typing.Callable[[str, argparse.Action], None]
+"""Called with each option string as it is added, along with its action, to reject those that can't be used"""
+
+
+class OptionIndex(dict):
+    """
+    A parser's option strings mapped to their actions, which may also be searched by prefix
+
+    Iterating over the index while it is narrowed only gives the candidates it was narrowed to. The
+    narrowing is kept per thread, so arguments may be parsed on several threads at once
+    """
+    def __init__(
+        self,
+        option_string_actions: typing.Mapping[str, argparse.Action] = None,
+        check_option: typing.Optional[OptionCheck] = None
+    ):
+        """
+        Args:
+            option_string_actions: The option strings the parser already has
+            check_option: Rejects option strings as they are added by raising, if given
+        """
+        super().__init__(option_string_actions or {})
+        self.check_option: typing.Optional[OptionCheck] = check_option
+        self._positions: typing.Dict[str, int] = {
+            option_string: position
+            for position, option_string in enumerate(super().__iter__())
+        }
+        self._next_position: int = len(self._positions)
+        self._sorted: typing.Optional[typing.List[str]] = None
+        self._narrowing = threading.local()
+
+    def __setitem__(self, option_string: str, action: argparse.Action) -> None:
+        if self.check_option is not None:
+            self.check_option(option_string, action)
+
+        if option_string not in self._positions:
+            self._positions[option_string] = self._next_position
+            self._next_position += 1
+            self._sorted = None
+
+        super().__setitem__(option_string, action)
+
+    def __delitem__(self, option_string: str) -> None:
+        super().__delitem__(option_string)
+        del self._positions[option_string]
+        self._sorted = None
+
+    def pop(self, option_string: str, *default):
+        if option_string in self._positions:
+            del self._positions[option_string]
+            self._sorted = None
+
+        return super().pop(option_string, *default)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        candidates: typing.Optional[typing.List[str]] = getattr(self._narrowing, "candidates", None)
+
+        if candidates is None:
+            return super().__iter__()
+
+        return iter(candidates)
+
+    def starting_with(self, prefix: str) -> typing.List[str]:
+        """
+        Find every option string that starts with a prefix
+
+        Args:
+            prefix: What the option strings must start with
+
+        Returns:
+            The matching option strings in the order they were added, just as the parser would have visited them
+        """
+        if self._sorted is None:
+            self._sorted = sorted(self._positions)
+
+        matches: typing.List[str] = []
+
+        for option_string in self._sorted[bisect.bisect_left(self._sorted, prefix):]:
+            if not option_string.startswith(prefix):
+                break
+
+            matches.append(option_string)
+
+        return sorted(matches, key=self._positions.__getitem__)
+
+    def find_candidates(self, argument: str) -> typing.List[str]:
+        """
+        Find every option string that an argument could be, or be an abbreviation of
+
+        This is every option string starting with the part of the argument before any '=', along with
+        the first two characters of the argument, which may be a short flag with its value attached
+
+        Args:
+            argument: An argument that starts with a prefix character
+
+        Returns:
+            The candidates in the order they were added
+        """
+        candidates: typing.List[str] = self.starting_with(argument.partition("=")[0])
+        short_option_string: str = argument[:2]
+
+        if short_option_string in self._positions and short_option_string not in candidates:
+            candidates.append(short_option_string)
+            candidates.sort(key=self._positions.__getitem__)
+
+        return candidates
+
+    @contextlib.contextmanager
+    def narrowed(self, argument: str) -> typing.Iterator[None]:
+        """
+        Only give the candidates for an argument when the index is iterated over on this thread
+
+        Args:
+            argument: The argument being resolved
+        """
+        previous: typing.Optional[typing.List[str]] = getattr(self._narrowing, "candidates", None)
+        self._narrowing.candidates = self.find_candidates(argument)
+
+        try:
+            yield
+        finally:
+            self._narrowing.candidates = previous
@@ -0,0 +1,365 @@
+"""
+Loads the choices for an argument only once they are needed
+
+Choices may come from scanning a directory, reading a large manifest, or querying a catalog. Passing a
+`ChoiceProvider` as an argument's `choices` defers that work until a field for the argument is first
+shown, or until a parsed value has to be checked against the choices. A provider wraps a function
+returning an iterable, a function returning an awaitable of one, or an async generator function.
+
+Choices are streamed in batches that start small so that the first of them appear right away and
+grow so that a long list isn't handed over a handful at a time. Synchronous sources are iterated on
+a worker thread. Finished lists are kept in a `ProvidedChoiceCache` until they are older than their
+provider's time to live.
+
+Nothing here imports `asyncio` or `inspect` until choices are loaded, so providers may be declared in
+modules that are imported by non-interactive launches.
+"""
+from __future__ import annotations
+
+import math
+import time
+import typing
+import threading
+
+if typing.TYPE_CHECKING:
+    from argui.utilities.search import Option
+
+DEFAULT_CHOICE_TTL: typing.Final[typing.Optional[float]] = 300.0
+"""The number of seconds that loaded choices are kept before they are loaded again"""
+
+FIRST_CHOICE_BATCH_SIZE: typing.Final[int] = 100
+"""The number of choices handed over in the first batch"""
+
+MAXIMUM_CHOICE_BATCH_SIZE: typing.Final[int] = 10_000
+"""The largest number of choices handed over in a single batch. Each batch is twice the size of the last until then"""
+
+CHOICE_BATCH_INTERVAL: typing.Final[float] = 0.05
+"""The number of seconds to wait for a batch to fill before handing over whatever has been loaded"""
+
+ChoiceSource = typing.Callable[
+    [],
+    typing.Union[
+        typing.Iterable[typing.Any],
+        typing.Awaitable[typing.Iterable[typing.Any]],
+        typing.AsyncIterable[typing.Any]
+    ]
+]
+"""A function producing choices, or an async generator function"""
+
+
+def normalize_option(choice: typing.Any) -> Option:
+    """
+    Convert a loaded choice into an option the way choices given up front are converted
+
+    Args:
+        choice: A value, or the text for a value paired with the value
+
+    Returns:
+        The choice if it may be shown as it is, otherwise its text
+    """
+    return choice if isinstance(choice, (str, int, tuple)) else str(choice)
+
+
+def get_option_value(option: Option) -> typing.Any:
+    """
+    Get the value that choosing an option enters
+    """
+    return option[1] if isinstance(option, tuple) else option
+
+
+def take_batch(
+    choices: typing.Iterator[typing.Any],
+    size: int,
+    interval: float = CHOICE_BATCH_INTERVAL
+) -> typing.Tuple[typing.List[Option], bool]:
+    """
+    Read the next batch of choices from a synchronous source
+
+    Args:
+        choices: The remaining choices
+        size: The largest number of choices to read
+        interval: The number of seconds to read for before handing over a partial batch
+
+    Returns:
+        The batch and whether the source ran out
+    """
+    deadline: float = time.monotonic() + interval
+    batch: typing.List[Option] = []
+
+    for choice in choices:
+        batch.append(normalize_option(choice))
+
+        if len(batch) >= size or time.monotonic() > deadline:
+            return batch, False
+
+    return batch, True
+
+
+class ChoiceProvider:
+    """
+    Choices for an argument that are loaded the first time they are needed
+
+    May be passed as `choices` to `add_argument`. Checking whether a parsed value is one of the choices
+    loads them if they aren't cached, as does listing them. Give the argument a `metavar` so that
+    formatting its usage doesn't list them
+    """
+    __slots__ = ("source", "ttl", "first_batch_size")
+
+    def __init__(
+        self,
+        source: ChoiceSource,
+        ttl: typing.Optional[float] = DEFAULT_CHOICE_TTL,
+        first_batch_size: int = FIRST_CHOICE_BATCH_SIZE
+    ):
+        """
+        Args:
+            source: A function returning the choices or an awaitable of them, or an async generator function
+            ttl: The number of seconds to keep loaded choices. `None` keeps them for the life of the process
+            first_batch_size: The number of choices to hand over in the first batch
+        """
+        self.source: ChoiceSource = source
+        self.ttl: typing.Optional[float] = ttl
+        self.first_batch_size: int = first_batch_size
+
+    def get_cached(self) -> typing.Optional[typing.Tuple[Option, ...]]:
+        """
+        Get the choices if they were loaded recently enough
+        """
+        return PROVIDED_CHOICES.get(self)
+
+    async def stream(self) -> typing.AsyncIterator[typing.List[Option]]:
+        """
+        Load the choices a batch at a time, caching them once every batch has been loaded
+
+        Returns:
+            Batches of options, each up to twice the size of the last
+        """
+        import asyncio
+        import inspect
+
+        if inspect.iscoroutinefunction(self.source) or inspect.isasyncgenfunction(self.source):
+            produced: typing.Any = self.source()
+        else:
+            # Merely producing the iterable may be the expensive part, such as reading a whole manifest
+            produced = await asyncio.to_thread(self.source)
+
+        if inspect.isawaitable(produced):
+            produced = await produced
+
+        options: typing.List[Option] = []
+        size: int = self.first_batch_size
+
+        if hasattr(produced, "__aiter__"):
+            batch: typing.List[Option] = []
+            deadline: float = time.monotonic() + CHOICE_BATCH_INTERVAL
+
+            async for choice in produced:
+                batch.append(normalize_option(choice))
+
+                if len(batch) >= size or time.monotonic() > deadline:
+                    options.extend(batch)
+                    yield batch
+                    batch = []
+                    size = min(size * 2, MAXIMUM_CHOICE_BATCH_SIZE)
+                    deadline = time.monotonic() + CHOICE_BATCH_INTERVAL
+
+            if batch:
+                options.extend(batch)
+                yield batch
+        else:
+            choices: typing.Iterator[typing.Any] = iter(produced)
+            exhausted: bool = False
+
+            while not exhausted:
+                batch, exhausted = await asyncio.to_thread(take_batch, choices, size)
+
+                if batch:
+                    options.extend(batch)
+                    yield batch
+
+                size = min(size * 2, MAXIMUM_CHOICE_BATCH_SIZE)
+
+        PROVIDED_CHOICES.put(self, options)
+
+    def load(self) -> typing.Tuple[Option, ...]:
+        """
+        Get every choice, loading them and waiting for them if they aren't cached
+
+        Returns:
+            Every option
+        """
+        cached: typing.Optional[typing.Tuple[Option, ...]] = self.get_cached()
+
+        if cached is not None:
+            return cached
+
+        import asyncio
+
+        async def collect() -> typing.Tuple[Option, ...]:
+            return tuple(option for batch in [batch async for batch in self.stream()] for option in batch)
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(collect())
+
+        # The calling thread is already running an event loop, so the choices are loaded on another
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, collect()).result()
+
+    def to_data(self) -> typing.Dict[str, typing.Any]:
+        """
+        Describe the provider in a form that may be stored as JSON
+
+        Raises:
+            ValueError: If the source can't be imported by name
+        """
+        from argui.utilities.fingerprint import get_qualified_name
+
+        source_name: typing.Optional[str] = get_qualified_name(self.source)
+
+        if source_name is None:
+            raise ValueError(f"'{self.source}' cannot be imported by name and may not be serialized")
+
+        return {"source": source_name, "ttl": self.ttl, "first_batch_size": self.first_batch_size}
+
+    @classmethod
+    def from_data(cls, data: typing.Mapping[str, typing.Any]) -> ChoiceProvider:
+        """
+        Recreate a provider from the output of `to_data`
+        """
+        from argui.utilities.common import resolve_name
+
+        return cls(
+            resolve_name(data["source"]),
+            ttl=data.get("ttl", DEFAULT_CHOICE_TTL),
+            first_batch_size=data.get("first_batch_size", FIRST_CHOICE_BATCH_SIZE)
+        )
+
+    def __contains__(self, value: object) -> bool:
+        return value in PROVIDED_CHOICES.get_values(self, self.load)
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return (get_option_value(option) for option in self.load())
+
+    def __bool__(self) -> bool:
+        # argparse and ArgUI test `choices` for truth - that alone shouldn't load them
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ChoiceProvider)
+            and (self.source, self.ttl, self.first_batch_size) == (other.source, other.ttl, other.first_batch_size)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.source, self.ttl))
+
+    def __repr__(self) -> str:
+        # Kept free of memory addresses so that parsers with providers may still be fingerprinted
+        source_name: str = getattr(self.source, "__module__", "") + "." + getattr(self.source, "__qualname__", "")
+        return f"{self.__class__.__name__}({source_name}, ttl={self.ttl})"
+
+
+class ProvidedChoiceCache:
+    """
+    Keeps loaded choices until they are older than the time to live of the provider that loaded them
+
+    Entries are shared by every provider with the same source. Safe to use from loading threads and
+    the event loop at the same time
+    """
+    def __init__(self):
+        self._entries: typing.Dict[
+            typing.Hashable,
+            typing.Tuple[float, typing.Tuple[Option, ...], typing.Optional[typing.FrozenSet[typing.Any]]]
+        ] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, provider: ChoiceProvider) -> typing.Optional[typing.Tuple[Option, ...]]:
+        """
+        Get the choices last loaded for a provider's source if they haven't expired
+
+        Args:
+            provider: The provider whose choices are needed
+
+        Returns:
+            The options, `None` if they have to be loaded
+        """
+        with self._lock:
+            entry = self._entries.get(provider.source)
+
+            if entry is None:
+                return None
+
+            if entry[0] < time.monotonic():
+                del self._entries[provider.source]
+                return None
+
+            return entry[1]
+
+    def get_values(
+        self,
+        provider: ChoiceProvider,
+        load: typing.Callable[[], typing.Tuple[Option, ...]]
+    ) -> typing.FrozenSet[typing.Any]:
+        """
+        Get the values of a provider's choices, indexed for checking whether they contain a value
+
+        Args:
+            provider: The provider whose choices are needed
+            load: Loads the choices if they aren't cached
+
+        Returns:
+            Every value that may be chosen
+        """
+        options: typing.Tuple[Option, ...] = load()
+
+        with self._lock:
+            entry = self._entries.get(provider.source)
+
+            if entry is None or entry[1] is not options:
+                return frozenset(get_option_value(option) for option in options)
+
+            if entry[2] is None:
+                entry = (entry[0], entry[1], frozenset(get_option_value(option) for option in options))
+                self._entries[provider.source] = entry
+
+            return typing.cast(typing.FrozenSet[typing.Any], entry[2])
+
+    def put(self, provider: ChoiceProvider, options: typing.Iterable[Option]) -> typing.Tuple[Option, ...]:
+        """
+        Remember freshly loaded choices
+
+        Args:
+            provider: The provider that loaded the choices
+            options: Every choice that was loaded
+
+        Returns:
+            The choices as they are kept
+        """
+        expires_at: float = math.inf if provider.ttl is None else time.monotonic() + provider.ttl
+        kept: typing.Tuple[Option, ...] = tuple(options)
+
+        with self._lock:
+            self._entries[provider.source] = (expires_at, kept, None)
+
+        return kept
+
+    def clear(self) -> None:
+        """
+        Forget every loaded set of choices
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, provider: object) -> bool:
+        return isinstance(provider, ChoiceProvider) and self.get(provider) is not None
+
+
+PROVIDED_CHOICES: ProvidedChoiceCache = ProvidedChoiceCache()
+"""The choices loaded by every provider in the process"""
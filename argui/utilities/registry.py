@@ -0,0 +1,187 @@
+"""
+Defines a registry that decides what widget to use for a type by walking that type's method resolution order
+
+Registries are keyed by class. Looking up a class walks its MRO once to find the closest registered
+ancestor and remembers the answer, so repeated lookups for the same class are a single dictionary
+access. Projects may add their own entries with `register`/`register_factory` or by publishing
+entry points that receive the registry.
+"""
+from __future__ import annotations
+
+import typing
+import inspect
+import threading
+import importlib.metadata
+
+ENTRY_POINT_GROUP: typing.Final[str] = "argui.widgets"
+"""
+The entry point group that packages may use to add widgets. Each entry point should load a function
+that accepts the registry and registers whatever it needs to
+"""
+
+WidgetBuilder = typing.Callable[..., typing.Any]
+"""
+A widget class or a function that creates a widget. Builders used for field values are called with
+`value`, `placeholder`, and `id` keyword arguments along with any of the field's widget parameters.
+Builders registered for a `ChoiceProvider` also receive the provider first and a `multiple` keyword.
+Builders registered for an `ItemStore` also receive a `conversion` keyword to check each item with
+"""
+
+WidgetFactory = typing.Callable[[type], WidgetBuilder]
+"""A function that creates a builder specific to the class being looked up, such as one `Enum` or another"""
+
+_T = typing.TypeVar("_T")
+
+
+class WidgetRegistry:
+    """
+    Maps classes to the widgets that should represent them, resolving subclasses through their MRO
+    """
+    def __init__(self, entry_point_group: typing.Optional[str] = None):
+        """
+        Args:
+            entry_point_group: The entry point group to load extra registrations from on first lookup
+        """
+        self.entry_point_group: typing.Optional[str] = entry_point_group
+        self._factories: typing.Dict[type, WidgetFactory] = {}
+        self._resolved: typing.Dict[type, typing.Optional[WidgetBuilder]] = {}
+        self._entry_points_loaded: bool = entry_point_group is None
+        self._lock = threading.RLock()
+
+    def register(
+        self,
+        registered_type: type,
+        builder: typing.Optional[WidgetBuilder] = None
+    ) -> typing.Union[WidgetBuilder, typing.Callable[[WidgetBuilder], WidgetBuilder]]:
+        """
+        Use a widget for a class and all of its subclasses. May be used as a decorator if no builder is given
+
+        Args:
+            registered_type: The class that the widget represents
+            builder: The widget class or function that creates the widget
+
+        Returns:
+            The builder, or a decorator that will register the builder
+        """
+        if builder is None:
+            def decorator(decorated_builder: WidgetBuilder) -> WidgetBuilder:
+                self.register(registered_type, decorated_builder)
+                return decorated_builder
+            return decorator
+
+        self.register_factory(registered_type, lambda _: builder)
+        return builder
+
+    def register_factory(
+        self,
+        registered_type: type,
+        factory: typing.Optional[WidgetFactory] = None
+    ) -> typing.Union[WidgetFactory, typing.Callable[[WidgetFactory], WidgetFactory]]:
+        """
+        Use a function to create a builder for a class and each of its subclasses.
+        May be used as a decorator if no factory is given
+
+        Args:
+            registered_type: The base class that the factory handles
+            factory: A function that receives the class that was looked up and returns a builder for it
+
+        Returns:
+            The factory, or a decorator that will register the factory
+        """
+        if factory is None:
+            def decorator(decorated_factory: WidgetFactory) -> WidgetFactory:
+                self.register_factory(registered_type, decorated_factory)
+                return decorated_factory
+            return decorator
+
+        if not isinstance(registered_type, type):
+            raise TypeError(f"Widgets may only be registered for classes - received {registered_type}")
+
+        with self._lock:
+            self._factories[registered_type] = factory
+            self._resolved.clear()
+
+        return factory
+
+    def unregister(self, registered_type: type) -> None:
+        """
+        Stop using a specific widget for a class. Its subclasses will fall back to the next registered ancestor
+
+        Args:
+            registered_type: The class to unregister
+        """
+        with self._lock:
+            self._factories.pop(registered_type, None)
+            self._resolved.clear()
+
+    def load_entry_points(self) -> None:
+        """
+        Let installed packages register their widgets. Only happens once
+        """
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+
+            self._entry_points_loaded = True
+
+            for entry_point in importlib.metadata.entry_points(group=self.entry_point_group):
+                register_widgets: typing.Callable[[WidgetRegistry], None] = entry_point.load()
+                register_widgets(self)
+
+    def get(self, looked_up_type: type, default: _T = None) -> typing.Union[WidgetBuilder, _T]:
+        """
+        Find the builder for a class
+
+        Args:
+            looked_up_type: The class to find a widget for
+            default: What to return if neither the class nor any of its ancestors have been registered
+
+        Returns:
+            The builder registered for the closest ancestor of the class
+        """
+        builder: typing.Optional[WidgetBuilder] = self._resolved.get(looked_up_type, None)
+
+        if builder is None and looked_up_type not in self._resolved:
+            builder = self._resolve(looked_up_type)
+
+        return default if builder is None else builder
+
+    def resolve(self, looked_up_type: type) -> WidgetBuilder:
+        """
+        Find the builder for a class
+
+        Args:
+            looked_up_type: The class to find a widget for
+
+        Returns:
+            The builder registered for the closest ancestor of the class
+        """
+        builder: typing.Optional[WidgetBuilder] = self.get(looked_up_type)
+
+        if builder is None:
+            raise LookupError(f"There are no widgets registered for {looked_up_type} or any of its ancestors")
+
+        return builder
+
+    def _resolve(self, looked_up_type: type) -> typing.Optional[WidgetBuilder]:
+        """
+        Walk the MRO of a class for the first registered ancestor and remember the result
+        """
+        if not isinstance(looked_up_type, type):
+            raise TypeError(f"Widgets may only be found for classes - received {looked_up_type}")
+
+        self.load_entry_points()
+
+        with self._lock:
+            builder: typing.Optional[WidgetBuilder] = None
+
+            for ancestor in inspect.getmro(looked_up_type):
+                if ancestor in self._factories:
+                    builder = self._factories[ancestor](looked_up_type)
+                    break
+
+            self._resolved[looked_up_type] = builder
+            return builder
+
+    def __contains__(self, registered_type: object) -> bool:
+        return registered_type in self._factories
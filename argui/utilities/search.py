@@ -0,0 +1,545 @@
+"""
+Searches large sets of options quickly enough to filter them on every keystroke
+
+A `SearchIndex` is built once per set of options. It keeps every label casefolded and joined into a
+single newline separated corpus along with where each label starts, plus the labels in sorted order:
+
+    * labels that start with the query are found by bisecting the sorted labels
+    * labels that contain the query are found by `str.find` over the corpus, which runs in C, and
+      whether a match starts a word is read from the character before it
+    * labels that only contain the query's characters in order are found with a single regular
+      expression over the corpus, a window at a time, so a search may stop once its time is up
+
+Matches are ranked in that order. A search that runs out of time may be resumed where it stopped, so
+a caller may show what was found and carry on after the next frame. A `SearchSession` remembers every
+match of the last complete search, so a query that extends the last one, as happens with each typed
+character, only has to rank the labels that matched before rather than search everything again.
+"""
+from __future__ import annotations
+
+import re
+import time
+import array
+import bisect
+import typing
+import threading
+import collections
+
+SEARCH_RESULT_LIMIT: typing.Final[int] = 50
+"""The number of matches returned, and therefore shown, for a search"""
+
+SEARCHABLE_OPTION_THRESHOLD: typing.Final[int] = 100
+"""Fields with at least this many options are chosen by searching through them rather than scrolling"""
+
+SEARCH_BUDGET: typing.Final[float] = 0.008
+"""The number of seconds a search may spend looking for loose matches before settling for what it found"""
+
+MAXIMUM_SCANNED_MATCHES: typing.Final[int] = 5_000
+"""The number of places containing the query that a search looks at before it stops counting them"""
+
+MAXIMUM_NARROWED_MATCHES: typing.Final[int] = 5_000
+"""The largest number of matches that a search remembers so that the next search may narrow them"""
+
+LOOSE_SEARCH_WINDOW: typing.Final[int] = 1 << 16
+"""The number of characters searched for loose matches between checks of the time"""
+
+MAXIMUM_CACHED_INDICES: typing.Final[int] = 8
+"""The number of sets of options to keep indices for"""
+
+WORD_BOUNDARIES: typing.Final[typing.FrozenSet[str]] = frozenset("\n -_./:@,")
+"""The characters that end a word, such that the character after them starts one"""
+
+PREFIX_MATCH: typing.Final[int] = 0
+"""The rank of labels that start with the query"""
+
+WORD_MATCH: typing.Final[int] = 1
+"""The rank of labels that contain a word starting with the query"""
+
+SUBSTRING_MATCH: typing.Final[int] = 2
+"""The rank of labels that contain the query anywhere else"""
+
+LOOSE_MATCH: typing.Final[int] = 3
+"""The rank of labels that only contain the characters of the query in order"""
+
+OptionValue = typing.Union[str, int]
+"""A value that may be chosen for a field"""
+
+Option = typing.Union[OptionValue, typing.Tuple[str, OptionValue]]
+"""A value that may be chosen, or the text shown for a value paired with that value"""
+
+
+def fold_text(text: str) -> str:
+    """
+    Prepare text to be searched or searched for, ignoring case and keeping it on one line
+
+    Args:
+        text: A label or query
+
+    Returns:
+        The casefolded text with every line break replaced by a space
+    """
+    return text.casefold().replace("\n", " ")
+
+
+def is_loose_match(label: str, query: str) -> bool:
+    """
+    Determine if every character of a query appears in a label in the same order
+
+    Args:
+        label: The folded label
+        query: The folded query
+
+    Returns:
+        True if the query is a subsequence of the label
+    """
+    characters: typing.Iterator[str] = iter(label)
+    return all(character in characters for character in query)
+
+
+def build_loose_pattern(query: str) -> typing.Pattern[str]:
+    """
+    Build an expression matching the line break before every line containing the characters of a query in order
+
+    Args:
+        query: The folded query
+
+    Returns:
+        The compiled expression
+    """
+    # Excluding the next character from each gap means that the gaps can only end in one place
+    gaps: str = "".join(f"[^\\n{re.escape(character)}]*{re.escape(character)}" for character in query)
+    return re.compile(f"\\n(?={gaps})")
+
+
+def split_options(options: typing.Iterable[Option]) -> typing.Tuple[typing.List[str], typing.List[OptionValue]]:
+    """
+    Separate the text shown for options from their values
+
+    Args:
+        options: Values, or the text for a value paired with it
+
+    Returns:
+        The label of each option and the value of each option
+    """
+    labels: typing.List[str] = []
+    values: typing.List[OptionValue] = []
+
+    for option in options:
+        label, value = option if isinstance(option, tuple) else (str(option), option)
+        labels.append(label)
+        values.append(value)
+
+    return labels, values
+
+
+class SearchResult(typing.NamedTuple):
+    """
+    The best matches for a query
+    """
+    indices: typing.List[int]
+    """The positions of the best matching options, best first"""
+
+    matches: typing.List[int]
+    """The positions of every matching option found so far, best first"""
+
+    complete: bool
+    """Whether every option was considered"""
+
+    resume_at: typing.Optional[int] = None
+    """Where in the corpus the search for loose matches stopped, if it ran out of time"""
+
+
+class SearchIndex:
+    """
+    A prebuilt index over the labels of a set of options
+    """
+    __slots__ = ("labels", "values", "folded", "corpus", "starts", "ordered", "ordered_labels")
+
+    def __init__(self, labels: typing.Sequence[str], values: typing.Optional[typing.Sequence[typing.Any]] = None):
+        """
+        Args:
+            labels: The text shown for each option
+            values: The value of each option. The labels are used if there aren't any
+        """
+        self.labels: typing.List[str] = []
+        self.values: typing.List[typing.Any] = []
+        self.folded: typing.List[str] = []
+        self.corpus: str = "\n"
+        self.starts: array.array = array.array("q")
+        self.ordered: typing.List[int] = []
+        self.ordered_labels: typing.List[str] = []
+        self.extend(labels, values)
+
+    @classmethod
+    def from_options(cls, options: typing.Iterable[Option]) -> SearchIndex:
+        """
+        Index options the way they are given to a field
+
+        Args:
+            options: Values, or the text for a value paired with it
+
+        Returns:
+            An index over the text shown for each option
+        """
+        return cls(*split_options(options))
+
+    def extend(self, labels: typing.Sequence[str], values: typing.Optional[typing.Sequence[typing.Any]] = None) -> None:
+        """
+        Add more options to the index, such as the next batch of options that are still being loaded
+
+        Args:
+            labels: The text shown for each new option
+            values: The value of each new option. The labels are used if there aren't any
+        """
+        first_index: int = len(self.folded)
+        folded: typing.List[str] = [fold_text(label) for label in labels]
+        position: int = len(self.corpus)
+
+        for label in folded:
+            self.starts.append(position)
+            position += len(label) + 1
+
+        self.labels.extend(labels)
+        self.values.extend(labels if values is None else values)
+        self.folded.extend(folded)
+
+        if folded:
+            self.corpus += "\n".join(folded) + "\n"
+
+        # The existing order is a single sorted run, so sorting again only merges in the new options
+        self.ordered.extend(range(first_index, len(self.folded)))
+        self.ordered.sort(key=self.folded.__getitem__)
+        self.ordered_labels = [self.folded[index] for index in self.ordered]
+
+    def get_index(self, position: int) -> int:
+        """
+        Find the option whose label contains a position in the corpus
+
+        Args:
+            position: A position within the corpus
+
+        Returns:
+            The position of the option
+        """
+        return bisect.bisect_right(self.starts, position) - 1
+
+    def rank(self, index: int, query: str) -> typing.Optional[int]:
+        """
+        Determine how well an option matches a query
+
+        Args:
+            index: The position of the option
+            query: The folded query
+
+        Returns:
+            The rank of the match, `None` if the option doesn't match at all
+        """
+        label: str = self.folded[index]
+
+        if label.startswith(query):
+            return PREFIX_MATCH
+
+        position: int = label.find(query)
+
+        if position < 0:
+            return LOOSE_MATCH if is_loose_match(label, query) else None
+
+        while position >= 0:
+            if label[position - 1] in WORD_BOUNDARIES:
+                return WORD_MATCH
+            position = label.find(query, position + 1)
+
+        return SUBSTRING_MATCH
+
+    def get_sort_key(self, rank: int, index: int) -> typing.Tuple[int, str, int]:
+        """
+        Get what orders matches the same way a full search does: by rank, then alphabetically
+        for labels starting with the query, then by the order the options were given in
+        """
+        return rank, self.folded[index] if rank == PREFIX_MATCH else "", index
+
+    def search(
+        self,
+        query: str,
+        limit: int = SEARCH_RESULT_LIMIT,
+        candidates: typing.Optional[typing.Iterable[int]] = None,
+        deadline: typing.Optional[float] = None
+    ) -> SearchResult:
+        """
+        Find the options that best match a query
+
+        Args:
+            query: The text that was typed
+            limit: The largest number of matches to return
+            candidates: The only options that may match, such as every match of a shorter query
+            deadline: When to stop looking for loose matches, as given by `time.perf_counter`
+
+        Returns:
+            The best matches
+        """
+        query = fold_text(query)
+
+        if not query:
+            return SearchResult(list(range(min(limit, len(self.folded)))), [], False)
+
+        if candidates is not None:
+            return self.narrow(query, candidates, limit)
+
+        # Labels starting with the query sit next to each other once sorted
+        first: int = bisect.bisect_left(self.ordered_labels, query)
+        last: int = bisect.bisect_left(self.ordered_labels, query + "\U0010ffff", first)
+        prefixed: typing.List[int] = self.ordered[first:last]
+
+        if len(prefixed) >= limit:
+            return SearchResult(prefixed[:limit], prefixed, False)
+
+        excluded: typing.Set[int] = set(prefixed)
+        contained: typing.Dict[int, int] = {}
+        scanned: int = 0
+        position: int = self.corpus.find(query)
+
+        while position >= 0:
+            scanned += 1
+
+            if scanned > MAXIMUM_SCANNED_MATCHES:
+                break
+
+            index: int = self.get_index(position)
+
+            if index not in excluded:
+                rank: int = WORD_MATCH if self.corpus[position - 1] in WORD_BOUNDARIES else SUBSTRING_MATCH
+                contained[index] = min(rank, contained.get(index, rank))
+
+            position = self.corpus.find(query, position + 1)
+
+        matches: typing.List[int] = prefixed
+        matches.extend(index for index, rank in contained.items() if rank == WORD_MATCH)
+        matches.extend(index for index, rank in contained.items() if rank == SUBSTRING_MATCH)
+
+        if position >= 0 or len(matches) >= limit:
+            # Loose matches would rank below everything already found
+            return SearchResult(matches[:limit], matches, position < 0)
+
+        return self.resume(query, SearchResult([], matches, False, 0), limit, deadline)
+
+    def resume(
+        self,
+        query: str,
+        result: SearchResult,
+        limit: int = SEARCH_RESULT_LIMIT,
+        deadline: typing.Optional[float] = None
+    ) -> SearchResult:
+        """
+        Carry on looking for loose matches from wherever a search ran out of time
+
+        Args:
+            query: The folded query
+            result: What the search found before it stopped
+            limit: The largest number of matches to return
+            deadline: When to stop looking, as given by `time.perf_counter`
+
+        Returns:
+            Everything the search found along with what was found now
+        """
+        if result.resume_at is None:
+            return result
+
+        pattern: typing.Pattern[str] = build_loose_pattern(query)
+
+        # Loose matches are only looked for once fewer than `limit` closer matches were found, and
+        # each line is only looked at once, so only the first matches could be found again
+        excluded: typing.Set[int] = set(result.matches[:limit])
+        matches: typing.List[int] = list(result.matches)
+        last_line: int = len(self.corpus) - 1
+        position: int = result.resume_at
+
+        while position < last_line:
+            # Windows end on a line break so that no label is split between them
+            end: int = self.corpus.find("\n", min(position + LOOSE_SEARCH_WINDOW, last_line))
+
+            for match in pattern.finditer(self.corpus, position, end):
+                index: int = self.get_index(match.start() + 1)
+
+                if index not in excluded:
+                    matches.append(index)
+
+            position = end
+
+            # Loose matches rank in the order they're found, so the best of them are already known
+            # and a set this large couldn't be narrowed anyway
+            if len(matches) > MAXIMUM_NARROWED_MATCHES:
+                return SearchResult(matches[:limit], matches, False)
+
+            if deadline is not None and position < last_line and time.perf_counter() > deadline:
+                return SearchResult(matches[:limit], matches, False, position)
+
+        return SearchResult(matches[:limit], matches, True)
+
+    def narrow(self, query: str, candidates: typing.Iterable[int], limit: int = SEARCH_RESULT_LIMIT) -> SearchResult:
+        """
+        Rank only the given options against a query
+
+        Args:
+            query: The folded query
+            candidates: The options that may match
+            limit: The largest number of matches to return
+
+        Returns:
+            The best matches among the candidates
+        """
+        ranked: typing.List[typing.Tuple[typing.Tuple[int, str, int], int]] = []
+
+        for index in candidates:
+            rank: typing.Optional[int] = self.rank(index, query)
+
+            if rank is not None:
+                ranked.append((self.get_sort_key(rank, index), index))
+
+        ranked.sort()
+        matches: typing.List[int] = [index for _, index in ranked]
+        return SearchResult(matches[:limit], matches, True)
+
+    def __len__(self) -> int:
+        return len(self.folded)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self)} options>"
+
+
+class SearchSession:
+    """
+    Searches an index as a query is typed, narrowing the last search's matches whenever the query grows
+    """
+    __slots__ = ("index", "limit", "budget", "_query", "_result")
+
+    def __init__(self, index: SearchIndex, limit: int = SEARCH_RESULT_LIMIT, budget: float = SEARCH_BUDGET):
+        """
+        Args:
+            index: The options to search
+            limit: The largest number of matches to return
+            budget: The number of seconds each search, or each resumption of one, may spend on loose matches
+        """
+        self.index: SearchIndex = index
+        self.limit: int = limit
+        self.budget: float = budget
+        self._query: str = ""
+        self._result: typing.Optional[SearchResult] = None
+
+    @property
+    def can_resume(self) -> bool:
+        """
+        Whether the last search ran out of time before looking at every option
+        """
+        return self._result is not None and self._result.resume_at is not None
+
+    def search(self, query: str) -> SearchResult:
+        """
+        Find the options that best match the query as it now stands
+
+        Args:
+            query: The text that has been typed
+
+        Returns:
+            The best matches
+        """
+        folded_query: str = fold_text(query)
+        last_result: typing.Optional[SearchResult] = self._result
+
+        # Every label matching a longer query also matches the shorter one, however loosely
+        if (
+            last_result is not None
+            and last_result.complete
+            and len(last_result.matches) <= MAXIMUM_NARROWED_MATCHES
+            and folded_query.startswith(self._query)
+        ):
+            result: SearchResult = self.index.narrow(folded_query, last_result.matches, self.limit)
+        else:
+            result = self.index.search(folded_query, self.limit, deadline=time.perf_counter() + self.budget)
+
+        self._query = folded_query
+        self._result = result
+        return result
+
+    def resume(self) -> typing.Optional[SearchResult]:
+        """
+        Carry on with the last search if it ran out of time
+
+        Returns:
+            The best matches found so far, `None` if there was nothing left to search
+        """
+        if self._result is None or self._result.resume_at is None:
+            return None
+
+        self._result = self.index.resume(
+            self._query,
+            self._result,
+            self.limit,
+            deadline=time.perf_counter() + self.budget
+        )
+        return self._result
+
+
+class SearchIndexCache:
+    """
+    Keeps the indices of recently searched sets of options so that rebuilding a field's widget doesn't rebuild its index
+
+    Sets of options are identified by identity, so they should not be changed once they have been indexed
+    """
+    def __init__(self, maximum_indices: int = MAXIMUM_CACHED_INDICES):
+        """
+        Args:
+            maximum_indices: The number of indices to keep
+        """
+        self.maximum_indices: int = maximum_indices
+        self._indices: typing.OrderedDict[int, typing.Tuple[typing.Sequence[Option], SearchIndex]] = (
+            collections.OrderedDict()
+        )
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, options: typing.Sequence[Option]) -> SearchIndex:
+        """
+        Get the index for a set of options, building it if it isn't kept
+
+        Args:
+            options: The options to search
+
+        Returns:
+            The index over the options
+        """
+        key: int = id(options)
+
+        with self._lock:
+            entry = self._indices.get(key)
+
+            # The options are kept alongside their index so that their identity can't be reused
+            if entry is not None and entry[0] is options:
+                self._indices.move_to_end(key)
+                return entry[1]
+
+        index: SearchIndex = SearchIndex.from_options(options)
+
+        with self._lock:
+            self._indices[key] = (options, index)
+
+            while len(self._indices) > self.maximum_indices:
+                self._indices.popitem(last=False)
+
+        return index
+
+    def clear(self) -> None:
+        """
+        Forget every index
+        """
+        with self._lock:
+            self._indices.clear()
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __contains__(self, options: object) -> bool:
+        entry = self._indices.get(id(options))
+        return entry is not None and entry[0] is options
+
+
+SEARCH_INDICES: SearchIndexCache = SearchIndexCache()
+"""The indices shared by every searchable selector in the process"""
@@ -0,0 +1,333 @@
+"""
+Provides spans that time each stage of a launch, such as converting a parser or building widgets
+
+Tracing is off unless `ARGUI_TRACE` names a file, or `enable` is called, and spans cost a single
+check while it is off. Once the process exits, every span is written to that file as Chrome trace
+events, which may be opened with `chrome://tracing` or https://ui.perfetto.dev, and a table of how
+long each stage took is printed to stderr. A `{pid}` within the file name is replaced with the id of
+the process so that processes started by a traced one don't overwrite each other's traces.
+
+Spans are recorded for every thread of the process. Spans within worker processes are not.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+import typing
+import functools
+import threading
+
+TRACE_VARIABLE: typing.Final[str] = "ARGUI_TRACE"
+"""The environment variable naming the file that a trace of the process is written to"""
+
+PROCESS_PLACEHOLDER: typing.Final[str] = "{pid}"
+"""Replaced with the id of the process within the name of a trace file"""
+
+SUMMARY_PERCENTILES: typing.Final[typing.Tuple[int, ...]] = (50, 95)
+"""The percentiles of each stage's latency shown within the summary"""
+
+_CallableType = typing.TypeVar("_CallableType", bound=typing.Callable[..., typing.Any])
+
+SpanRecord = typing.Tuple[str, int, int, int, typing.Optional[typing.Dict[str, typing.Any]]]
+"""The stage, thread id, start, and duration in nanoseconds of a finished span, along with its details"""
+
+
+class Span:
+    """
+    Times a stage from when it is entered, or started, until it exits, or is finished
+    """
+    __slots__ = ("tracer", "stage", "details", "start")
+
+    def __init__(self, tracer: Tracer, stage: str, details: typing.Optional[typing.Dict[str, typing.Any]] = None):
+        self.tracer: Tracer = tracer
+        self.stage: str = stage
+        self.details: typing.Optional[typing.Dict[str, typing.Any]] = details
+        self.start: int = 0
+
+    def begin(self) -> Span:
+        """
+        Start timing the stage, for stages that begin and end within different functions
+        """
+        self.start = time.perf_counter_ns()
+        return self
+
+    def finish(self) -> None:
+        """
+        Stop timing the stage and record it
+        """
+        self.tracer.record(self.stage, self.start, time.perf_counter_ns() - self.start, self.details)
+
+    def __enter__(self) -> Span:
+        return self.begin()
+
+    def __exit__(self, *exception_information) -> None:
+        self.finish()
+
+
+class _DisabledSpan:
+    """
+    Stands in for every span while tracing is off
+    """
+    __slots__ = ()
+
+    def begin(self) -> _DisabledSpan:
+        return self
+
+    def finish(self) -> None:
+        pass
+
+    def __enter__(self) -> _DisabledSpan:
+        return self
+
+    def __exit__(self, *exception_information) -> None:
+        pass
+
+
+DISABLED_SPAN: typing.Final[_DisabledSpan] = _DisabledSpan()
+"""The span handed out while tracing is off"""
+
+
+class Tracer:
+    """
+    Collects the spans recorded by every thread of the process
+    """
+    def __init__(self, path: typing.Optional[str] = None):
+        """
+        Args:
+            path: Where to write the trace once the process exits. Nothing is written if not given
+        """
+        self.path: typing.Optional[str] = path
+        self.origin: int = time.perf_counter_ns()
+        self.process_id: int = os.getpid()
+        self.spans: typing.List[SpanRecord] = []
+
+    def record(self, stage: str, start: int, duration: int, details: typing.Optional[typing.Dict[str, typing.Any]] = None) -> None:
+        """
+        Record a finished span
+
+        Args:
+            stage: The name of the stage that was timed
+            start: When the stage started, from `time.perf_counter_ns`
+            duration: How many nanoseconds the stage took
+            details: Anything else worth showing about the span, such as the field it was for
+        """
+        # Appending to a list is atomic, so spans from worker threads need no lock
+        self.spans.append((stage, threading.get_ident(), start, duration, details))
+
+    def to_trace_events(self) -> typing.Dict[str, typing.Any]:
+        """
+        Describe every recorded span as Chrome trace events
+
+        Returns:
+            Data that may be written as JSON and opened with `chrome://tracing`
+        """
+        thread_names: typing.Dict[int, str] = {thread.ident: thread.name for thread in threading.enumerate()}
+        events: typing.List[typing.Dict[str, typing.Any]] = []
+
+        for thread_id in sorted({thread_id for _, thread_id, _, _, _ in self.spans}):
+            events.append({
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.process_id,
+                "tid": thread_id,
+                "args": {"name": thread_names.get(thread_id, str(thread_id))},
+            })
+
+        for stage, thread_id, start, duration, details in self.spans:
+            event: typing.Dict[str, typing.Any] = {
+                "name": stage,
+                "cat": "argui",
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": duration / 1000,
+                "pid": self.process_id,
+                "tid": thread_id,
+            }
+
+            if details:
+                event["args"] = {key: str(value) for key, value in details.items()}
+
+            events.append(event)
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def summarize(self) -> typing.List[typing.Tuple[str, int, float, float, typing.List[float], float]]:
+        """
+        Aggregate the latency of each stage
+
+        Returns:
+            The stage, number of spans, total, mean, percentiles, and maximum in milliseconds for each stage,
+            slowest stage first
+        """
+        durations: typing.Dict[str, typing.List[int]] = {}
+
+        for stage, _, _, duration, _ in self.spans:
+            durations.setdefault(stage, []).append(duration)
+
+        rows = []
+
+        for stage, stage_durations in durations.items():
+            stage_durations.sort()
+            count: int = len(stage_durations)
+            total: float = sum(stage_durations) / 1e6
+            percentiles: typing.List[float] = [
+                stage_durations[max(0, -(-count * percentile // 100) - 1)] / 1e6
+                for percentile in SUMMARY_PERCENTILES
+            ]
+            rows.append((stage, count, total, total / count, percentiles, stage_durations[-1] / 1e6))
+
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def format_summary(self) -> str:
+        """
+        Describe the latency of each stage as a table
+        """
+        percentile_headers: typing.List[str] = [f"p{percentile} ms" for percentile in SUMMARY_PERCENTILES]
+        headers: typing.List[str] = ["stage", "count", "total ms", "mean ms", *percentile_headers, "max ms"]
+        lines: typing.List[str] = [f"{headers[0]:<16}{headers[1]:>8}" + "".join(f"{header:>12}" for header in headers[2:])]
+
+        for stage, count, total, mean, percentiles, maximum in self.summarize():
+            timings: typing.List[float] = [total, mean, *percentiles, maximum]
+            lines.append(f"{stage:<16}{count:>8}" + "".join(f"{timing:>12.3f}" for timing in timings))
+
+        return "\n".join(lines)
+
+    def write(self, path: typing.Optional[str] = None) -> typing.Optional[str]:
+        """
+        Write the trace as Chrome trace events
+
+        Args:
+            path: Where to write the trace. Defaults to the path the tracer was created with
+
+        Returns:
+            The path the trace was written to, `None` if there was nowhere to write it
+        """
+        import json
+
+        path = path or self.path
+
+        if not path:
+            return None
+
+        path = path.replace(PROCESS_PLACEHOLDER, str(os.getpid()))
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_trace_events(), file)
+
+        return path
+
+
+_tracer: typing.Optional[Tracer] = None
+"""The tracer collecting spans, `None` while tracing is off"""
+
+
+def enable(path: typing.Optional[str] = None, report_on_exit: bool = True) -> Tracer:
+    """
+    Start recording spans
+
+    Args:
+        path: Where to write the trace once the process exits
+        report_on_exit: Whether to write the trace and print the summary when the process exits
+
+    Returns:
+        The tracer collecting the spans
+    """
+    global _tracer
+
+    if _tracer is None:
+        _tracer = Tracer(path)
+
+        if report_on_exit:
+            import atexit
+            atexit.register(report, _tracer)
+    elif path:
+        _tracer.path = path
+
+    return _tracer
+
+
+def disable() -> typing.Optional[Tracer]:
+    """
+    Stop recording spans
+
+    Returns:
+        The tracer that was collecting spans, if there was one
+    """
+    global _tracer
+
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> typing.Optional[Tracer]:
+    """
+    Get the tracer collecting spans, `None` if tracing is off
+    """
+    return _tracer
+
+
+def report(tracer: Tracer) -> None:
+    """
+    Write a tracer's trace and print its summary to stderr, as is done when a traced process exits
+
+    Forked children share their parent's tracer but leave the reporting to it
+    """
+    if tracer.process_id != os.getpid() or not tracer.spans:
+        return
+
+    try:
+        path: typing.Optional[str] = tracer.write()
+    except OSError as error:
+        path = None
+        sys.stderr.write(f"argui: the trace could not be written: {error}\n")
+
+    sys.stderr.write(tracer.format_summary() + "\n")
+
+    if path:
+        sys.stderr.write(f"argui: trace written to {path}\n")
+
+
+def span(stage: str, **details: typing.Any) -> typing.Union[Span, _DisabledSpan]:
+    """
+    Time a stage, as in `with tracing.span("build_widget", field=name):`
+
+    Args:
+        stage: The name of the stage that rows of the summary are grouped by
+        details: Anything else worth showing about the span
+
+    Returns:
+        A span to enter, or call `begin` and `finish` on
+    """
+    if _tracer is None:
+        return DISABLED_SPAN
+
+    return Span(_tracer, stage, details)
+
+
+def traced(stage: str) -> typing.Callable[[_CallableType], _CallableType]:
+    """
+    Time every call to a function as a stage
+
+    Args:
+        stage: The name of the stage that rows of the summary are grouped by
+
+    Returns:
+        A decorator for the function
+    """
+    def decorate(function: _CallableType) -> _CallableType:
+        @functools.wraps(function)
+        def trace_call(*args, **kwargs):
+            if _tracer is None:
+                return function(*args, **kwargs)
+
+            with Span(_tracer, stage):
+                return function(*args, **kwargs)
+
+        return typing.cast(_CallableType, trace_call)
+
+    return decorate
+
+
+if os.environ.get(TRACE_VARIABLE):
+    enable(os.environ[TRACE_VARIABLE])
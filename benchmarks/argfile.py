@@ -0,0 +1,135 @@
+"""
+Compares the time and peak memory taken to parse a huge argument file as argparse reads it against streaming it
+
+Run from the root of the repository with `python benchmarks/argfile.py`. A manifest of paths of the
+given size is written to a temporary directory and handed to a `nargs="*"` argument as '@manifest'.
+Each measurement runs in a fresh interpreter that parses the arguments and then reads every value,
+and reports the peak resident memory of that interpreter beyond what it held before parsing. Reading
+the file the way argparse does needs several times the size of the file in memory, so leave it out
+with `--modes streamed` on machines without that much to spare.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import json
+import typing
+import pathlib
+import argparse
+import tempfile
+import subprocess
+
+REPOSITORY_ROOT: typing.Final[pathlib.Path] = pathlib.Path(__file__).resolve().parent.parent
+"""The directory holding the `argui` package"""
+
+DEFAULT_SIZE: typing.Final[int] = 1 << 30
+"""The size of the manifest, in bytes, if none is given"""
+
+WRITE_BATCH_SIZE: typing.Final[int] = 100_000
+"""The number of paths written to the manifest at a time"""
+
+PARSERS: typing.Final[typing.Dict[str, str]] = {
+    "argparse": "import argparse; parser = argparse.ArgumentParser(fromfile_prefix_chars='@')",
+    "streamed": "import argui; parser = argui.ArgumentParser(fromfile_prefix_chars='@', stream_argfiles=True)",
+}
+"""Builds the parser measured by each mode"""
+
+MEASUREMENT_SCRIPT: typing.Final[str] = """
+import json
+import time
+import resource
+{setup}
+parser.add_argument("paths", nargs="*")
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+parsed = parser.parse_args([{argument!r}])
+parsed_time = time.perf_counter() - start
+count = sum(1 for _ in parsed.paths)
+print(json.dumps({{
+    "parse": parsed_time,
+    "total": time.perf_counter() - start,
+    "count": count,
+    "peak": (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline) * 1024,
+}}))
+"""
+"""Parses the manifest, reads every value, and prints how long that took and how much memory it needed"""
+
+
+def write_manifest(path: pathlib.Path, size: int) -> int:
+    """
+    Write a file of made up paths, one per line
+
+    Args:
+        path: Where to write the manifest
+        size: Roughly how many bytes to write
+
+    Returns:
+        The number of paths written
+    """
+    written: int = 0
+    count: int = 0
+
+    with open(path, "w", encoding="utf-8") as manifest:
+        while written < size:
+            lines: str = "".join(
+                f"/data/shard_{index // 10_000:05d}/part_{index:09d}.parquet\n"
+                for index in range(count, count + WRITE_BATCH_SIZE)
+            )
+            manifest.write(lines)
+            written += len(lines)
+            count += WRITE_BATCH_SIZE
+
+    return count
+
+
+def measure(mode: str, manifest: pathlib.Path) -> typing.Dict[str, float]:
+    """
+    Parse the manifest in a fresh interpreter
+
+    Args:
+        mode: Which of the `PARSERS` to parse it with
+        manifest: The argument file to parse
+
+    Returns:
+        The seconds taken to parse and to read every value, the number of values, and the peak memory in bytes
+    """
+    script: str = MEASUREMENT_SCRIPT.format(setup=PARSERS[mode], argument=f"@{manifest}")
+    environment: typing.Dict[str, str] = dict(os.environ)
+    environment["PYTHONPATH"] = str(REPOSITORY_ROOT)
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        env=environment,
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    return json.loads(completed.stdout)
+
+
+def main(args: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="The size of the manifest in bytes")
+    parser.add_argument("--modes", nargs="+", choices=list(PARSERS), default=list(PARSERS), help="How to read the manifest")
+    parsed_arguments = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as directory:
+        manifest = pathlib.Path(directory) / "manifest.txt"
+        count: int = write_manifest(manifest, parsed_arguments.size)
+        print(f"{manifest.stat().st_size / (1 << 20):.0f} MiB manifest of {count:,} paths")
+
+        for mode in parsed_arguments.modes:
+            result = measure(mode, manifest)
+            print(
+                f"{mode:<10}{result['parse'] * 1000:>10.1f} ms to parse{result['total']:>9.2f} s to read"
+                f"{result['peak'] / (1 << 20):>9.1f} MiB peak"
+            )
+
+            if result["count"] != count:
+                print(f"{mode} read {result['count']:,} paths rather than {count:,}", file=sys.stderr)
+                return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
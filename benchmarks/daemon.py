@@ -0,0 +1,123 @@
+"""
+Compares how long a run takes through a warm daemon against a cold start of a fresh interpreter
+
+Run from the root of the repository with `python benchmarks/daemon.py`. Every measurement is the wall
+time of a whole process, as a user would see it, and the fastest of several runs is kept. The daemon
+is started and given one run before it is timed.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+import typing
+import pathlib
+import argparse
+import tempfile
+import textwrap
+import py_compile
+import subprocess
+
+from synthetic import SyntheticShape
+from synthetic import write_synthetic_module
+
+REPOSITORY_ROOT: typing.Final[pathlib.Path] = pathlib.Path(__file__).resolve().parent.parent
+"""The directory holding the `argui` package"""
+
+SYNTHETIC_MODULE_NAME: typing.Final[str] = "synthetic_cli"
+"""The name of the generated module holding the parser being measured"""
+
+HANDLED_MODULE_NAME: typing.Final[str] = "handled_cli"
+"""The name of the module that binds a handler to the synthetic parser"""
+
+HANDLED_MODULE: typing.Final[str] = textwrap.dedent(f"""
+    from {SYNTHETIC_MODULE_NAME} import build_parser as build_synthetic_parser
+
+    def handle(arguments):
+        return 0
+
+    def build_parser():
+        parser = build_synthetic_parser()
+        parser.set_defaults(func=handle)
+        return parser
+""")
+"""Binds a handler that does nothing to the synthetic parser"""
+
+PARSED_ARGUMENTS: typing.Final[typing.List[str]] = ["command_0", "--option-0", "value"]
+"""The arguments given to every run"""
+
+SOURCE: typing.Final[str] = f"{HANDLED_MODULE_NAME}:build_parser"
+"""The reference to the parser that runs use"""
+
+SCENARIOS: typing.Final[typing.Dict[str, typing.List[str]]] = {
+    "interpreter alone": [sys.executable, "-c", "pass"],
+    "cold start": [
+        sys.executable,
+        "-c",
+        f"import sys; from argui.daemon import dispatch; from {HANDLED_MODULE_NAME} import build_parser; "
+        f"sys.exit(dispatch(build_parser(), {PARSED_ARGUMENTS!r}))"
+    ],
+    "warm daemon": [sys.executable, "-m", "argui.daemon", SOURCE, *PARSED_ARGUMENTS],
+}
+"""The command to time for each measurement, mapped to the name of the measurement"""
+
+
+def time_command(command: typing.Sequence[str], environment: typing.Mapping[str, str], working_directory: pathlib.Path, attempts: int) -> float:
+    """
+    Time whole runs of a command
+
+    Args:
+        command: The command to run
+        environment: The environment to run it with
+        working_directory: The directory holding the modules that the command imports
+        attempts: The number of times to run the command
+
+    Returns:
+        The fastest time, in seconds
+    """
+    timings: typing.List[float] = []
+
+    for _ in range(attempts):
+        start: float = time.perf_counter()
+        subprocess.run(command, check=True, cwd=working_directory, env=environment, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main(args: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--commands", type=int, default=50, help="The number of subcommands in the synthetic parser")
+    parser.add_argument("--options", type=int, default=20, help="The number of options on each subcommand")
+    parser.add_argument("--attempts", type=int, default=10, help="The number of times to run each measurement")
+    parsed_arguments = parser.parse_args(args)
+    shape = SyntheticShape(breadth=parsed_arguments.commands, options=parsed_arguments.options)
+
+    with tempfile.TemporaryDirectory() as directory:
+        working_directory = pathlib.Path(directory)
+        write_synthetic_module(working_directory / f"{SYNTHETIC_MODULE_NAME}.py", shape)
+        (working_directory / f"{HANDLED_MODULE_NAME}.py").write_text(HANDLED_MODULE, encoding="utf-8")
+
+        for module_name in (SYNTHETIC_MODULE_NAME, HANDLED_MODULE_NAME):
+            py_compile.compile(str(working_directory / f"{module_name}.py"), doraise=True)
+
+        environment: typing.Dict[str, str] = dict(os.environ)
+        environment["PYTHONPATH"] = os.pathsep.join([str(working_directory), str(REPOSITORY_ROOT)])
+        environment["ARGUI_CACHE_DIR"] = str(working_directory / "cache")
+        environment["ARGUI_DAEMON_DIR"] = str(working_directory)
+        environment["ARGUI_DAEMON_IDLE_TIMEOUT"] = "5"
+
+        # Starts the daemon so that the warm runs don't include starting it
+        subprocess.run(SCENARIOS["warm daemon"], check=True, cwd=working_directory, env=environment)
+
+        print(shape)
+
+        for scenario, command in SCENARIOS.items():
+            elapsed: float = time_command(command, environment, working_directory, parsed_arguments.attempts)
+            print(f"{scenario:<24}{elapsed * 1000:>10.1f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Compares the time and memory taken to convert a large parser into validated workflow models against slotted workflow specs
+
+Run from the root of the repository with `python benchmarks/memory.py`. Memory is what remains
+allocated, as traced by `tracemalloc`, once the entire tree of workflows has been converted.
+"""
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import typing
+import argparse
+import tracemalloc
+
+from startup import REPOSITORY_ROOT
+from synthetic import SyntheticShape
+from synthetic import build_synthetic_parser
+
+
+def measure(build: typing.Callable[[], typing.Any], attempts: int) -> typing.Tuple[float, int]:
+    """
+    Measure how long it takes to build something and how much memory it keeps
+
+    Args:
+        build: The function that builds the object to measure
+        attempts: The number of times to time the function - the fastest time is kept
+
+    Returns:
+        The fastest time in seconds and the number of bytes still allocated for what was built
+    """
+    build()
+    timings: typing.List[float] = []
+
+    for _ in range(attempts):
+        start: float = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    built = build()
+    retained_bytes: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+
+    return min(timings), retained_bytes
+
+
+def main(args: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--commands", type=int, default=50, help="The number of subcommands in the synthetic parser")
+    parser.add_argument("--options", type=int, default=20, help="The number of options on each subcommand")
+    parser.add_argument("--attempts", type=int, default=10, help="The number of times to time each conversion")
+    parsed_arguments = parser.parse_args(args)
+    shape = SyntheticShape(breadth=parsed_arguments.commands, options=parsed_arguments.options)
+
+    sys.path.insert(0, str(REPOSITORY_ROOT))
+    from argui.model import Workflow
+    from argui.model import WorkflowSpec
+
+    synthetic_parser = build_synthetic_parser(shape)
+    conversions: typing.Dict[str, typing.Callable[[], typing.Any]] = {
+        "workflow models": lambda: Workflow.from_parser(synthetic_parser).materialize_all(),
+        "workflow specs": lambda: WorkflowSpec.from_parser(synthetic_parser).materialize_all(),
+    }
+
+    print(shape)
+
+    for name, build in conversions.items():
+        elapsed, retained_bytes = measure(build, parsed_arguments.attempts)
+        print(
+            f"{name:<18}{elapsed * 1000:>9.2f} ms{retained_bytes / 1024:>10.0f} KiB"
+            f"{retained_bytes / shape.field_count:>8.0f} bytes per field"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
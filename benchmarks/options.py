@@ -0,0 +1,69 @@
+"""
+Compares the time taken by argparse and ArgUI to parse a long command line against a parser with thousands of flags
+
+Run from the root of the repository with `python benchmarks/options.py`. Every flag is entered as
+an abbreviation, which `argparse` resolves by visiting each of the parser's option strings.
+"""
+from __future__ import annotations
+
+import sys
+import time
+import typing
+import argparse
+
+from startup import REPOSITORY_ROOT
+
+DEFAULT_FLAG_COUNT: typing.Final[int] = 5000
+"""The number of flags on the parser if no count is given"""
+
+DEFAULT_ENTERED_COUNT: typing.Final[int] = 1000
+"""The number of flags entered on the command line if no count is given"""
+
+
+def build_parser(parser_class: typing.Type[argparse.ArgumentParser], flag_count: int) -> argparse.ArgumentParser:
+    """
+    Create a parser shaped like one generated from a schema
+
+    Args:
+        parser_class: The class of parser to create
+        flag_count: The number of flags to give it
+
+    Returns:
+        The parser
+    """
+    parser = parser_class(add_help=False)
+
+    for index in range(flag_count):
+        parser.add_argument(f"--setting-{index:06d}-value", type=int)
+
+    return parser
+
+
+def main(args: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--flags", type=int, default=DEFAULT_FLAG_COUNT, help="The number of flags on the parser")
+    parser.add_argument("--entered", type=int, default=DEFAULT_ENTERED_COUNT, help="The number of flags entered")
+    parsed_arguments = parser.parse_args(args)
+
+    sys.path.insert(0, str(REPOSITORY_ROOT))
+    import argui
+
+    step: int = max(parsed_arguments.flags // parsed_arguments.entered, 1)
+    command_line: typing.List[str] = []
+
+    for index in range(0, parsed_arguments.flags, step)[:parsed_arguments.entered]:
+        command_line.extend([f"--setting-{index:06d}", str(index)])
+
+    print(f"{len(command_line) // 2:,} abbreviated flags against {parsed_arguments.flags:,} flags")
+
+    for name, parser_class in (("argparse", argparse.ArgumentParser), ("argui", argui.ArgumentParser)):
+        measured_parser = build_parser(parser_class, parsed_arguments.flags)
+        start: float = time.perf_counter()
+        measured_parser.parse_args(command_line)
+        print(f"{name:<10}{(time.perf_counter() - start) * 1000:>10.1f} ms to parse")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Compares how long it takes to get a workflow by converting a parser at runtime against loading it from a generated entry point
+
+Run from the root of the repository with `python benchmarks/startup.py`. Every measurement is taken
+in a fresh interpreter and the fastest of several runs is kept. Imports and building the parser are
+left out of every measurement except the cold launches and parses.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import typing
+import pathlib
+import argparse
+import tempfile
+import py_compile
+import subprocess
+
+from synthetic import SyntheticShape
+from synthetic import write_synthetic_module
+
+REPOSITORY_ROOT: typing.Final[pathlib.Path] = pathlib.Path(__file__).resolve().parent.parent
+"""The directory holding the `argui` package"""
+
+SYNTHETIC_MODULE_NAME: typing.Final[str] = "synthetic_cli"
+"""The name of the generated module holding the parser being measured"""
+
+GENERATED_MODULE_NAME: typing.Final[str] = "synthetic_entry_point"
+"""The name of the entry point generated for the synthetic parser"""
+
+TIMING_SCRIPT: typing.Final[str] = """
+import time
+{setup}
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+"""Times a statement after running its untimed setup"""
+
+RUNTIME_SETUP: typing.Final[str] = (
+    "from argui.model import Workflow\n"
+    f"from {SYNTHETIC_MODULE_NAME} import build_parser\n"
+    "parser = build_parser()\n"
+    "parser.to_model()"
+)
+"""Builds the synthetic parser and makes sure that its workflow is in the cache"""
+
+GENERATED_SETUP: typing.Final[str] = (
+    "import argui.model\n"
+    f"from {GENERATED_MODULE_NAME} import build_parser\n"
+    "parser = build_parser()"
+)
+"""Builds the parser from the generated entry point, importing the workflow model that it loads lazily"""
+
+PARSED_ARGUMENTS: typing.Final[str] = "['command_0', '--option-0', 'value']"
+"""The arguments parsed when timing non-interactive launches"""
+
+SCENARIOS: typing.Final[typing.Dict[str, typing.Tuple[str, str]]] = {
+    "convert at runtime": (RUNTIME_SETUP, "Workflow.from_parser(parser)"),
+    "load from the cache": (RUNTIME_SETUP, "parser.to_model()"),
+    "load generated": (GENERATED_SETUP, "parser.to_model()"),
+    "convert every command": (RUNTIME_SETUP, "Workflow.from_parser(parser).materialize_all()"),
+    "load every command": (GENERATED_SETUP, "parser.to_model().materialize_all()"),
+    "cold launch at runtime": ("", f"from {SYNTHETIC_MODULE_NAME} import build_parser\nbuild_parser().to_model()"),
+    "cold launch generated": ("", f"from {GENERATED_MODULE_NAME} import build_parser\nbuild_parser().to_model()"),
+    "parse at runtime": ("", f"from {SYNTHETIC_MODULE_NAME} import build_parser\nbuild_parser().parse_args({PARSED_ARGUMENTS})"),
+    "parse generated": ("", f"from {GENERATED_MODULE_NAME} import build_parser\nbuild_parser().parse_args({PARSED_ARGUMENTS})"),
+}
+"""The setup and the statement to time for each measurement, mapped to the name of the measurement"""
+
+
+def time_statement(setup: str, statement: str, working_directory: pathlib.Path, attempts: int) -> float:
+    """
+    Time a statement within fresh interpreters
+
+    Args:
+        setup: Python statements to run before timing starts
+        statement: The python statement to time
+        working_directory: The directory holding the modules that the statement imports
+        attempts: The number of interpreters to time the statement in
+
+    Returns:
+        The fastest time, in seconds
+    """
+    environment: typing.Dict[str, str] = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join([str(working_directory), str(REPOSITORY_ROOT)])
+    environment["ARGUI_CACHE_DIR"] = str(working_directory / "cache")
+
+    timings: typing.List[float] = []
+
+    for _ in range(attempts):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMING_SCRIPT.format(setup=setup, statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=working_directory,
+            env=environment,
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+
+    return min(timings)
+
+
+def main(args: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--commands", type=int, default=50, help="The number of subcommands in the synthetic parser")
+    parser.add_argument("--options", type=int, default=20, help="The number of options on each subcommand")
+    parser.add_argument("--attempts", type=int, default=5, help="The number of times to run each measurement")
+    parsed_arguments = parser.parse_args(args)
+    shape = SyntheticShape(breadth=parsed_arguments.commands, options=parsed_arguments.options)
+
+    sys.path.insert(0, str(REPOSITORY_ROOT))
+    from argui.generator import generate_entry_point
+    from argui.generator import load_workflow
+
+    with tempfile.TemporaryDirectory() as directory:
+        working_directory = pathlib.Path(directory)
+        write_synthetic_module(working_directory / f"{SYNTHETIC_MODULE_NAME}.py", shape)
+
+        sys.path.insert(0, directory)
+        workflow = load_workflow(f"{SYNTHETIC_MODULE_NAME}:build_parser")
+        (working_directory / f"{GENERATED_MODULE_NAME}.py").write_text(generate_entry_point(workflow))
+
+        # Installed modules are loaded from bytecode, so neither module should be compiled while being timed
+        for module_name in (SYNTHETIC_MODULE_NAME, GENERATED_MODULE_NAME):
+            py_compile.compile(str(working_directory / f"{module_name}.py"), doraise=True)
+
+        print(shape)
+
+        for scenario, (setup, statement) in SCENARIOS.items():
+            elapsed: float = time_statement(setup, statement, working_directory, parsed_arguments.attempts)
+            print(f"{scenario:<24}{elapsed * 1000:>10.1f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,453 @@
+"""
+Times every stage of turning a synthetic command line into a TUI and saves the results so that commits may be compared
+
+Run from the root of the repository with `python benchmarks/suite.py -o results.json`, then compare a later
+commit against those results with `python benchmarks/suite.py --compare results.json`. Conversions, widgets,
+and the time it takes the TUI to show its first screen are measured in this interpreter. Imports are measured
+in fresh interpreters so that nothing is already loaded. Every measurement is repeated and summarized by its
+fastest and median times, and the fastest times are what gets compared.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import json
+import time
+import typing
+import asyncio
+import pathlib
+import argparse
+import platform
+import datetime
+import tempfile
+import statistics
+import subprocess
+import dataclasses
+
+from startup import REPOSITORY_ROOT
+from synthetic import SyntheticShape
+from synthetic import build_synthetic_parser
+
+RESULTS_FORMAT_VERSION: typing.Final[str] = "1"
+"""The version of the layout of saved results. Results with a different version can't be compared"""
+
+IMPORTED_MODULES: typing.Final[typing.Sequence[str]] = ("argui", "argui.model", "argui.interface")
+"""The modules whose cold imports are timed"""
+
+IMPORT_SCRIPT: typing.Final[str] = """
+import time
+start = time.perf_counter()
+import {module_name}
+print(time.perf_counter() - start)
+"""
+"""Times importing a module in a fresh interpreter"""
+
+DEFAULT_THRESHOLD: typing.Final[float] = 0.25
+"""How much slower, as a fraction, a measurement may get before it is reported as a regression"""
+
+SEARCHED_OPTION_COUNT: typing.Final[int] = 100_000
+"""The number of options searched by the search benchmarks"""
+
+SEARCHED_QUERY: typing.Final[str] = "eu-db-0421"
+"""What the search benchmarks type, a character at a time"""
+
+TERMINAL_SIZE: typing.Final[typing.Tuple[int, int]] = (120, 40)
+"""The size of the headless terminal that the TUI is drawn in"""
+
+Timer = typing.Callable[[], float]
+"""A function that runs what is being measured once and returns how long it took, in seconds"""
+
+
+@dataclasses.dataclass
+class Measurement:
+    """
+    Every time taken for one benchmark
+    """
+    name: str
+    """The name of the benchmark"""
+
+    timings: typing.List[float]
+    """How long each run took, in seconds"""
+
+    @property
+    def best(self) -> float:
+        """
+        The fastest run, which is the least affected by noise
+        """
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        """
+        The run in the middle
+        """
+        return statistics.median(self.timings)
+
+    def to_data(self) -> typing.Dict[str, typing.Any]:
+        """
+        Describe the measurement in a form that may be written as JSON
+        """
+        return {"best": self.best, "median": self.median, "timings": self.timings}
+
+
+def time_function(function: typing.Callable[[], typing.Any]) -> Timer:
+    """
+    Create a timer for a function
+
+    Args:
+        function: The function to time
+
+    Returns:
+        A function that calls the given function once and returns how long it took
+    """
+    def timer() -> float:
+        start: float = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+    return timer
+
+
+def time_within_application(function: typing.Callable[[], typing.Any]) -> Timer:
+    """
+    Create a timer for a function that needs a running application, such as one that builds widgets
+
+    Starting and stopping the application isn't included in the time
+
+    Args:
+        function: The function to time
+
+    Returns:
+        A function that calls the given function once within a headless application and returns how long it took
+    """
+    from textual.app import App
+
+    async def run() -> float:
+        async with App().run_test(size=TERMINAL_SIZE):
+            return time_function(function)()
+
+    def timer() -> float:
+        return asyncio.run(run())
+
+    return timer
+
+
+def time_cold_import(module_name: str) -> Timer:
+    """
+    Create a timer for importing a module in a fresh interpreter
+
+    Starting the interpreter isn't included in the time
+
+    Args:
+        module_name: The name of the module to import
+
+    Returns:
+        A function that imports the module in a new interpreter and returns how long the import took
+    """
+    environment: typing.Dict[str, str] = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [str(REPOSITORY_ROOT)] + [path for path in [environment.get("PYTHONPATH")] if path]
+    )
+
+    def timer() -> float:
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT.format(module_name=module_name)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=environment,
+        )
+        return float(result.stdout.strip().splitlines()[-1])
+
+    return timer
+
+
+def time_first_frame(workflow) -> Timer:
+    """
+    Create a timer for how long it takes the TUI to show its first screen in a headless terminal
+
+    The screen counts as shown once it has been composed, mounted, and every message from doing so has been handled
+
+    Args:
+        workflow: The workflow to show
+
+    Returns:
+        A function that starts the TUI, waits for its first screen, closes it, and returns how long the wait took
+    """
+    from argui.interface import WorkflowApplication
+
+    async def run() -> float:
+        start: float = time.perf_counter()
+        application = WorkflowApplication(workflow)
+
+        async with application.run_test(size=TERMINAL_SIZE) as pilot:
+            await pilot.pause()
+            elapsed: float = time.perf_counter() - start
+            application.exit()
+
+        return elapsed
+
+    def timer() -> float:
+        return asyncio.run(run())
+
+    return timer
+
+
+def build_benchmarks(shape: SyntheticShape, cache_directory: pathlib.Path) -> typing.Dict[str, Timer]:
+    """
+    Create a timer for everything that should be measured for a command line of the given shape
+
+    Args:
+        shape: The shape of the command line to measure
+        cache_directory: Where ArgUI may write cached data
+
+    Returns:
+        A timer for each benchmark, mapped to the name of the benchmark
+    """
+    os.environ["ARGUI_CACHE_DIR"] = str(cache_directory)
+
+    from argui.model import Workflow
+    from argui.model import WorkflowSpec
+
+    parser = build_synthetic_parser(shape)
+    workflow = WorkflowSpec.from_parser(parser).materialize_all()
+    fields = [
+        field
+        for subworkflow in iterate_workflows(workflow)
+        for field in subworkflow.fields
+    ]
+
+    benchmarks: typing.Dict[str, Timer] = {
+        "Workflow.from_parser": time_function(lambda: Workflow.from_parser(parser).materialize_all()),
+        "WorkflowSpec.from_parser": time_function(lambda: WorkflowSpec.from_parser(parser).materialize_all()),
+        "ArgumentParser.to_model": time_function(lambda: parser.to_model()),
+        "Field.build_widget": time_within_application(lambda: [field.build_widget() for field in fields]),
+    }
+
+    from argui.utilities.search import SearchIndex
+
+    regions = ("us-east", "us-west", "eu-central", "ap-south")
+    labels = [f"{regions[index % 4]}-db-{index:06}" for index in range(SEARCHED_OPTION_COUNT)]
+    index = SearchIndex(labels)
+
+    benchmarks["SearchIndex"] = time_function(lambda: SearchIndex(labels))
+    benchmarks["SearchSession.search"] = time_function(lambda: type_query(index, SEARCHED_QUERY))
+
+    for module_name in IMPORTED_MODULES:
+        benchmarks[f"import {module_name}"] = time_cold_import(module_name)
+
+    benchmarks["first frame"] = time_first_frame(workflow)
+    return benchmarks
+
+
+def type_query(index, query: str) -> None:
+    """
+    Search an index the way a selector does while a query is typed, finishing every search that runs out of time
+
+    Args:
+        index: The `SearchIndex` to search
+        query: The text to type
+    """
+    from argui.utilities.search import SearchSession
+
+    session = SearchSession(index)
+
+    for end in range(1, len(query) + 1):
+        session.search(query[:end])
+
+        while session.can_resume:
+            session.resume()
+
+
+def iterate_workflows(workflow) -> typing.Iterator:
+    """
+    Iterate through a workflow and every workflow nested within it
+
+    Args:
+        workflow: The workflow at the top of the tree. Its subworkflows must already be materialized
+
+    Returns:
+        Every workflow in the tree, parents first
+    """
+    yield workflow
+
+    for subworkflow in workflow.subworkflows.values():
+        yield from iterate_workflows(subworkflow)
+
+
+def run_benchmarks(benchmarks: typing.Mapping[str, Timer], repeat: int) -> typing.List[Measurement]:
+    """
+    Run every benchmark several times
+
+    Each benchmark is run once before it is timed so that caches and lazy imports don't count against it
+
+    Args:
+        benchmarks: A timer for each benchmark, mapped to the name of the benchmark
+        repeat: The number of times to time each benchmark
+
+    Returns:
+        The measurements for every benchmark, in the order they were given
+    """
+    measurements: typing.List[Measurement] = []
+
+    for name, timer in benchmarks.items():
+        timer()
+        measurements.append(Measurement(name=name, timings=[timer() for _ in range(repeat)]))
+
+    return measurements
+
+
+def get_commit() -> typing.Optional[str]:
+    """
+    Get the commit that the repository is on, if it can be found
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=REPOSITORY_ROOT
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return result.stdout.strip() or None
+
+
+def describe_environment() -> typing.Dict[str, typing.Any]:
+    """
+    Describe what the benchmarks were run on so that results from different commits can be told apart
+    """
+    from importlib import metadata
+
+    versions: typing.Dict[str, typing.Optional[str]] = {}
+
+    for distribution in ("textual", "pydantic"):
+        try:
+            versions[distribution] = metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            versions[distribution] = None
+
+    return {
+        "commit": get_commit(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "versions": versions,
+    }
+
+
+def compare(
+    measurements: typing.Sequence[Measurement],
+    baseline: typing.Mapping[str, typing.Any],
+    threshold: float
+) -> typing.List[str]:
+    """
+    Print how the fastest time of each measurement compares with the same measurement in earlier results
+
+    Args:
+        measurements: The measurements that were just taken
+        baseline: The saved results to compare against
+        threshold: How much slower, as a fraction, a measurement may get before it counts as a regression
+
+    Returns:
+        The names of the measurements that regressed
+    """
+    if baseline.get("version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(
+            f"Results in version {baseline.get('version')!r} can't be compared with version {RESULTS_FORMAT_VERSION}"
+        )
+
+    baseline_results: typing.Mapping[str, typing.Mapping[str, typing.Any]] = baseline["results"]
+    regressions: typing.List[str] = []
+
+    print(f"\nCompared with {baseline['environment'].get('commit') or 'an unknown commit'}")
+
+    for measurement in measurements:
+        if measurement.name not in baseline_results:
+            print(f"{measurement.name:<36}{'new':>12}")
+            continue
+
+        previous: float = baseline_results[measurement.name]["best"]
+        change: float = measurement.best / previous - 1 if previous else 0.0
+        verdict: str = ""
+
+        if change > threshold:
+            regressions.append(measurement.name)
+            verdict = "  slower"
+        elif change < -threshold:
+            verdict = "  faster"
+
+        print(f"{measurement.name:<36}{previous * 1000:>10.2f} ms{measurement.best * 1000:>10.2f} ms{change:>+9.1%}{verdict}")
+
+    return regressions
+
+
+def main(args: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--breadth", type=int, default=10, help="The number of subcommands on each parser")
+    parser.add_argument("--depth", type=int, default=2, help="How many levels of subcommands there are")
+    parser.add_argument("--options", type=int, default=20, help="The number of options on each parser")
+    parser.add_argument("--choices", type=int, default=10, help="The number of choices for options with choices")
+    parser.add_argument("--nargs", default="*", help="How many values options with many values take")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of times to time each benchmark")
+    parser.add_argument("-k", "--only", help="Only run benchmarks whose names contain this text")
+    parser.add_argument("-o", "--output", type=pathlib.Path, help="Where to save the results as JSON")
+    parser.add_argument("--compare", type=pathlib.Path, help="Saved results to compare these results against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="How much slower, as a fraction, a benchmark may get before the comparison fails"
+    )
+    parsed_arguments = parser.parse_args(args)
+
+    shape = SyntheticShape(
+        breadth=parsed_arguments.breadth,
+        depth=parsed_arguments.depth,
+        options=parsed_arguments.options,
+        choices=parsed_arguments.choices,
+        nargs=int(parsed_arguments.nargs) if parsed_arguments.nargs.isdigit() else parsed_arguments.nargs,
+    )
+
+    sys.path.insert(0, str(REPOSITORY_ROOT))
+    print(shape)
+
+    with tempfile.TemporaryDirectory() as cache_directory:
+        benchmarks = build_benchmarks(shape, pathlib.Path(cache_directory))
+
+        if parsed_arguments.only:
+            benchmarks = {name: timer for name, timer in benchmarks.items() if parsed_arguments.only in name}
+
+        measurements = run_benchmarks(benchmarks, parsed_arguments.repeat)
+
+    for measurement in measurements:
+        print(f"{measurement.name:<36}{measurement.best * 1000:>10.2f} ms{measurement.median * 1000:>10.2f} ms")
+
+    results: typing.Dict[str, typing.Any] = {
+        "version": RESULTS_FORMAT_VERSION,
+        "environment": describe_environment(),
+        "shape": shape.describe(),
+        "repeat": parsed_arguments.repeat,
+        "results": {measurement.name: measurement.to_data() for measurement in measurements},
+    }
+
+    if parsed_arguments.output:
+        parsed_arguments.output.write_text(json.dumps(results, indent=4), encoding="utf-8")
+
+    if parsed_arguments.compare:
+        baseline = json.loads(parsed_arguments.compare.read_text(encoding="utf-8"))
+
+        if baseline.get("shape") != results["shape"]:
+            print("The results being compared against were measured for a different shape", file=sys.stderr)
+
+        if compare(measurements, baseline, parsed_arguments.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
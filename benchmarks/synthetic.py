@@ -0,0 +1,175 @@
+"""
+Builds synthetic command lines of any shape for the benchmarks to measure
+
+A shape describes how many commands each parser has, how deeply commands nest, how many options each
+parser has, how many choices the options with choices have, and how many values the options with many
+values take. The parser is written as source code so that it may be imported just like a real command
+line would be, or built in memory without touching the disk.
+"""
+from __future__ import annotations
+
+import typing
+import pathlib
+import dataclasses
+
+OPTION_KIND_COUNT: typing.Final[int] = 7
+"""The number of different kinds of options that are cycled through on each parser"""
+
+SYNTHETIC_PARSER_FUNCTION: typing.Final[str] = "build_parser"
+"""The name of the function that builds the parser in the synthetic source code"""
+
+
+@dataclasses.dataclass(frozen=True)
+class SyntheticShape:
+    """
+    The shape of a synthetic command line
+    """
+    breadth: int = 50
+    """The number of subcommands on each parser that has subcommands"""
+
+    depth: int = 1
+    """How many levels of subcommands there are below the root parser"""
+
+    options: int = 20
+    """The number of options on each parser"""
+
+    choices: int = 3
+    """The number of choices for each option that has choices"""
+
+    nargs: typing.Union[int, str] = "*"
+    """How many values each option that accepts many values takes"""
+
+    @property
+    def parser_count(self) -> int:
+        """
+        The number of parsers, including the root parser, in the command line
+        """
+        return sum(self.breadth ** level for level in range(self.depth + 1))
+
+    @property
+    def field_count(self) -> int:
+        """
+        The number of options across every parser in the command line
+        """
+        return self.parser_count * self.options
+
+    def describe(self) -> typing.Dict[str, typing.Any]:
+        """
+        Describe the shape in a form that may be written as JSON
+        """
+        description: typing.Dict[str, typing.Any] = dataclasses.asdict(self)
+        description.update(parsers=self.parser_count, fields=self.field_count)
+        return description
+
+    def __str__(self):
+        return (
+            f"{self.breadth} commands x {self.depth} levels x {self.options} options "
+            f"({self.parser_count} parsers, {self.field_count} fields)"
+        )
+
+
+def get_option_line(variable: str, option_index: int, shape: SyntheticShape) -> str:
+    """
+    Write the source code that adds an option to a parser
+
+    Args:
+        variable: The name of the variable holding the parser
+        option_index: The position of the option on the parser, which decides what kind of option it is
+        shape: The shape of the command line being written
+
+    Returns:
+        A line of source code
+    """
+    flag: str = f"'--option-{option_index}'"
+    option_kind: int = option_index % OPTION_KIND_COUNT
+
+    if option_kind == 1:
+        keywords: str = f"type=int, default={option_index}"
+    elif option_kind == 2 and shape.choices > 0:
+        keywords = f"choices={[f'choice_{choice_index}' for choice_index in range(shape.choices)]!r}"
+    elif option_kind == 3:
+        keywords = "type=pathlib.Path"
+    elif option_kind == 4:
+        keywords = "action='store_true'"
+    elif option_kind == 5:
+        keywords = f"nargs={shape.nargs!r}"
+    elif option_kind == 6:
+        keywords = "action='append'"
+    else:
+        keywords = f"help='Option {option_index}'"
+
+    return f"    {variable}.add_argument({flag}, {keywords})"
+
+
+def write_synthetic_source(shape: SyntheticShape) -> str:
+    """
+    Write a module that builds a parser with the given shape through a function named `build_parser`
+
+    Every command routes to the same handler through `set_defaults`, just like a real command line
+
+    Args:
+        shape: The shape of the command line to write
+
+    Returns:
+        The source code for the module
+    """
+    lines: typing.List[str] = [
+        "import pathlib",
+        "import argui",
+        "",
+        "def handle(arguments):",
+        "    return 0",
+        "",
+        f"def {SYNTHETIC_PARSER_FUNCTION}():",
+        "    parser = argui.ArgumentParser(prog='synthetic', description='A synthetic command line')",
+    ]
+
+    def add_parser_lines(variable: str, level: int):
+        for option_index in range(shape.options):
+            lines.append(get_option_line(variable, option_index, shape))
+
+        if level >= shape.depth or shape.breadth < 1:
+            return
+
+        commands_variable: str = f"{variable}_commands"
+        lines.append(f"    {commands_variable} = {variable}.add_subparsers(dest='command_{level}', required=True)")
+
+        for command_index in range(shape.breadth):
+            command_variable: str = f"{variable}_{command_index}"
+            lines.append(
+                f"    {command_variable} = {commands_variable}.add_parser("
+                f"'command_{command_index}', help='Command {command_index}')"
+            )
+            lines.append(f"    {command_variable}.set_defaults(func=handle)")
+            add_parser_lines(command_variable, level + 1)
+
+    add_parser_lines("parser", 0)
+    lines.append("    return parser")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_synthetic_module(path: pathlib.Path, shape: SyntheticShape) -> None:
+    """
+    Write a module that builds a parser with the given shape
+
+    Args:
+        path: Where to write the module
+        shape: The shape of the command line to write
+    """
+    path.write_text(write_synthetic_source(shape), encoding="utf-8")
+
+
+def build_synthetic_parser(shape: SyntheticShape):
+    """
+    Build a parser with the given shape without writing it anywhere
+
+    Args:
+        shape: The shape of the command line to build
+
+    Returns:
+        An `argui.ArgumentParser` with the given shape
+    """
+    namespace: typing.Dict[str, typing.Any] = {"__name__": "synthetic"}
+    exec(compile(write_synthetic_source(shape), "<synthetic>", "exec"), namespace)
+    return namespace[SYNTHETIC_PARSER_FUNCTION]()
@@ -0,0 +1,306 @@
+"""
+Unit tests for `argui.interface.application`
+"""
+import pathlib
+import unittest
+import tempfile
+
+from textual import widgets
+
+import argui
+from argui.model import Workflow
+from argui.model import WorkflowSpec
+from argui.interface import WorkflowApplication
+from argui.interface.application import VALIDATION_DELAY
+from argui.model.history import HistoryStore
+from argui.model.history import HISTORY_ENTRY_SUFFIX
+from argui.utilities import tracing
+
+from test.model.test_workflow import build_example_parser
+from test.model.test_diff import build_changed_parser
+
+
+class TestWorkflowApplication(unittest.IsolatedAsyncioTestCase):
+    """Tests for `argui.interface.application.WorkflowApplication`"""
+    async def test_submit_subworkflow(self):
+        """
+        Tests to ensure that values entered for a subcommand are submitted as parseable arguments
+        """
+        parser = build_example_parser()
+        application = WorkflowApplication(Workflow.from_parser(parser), validator=parser.check_arguments)
+
+        async with application.run_test() as pilot:
+            await pilot.click("#command_create")
+            await pilot.pause()
+
+            screen = application.screen
+            self.assertEqual(screen.path, ("create",))
+
+            screen.query_one("#field_name_input", widgets.Input).value = "example.txt"
+            screen.query_one("#field_type_input", widgets.Select).value = "dir"
+            await pilot.pause()
+
+            await pilot.click("#submit")
+            await application.workers.wait_for_complete()
+            await pilot.pause()
+
+        self.assertEqual(application.return_value, ["create", "dir", "example.txt"])
+
+        parsed = parser.parse_args(application.return_value)
+        self.assertEqual(parsed.type, "dir")
+        self.assertEqual(parsed.name, "example.txt")
+
+    async def test_invalid_submission(self):
+        """
+        Tests to ensure that arguments that can't be parsed are announced instead of submitted
+        """
+        parser = build_example_parser()
+        application = WorkflowApplication(parser.to_model(), validator=parser.check_arguments)
+
+        async with application.run_test(notifications=True) as pilot:
+            await pilot.click("#command_copy")
+            await pilot.pause()
+            await pilot.click("#submit")
+            await pilot.pause()
+
+            self.assertTrue(application.is_running)
+            self.assertTrue(application._notifications)
+
+            await pilot.click("#quit")
+            await pilot.pause()
+
+        self.assertIsNone(application.return_value)
+
+    async def test_incremental_validation(self):
+        """
+        Tests to ensure that the submit button reflects the workflow's constraints once editing pauses
+        """
+        parser = build_example_parser()
+        application = WorkflowApplication(parser.to_model(), validator=parser.check_arguments)
+
+        async with application.run_test(notifications=True) as pilot:
+            submit = application.screen.query_one("#submit", widgets.Button)
+            self.assertTrue(submit.has_class("incomplete"))
+
+            await pilot.click("#command_copy")
+            await pilot.pause()
+
+            screen = application.screen
+            submit = screen.query_one("#submit", widgets.Button)
+            self.assertTrue(submit.has_class("incomplete"))
+
+            screen.query_one("#field_source_input", widgets.Input).value = "a"
+            screen.query_one("#field_destination_input", widgets.Input).value = "b"
+            await pilot.pause()
+
+            # Nothing is checked until editing pauses
+            self.assertEqual(screen._pending_validation, {"source", "destination"})
+            self.assertTrue(submit.has_class("incomplete"))
+
+            await pilot.pause(VALIDATION_DELAY * 2)
+            self.assertFalse(submit.has_class("incomplete"))
+            self.assertFalse(screen._pending_validation)
+
+            screen.query_one("#field_destination_input", widgets.Input).value = ""
+            await pilot.pause()
+            await pilot.click("#submit")
+            await pilot.pause()
+
+            self.assertTrue(submit.has_class("incomplete"))
+            self.assertTrue(application.is_running)
+            self.assertIn("destination", list(application._notifications)[-1].message)
+
+    async def test_conversion(self):
+        """
+        Tests to ensure that values are converted off the event loop and that the outcome marks their field
+        """
+        parser = argui.ArgumentParser(prog="conversion")
+        parser.add_argument("--count", type=int)
+        application = WorkflowApplication(parser.to_model(), validator=parser.check_arguments)
+
+        async with application.run_test(notifications=True) as pilot:
+            screen = application.screen
+            count = screen.query_one("#field_count_input", widgets.Input)
+            row = screen.query_one("#field_count")
+
+            count.value = "three"
+            await pilot.pause()
+            screen.validate_pending()
+            self.assertTrue(row.has_class("pending"))
+
+            await application.workers.wait_for_complete()
+            await pilot.pause()
+
+            self.assertTrue(row.has_class("invalid"))
+            self.assertEqual(row.tooltip, "invalid int value: 'three'")
+            self.assertTrue(screen.query_one("#submit", widgets.Button).has_class("incomplete"))
+
+            count.value = "3"
+            await pilot.pause()
+            screen.validate_pending()
+            await application.workers.wait_for_complete()
+            await pilot.pause()
+
+            self.assertFalse(row.has_class("invalid") or row.has_class("pending"))
+            self.assertFalse(screen.query_one("#submit", widgets.Button).has_class("incomplete"))
+
+            # Values that were already checked are marked without starting another check
+            count.value = "three"
+            await pilot.pause()
+            screen.validate_pending()
+            self.assertTrue(row.has_class("invalid"))
+
+            await pilot.click("#submit")
+            await pilot.pause()
+            self.assertTrue(application.is_running)
+
+        self.assertIsNone(application.return_value)
+
+    async def test_history(self):
+        """
+        Tests to ensure that submissions are remembered and prefill the screens of the next launch
+        """
+        parser = build_example_parser()
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = HistoryStore(pathlib.Path(directory) / f"example{HISTORY_ENTRY_SUFFIX}")
+            application = WorkflowApplication(parser.to_model(), validator=parser.check_arguments, history=store)
+
+            async with application.run_test() as pilot:
+                await pilot.click("#command_copy")
+                await pilot.pause()
+
+                screen = application.screen
+                screen.query_one("#field_source_input", widgets.Input).value = "a.txt"
+                screen.query_one("#field_destination_input", widgets.Input).value = "b.txt"
+                await pilot.pause()
+                await pilot.click("#submit")
+                await application.workers.wait_for_complete()
+                await pilot.pause()
+
+            self.assertEqual(store.latest(("copy",)), {"source": "a.txt", "destination": "b.txt"})
+
+            application = WorkflowApplication(parser.to_model(), validator=parser.check_arguments, history=store)
+
+            async with application.run_test() as pilot:
+                await pilot.click("#command_copy")
+                await pilot.pause()
+
+                screen = application.screen
+                self.assertEqual(screen.query_one("#field_source_input", widgets.Input).value, "a.txt")
+                self.assertFalse(screen.query_one("#submit", widgets.Button).has_class("incomplete"))
+
+                await pilot.click("#submit")
+                await application.workers.wait_for_complete()
+                await pilot.pause()
+
+            self.assertEqual(application.return_value, ["copy", "a.txt", "b.txt"])
+            self.assertEqual(len(store.entries()), 2)
+
+    async def test_tracing(self):
+        """
+        Tests to ensure that traced screens record how long they took to mount along with the widgets they built
+        """
+        previous_tracer = tracing.disable()
+        tracer = tracing.enable(report_on_exit=False)
+
+        try:
+            application = WorkflowApplication(Workflow.from_parser(build_example_parser()))
+
+            async with application.run_test() as pilot:
+                await pilot.click("#command_create")
+                await pilot.pause()
+        finally:
+            tracing.disable()
+
+            if previous_tracer is not None:
+                tracing.enable(previous_tracer.path, report_on_exit=False)
+
+        mounted_screens = [details["screen"] for stage, _, _, _, details in tracer.spans if stage == "mount"]
+        self.assertEqual(mounted_screens[-1], "create")
+        self.assertIn("build_widget", {stage for stage, *_ in tracer.spans})
+
+    async def test_replace_workflow(self):
+        """
+        Tests to ensure that a new version of the workflow only replaces the widgets for what changed and keeps
+        the values that were entered
+        """
+        application = WorkflowApplication(WorkflowSpec.from_parser(build_example_parser()))
+
+        async with application.run_test() as pilot:
+            await pilot.click("#command_create")
+            await pilot.pause()
+
+            screen = application.screen
+            screen.query_one("#field_name_input", widgets.Input).value = "example.txt"
+            await pilot.pause()
+            name_row = screen.query_one("#field_name")
+
+            diff = await application.replace_workflow(WorkflowSpec.from_parser(build_changed_parser()))
+            await pilot.pause()
+
+            self.assertEqual([child.path for child in diff.children], [("create",)])
+            self.assertIs(application.screen, screen)
+            self.assertIs(screen.query_one("#field_name"), name_row)
+            self.assertEqual(screen.query_one("#field_name_input", widgets.Input).value, "example.txt")
+            self.assertEqual(screen.query_one("#field_mode_input", widgets.Input).value, "644")
+            self.assertEqual(
+                [row.id for row in screen.query(".field")],
+                ["field_type", "field_name", "field_content", "field_mode"]
+            )
+            self.assertTrue(application.screen_stack[-2].query("#command_clean"))
+
+            # Removing the command that is being shown returns to the screen that led to it
+            removed_parser = argui.ArgumentParser(prog="example", description="An example")
+            removed_parser.add_argument("--verbose", action="store_true")
+            removed_parser.add_subparsers(dest="command").add_parser("copy")
+
+            await application.replace_workflow(WorkflowSpec.from_parser(removed_parser))
+            await pilot.pause()
+
+            self.assertEqual(application.screen.path, ())
+            self.assertNotIn(("create",), application.values)
+            self.assertFalse(application.screen.query("#command_create"))
+
+    async def test_revisit_subworkflow(self):
+        """
+        Tests to ensure that returning to a command that was left shows the same screen, with whatever was typed
+        """
+        application = WorkflowApplication(WorkflowSpec.from_parser(build_example_parser()))
+
+        async with application.run_test() as pilot:
+            await pilot.click("#command_create")
+            await pilot.pause()
+
+            create_screen = application.screen
+            create_screen.query_one("#field_name_input", widgets.Input).value = "example.txt"
+            name_row = create_screen.query_one("#field_name")
+            await pilot.click("#back")
+            await pilot.pause()
+
+            await pilot.click("#command_copy")
+            await pilot.pause()
+            self.assertEqual(application.screen.path, ("copy",))
+            await pilot.click("#back")
+            await pilot.pause()
+
+            await pilot.click("#command_create")
+            await pilot.pause()
+            self.assertIs(application.screen, create_screen)
+            self.assertIs(create_screen.query_one("#field_name"), name_row)
+            self.assertEqual(create_screen.query_one("#field_name_input", widgets.Input).value, "example.txt")
+            self.assertEqual(len(application.screen_cache), 2)
+
+            # Cached screens that aren't shown are patched too, and dropped once their command is gone
+            await pilot.click("#back")
+            await pilot.pause()
+            await application.replace_workflow(WorkflowSpec.from_parser(build_changed_parser()))
+            await pilot.pause()
+            self.assertTrue(create_screen.query("#field_mode"))
+
+            removed_parser = argui.ArgumentParser(prog="example", description="An example")
+            removed_parser.add_subparsers(dest="command").add_parser("copy")
+            await application.replace_workflow(WorkflowSpec.from_parser(removed_parser))
+            await pilot.pause()
+            self.assertNotIn(("create",), application.screen_cache)
+            self.assertFalse(create_screen.is_attached)
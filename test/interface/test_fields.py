@@ -0,0 +1,132 @@
+"""
+Unit tests for `argui.interface.fields`
+"""
+import argparse
+import unittest
+
+from textual import widgets
+from textual.app import App
+
+from argui.model import Workflow
+from argui.model.values import FieldValues
+from argui.interface.fields import VirtualFieldList
+from argui.interface.fields import FIELD_ROW_HEIGHT
+from argui.interface.fields import ROW_POOL_SIZE
+
+FIELD_COUNT: int = 300
+
+
+def build_wide_workflow(field_count: int = FIELD_COUNT) -> Workflow:
+    """
+    Build a workflow for a command with a large number of flags
+    """
+    parser = argparse.ArgumentParser(prog="wide")
+
+    for index in range(field_count):
+        parser.add_argument(f"--option-{index}", help=f"Option number {index}")
+
+    return Workflow.from_parser(parser)
+
+
+class FieldListApplication(App):
+    """A bare application that only shows a virtual field list"""
+    def __init__(self, workflow: Workflow, values: FieldValues, pool_size: int = ROW_POOL_SIZE):
+        super().__init__()
+        self.workflow = workflow
+        self.field_values = values
+        self.pool_size = pool_size
+
+    def compose(self):
+        yield VirtualFieldList(self.workflow.fields, self.field_values, pool_size=self.pool_size)
+
+
+class TestVirtualFieldList(unittest.IsolatedAsyncioTestCase):
+    """Tests for `argui.interface.fields.VirtualFieldList`"""
+    async def test_mounts_visible_rows(self):
+        """
+        Tests to ensure that only rows near the viewport are mounted and that scrolling moves the window
+        """
+        workflow = build_wide_workflow()
+        application = FieldListApplication(workflow, FieldValues())
+
+        async with application.run_test(size=(80, 24)) as pilot:
+            field_list = application.query_one(VirtualFieldList)
+            await pilot.pause()
+
+            mounted = field_list.mounted_indices
+            self.assertEqual(mounted[0], 0)
+            self.assertLess(len(mounted), 20)
+            self.assertEqual(len(application.query(".field")), len(mounted))
+            self.assertEqual(field_list.virtual_size.height, FIELD_COUNT * FIELD_ROW_HEIGHT)
+
+            field_list.scroll_end(animate=False, immediate=True)
+            await pilot.pause()
+
+            mounted = field_list.mounted_indices
+            self.assertEqual(mounted[-1], FIELD_COUNT - 1)
+            self.assertLess(len(mounted), 20)
+            self.assertEqual(mounted, list(range(mounted[0], mounted[-1] + 1)))
+
+    async def test_values_survive_unmounting(self):
+        """
+        Tests to ensure that values entered into a row are shown again once the row is scrolled back into view
+        """
+        workflow = build_wide_workflow()
+        values = FieldValues()
+        application = FieldListApplication(workflow, values, pool_size=0)
+
+        async with application.run_test(size=(80, 24)) as pilot:
+            field_list = application.query_one(VirtualFieldList)
+            await pilot.pause()
+
+            first_field = workflow.fields[0]
+            values.set(first_field.name, "entered")
+
+            field_list.scroll_end(animate=False, immediate=True)
+            await pilot.pause()
+            self.assertNotIn(0, field_list.mounted_indices)
+            self.assertFalse(application.query(f"#{first_field.input_id}"))
+
+            field_list.scroll_home(animate=False, immediate=True)
+            await pilot.pause()
+            self.assertIn(0, field_list.mounted_indices)
+            self.assertEqual(application.query_one(f"#{first_field.input_id}", widgets.Input).value, "entered")
+
+    async def test_recycles_rows(self):
+        """
+        Tests to ensure that rows scrolled away are hidden and shown again rather than rebuilt, up to the pool size
+        """
+        workflow = build_wide_workflow()
+        application = FieldListApplication(workflow, FieldValues(), pool_size=8)
+
+        async with application.run_test(size=(80, 24)) as pilot:
+            field_list = application.query_one(VirtualFieldList)
+            await pilot.pause()
+
+            first_field = workflow.fields[0]
+            first_row = application.query_one(f"#{first_field.widget_id}")
+            application.query_one(f"#{first_field.input_id}", widgets.Input).value = "typed"
+
+            field_list.scroll_to(y=10 * FIELD_ROW_HEIGHT, animate=False, immediate=True)
+            await pilot.pause()
+            self.assertNotIn(0, field_list.mounted_indices)
+            self.assertFalse(first_row.display)
+            self.assertGreater(field_list.parked_count, 0)
+
+            field_list.scroll_home(animate=False, immediate=True)
+            await pilot.pause()
+            self.assertIs(application.query_one(f"#{first_field.widget_id}"), first_row)
+            self.assertTrue(first_row.display)
+            self.assertEqual(application.query_one(f"#{first_field.input_id}", widgets.Input).value, "typed")
+
+            rows = list(field_list.query_children(".field"))
+            self.assertEqual([row.id for row in rows if row.display], [
+                workflow.fields[index].widget_id
+                for index in field_list.mounted_indices
+            ])
+
+            # Rows beyond the pool are removed rather than hidden
+            field_list.scroll_end(animate=False, immediate=True)
+            await pilot.pause()
+            self.assertEqual(field_list.parked_count, 8)
+            self.assertEqual(len(field_list.query_children(".field")), len(field_list.mounted_indices) + 8)
@@ -0,0 +1,75 @@
+"""
+Unit tests for `argui.interface.history`
+"""
+import pathlib
+import tempfile
+import unittest
+
+from textual import widgets
+
+import argui
+from argui.interface import WorkflowApplication
+from argui.interface.history import RecallScreen
+from argui.model.history import HistoryStore
+from argui.model.history import HISTORY_ENTRY_SUFFIX
+
+
+class TestRecallScreen(unittest.IsolatedAsyncioTestCase):
+    """Tests for `argui.interface.history.RecallScreen`"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = HistoryStore(pathlib.Path(self.directory.name) / f"recall{HISTORY_ENTRY_SUFFIX}")
+
+        for host in ("alpha.example.com", "beta.example.com", "gamma.example.com"):
+            self.store.append((), [{"host": host}])
+
+        parser = argui.ArgumentParser(prog="recall")
+        parser.add_argument("--host")
+        parser.add_argument("--port", type=int)
+        self.application = WorkflowApplication(parser.to_model(), history=self.store)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def test_recall(self):
+        """
+        Tests to ensure that a past value may be searched for and entered into the focused field
+        """
+        async with self.application.run_test() as pilot:
+            screen = self.application.screen
+            host = screen.query_one("#field_host_input", widgets.Input)
+            self.assertEqual(host.value, "gamma.example.com")
+
+            host.focus()
+            await pilot.press("ctrl+r")
+            await self.application.workers.wait_for_complete()
+            await pilot.pause()
+
+            recall = self.application.screen
+            self.assertIsInstance(recall, RecallScreen)
+
+            matches = recall.query_one("#recall_matches", widgets.OptionList)
+            self.assertEqual(matches.option_count, 3)
+
+            await pilot.press("b", "e", "t")
+            await pilot.pause()
+            self.assertEqual(matches.option_count, 1)
+
+            await pilot.press("enter")
+            await pilot.pause()
+
+            self.assertIs(self.application.screen, screen)
+            self.assertEqual(screen.values["host"], "beta.example.com")
+            self.assertEqual(screen.query_one("#field_host_input", widgets.Input).value, "beta.example.com")
+
+            # Fields without a history have nothing to recall, and escape leaves the field alone
+            screen.query_one("#field_port_input", widgets.Input).focus()
+            await pilot.press("ctrl+r")
+            await self.application.workers.wait_for_complete()
+            await pilot.pause()
+            self.assertEqual(self.application.screen.query_one("#recall_matches", widgets.OptionList).option_count, 0)
+
+            await pilot.press("escape")
+            await pilot.pause()
+            self.assertIs(self.application.screen, screen)
+            self.assertNotIn("port", screen.values)
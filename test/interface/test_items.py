@@ -0,0 +1,79 @@
+"""
+Unit tests for `argui.interface.items`
+"""
+import pathlib
+import tempfile
+import unittest
+
+from textual import events
+
+import argui
+from argui.model import WorkflowSpec
+from argui.interface import WorkflowApplication
+from argui.interface.items import ItemListEditor
+
+
+def build_list_parser() -> argui.ArgumentParser:
+    """
+    Build a parser that takes a list of numbers
+    """
+    parser = argui.ArgumentParser(prog="items")
+    parser.add_argument("--ids", nargs="+", type=int)
+    return parser
+
+
+class TestItemListEditor(unittest.IsolatedAsyncioTestCase):
+    """Tests for `argui.interface.items.ItemListEditor`"""
+    async def test_import(self):
+        """
+        Tests to ensure that typed, pasted, and imported items are checked and deduplicated, and that invalid
+        items hold back submission until they are removed
+        """
+        parser = build_list_parser()
+        application = WorkflowApplication(WorkflowSpec.from_parser(parser), validator=parser.check_arguments)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / "ids.txt"
+            path.write_text("\n".join(str(number) for number in range(10, 5010)), encoding="utf-8")
+
+            async with application.run_test() as pilot:
+                await pilot.pause()
+                editor = application.screen.query_one(ItemListEditor)
+                editor.input.focus()
+
+                editor.input.value = "1"
+                await pilot.press("enter")
+                await application.workers.wait_for_complete()
+                await pilot.pause()
+                self.assertEqual(editor.store, ["1"])
+                self.assertEqual(editor.input.value, "")
+
+                editor.input.post_message(events.Paste("2\n3\n2\nx\n1"))
+                await pilot.pause()
+                await application.workers.wait_for_complete()
+                await pilot.pause()
+                self.assertEqual(editor.store, ["1", "2", "3", "x"])
+                self.assertEqual(editor.duplicates, 2)
+                self.assertIn("ids", application.get_conversion_problems(()))
+
+                editor.input.value = f"@{path}"
+                await pilot.press("enter")
+                await pilot.pause()
+                await application.workers.wait_for_complete()
+                await pilot.pause()
+                self.assertEqual(len(editor.store), 5004)
+                self.assertEqual(editor.store[-1], "5009")
+                self.assertIs(application.screen.values["ids"], editor.store)
+
+                # Removing the invalid item from the list clears the problem
+                await pilot.press("down", "down", "down", "down", "delete")
+                await pilot.pause()
+                self.assertNotIn("x", editor.store)
+                self.assertEqual(application.get_conversion_problems(()), {})
+
+                await pilot.click("#submit")
+                await application.workers.wait_for_complete()
+                await pilot.pause()
+
+        self.assertEqual(application.return_value[:4], ["--ids", "1", "2", "3"])
+        self.assertEqual(len(parser.parse_args(application.return_value).ids), 5003)
@@ -0,0 +1,97 @@
+"""
+Unit tests for `argui.interface.paths`
+"""
+import pathlib
+import tempfile
+import unittest
+
+from textual import widgets
+
+import argui
+from argui.interface import WorkflowApplication
+from argui.interface.paths import PathBrowser
+from argui.utilities.listing import DirectoryListingCache
+
+
+class TestPathPicker(unittest.IsolatedAsyncioTestCase):
+    """Tests for `argui.interface.paths.PathPicker` and `argui.interface.paths.PathBrowser`"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+
+        for index in range(25):
+            (self.path / f"file_{index:02}.txt").touch()
+
+        (self.path / "nested").mkdir()
+        (self.path / "nested" / "inner.txt").touch()
+
+        parser = argui.ArgumentParser(prog="paths")
+        parser.add_argument("--source", type=pathlib.Path)
+        self.application = WorkflowApplication(parser.to_model())
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    async def test_browse(self):
+        """
+        Tests to ensure that a path may be picked by browsing and is then entered as the field's value
+        """
+        async with self.application.run_test() as pilot:
+            source = self.application.screen.query_one("#field_source_input", widgets.Input)
+            source.value = str(self.path / "nested")
+            await pilot.pause()
+
+            await pilot.click("#field_source_input_browse")
+            await pilot.pause()
+
+            browser = self.application.screen
+            self.assertIsInstance(browser, PathBrowser)
+
+            await self.application.workers.wait_for_complete()
+            await pilot.pause()
+
+            self.assertEqual(browser.directory, self.path / "nested")
+            self.assertEqual([entry.name for entry in browser.entries], ["..", "inner.txt"])
+
+            browser.choose_entry(browser.entries[1])
+            await pilot.pause()
+
+            self.assertNotIsInstance(self.application.screen, PathBrowser)
+            self.assertEqual(source.value, str(self.path / "nested" / "inner.txt"))
+            self.assertEqual(self.application.get_values(())["source"], str(self.path / "nested" / "inner.txt"))
+
+    async def test_chunks_and_cache(self):
+        """
+        Tests to ensure that listings are shown in chunks, remembered, and abandoned when another directory is opened
+        """
+        listings = DirectoryListingCache()
+        browser = PathBrowser(self.path, listings=listings, chunk_size=10)
+
+        async with self.application.run_test() as pilot:
+            self.application.push_screen(browser)
+            await pilot.pause()
+            await self.application.workers.wait_for_complete()
+            await pilot.pause()
+
+            self.assertEqual(len(browser.entries), 27)
+            self.assertIn(self.path, listings)
+            self.assertEqual(browser.query_one("#browser_entries", widgets.OptionList).option_count, 27)
+
+            # Results that arrive for a directory that is no longer shown are dropped
+            browser.open_directory(self.path / "nested")
+            browser.add_entries(self.path, listings.get(self.path)[:5])
+            await self.application.workers.wait_for_complete()
+            await pilot.pause()
+
+            self.assertEqual([entry.name for entry in browser.entries], ["..", "inner.txt"])
+
+            browser.action_open_parent()
+            await self.application.workers.wait_for_complete()
+            await pilot.pause()
+
+            self.assertEqual(len(browser.entries), 27)
+
+            await pilot.click("#browser_choose")
+            await pilot.pause()
+
+            self.assertNotIsInstance(self.application.screen, PathBrowser)
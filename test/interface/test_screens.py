@@ -0,0 +1,45 @@
+"""
+Unit tests for `argui.interface.screens`
+"""
+import unittest
+
+from textual.app import App
+from textual.screen import Screen
+
+from argui.interface.screens import ScreenCache
+
+
+class TestScreenCache(unittest.IsolatedAsyncioTestCase):
+    """Tests for `argui.interface.screens.ScreenCache`"""
+    async def test_eviction(self):
+        """
+        Tests to ensure that the least recently shown screens are removed first, but never while they are shown
+        """
+        application = App()
+
+        async with application.run_test() as pilot:
+            cache = ScreenCache(application, capacity=2)
+            first, second, third = Screen(), Screen(), Screen()
+
+            cache.add(("first",), first)
+            await application.push_screen(first)
+            cache.add(("second",), second)
+            self.assertIs(cache.get(("first",)), first)
+            self.assertEqual([path for path, _ in cache.items()], [("second",), ("first",)])
+
+            cache.add(("third",), third)
+            self.assertNotIn(("second",), cache)
+            self.assertEqual(len(cache), 2)
+
+            # The shown screen is kept over the one that was shown more recently, and outlives being discarded
+            cache.add(("second",), Screen())
+            self.assertNotIn(("third",), cache)
+            self.assertIn(("first",), cache)
+
+            cache.discard(("first",))
+            self.assertTrue(application.is_screen_installed(first))
+
+            await application.pop_screen()
+            cache.release(first)
+            await pilot.pause()
+            self.assertFalse(application.is_screen_installed(first))
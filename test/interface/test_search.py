@@ -0,0 +1,127 @@
+"""
+Unit tests for `argui.interface.search`
+"""
+import unittest
+
+from textual import widgets
+
+import argui
+from argui.interface import WorkflowApplication
+from argui.interface.search import SearchableSelect
+from argui.utilities.search import SEARCH_RESULT_LIMIT
+from argui.utilities.providers import ChoiceProvider
+from argui.utilities.providers import PROVIDED_CHOICES
+
+from test.utilities.test_search import build_labels
+from test.utilities.test_providers import CALLS
+from test.utilities.test_providers import list_hosts
+
+
+class TestSearchableSelect(unittest.IsolatedAsyncioTestCase):
+    """Tests for `argui.interface.search.SearchableSelect`"""
+    def setUp(self):
+        self.hosts = build_labels(2_000)
+
+        parser = argui.ArgumentParser(prog="hosts")
+        parser.add_argument("--host", choices=self.hosts)
+        parser.add_argument("--tables", nargs="+", choices=self.hosts)
+        parser.add_argument("--mode", choices=["fast", "slow"])
+        self.application = WorkflowApplication(parser.to_model())
+
+    async def test_choose(self):
+        """
+        Tests to ensure that typing narrows the shown matches and choosing one enters it as the field's value
+        """
+        async with self.application.run_test() as pilot:
+            screen = self.application.screen
+            host = screen.query_one("#field_host_input", SearchableSelect)
+            self.assertIsInstance(screen.query_one("#field_mode_input"), widgets.Select)
+
+            await self.application.workers.wait_for_complete()
+            await pilot.pause()
+            self.assertIsNotNone(host.index)
+            self.assertIsNone(host.value)
+
+            await pilot.click("#field_host_input_query")
+            await pilot.press("w", "e", "b")
+            await pilot.pause()
+
+            self.assertTrue(host.has_class("-expanded"))
+            self.assertEqual(host.matches.option_count, SEARCH_RESULT_LIMIT)
+
+            await pilot.press(*"-001995")
+            await pilot.pause()
+
+            self.assertEqual(host.matches.option_count, 1)
+
+            await pilot.press("enter")
+            await pilot.pause()
+
+            self.assertEqual(host.value, self.hosts[1995])
+            self.assertEqual(host.input.value, self.hosts[1995])
+            self.assertFalse(host.has_class("-expanded"))
+            self.assertEqual(self.application.get_values(())["host"], self.hosts[1995])
+
+            # Clearing the text box clears the value
+            host.input.value = ""
+            await pilot.pause()
+            self.assertIsNone(host.value)
+
+    async def test_choose_many(self):
+        """
+        Tests to ensure that fields taking many values toggle each chosen match
+        """
+        async with self.application.run_test() as pilot:
+            tables = self.application.screen.query_one("#field_tables_input", SearchableSelect)
+            await self.application.workers.wait_for_complete()
+            await pilot.pause()
+
+            await pilot.click("#field_tables_input_query")
+            await pilot.press(*"db-00000")
+            await pilot.pause()
+
+            self.assertEqual(tables.matches.option_count, 2)
+
+            await pilot.press("down", "enter", "down", "enter")
+            await pilot.pause()
+
+            self.assertTrue(tables.multiple)
+            self.assertEqual(len(tables.value), 2)
+            self.assertEqual(self.application.get_values(())["tables"], tables.value)
+
+            await pilot.press("enter")
+            await pilot.pause()
+
+            self.assertEqual(len(tables.value), 1)
+            self.assertIn("1 selected", tables.input.placeholder)
+
+    async def test_provider(self):
+        """
+        Tests to ensure that provided options are only loaded once shown and are searchable as they stream in
+        """
+        CALLS.clear()
+        PROVIDED_CHOICES.clear()
+
+        parser = argui.ArgumentParser(prog="provided")
+        parser.add_argument("--host", choices=ChoiceProvider(list_hosts, first_batch_size=2), metavar="HOST")
+        application = WorkflowApplication(parser.to_model())
+        self.assertEqual(CALLS, [])
+
+        async with application.run_test() as pilot:
+            host = application.screen.query_one("#field_host_input", SearchableSelect)
+            await application.workers.wait_for_complete()
+            await pilot.pause()
+
+            self.assertEqual(CALLS, ["list_hosts"])
+            self.assertEqual(len(host.index), 5)
+            self.assertIsNone(host.provider)
+
+            await pilot.click("#field_host_input_query")
+            await pilot.press(*"host 3", "enter")
+            await pilot.pause()
+
+            self.assertEqual(host.value, "host-3")
+            self.assertEqual(application.get_values(())["host"], "host-3")
+
+        # Later selectors start with the cached options
+        self.assertEqual(len(SearchableSelect([], provider=ChoiceProvider(list_hosts)).options), 5)
@@ -0,0 +1,59 @@
+"""
+Unit tests for `argui.model.cache`
+"""
+import os
+import sys
+import types
+import pathlib
+import argparse
+import unittest
+import tempfile
+from unittest import mock
+
+from argui.model import cache
+
+
+class TestCache(unittest.TestCase):
+    """Tests for the helpers in `argui.model.cache`"""
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = pathlib.Path(self.temporary_directory.name)
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_write_atomically(self):
+        """
+        Tests to ensure that a file is replaced in full without leaving temporary files behind
+        """
+        path = self.directory / "entry"
+        cache.write_atomically(path, b"first")
+        cache.write_atomically(path, b"second")
+
+        self.assertEqual(path.read_bytes(), b"second")
+        self.assertEqual(list(self.directory.iterdir()), [path])
+
+    def test_program_key(self):
+        """
+        Tests to ensure that programs sharing a name are told apart by the script that was run
+        """
+        first_parser = argparse.ArgumentParser(prog="tool")
+        second_parser = argparse.ArgumentParser(prog="tool")
+
+        with mock.patch.dict(sys.modules, {"__main__": types.SimpleNamespace(__file__="/first/tool.py")}):
+            first_key = cache.get_program_key(first_parser)
+            self.assertEqual(cache.get_program_key(second_parser), first_key)
+            self.assertNotEqual(cache.get_program_key(argparse.ArgumentParser(prog="other")), first_key)
+
+        with mock.patch.dict(sys.modules, {"__main__": types.SimpleNamespace(__file__="/second/tool.py")}):
+            self.assertNotEqual(cache.get_program_key(second_parser), first_key)
+
+    def test_disabled(self):
+        """
+        Tests to ensure that caching may be turned off through the environment
+        """
+        with mock.patch.dict(os.environ, {cache.CACHE_DIRECTORY_VARIABLE: ""}):
+            self.assertIsNone(cache.get_cache_directory())
+
+        with mock.patch.dict(os.environ, {cache.CACHE_DIRECTORY_VARIABLE: str(self.directory)}):
+            self.assertEqual(cache.get_cache_directory(), self.directory)
@@ -0,0 +1,103 @@
+"""
+Unit tests for `argui.model.constraints`
+"""
+import unittest
+
+import argui
+from argui.model import WorkflowSpec
+from argui.model import ConstraintGraph
+from argui.model import ConstraintState
+
+
+def build_constrained_parser() -> argui.ArgumentParser:
+    """
+    Build a parser with a required positional, a required exclusive group, and an optional exclusive group
+    """
+    parser = argui.ArgumentParser(prog="constrained")
+    parser.add_argument("name")
+
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--json", action="store_true")
+    output.add_argument("--format", choices=["text", "csv"])
+
+    speed = parser.add_mutually_exclusive_group()
+    speed.add_argument("--fast", dest="speed", action="store_const", const="fast")
+    speed.add_argument("--slow", dest="speed", action="store_const", const="slow")
+    speed.add_argument("--limit", type=int)
+
+    return parser
+
+
+class TestConstraintState(unittest.TestCase):
+    """Tests for `argui.model.constraints.ConstraintState`"""
+    def setUp(self):
+        self.graph = ConstraintGraph(WorkflowSpec.from_parser(build_constrained_parser()))
+
+    def test_graph(self):
+        """
+        Tests to ensure that each field only depends on the constraints that cover it
+        """
+        self.assertEqual(len(self.graph), 4)
+        self.assertEqual(len(self.graph.dependents["name"]), 1)
+        self.assertEqual(len(self.graph.dependents["json"]), 2)
+        self.assertEqual(len(self.graph.dependents["speed"]), 1)
+        self.assertNotIn("unknown", self.graph.dependents)
+
+    def test_required(self):
+        """
+        Tests to ensure that required fields and required groups must be given
+        """
+        state = ConstraintState(self.graph)
+        self.assertFalse(state.is_satisfied())
+        self.assertEqual(len(state.describe_problems()), 2)
+
+        self.assertFalse(state.update("name", "example"))
+        self.assertTrue(state.update("format", "csv"))
+        self.assertTrue(state.is_satisfied())
+
+        # Values that wouldn't put the field on the command line don't count as given
+        self.assertTrue(state.update("name", ""))
+        self.assertEqual(state.describe_problems(), ["the following arguments are required: name"])
+
+    def test_exclusive(self):
+        """
+        Tests to ensure that fields in an exclusive group may not be given together
+        """
+        state = ConstraintState(self.graph, {"name": "example", "json": True})
+        self.assertTrue(state.is_satisfied())
+
+        self.assertTrue(state.update("format", "text"))
+        self.assertEqual(state.describe_problems(), ["only one of these arguments may be given: --json --format"])
+
+        self.assertTrue(state.update("json", False))
+        self.assertTrue(state.is_satisfied())
+
+        # Options that store into the same value can't conflict with each other
+        self.assertFalse(state.update("speed", "fast"))
+        self.assertTrue(state.update("limit", 3))
+        self.assertFalse(state.is_satisfied())
+
+    def test_unchanged(self):
+        """
+        Tests to ensure that values that don't change what has been given leave the state alone
+        """
+        state = ConstraintState(self.graph, {"name": "example"})
+        broken: int = state.broken
+
+        self.assertFalse(state.update("name", "renamed"))
+        self.assertFalse(state.update("unknown", "value"))
+        self.assertEqual(state.broken, broken)
+
+    def test_command_required(self):
+        """
+        Tests to ensure that a workflow with required commands can't be submitted without one
+        """
+        parser = argui.ArgumentParser(prog="commands")
+        commands = parser.add_subparsers(dest="command", required=True)
+        commands.add_parser("run")
+
+        state = ConstraintState(ConstraintGraph(WorkflowSpec.from_parser(parser)))
+
+        self.assertFalse(state.is_satisfied())
+        self.assertTrue(state.is_satisfied(command_chosen=True))
+        self.assertEqual(state.describe_problems(), ["a command must be chosen"])
@@ -0,0 +1,122 @@
+"""
+Unit tests for `argui.model.diff`
+"""
+import pathlib
+import unittest
+
+import argui
+from argui.model import WorkflowSpec
+from argui.model.diff import diff_workflows
+from argui.model.diff import graft_unchanged
+from argui.model.diff import get_field_keys
+
+from test.model.test_workflow import build_example_parser
+
+
+def build_changed_parser(change_create: bool = True) -> argui.ArgumentParser:
+    """
+    Build the example parser with a field added to `create`, a field changed within `copy`, and a command added
+    """
+    parser = argui.ArgumentParser(prog="example", description="An example")
+    parser.add_argument("--verbose", action="store_true")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create = subparsers.add_parser("create", help="Create a file or directory")
+    create.add_argument("type", choices=["file", "dir"])
+    create.add_argument("name")
+    create.add_argument("--content")
+
+    if change_create:
+        create.add_argument("--mode", default="644")
+
+    copy = subparsers.add_parser("copy", help="Copy a file or directory")
+    copy.add_argument("source", type=pathlib.Path)
+    copy.add_argument("destination", type=str)
+
+    subparsers.add_parser("clean", help="Remove everything")
+    return parser
+
+
+class TestDiffWorkflows(unittest.TestCase):
+    """Tests for `argui.model.diff.diff_workflows`"""
+    def test_unchanged(self):
+        """
+        Tests to ensure that rebuilding the same parser, even from reloaded modules, changes nothing
+        """
+        old = WorkflowSpec.from_parser(build_example_parser())
+        old.subworkflows["create"]
+        diff = diff_workflows(old, WorkflowSpec.from_parser(build_example_parser()))
+
+        self.assertTrue(diff.is_empty)
+        self.assertEqual([child.path for child in diff.children], [("create",)])
+        self.assertEqual(diff.describe(), "Nothing changed")
+
+    def test_changes(self):
+        """
+        Tests to ensure that changes are reported per field and per command, only beneath converted subworkflows
+        """
+        old = WorkflowSpec.from_parser(build_example_parser())
+        old.subworkflows["copy"]
+        new = WorkflowSpec.from_parser(build_changed_parser())
+        diff = diff_workflows(old, new)
+
+        self.assertFalse(diff.is_empty)
+        self.assertFalse(diff.fields_changed)
+        self.assertEqual(diff.added_commands, ("clean",))
+        self.assertEqual([child.path for child in diff.children], [("copy",)])
+        self.assertEqual(diff.children[0].changed_fields, ("destination",))
+
+        # `create` was never converted in the old tree, so it is neither compared nor converted in the new one
+        self.assertFalse(new.subworkflows.is_materialized("create"))
+
+        old.subworkflows["create"]
+        create_diff = diff_workflows(old, new).children[0]
+        self.assertEqual(create_diff.path, ("create",))
+        self.assertEqual(create_diff.added_fields, ("mode",))
+        self.assertIn("create: added mode", diff_workflows(old, new).describe())
+
+    def test_reordered(self):
+        """
+        Tests to ensure that moving fields and repeating names are told apart from changing fields
+        """
+        old_parser = argui.ArgumentParser(prog="ordered")
+        old_parser.add_argument("--first")
+        old_parser.add_argument("--second")
+        old_parser.add_argument("--level", action="store_const", const=1, dest="level")
+
+        new_parser = argui.ArgumentParser(prog="ordered")
+        new_parser.add_argument("--second")
+        new_parser.add_argument("--first")
+        new_parser.add_argument("--level", action="store_const", const=1, dest="level")
+        new_parser.add_argument("--quiet", action="store_const", const=0, dest="level")
+
+        new = WorkflowSpec.from_parser(new_parser)
+        diff = diff_workflows(WorkflowSpec.from_parser(old_parser), new)
+
+        self.assertTrue(diff.reordered)
+        self.assertEqual(diff.changed_fields, ())
+        self.assertEqual(diff.added_fields, ("level#1",))
+        self.assertEqual(get_field_keys(new.fields), ["second", "first", "level", "level#1"])
+
+    def test_graft(self):
+        """
+        Tests to ensure that subworkflows that didn't change are carried into the new tree
+        """
+        old = WorkflowSpec.from_parser(build_example_parser())
+        old_create = old.subworkflows["create"]
+        old_copy = old.subworkflows["copy"]
+        new = WorkflowSpec.from_parser(build_changed_parser())
+
+        grafted = graft_unchanged(old, new, diff_workflows(old, new))
+
+        self.assertIs(grafted, new)
+        self.assertIsNot(grafted.subworkflows["create"], old_create)
+        self.assertIsNot(grafted.subworkflows["copy"], old_copy)
+
+        only_copy_changed = WorkflowSpec.from_parser(build_changed_parser(change_create=False))
+        grafted = graft_unchanged(old, only_copy_changed, diff_workflows(old, only_copy_changed))
+        self.assertIs(grafted.subworkflows["create"], old_create)
+        self.assertIsNot(grafted.subworkflows["copy"], old_copy)
+
+        unchanged = WorkflowSpec.from_parser(build_example_parser())
+        self.assertIs(graft_unchanged(old, unchanged, diff_workflows(old, unchanged)), old)
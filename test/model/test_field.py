@@ -0,0 +1,262 @@
+"""
+Unit tests for `argui.model.field`
+"""
+import time
+import argparse
+import dataclasses
+import pathlib
+import unittest
+from unittest import mock
+
+from textual import widgets
+
+from argui.model import field
+from argui.utilities import actions
+from argui.utilities.items import ItemStore
+
+
+class TestField(unittest.TestCase):
+    """Tests for `argui.model.field.Field`"""
+    def setUp(self) -> None:
+        self.parser = argparse.ArgumentParser()
+
+    def create_field(self, *args, **kwargs) -> field.Field:
+        """
+        Create a field from a freshly added argument
+        """
+        return field.Field.from_action(self.parser.add_argument(*args, **kwargs), index=0)
+
+    def test_from_action(self):
+        """
+        Tests to ensure that argparse actions are described correctly
+        """
+        count = self.create_field("--count", type=int, default=3, help="How many")
+        self.assertEqual(count.name, "count")
+        self.assertEqual(count.flags, ["--count"])
+        self.assertEqual(count.type, int)
+        self.assertEqual(count.default, 3)
+        self.assertEqual(count.help, "How many")
+        self.assertFalse(count.required)
+
+        source = self.create_field("source", type=pathlib.Path)
+        self.assertEqual(source.flags, [])
+        self.assertEqual(source.type, pathlib.Path)
+        self.assertTrue(source.required)
+
+        verbose = self.create_field("--verbose", action="store_true")
+        self.assertTrue(verbose.is_switch)
+        self.assertEqual(verbose.type, bool)
+
+        kind = self.create_field("--kind", choices=["file", "dir"])
+        self.assertIsInstance(kind, field.SelectionField)
+        self.assertTrue(kind.exclusive)
+        self.assertEqual(kind.options, ["file", "dir"])
+
+        kinds = self.create_field("--kinds", choices=["file", "dir"], nargs="+")
+        self.assertFalse(kinds.exclusive)
+        self.assertTrue(kinds.accepts_multiple_values)
+        self.assertFalse(kinds.uses_item_editor)
+
+        # Lists of items are checked by their editor rather than by the screen
+        ids = self.create_field("--ids", type=int, nargs="*")
+        self.assertTrue(ids.uses_item_editor)
+        self.assertIsNone(ids.conversion)
+        self.assertIs(ids.type_conversion, int)
+
+    def test_to_arguments(self):
+        """
+        Tests to ensure that values entered on screen turn into the arguments that would produce them
+        """
+        self.assertEqual(self.create_field("-c", "--count", type=int).to_arguments(4), ["--count", "4"])
+        self.assertEqual(self.create_field("--name").to_arguments(""), [])
+        self.assertEqual(self.create_field("--other").to_arguments(None), [])
+        self.assertEqual(self.create_field("names", nargs="*").to_arguments(["a", "b"]), ["a", "b"])
+        self.assertEqual(self.create_field("--paths", nargs="+").to_arguments(ItemStore(["a", "b"])), ["--paths", "a", "b"])
+        self.assertEqual(self.create_field("--add", action="append").to_arguments(["a", "b"]), ["--add", "a", "--add", "b"])
+        self.assertEqual(self.create_field("-v", action="count").to_arguments(2), ["-v", "-v"])
+
+        self.assertEqual(self.create_field("--yes", action="store_true").to_arguments(True), ["--yes"])
+        self.assertEqual(self.create_field("--maybe", action="store_true").to_arguments(False), [])
+        self.assertEqual(self.create_field("--no", dest="no", action="store_false").to_arguments(False), ["--no"])
+        self.assertEqual(self.create_field("--nope", dest="nope", action="store_false").to_arguments(True), [])
+
+        color = self.create_field("--color", action=argparse.BooleanOptionalAction, default=True)
+        self.assertEqual(color.negative_flags, ("--no-color",))
+        self.assertEqual(color.to_arguments(False), ["--no-color"])
+        self.assertEqual(color.to_arguments(True), [])
+        self.assertEqual(self.create_field("--fast", action=argparse.BooleanOptionalAction).to_arguments(True), ["--fast"])
+
+        for arguments, value in (
+            (["--count", "4"], 4),
+            (["--add", "a", "--add", "b"], ["a", "b"]),
+            (["--no-color"], False),
+        ):
+            self.assertEqual(getattr(self.parser.parse_args(arguments), arguments[0][2:].removeprefix("no-")), value)
+
+    def test_build_input(self):
+        """
+        Tests to ensure that every field builds its input through the registered widgets
+        """
+        typed = self.create_field("--x", type=bool, help="Whether to do x")
+        self.assertIsInstance(typed.build_input(True), widgets.Switch)
+        self.assertTrue(typed.build_input(True).value)
+        self.assertFalse(typed.build_input().value)
+
+        color = self.create_field("--color", action=argparse.BooleanOptionalAction, default=True)
+        self.assertTrue(color.is_switch)
+        self.assertEqual(color.type, bool)
+        self.assertIsInstance(color.build_input(), widgets.Switch)
+        self.assertTrue(color.build_input().value)
+        self.assertFalse(color.build_input(False).value)
+
+        verbose = self.create_field("--verbose", action="store_true", help="Say more")
+        self.assertFalse(verbose.build_input().value)
+
+        # Selectors are chosen by the same dispatch as `actions.get_widget_by_action`
+        kinds = self.create_field("--kinds", choices=["file", "dir"], nargs="+")
+        self.assertIs(kinds.get_input_builder().func, actions.build_select)
+        self.assertTrue(kinds.get_input_builder().keywords["multiple"])
+        self.assertEqual(kinds.get_initial_value(), None)
+
+        many = self.create_field("--many", choices=[str(index) for index in range(1_000)])
+        self.assertIs(many.get_input_builder().func, actions.build_searchable_select)
+        self.assertFalse(many.get_input_builder().keywords["multiple"])
+
+        # Lists of items are built by whatever is registered for `ItemStore`
+        ids = self.create_field("--ids", type=int, nargs="*", default=[1, 2], help="The ids")
+        editor = actions.VALUE_WIDGETS.register(ItemStore, mock.Mock())
+
+        try:
+            ids.build_input()
+        finally:
+            actions.VALUE_WIDGETS.register(ItemStore, actions.build_item_list_editor)
+
+        editor.assert_called_once_with(value=[1, 2], placeholder="The ids", id=ids.input_id, conversion=int)
+
+
+class TestFieldSpec(unittest.TestCase):
+    """Tests for `argui.model.field.FieldSpec`"""
+    def test_from_action(self):
+        """
+        Tests to ensure that specs describe actions the same way that validated fields do
+        """
+        parser = argparse.ArgumentParser()
+        parsed_actions = [
+            parser.add_argument("--count", type=int, default=3, help="How many"),
+            parser.add_argument("mode", choices=["fast", "slow"]),
+            parser.add_argument("--verbose", action="store_true"),
+        ]
+
+        for index, action in enumerate(parsed_actions):
+            with self.subTest(action=action.dest):
+                spec = field.FieldSpec.from_action(action, index=index)
+                self.assertEqual(spec.to_model().model_dump(), field.Field.from_action(action, index=index).model_dump())
+                self.assertEqual(isinstance(spec, field.SelectionBehavior), action.choices is not None)
+
+    def test_provider(self):
+        """
+        Tests to ensure that provided choices are carried through models and storage without being loaded
+        """
+        from argui.utilities.fingerprint import fingerprint_parser
+        from argui.utilities.providers import ChoiceProvider
+        from test.utilities.test_providers import CALLS
+        from test.utilities.test_providers import list_tables
+
+        CALLS.clear()
+        provider = ChoiceProvider(list_tables, ttl=60)
+        parser = argparse.ArgumentParser()
+        spec = field.FieldSpec.from_action(parser.add_argument("--table", choices=provider, metavar="TABLE"), 0)
+
+        self.assertIsInstance(spec, field.SelectionFieldSpec)
+        self.assertIs(spec.provider, provider)
+        self.assertEqual(spec.options, ())
+
+        model = spec.to_model()
+        restored = field.SelectionField.model_validate_json(model.model_dump_json())
+        self.assertEqual(restored.provider, provider)
+        self.assertEqual(fingerprint_parser(parser), fingerprint_parser(parser))
+        self.assertEqual(CALLS, [])
+
+    def test_compact(self):
+        """
+        Tests to ensure that specs use slots and share their help text and empty containers
+        """
+        first_parser = argparse.ArgumentParser()
+        second_parser = argparse.ArgumentParser()
+        first = field.FieldSpec.from_action(first_parser.add_argument("--name", help="".join(["The ", "name"])), 0)
+        second = field.FieldSpec.from_action(second_parser.add_argument("--name", help="".join(["The ", "name"])), 0)
+
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertIs(first.help, second.help)
+        self.assertIs(first.widget_parameters, second.widget_parameters)
+        self.assertIsInstance(first.flags, tuple)
+
+    def test_abstract(self):
+        """
+        Tests to ensure that every kind of field must be able to become a model
+        """
+        with self.assertRaises(TypeError):
+            field.FieldBehavior()
+
+        @dataclasses.dataclass(slots=True)
+        class UnconvertibleSpec(field.FieldBehavior):
+            name: str
+
+        with self.assertRaises(TypeError):
+            UnconvertibleSpec("name")
+
+
+class TestSanitizeName(unittest.TestCase):
+    """Tests for `argui.model.field.sanitize_name`"""
+    def test_sanitize(self):
+        """
+        Tests to ensure that runs of invalid characters are collapsed into a single replacement
+        """
+        self.assertEqual(field.sanitize_name("verbose"), "verbose")
+        self.assertEqual(field.sanitize_name("? this+ -?\\ /. is # a    ____ string"), "_this_is_a_string")
+        self.assertEqual(field.sanitize_name("dry-run"), "dry_run")
+        self.assertEqual(field.sanitize_name("trailing?"), "trailing_")
+        self.assertEqual(field.sanitize_name("???"), "_")
+        self.assertEqual(field.sanitize_name("3d"), "_3d")
+        self.assertEqual(field.sanitize_name("café"), "caf_")
+        self.assertEqual(field.sanitize_name("a b", replacement="x"), "axb")
+
+        with self.assertRaises(ValueError):
+            field.sanitize_name("")
+
+        with self.assertRaises(ValueError):
+            field.sanitize_name("name", replacement="-")
+
+
+class TestWidgetIdAllocator(unittest.TestCase):
+    """Tests for `argui.model.field.WidgetIdAllocator`"""
+    def test_unique(self):
+        """
+        Tests to ensure that names that sanitize to the same text still get distinct, stable ids
+        """
+        names = ["dry-run", "dry_run", "dry run", "dry_run_1", "dry-run"]
+        allocator = field.WidgetIdAllocator()
+        ids = [allocator.allocate(name) for name in names]
+
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(ids[:3], ["field_dry_run", "field_dry_run_1", "field_dry_run_2"])
+
+        second_allocator = field.WidgetIdAllocator()
+        self.assertEqual([second_allocator.allocate(name) for name in names], ids)
+
+    def test_large_batch(self):
+        """
+        Tests to ensure that ids for very large workflows are generated quickly and never collide
+        """
+        fields = [
+            field.Field(index=index, name=f"option {index % 2500}.{index // 2500}")
+            for index in range(10_000)
+        ]
+
+        start = time.perf_counter()
+        ids = field.WidgetIdAllocator().allocate_all(fields)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(set(ids)), len(fields))
+        self.assertEqual([entry.widget_id for entry in fields], ids)
+        self.assertLess(elapsed, 0.5)
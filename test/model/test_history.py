@@ -0,0 +1,139 @@
+"""
+Unit tests for `argui.model.history`
+"""
+import os
+import pathlib
+import unittest
+import tempfile
+from unittest import mock
+
+from argui.model import history
+
+from test.model.test_workflow import build_example_parser
+
+
+class TestHistoryStore(unittest.TestCase):
+    """Tests for `argui.model.history.HistoryStore`"""
+    def setUp(self) -> None:
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = pathlib.Path(self.temporary_directory.name)
+        self.path = self.directory / f"example{history.HISTORY_ENTRY_SUFFIX}"
+
+    def tearDown(self) -> None:
+        self.temporary_directory.cleanup()
+
+    def test_latest(self):
+        """
+        Tests to ensure that the newest values for each workflow are found by reading backwards
+        """
+        store = history.HistoryStore(self.path)
+        self.assertIsNone(store.latest())
+
+        store.append(("create",), [{"verbose": True}, {"name": "first.txt", "type": "file"}])
+        store.append(("copy",), [{}, {"source": "a", "destination": "b"}])
+        store.append(("create",), [{"verbose": False}, {"name": "second.txt", "type": "dir"}])
+
+        self.assertEqual(store.latest(), {"verbose": False})
+        self.assertEqual(store.latest(("create",)), {"name": "second.txt", "type": "dir"})
+        self.assertEqual(store.latest(("copy",)), {"source": "a", "destination": "b"})
+        self.assertIsNone(store.latest(("remove",)))
+
+        # Reading a few bytes at a time finds the same lines
+        lines = list(history.read_lines_backwards(self.path, block_size=7))
+        self.assertEqual(lines, list(reversed(self.path.read_bytes().splitlines())))
+
+    def test_partial_line(self):
+        """
+        Tests to ensure that a write that was cut short doesn't hide the entries around it
+        """
+        store = history.HistoryStore(self.path)
+        store.append((), [{"name": "first.txt"}])
+
+        with open(self.path, "ab") as file:
+            file.write(b'{"path": [], "val')
+
+        self.assertEqual(store.latest(), {"name": "first.txt"})
+
+        store.append((), [{"name": "second.txt"}])
+        self.assertEqual(store.latest(), {"name": "second.txt"})
+        self.assertEqual(len(store.entries()), 2)
+
+    def test_compact(self):
+        """
+        Tests to ensure that only the newest value sets for each workflow survive compaction
+        """
+        store = history.HistoryStore(self.path, limit=3)
+
+        with mock.patch.object(history, "MINIMUM_COMPACTION_SIZE", 0):
+            for number in range(20):
+                store.append(("create",), [{}, {"name": f"{number}.txt"}])
+                store.append(("copy",), [{}, {"source": str(number)}])
+
+        entries = store.entries()
+        self.assertLessEqual(len([entry for entry in entries if entry.path == ("create",)]), 6)
+        self.assertEqual(store.latest(("create",)), {"name": "19.txt"})
+        self.assertEqual(store.latest(("copy",)), {"source": "19"})
+        self.assertEqual(store.read_header()["format"], history.HISTORY_FORMAT_VERSION)
+
+        store.compact()
+        self.assertEqual(
+            [entry.values[1] for entry in store.entries() if entry.path == ("create",)],
+            [{"name": "17.txt"}, {"name": "18.txt"}, {"name": "19.txt"}]
+        )
+        self.assertEqual(store.read_header()["compacted_size"], self.path.stat().st_size)
+
+    def test_default(self):
+        """
+        Tests to ensure that changing a parser keeps its history and that history may be disabled
+        """
+        with mock.patch.dict(os.environ, {"ARGUI_CACHE_DIR": str(self.directory)}):
+            store = history.HistoryStore.default(build_example_parser())
+            store.append((), [{"verbose": True}])
+            self.assertEqual(history.HistoryStore.default(build_example_parser()).latest(), {"verbose": True})
+
+            changed_parser = build_example_parser()
+            changed_parser.add_argument("--quiet", action="store_true")
+            changed_store = history.HistoryStore.default(changed_parser)
+            self.assertEqual(changed_store.path, store.path)
+            self.assertEqual(changed_store.latest(), {"verbose": True})
+
+            changed_store.append((), [{"quiet": True}])
+            self.assertEqual([entry.values for entry in store.entries()], [({"verbose": True},), ({"quiet": True},)])
+
+            renamed_parser = build_example_parser()
+            renamed_parser.prog = "renamed"
+            self.assertNotEqual(history.HistoryStore.default(renamed_parser).path, store.path)
+
+            with mock.patch.dict(os.environ, {history.HISTORY_LIMIT_VARIABLE: "0"}):
+                self.assertFalse(history.HistoryStore.default(changed_parser).enabled)
+
+        with mock.patch.dict(os.environ, {"ARGUI_CACHE_DIR": ""}):
+            disabled_store = history.HistoryStore.default(build_example_parser())
+            self.assertFalse(disabled_store.append((), [{"verbose": True}]))
+            self.assertIsNone(disabled_store.latest())
+
+
+class TestHistoryIndex(unittest.TestCase):
+    """Tests for `argui.model.history.HistoryIndex`"""
+    def test_search(self):
+        """
+        Tests to ensure that each field's distinct past values are searched newest first
+        """
+        entries = [
+            history.HistoryEntry(("copy",), ({}, {"source": "alpha.txt", "flags": ["-a", "-b"]}), 1.0),
+            history.HistoryEntry(("copy",), ({}, {"source": "beta.txt"}), 2.0),
+            history.HistoryEntry(("copy",), ({}, {"source": "alpha.txt"}), 3.0),
+            history.HistoryEntry(("create",), ({}, {"source": "gamma.txt"}), 4.0),
+        ]
+        index = history.HistoryIndex(entries)
+
+        self.assertEqual(index.get_values(("copy",), "source"), ["alpha.txt", "beta.txt"])
+        self.assertEqual(index.get_values(("copy",), "flags"), [["-a", "-b"]])
+        self.assertEqual(index.get_values((), "source"), [])
+
+        session = index.get_session(("copy",), "source")
+        self.assertEqual([session.index.values[position] for position in session.search("").indices], ["alpha.txt", "beta.txt"])
+        self.assertEqual([session.index.values[position] for position in session.search("bet").indices], ["beta.txt"])
+
+        flags_session = index.get_session(("copy",), "flags")
+        self.assertEqual(flags_session.index.labels, ["-a -b"])
@@ -0,0 +1,207 @@
+"""
+Unit tests for `argui.model.workflow`
+"""
+import typing
+import pathlib
+import unittest
+
+import argui
+from argui.model import Workflow
+from argui.model import WorkflowSpec
+from argui.model import SelectionField
+
+
+def build_example_parser(copy_aliases: typing.Sequence[str] = ()) -> argui.ArgumentParser:
+    """
+    Build a parser shaped like the one in `test_cases/arg_parse_subcommands`
+
+    Args:
+        copy_aliases: Other names for the 'copy' command
+    """
+    parser = argui.ArgumentParser(prog="example", description="An example")
+    parser.add_argument("--verbose", action="store_true")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create = subparsers.add_parser("create", help="Create a file or directory")
+    create.add_argument("type", choices=["file", "dir"])
+    create.add_argument("name")
+    create.add_argument("--content")
+
+    copy = subparsers.add_parser("copy", aliases=list(copy_aliases), help="Copy a file or directory")
+    copy.add_argument("source", type=pathlib.Path)
+    copy.add_argument("destination", type=pathlib.Path)
+
+    return parser
+
+
+class TestWorkflow(unittest.TestCase):
+    """Tests for `argui.model.workflow.Workflow`"""
+    def test_from_parser(self):
+        """
+        Tests to ensure that a parser and its subparsers are described correctly
+        """
+        workflow = Workflow.from_parser(build_example_parser())
+
+        self.assertEqual(workflow.name, "example")
+        self.assertEqual(workflow.description, "An example")
+        self.assertEqual([field.name for field in workflow.fields], ["verbose"])
+        self.assertEqual(list(workflow.subworkflows), ["create", "copy"])
+
+        create = workflow.subworkflows["create"]
+        self.assertEqual([field.name for field in create.fields], ["type", "name", "content"])
+        self.assertEqual([field.index for field in create.fields], [0, 1, 2])
+        self.assertIsInstance(create.fields[0], SelectionField)
+
+        copy = workflow.subworkflows["copy"]
+        self.assertEqual([field.type for field in copy.fields], [pathlib.Path, pathlib.Path])
+
+    def test_to_arguments(self):
+        """
+        Tests to ensure that entered values may be parsed by the parser that the workflow came from
+        """
+        parser = build_example_parser()
+        workflow = Workflow.from_parser(parser)
+        create = workflow.subworkflows["create"]
+
+        arguments = (
+            workflow.to_arguments({"verbose": True})
+            + ["create"]
+            + create.to_arguments({"content": "words", "type": "file", "name": "example.txt"})
+        )
+        parsed = parser.parse_args(arguments)
+
+        self.assertTrue(parsed.verbose)
+        self.assertEqual(parsed.command, "create")
+        self.assertEqual(parsed.type, "file")
+        self.assertEqual(parsed.name, "example.txt")
+        self.assertEqual(parsed.content, "words")
+
+    def test_lazy_subworkflows(self):
+        """
+        Tests to ensure that subparsers are converted once, and only when they are first needed
+        """
+        workflow = Workflow.from_parser(build_example_parser())
+
+        self.assertEqual(list(workflow.subworkflows), ["create", "copy"])
+        self.assertIn("copy", workflow.subworkflows)
+        self.assertFalse(workflow.subworkflows.is_materialized("create"))
+        self.assertFalse(workflow.subworkflows.is_materialized("copy"))
+
+        create = workflow.subworkflows["create"]
+
+        self.assertIs(workflow.subworkflows["create"], create)
+        self.assertTrue(workflow.subworkflows.is_materialized("create"))
+        self.assertFalse(workflow.subworkflows.is_materialized("copy"))
+
+        workflow.materialize_all()
+        self.assertTrue(workflow.subworkflows.is_materialized("copy"))
+
+    def test_serialization(self):
+        """
+        Tests to ensure that serializing a workflow includes subworkflows that were never accessed and
+        that deserialized subworkflows are only validated once accessed
+        """
+        workflow = Workflow.from_parser(build_example_parser())
+        restored = Workflow.from_json(workflow.model_dump_json())
+
+        self.assertFalse(restored.subworkflows.is_materialized("copy"))
+        self.assertIs(restored.subworkflows["copy"].fields[0].type, pathlib.Path)
+        self.assertEqual(
+            [field.name for field in restored.subworkflows["copy"].fields],
+            ["source", "destination"]
+        )
+        self.assertEqual(workflow.model_dump()["subworkflows"]["create"]["name"], "example create")
+
+    def test_lazy_serialization(self):
+        """
+        Tests to ensure that workflows serialized one document per subworkflow load the same workflow
+        """
+        workflow = Workflow.from_parser(build_example_parser())
+        restored = Workflow.from_json(workflow.dump_json_lazily())
+
+        self.assertEqual(restored.command_destination, "command")
+        self.assertTrue(restored.command_required)
+        self.assertFalse(restored.subworkflows.is_materialized("create"))
+        self.assertEqual(restored.subworkflows["create"].help, "Create a file or directory")
+        self.assertEqual(restored.materialize_all().model_dump(mode="json"), workflow.model_dump(mode="json"))
+
+    def test_aliases(self):
+        """
+        Tests to ensure that the aliases of a command lead to a single subworkflow that is only serialized once
+        """
+        workflow = Workflow.from_parser(build_example_parser(copy_aliases=("cp", "duplicate")))
+
+        self.assertEqual(list(workflow.subworkflows), ["create", "copy"])
+        self.assertIn("cp", workflow.subworkflows)
+        self.assertIs(workflow.subworkflows["cp"], workflow.subworkflows["copy"])
+        self.assertEqual(workflow.subworkflows.get_aliases("copy"), ["cp", "duplicate"])
+        self.assertEqual(workflow.subworkflows["duplicate"].help, "Copy a file or directory")
+
+        serialized = workflow.model_dump(mode="json")["subworkflows"]
+        self.assertEqual(serialized["cp"], {"alias_of": "copy"})
+
+        for restored in (Workflow.from_json(workflow.model_dump_json()), Workflow.from_json(workflow.dump_json_lazily())):
+            self.assertEqual(list(restored.subworkflows), ["create", "copy"])
+            self.assertEqual(dict(restored.subworkflows.aliases), {"cp": "copy", "duplicate": "copy"})
+            self.assertEqual([field.name for field in restored.subworkflows["cp"].fields], ["source", "destination"])
+
+    def test_exclusive_groups(self):
+        """
+        Tests to ensure that mutually exclusive groups are described by the positions of their fields,
+        which leave out the interactive flag
+        """
+        parser = argui.ArgumentParser(prog="exclusive")
+        parser.add_argument("name")
+        group = parser.add_mutually_exclusive_group(required=True)
+        group.add_argument("--json", action="store_true")
+        group.add_argument("--format", choices=["text", "csv"])
+
+        workflow = Workflow.from_parser(parser)
+
+        self.assertEqual(len(workflow.exclusive_groups), 1)
+        self.assertEqual(workflow.exclusive_groups[0].fields, (1, 2))
+        self.assertTrue(workflow.exclusive_groups[0].required)
+        self.assertEqual(Workflow.from_json(workflow.model_dump_json()).exclusive_groups, workflow.exclusive_groups)
+
+
+class TestWorkflowSpec(unittest.TestCase):
+    """Tests for `argui.model.workflow.WorkflowSpec`"""
+    def test_matches_model(self):
+        """
+        Tests to ensure that a spec exports the same workflow that is validated directly from the parser
+        """
+        spec = WorkflowSpec.from_parser(build_example_parser())
+
+        self.assertFalse(spec.subworkflows.is_materialized("create"))
+        self.assertEqual([field.name for field in spec.subworkflows["create"].fields], ["type", "name", "content"])
+        self.assertEqual(
+            spec.to_model().materialize_all().model_dump(mode="json"),
+            Workflow.from_parser(build_example_parser()).materialize_all().model_dump(mode="json")
+        )
+
+    def test_lazy_export(self):
+        """
+        Tests to ensure that exporting a spec doesn't convert subparsers until they're needed, and only once
+        """
+        spec = WorkflowSpec.from_parser(build_example_parser())
+        model = spec.to_model()
+
+        self.assertFalse(spec.subworkflows.is_materialized("copy"))
+        self.assertFalse(model.subworkflows.is_materialized("copy"))
+
+        copy = model.subworkflows["copy"]
+
+        self.assertIsInstance(copy, Workflow)
+        self.assertTrue(spec.subworkflows.is_materialized("copy"))
+        self.assertIsInstance(spec.subworkflows["copy"], WorkflowSpec)
+
+    def test_to_arguments(self):
+        """
+        Tests to ensure that values entered for a spec may be parsed by the parser that it came from
+        """
+        parser = build_example_parser()
+        spec = WorkflowSpec.from_parser(parser)
+        copy = spec.subworkflows["copy"]
+        arguments = spec.to_arguments({}) + ["copy"] + copy.to_arguments({"source": "a", "destination": "b"})
+
+        self.assertEqual(parser.parse_args(arguments).destination, pathlib.Path("b"))
@@ -0,0 +1,186 @@
+"""
+Unit tests for `argui.batch` and the `batch` command
+"""
+import io
+import sys
+import json
+import pathlib
+import argparse
+import unittest
+import tempfile
+
+import argui
+from argui import batch
+from argui.__main__ import main
+
+HANDLED_LINES: list = []
+"""The numbers squared by `handle_square` when it runs on a thread"""
+
+
+def handle_square(arguments: argparse.Namespace) -> int:
+    """A handler that prints and returns a value"""
+    HANDLED_LINES.append(arguments.number)
+    print(f"Squaring {arguments.number}")
+    return arguments.number ** 2
+
+
+async def handle_echo(arguments: argparse.Namespace) -> list:
+    """A coroutine handler that should be run to completion"""
+    return arguments.words
+
+
+def handle_failure(arguments: argparse.Namespace) -> None:
+    """A handler that always fails"""
+    raise RuntimeError(f"Unable to handle {arguments.reason}")
+
+
+def handle_exit(arguments: argparse.Namespace) -> None:
+    """A handler that exits with the status it was given"""
+    print(f"Exiting with {arguments.status}")
+    sys.exit(arguments.status)
+
+
+def build_batch_parser() -> argui.ArgumentParser:
+    """
+    Build a parser whose commands are each bound to a handler
+    """
+    parser = argui.ArgumentParser(prog="batch")
+    parser.add_argument("--verbose", action="store_true")
+    commands = parser.add_subparsers(dest="command")
+
+    square_parser = commands.add_parser("square")
+    square_parser.add_argument("number", type=int)
+    square_parser.set_defaults(func=handle_square)
+
+    echo_parser = commands.add_parser("echo")
+    echo_parser.add_argument("--words", nargs="*")
+    echo_parser.set_defaults(func=handle_echo)
+
+    failure_parser = commands.add_parser("fail")
+    failure_parser.add_argument("reason")
+    failure_parser.set_defaults(func=handle_failure)
+
+    exit_parser = commands.add_parser("exit")
+    exit_parser.add_argument("status", type=int)
+    exit_parser.set_defaults(func=handle_exit)
+
+    return parser
+
+
+def read_outcomes(output: io.StringIO) -> list:
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Tests for `argui.batch.BatchRunner`"""
+    def test_run(self):
+        """
+        Tests to ensure that every set of arguments is handled in another process and reported in input order
+        """
+        lines = [
+            json.dumps(["square", "3"]),
+            json.dumps({"verbose": True, "echo": {"words": ["a", "b"]}}),
+            "",
+            json.dumps(["square", "three"]),
+            json.dumps({"square": {"amount": 2}}),
+            json.dumps(["fail", "everything"]),
+            json.dumps(["--verbose"]),
+            "[not json",
+            json.dumps({"square": {"number": 12}}),
+        ]
+        output = io.StringIO()
+        summary = batch.run_batch(build_batch_parser(), lines, output, workers=2)
+
+        self.assertEqual(summary, batch.BatchSummary(succeeded=3, failed=5))
+        outcomes = read_outcomes(output)
+
+        self.assertEqual([outcome["line"] for outcome in outcomes], [1, 2, 4, 5, 6, 7, 8, 9])
+        self.assertEqual(outcomes[0], {"line": 1, "result": 9, "output": "Squaring 3\n"})
+        self.assertEqual(outcomes[1], {"line": 2, "result": ["a", "b"]})
+        self.assertIn("invalid int value: 'three'", outcomes[2]["error"])
+        self.assertIn("'amount'", outcomes[3]["error"])
+        self.assertEqual(outcomes[4]["error"], "RuntimeError: Unable to handle everything")
+        self.assertIn("set_defaults(func=...)", outcomes[5]["error"])
+        self.assertIn("Not valid JSON", outcomes[6]["error"])
+        self.assertEqual(outcomes[7]["result"], 144)
+
+    def test_backlog(self):
+        """
+        Tests to ensure that no more input is read than may wait on the workers
+        """
+        HANDLED_LINES.clear()
+        handled_when_read = []
+
+        def read_lines():
+            for number in range(1, 21):
+                handled_when_read.append(len(HANDLED_LINES))
+                yield json.dumps(["square", str(number)])
+
+        output = io.StringIO()
+        batch.run_batch(build_batch_parser(), read_lines(), output, workers=2, backlog=3, use_threads=True)
+
+        for line_number, handled in enumerate(handled_when_read, start=1):
+            self.assertGreaterEqual(handled, line_number - 3)
+
+        self.assertEqual([outcome["result"] for outcome in read_outcomes(output)], [number ** 2 for number in range(1, 21)])
+
+    def test_exit(self):
+        """
+        Tests to ensure that a handler calling `sys.exit` only ends its own set of arguments
+        """
+        lines = [
+            json.dumps(["exit", "3"]),
+            json.dumps(["exit", "0"]),
+            json.dumps(["square", "2"]),
+        ]
+
+        for use_threads in (False, True):
+            with self.subTest(use_threads=use_threads):
+                output = io.StringIO()
+                summary = batch.run_batch(build_batch_parser(), lines, output, workers=2, use_threads=use_threads)
+
+                self.assertEqual(summary, batch.BatchSummary(succeeded=2, failed=1))
+                outcomes = read_outcomes(output)
+
+                self.assertEqual([outcome["line"] for outcome in outcomes], [1, 2, 3])
+                self.assertEqual(outcomes[0]["exit_code"], 3)
+                self.assertEqual(outcomes[0]["error"], "Exited with status 3")
+                self.assertEqual(outcomes[1]["exit_code"], 0)
+                self.assertNotIn("error", outcomes[1])
+                self.assertEqual(outcomes[2]["result"], 4)
+
+                if not use_threads:
+                    self.assertEqual(outcomes[0]["output"], "Exiting with 3\n")
+
+    def test_plain_parser(self):
+        """
+        Tests to ensure that parsers that aren't ArgUI parsers report problems instead of exiting
+        """
+        parser = argparse.ArgumentParser(prog="plain")
+        parser.add_argument("number", type=int)
+        parser.set_defaults(func=handle_square)
+
+        output = io.StringIO()
+        summary = batch.run_batch(parser, [json.dumps(["4"]), json.dumps(["four"])], output, workers=1, use_threads=True)
+
+        self.assertEqual(summary, batch.BatchSummary(succeeded=1, failed=1))
+        self.assertEqual(read_outcomes(output)[1]["error"], "plain: error: argument number: invalid int value: 'four'")
+
+    def test_command(self):
+        """
+        Tests to ensure that the `batch` command reads a file and fails if any set of arguments does
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = pathlib.Path(directory) / "input.jsonl"
+            output_path = pathlib.Path(directory) / "output.jsonl"
+            input_path.write_text(json.dumps(["square", "5"]) + "\n", encoding="utf-8")
+
+            exit_code = main(["batch", "test.test_batch:build_batch_parser", str(input_path), "-o", str(output_path)])
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(json.loads(output_path.read_text(encoding="utf-8"))["result"], 25)
+
+            input_path.write_text(json.dumps(["fail", "now"]) + "\n", encoding="utf-8")
+            exit_code = main([
+                "batch", "test.test_batch:build_batch_parser", str(input_path), "-o", str(output_path), "--threads"
+            ])
+            self.assertEqual(exit_code, 1)
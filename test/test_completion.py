@@ -0,0 +1,167 @@
+"""
+Unit tests for `argui.completion` and the `completion` command
+"""
+import os
+import shutil
+import pathlib
+import tempfile
+import unittest
+import subprocess
+from unittest import mock
+
+import argui
+from argui import completion
+from argui.__main__ import main
+
+
+def build_completed_parser(levels: tuple = ("debug", "info", "warning")) -> argui.ArgumentParser:
+    """
+    Build a parser with choices, paths, and subcommands to complete
+    """
+    parser = argui.ArgumentParser(prog="completed")
+    parser.add_argument("--level", choices=list(levels))
+    parser.add_argument("--output-dir", type=pathlib.Path)
+    parser.add_argument("--tag", nargs="+")
+    parser.add_argument("--table", choices=argui.ChoiceProvider(lambda: ["a", "b"]), metavar="TABLE")
+    parser.add_argument("--verbose", action="store_true")
+    commands = parser.add_subparsers(dest="command")
+
+    copy_parser = commands.add_parser("copy")
+    copy_parser.add_argument("source", type=pathlib.Path)
+    copy_parser.add_argument("mode", choices=["fast", "safe"])
+
+    commands.add_parser("clean")
+    return parser
+
+
+class TestCompletion(unittest.TestCase):
+    """Tests for `argui.completion`"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+        self.index_path = self.path / "completed.index"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def complete(self, *words: str) -> list:
+        """
+        Run the completion program over the index for the words typed so far, the last being completed
+        """
+        environment = dict(os.environ)
+        environment["ARGUI_COMPLETION_WORDS"] = completion.CHOICE_SEPARATOR.join(words[:-1])
+        environment["ARGUI_COMPLETION_CURRENT"] = words[-1]
+        result = subprocess.run(
+            ["awk", completion.COMPLETION_PROGRAM, str(self.index_path)],
+            capture_output=True,
+            text=True,
+            env=environment,
+            check=True
+        )
+        return result.stdout.splitlines()
+
+    def test_index(self):
+        """
+        Tests to ensure that indices describe commands, flags, static choices, and paths
+        """
+        content = completion.build_completion_index(
+            build_completed_parser().to_model(),
+            fingerprint="abc",
+            source_files=["/src/completed.py"],
+            extra_flags=["--help"]
+        )
+        lines = content.splitlines()
+
+        self.assertEqual(lines[:2], ["V\t1\tabc", "S\t/src/completed.py"])
+        self.assertIn("O\t\t--level\t1\tchoice\tdebug\x1finfo\x1fwarning", lines)
+        self.assertIn("O\t\t--output-dir\t1\tdir\t", lines)
+        self.assertIn("O\t\t--tag\tn\t-\t", lines)
+        self.assertIn("O\t\t--table\t1\t-\t", lines)
+        self.assertIn("O\t\t--verbose\t0\t-\t", lines)
+        self.assertIn("C\t\tcopy", lines)
+        self.assertIn("O\tcopy\t--help\t0\t-\t", lines)
+        self.assertIn("P\tcopy\t0\t0\tfile\t", lines)
+        self.assertIn("P\tcopy\t1\t1\tchoice\tfast\x1fsafe", lines)
+
+    def test_refresh(self):
+        """
+        Tests to ensure that indices are only rewritten once the parser changes
+        """
+        self.assertTrue(completion.write_completion_index(build_completed_parser(), self.index_path))
+        self.assertFalse(completion.write_completion_index(build_completed_parser(), self.index_path))
+
+        changed_parser = build_completed_parser(levels=("debug", "error"))
+        self.assertTrue(completion.write_completion_index(changed_parser, self.index_path))
+        self.assertIn("debug\x1ferror", self.index_path.read_text(encoding="utf-8"))
+
+    @unittest.skipIf(shutil.which("awk") is None, "awk is not installed")
+    def test_program(self):
+        """
+        Tests to ensure that the completion program suggests what may come next
+        """
+        completion.write_completion_index(build_completed_parser(), self.index_path)
+
+        self.assertEqual(self.complete(""), ["copy", "clean"])
+        self.assertEqual(self.complete("cl"), ["clean"])
+        self.assertIn("--level", self.complete("--"))
+        self.assertEqual(self.complete("--le"), ["--level"])
+        self.assertEqual(self.complete("--level", ""), ["debug", "info", "warning"])
+        self.assertEqual(self.complete("--level", "d"), ["debug"])
+        self.assertEqual(self.complete("--output-dir", ""), ["\x1fdir"])
+        self.assertEqual(self.complete("--verbose", "c"), ["copy", "clean"])
+        self.assertEqual(self.complete("--level", "info", "copy", ""), ["\x1ffile"])
+        self.assertEqual(self.complete("copy", "a.txt", ""), ["fast", "safe"])
+        self.assertEqual(self.complete("copy", "--h"), ["--help"])
+
+    @unittest.skipIf(shutil.which("bash") is None, "bash is not installed")
+    def test_bash(self):
+        """
+        Tests to ensure that the bash shim completes from the index and rebuilds it in the background
+        """
+        completion.write_completion_index(build_completed_parser(), self.index_path)
+        shim = completion.generate_shim("bash", "completed", self.index_path, ["true"], str(self.path))
+        script = self.path / "completed.bash"
+        script.write_text(shim, encoding="utf-8")
+
+        result = subprocess.run(
+            [
+                "bash",
+                "-c",
+                f"source {script}; COMP_WORDS=(completed copy ''); COMP_CWORD=2; "
+                "_argui_complete_completed; printf '%s\\n' \"${COMPREPLY[@]}\""
+            ],
+            capture_output=True,
+            text=True,
+            cwd=self.path,
+            check=True
+        )
+        self.assertIn("completed.index", result.stdout.splitlines())
+
+    def test_shims(self):
+        """
+        Tests to ensure that every shell gets a shim for the program that reads the index
+        """
+        for shell in completion.SHELLS:
+            with self.subTest(shell=shell):
+                shim = completion.generate_shim(shell, "my-tool", self.path / "it's.index", ["python", "-m", "argui"], "/")
+                self.assertIn("_argui_complete_my_tool", shim)
+                self.assertIn("my-tool", shim)
+                self.assertIn("END {", shim)
+
+        self.assertEqual(completion.fish_quote("it's a \\"), "'it\\'s a \\\\'")
+
+    def test_command(self):
+        """
+        Tests to ensure that the `completion` command needs somewhere to keep the index
+        """
+        with mock.patch.dict(os.environ, {"ARGUI_CACHE_DIR": ""}):
+            with mock.patch("sys.stderr"):
+                self.assertEqual(main(["completion", "test.test_completion:build_completed_parser"]), 2)
+
+        with mock.patch("sys.stdout"):
+            self.assertEqual(
+                main(["completion", "test.test_completion:build_completed_parser", "--index", str(self.index_path)]),
+                0
+            )
+
+        self.assertTrue(self.index_path.read_text(encoding="utf-8").startswith("V\t1\t"))
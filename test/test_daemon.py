@@ -0,0 +1,156 @@
+"""
+Unit tests for `argui.daemon` and the `serve` command
+"""
+import os
+import sys
+import argparse
+import signal
+import pathlib
+import tempfile
+import textwrap
+import unittest
+import subprocess
+from unittest import mock
+
+import argui
+from argui import daemon
+
+REPOSITORY_ROOT: pathlib.Path = pathlib.Path(__file__).resolve().parent.parent
+"""The directory holding the `argui` package"""
+
+WARM_MODULE: str = textwrap.dedent("""
+    import os
+    import argui
+
+    def greet(arguments):
+        print(f"{GREETING} {arguments.name} from {os.getppid()} in {os.getcwd()} with {os.environ.get('GREETED_BY')}")
+        return arguments.code
+
+    def build_parser():
+        parser = argui.ArgumentParser(prog="warm")
+        parser.add_argument("name")
+        parser.add_argument("--code", type=int, default=0)
+        parser.set_defaults(func=greet)
+        return parser
+""")
+"""A module holding a parser whose handler reports which daemon ran it"""
+
+
+class TestDaemon(unittest.TestCase):
+    """Tests for `argui.daemon.DaemonServer` and `argui.daemon.run_client`"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+        (self.path / "sockets").mkdir(mode=0o700)
+        self.write_module("Hello")
+        self.daemon_ids = set()
+
+    def tearDown(self):
+        for daemon_id in self.daemon_ids:
+            try:
+                os.kill(daemon_id, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        self.directory.cleanup()
+
+    def write_module(self, greeting: str):
+        module_path = self.path / "warm_cli.py"
+        module_path.write_text(f"GREETING = {greeting!r}\n" + WARM_MODULE, encoding="utf-8")
+
+        # Make sure a rewrite within the same clock tick still looks like a change
+        status = module_path.stat()
+        os.utime(module_path, ns=(status.st_atime_ns, status.st_mtime_ns + len(greeting) * 1_000_000_000))
+
+    def run_client(self, *arguments: str) -> subprocess.CompletedProcess:
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = os.pathsep.join([str(self.path), str(REPOSITORY_ROOT)])
+        environment[daemon.SOCKET_DIRECTORY_VARIABLE] = str(self.path / "sockets")
+        environment[daemon.IDLE_TIMEOUT_VARIABLE] = "30"
+        environment["GREETED_BY"] = "client"
+
+        result = subprocess.run(
+            [sys.executable, "-m", "argui.daemon", "warm_cli:build_parser", *arguments],
+            capture_output=True,
+            text=True,
+            cwd=self.path,
+            env=environment,
+            timeout=30
+        )
+
+        words = result.stdout.split()
+        if "from" in words:
+            self.daemon_ids.add(int(words[words.index("from") + 1]))
+
+        return result
+
+    def test_runs(self):
+        """
+        Tests to ensure that runs share a daemon, use the client's stdio, environment, and directory, and pass
+        back exit codes
+        """
+        first = self.run_client("world")
+        self.assertEqual(first.returncode, 0, first.stderr)
+        self.assertEqual(first.stdout.split()[:2], ["Hello", "world"])
+        self.assertIn(f"in {self.path.resolve()} with client", first.stdout)
+
+        second = self.run_client("again", "--code", "3")
+        self.assertEqual(second.returncode, 3)
+        self.assertEqual(len(self.daemon_ids), 1)
+
+        invalid = self.run_client("again", "--code", "three")
+        self.assertEqual(invalid.returncode, 2)
+        self.assertIn("invalid int value: 'three'", invalid.stderr)
+
+        # Changing the parser's source replaces the daemon
+        self.write_module("Goodbye")
+        changed = self.run_client("world")
+        self.assertEqual(changed.stdout.split()[:2], ["Goodbye", "world"], changed.stderr)
+        self.assertEqual(len(self.daemon_ids), 2)
+
+    def test_dispatch_exit(self):
+        """
+        Tests to ensure that a handler calling `sys.exit` sets the run's exit code
+        """
+        def leave(arguments):
+            sys.exit(arguments.status)
+
+        parser = argparse.ArgumentParser(prog="leave")
+        parser.add_argument("status", type=int)
+        parser.set_defaults(func=leave)
+
+        self.assertEqual(daemon.dispatch(parser, ["4"]), 4)
+        self.assertEqual(daemon.dispatch(parser, ["0"]), 0)
+
+    def test_dispatch_workflow(self):
+        """
+        Tests to ensure that an interactive run shows the workflow the daemon built instead of building another
+        """
+        parser = argui.ArgumentParser(prog="shown")
+        parser.add_argument("--name")
+        parser.set_defaults(func=lambda arguments: 0)
+        workflow = parser.to_model()
+
+        with (
+            mock.patch.object(parser, "to_model") as to_model,
+            mock.patch.object(parser, "parse_interactively", return_value=argparse.Namespace(func=lambda arguments: 0)) as shown
+        ):
+            self.assertEqual(daemon.dispatch(parser, ["--interactive"], workflow=workflow), 0)
+            shown.assert_called_once_with(workflow=workflow)
+
+            self.assertEqual(daemon.dispatch(parser, ["--name", "plain"], workflow=workflow), 0)
+            shown.assert_called_once()
+            to_model.assert_not_called()
+
+    def test_socket_path(self):
+        """
+        Tests to ensure that sockets are kept where only the current user may reach them
+        """
+        with mock.patch.dict(os.environ, {daemon.SOCKET_DIRECTORY_VARIABLE: str(self.path / "sockets")}):
+            socket_path = daemon.get_socket_path("warm_cli:build_parser")
+            self.assertEqual(os.path.dirname(socket_path), str(self.path / "sockets"))
+            self.assertNotEqual(socket_path, daemon.get_socket_path("other_cli:build_parser"))
+
+            (self.path / "sockets").chmod(0o755)
+            with self.assertRaises(PermissionError):
+                daemon.get_socket_path("warm_cli:build_parser")
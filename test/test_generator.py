@@ -0,0 +1,187 @@
+"""
+Unit tests for `argui.generator` and the `generate` command
+"""
+import io
+import sys
+import types
+import pathlib
+import argparse
+import unittest
+import tempfile
+import importlib.util
+import contextlib
+
+import argui
+from argui import generator
+from argui.__main__ import main
+from argui.model import Workflow
+
+from test.model.test_workflow import build_example_parser
+from test.utilities.test_providers import list_tables
+
+
+def handle_create(arguments: argparse.Namespace) -> int:
+    """A handler that the generated entry point should route the `create` command to"""
+    return 3 if arguments.content == "words" else 0
+
+
+def build_handled_parser() -> argui.ArgumentParser:
+    """
+    Build the example parser with a handler, repeated values, and extra defaults
+    """
+    parser = build_example_parser(copy_aliases=("cp",))
+    parser.add_argument("--level", type=int, default=2, choices=[1, 2, 3], help="How loud the output is")
+    parser.add_argument("--tag", action="append", dest="tags")
+    parser.add_argument("--mode", action="store_const", const="fast", default="slow")
+    parser.add_argument("-q", "--quiet", action="count", default=0)
+    parser.add_argument("--location", type=pathlib.Path, default=pathlib.Path("out"))
+    parser.add_argument("--color", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--table", choices=argui.ChoiceProvider(list_tables, ttl=None), metavar="TABLE")
+    parser.set_defaults(extra={"key": [1, 2]})
+
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true")
+    output.add_argument("--format", choices=["text", "csv"])
+
+    commands: argparse.Action = next(action for action in parser._actions if isinstance(action.choices, dict))
+    commands.choices["create"].set_defaults(func=handle_create)
+
+    return parser
+
+
+def load_module(path: pathlib.Path) -> types.ModuleType:
+    """
+    Import a generated module from wherever it was written
+    """
+    specification = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(module)
+    return module
+
+
+class TestGenerator(unittest.TestCase):
+    """Tests for `argui.generator.generate_entry_point`"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name) / "generated_entry_point.py"
+        self.path.write_text(generator.generate_entry_point(Workflow.from_parser(build_handled_parser())))
+        self.module = load_module(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_parsing(self):
+        """
+        Tests to ensure that the generated parser parses arguments the same way as the original
+        """
+        arguments_to_check = [
+            ["create", "file", "example.txt"],
+            ["--verbose", "--level", "3", "--tag", "a", "--tag", "b", "-qq", "--mode", "copy", "a", "b"],
+            ["--location", "elsewhere", "create", "dir", "name", "--content", "words"],
+            ["--format", "csv", "copy", "a", "b"],
+            ["--no-color", "copy", "a", "b"],
+            ["--table", "table_3", "copy", "a", "b"],
+            ["cp", "a", "b"],
+        ]
+
+        for arguments in arguments_to_check:
+            with self.subTest(arguments=arguments):
+                expected = vars(build_handled_parser().parse_args(arguments))
+                generated = vars(self.module.build_parser().parse_args(arguments))
+
+                # Handlers are replaced with stand-ins that only import them once called
+                self.assertIsInstance(generated.pop("func", None), (self.module.LazyHandler, type(None)))
+                expected.pop("func", None)
+                self.assertEqual(generated, expected)
+
+    def test_invalid_arguments(self):
+        """
+        Tests to ensure that the generated parser rejects what the original rejects
+        """
+        invalid_arguments = (
+            ["--level", "7", "copy", "a", "b"],
+            ["create", "pipe", "name"],
+            ["--json", "--format", "csv", "copy", "a", "b"],
+            ["--table", "table_30", "copy", "a", "b"],
+            [],
+        )
+
+        for arguments in invalid_arguments:
+            with self.subTest(arguments=arguments), contextlib.redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit):
+                    self.module.build_parser().parse_args(arguments)
+
+    def test_prebuilt_workflow(self):
+        """
+        Tests to ensure that the workflow comes from the serialized copy rather than the parser's actions
+        """
+        parser = self.module.build_parser()
+        parser._actions.clear()
+
+        workflow = parser.to_model()
+        expected = Workflow.from_parser(build_handled_parser()).materialize_all()
+
+        self.assertEqual(workflow.model_dump(mode="json"), expected.model_dump(mode="json"))
+        self.assertIs(workflow.subworkflows["copy"].fields[0].type, pathlib.Path)
+        self.assertEqual(workflow.subworkflows["create"].action, f"{__name__}.handle_create")
+
+    def test_main(self):
+        """
+        Tests to ensure that the generated entry point routes parsed arguments to their handler
+        """
+        self.assertEqual(self.module.main(["create", "file", "name", "--content", "words"]), 3)
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(self.module.main(["copy", "a", "b"]), 0)
+
+        self.assertIn("usage:", output.getvalue())
+
+    def test_unimportable_values(self):
+        """
+        Tests to ensure that values that can't be written as source code are reported
+        """
+        parser = argparse.ArgumentParser(prog="unimportable")
+        parser.add_argument("--value", type=lambda value: value.upper())
+
+        with self.assertRaises(ValueError):
+            generator.generate_entry_point(Workflow.from_parser(parser))
+
+
+class TestGenerateCommand(unittest.TestCase):
+    """Tests for `python -m argui generate`"""
+    def test_generate_from_reference(self):
+        """
+        Tests to ensure that the command writes an entry point for a function that builds a parser
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / "reference_entry_point.py"
+            exit_code = main(["generate", f"{__name__}:build_handled_parser", "-o", str(path), "--prog", "renamed"])
+
+            self.assertEqual(exit_code, 0)
+            module = load_module(path)
+
+        self.assertEqual(module.build_parser().prog, "renamed")
+        self.assertEqual(module.build_parser().to_model().name, "renamed")
+
+    def test_generate_from_config(self):
+        """
+        Tests to ensure that the command writes an entry point for a serialized workflow
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = pathlib.Path(directory) / "workflow.json"
+            config_path.write_text(Workflow.from_parser(build_example_parser()).model_dump_json())
+
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                main(["generate", str(config_path)])
+
+            path = pathlib.Path(directory) / "config_entry_point.py"
+            path.write_text(output.getvalue())
+            module = load_module(path)
+
+        parsed = module.build_parser().parse_args(["copy", "a", "b"])
+        self.assertEqual(parsed.source, pathlib.Path("a"))
+        self.assertEqual(parsed.command, "copy")
+
+
+if __name__ == "__main__":
+    sys.exit(unittest.main())
@@ -0,0 +1,236 @@
+"""
+Unit tests for `argui.parser`
+"""
+import io
+import sys
+import typing
+import argparse
+import contextlib
+import pathlib
+import tempfile
+import unittest
+import subprocess
+from unittest import mock
+
+from argui import parser
+
+PACKAGE_ROOT: pathlib.Path = pathlib.Path(__file__).parent.parent
+
+TIMING_ATTEMPTS: int = 5
+"""The number of times to time each script - the fastest time is used to cut down on noise"""
+
+NON_INTERACTIVE_SCRIPT: str = """
+import sys
+import time
+start = time.perf_counter()
+from {module} import ArgumentParser
+parser = ArgumentParser(prog="timing")
+parser.add_argument("--count", type=int, default=3)
+parser.add_argument("name")
+parser.parse_args(["--count", "4", "example"])
+elapsed = time.perf_counter() - start
+loaded = [name for name in ("textual", "pydantic", "argui.model", "argui.interface") if name in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def time_script(module: str) -> typing.Tuple[float, str]:
+    """
+    Time a non-interactive parse within a fresh interpreter
+
+    Args:
+        module: The module that `ArgumentParser` should come from
+
+    Returns:
+        The fastest time that it took to import and parse and the names of heavy modules that were loaded
+    """
+    timings: typing.List[float] = []
+    loaded_modules: str = ""
+
+    for _ in range(TIMING_ATTEMPTS):
+        output: str = subprocess.check_output(
+            [sys.executable, "-c", NON_INTERACTIVE_SCRIPT.format(module=module)],
+            cwd=PACKAGE_ROOT,
+            text=True
+        ).strip()
+        elapsed, _, loaded_modules = output.partition(" ")
+        timings.append(float(elapsed))
+
+    return min(timings), loaded_modules
+
+
+class TestInteractiveRequested(unittest.TestCase):
+    """Tests for `argui.parser.interactive_requested`"""
+    def test_flags(self):
+        """
+        Tests to ensure that the interactive flag is found wherever it appears
+        """
+        self.assertTrue(parser.interactive_requested(["-i"]))
+        self.assertTrue(parser.interactive_requested(["--interactive"]))
+        self.assertTrue(parser.interactive_requested(["copy", "--count", "3", "-i"]))
+        self.assertTrue(parser.interactive_requested(["--inter"]))
+
+        self.assertFalse(parser.interactive_requested([]))
+        self.assertFalse(parser.interactive_requested(["copy", "source", "destination"]))
+        self.assertFalse(parser.interactive_requested(["--", "-i"]))
+        self.assertFalse(parser.interactive_requested(["--inter"], allow_abbrev=False))
+        self.assertFalse(parser.interactive_requested(["--input"]))
+        self.assertFalse(parser.interactive_requested(["+i"]))
+        self.assertTrue(parser.interactive_requested(["+i"], prefix_chars="+"))
+
+    def test_ambiguous_abbreviations(self):
+        """
+        Tests to ensure that an abbreviation only counts when the interactive flag is all it could mean
+        """
+        argument_parser = parser.ArgumentParser(prog="ambiguous")
+        argument_parser.add_argument("--input")
+        option_strings = argument_parser._option_string_actions
+
+        self.assertTrue(parser.interactive_requested(["--inter"], option_strings=option_strings))
+        self.assertFalse(parser.interactive_requested(["--in"], option_strings=option_strings))
+        self.assertTrue(parser.interactive_requested(["--in"]))
+
+        with mock.patch.object(parser.ArgumentParser, "parse_interactively") as parse_interactively:
+            argument_parser.parse_args(["--inter"])
+
+            with contextlib.redirect_stderr(io.StringIO()) as error, self.assertRaises(SystemExit):
+                argument_parser.parse_args(["--in", "value"])
+
+        parse_interactively.assert_called_once()
+        self.assertIn("ambiguous option", error.getvalue())
+
+
+class TestArgumentParser(unittest.TestCase):
+    """Tests for `argui.parser.ArgumentParser`"""
+    def test_non_interactive_parse(self):
+        """
+        Tests to ensure that the parser behaves like `argparse` when the interactive flag is not passed
+        """
+        argument_parser = parser.ArgumentParser(prog="test")
+        argument_parser.add_argument("--count", type=int, default=3)
+        argument_parser.add_argument("name")
+
+        parsed = argument_parser.parse_args(["--count", "4", "example"])
+
+        self.assertEqual(parsed.count, 4)
+        self.assertEqual(parsed.name, "example")
+        self.assertFalse(parsed.interactive)
+
+    def test_check_arguments(self):
+        """
+        Tests to ensure that invalid arguments are described instead of exiting the application
+        """
+        argument_parser = parser.ArgumentParser(prog="test")
+        argument_parser.add_argument("--count", type=int, default=3)
+        argument_parser.add_argument("name")
+
+        self.assertIsNone(argument_parser.check_arguments(["example"]))
+        self.assertIn("name", argument_parser.check_arguments([]))
+        self.assertIn("count", argument_parser.check_arguments(["--count", "three", "example"]))
+
+    def test_streamed_argfiles(self):
+        """
+        Tests to ensure that argument files supply lazy, checked values to arguments that take lists of them
+        """
+        argument_parser = parser.ArgumentParser(prog="test", fromfile_prefix_chars="@", stream_argfiles=True)
+        argument_parser.add_argument("--counts", type=int, nargs="+")
+        argument_parser.add_argument("--name")
+        argument_parser.add_argument("paths", nargs="*")
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths_file = pathlib.Path(directory) / "paths.txt"
+            paths_file.write_text("first\r\n\nsecond", encoding="utf-8")
+            counts_file = pathlib.Path(directory) / "counts.txt"
+            counts_file.write_text("1\n2\n", encoding="utf-8")
+            empty_file = pathlib.Path(directory) / "empty.txt"
+            empty_file.write_text("", encoding="utf-8")
+
+            parsed = argument_parser.parse_args(["start", f"@{paths_file}", "end", "--counts", "0", f"@{counts_file}"])
+            self.assertNotIsInstance(parsed.paths, list)
+            self.assertEqual(list(parsed.paths), ["start", "first", "", "second", "end"])
+            self.assertEqual(parsed.paths[-2], "second")
+            self.assertEqual(list(parsed.counts), [0, 1, 2])
+
+            self.assertIsNone(argument_parser.check_arguments([f"@{empty_file}"]))
+            self.assertIn("invalid int value", argument_parser.check_arguments(["--counts", f"@{paths_file}"]))
+            self.assertIn("at least one", argument_parser.check_arguments(["--counts", f"@{empty_file}"]))
+            self.assertIn("list of values", argument_parser.check_arguments(["--name", f"@{paths_file}"]))
+            self.assertIsNotNone(argument_parser.check_arguments([f"@{directory}/missing.txt"]))
+
+            # Without streaming, the file is spliced into the arguments just as argparse would
+            spliced_parser = parser.ArgumentParser(prog="test", fromfile_prefix_chars="@")
+            spliced_parser.add_argument("paths", nargs="*")
+            self.assertEqual(spliced_parser.parse_args([f"@{counts_file}"]).paths, ["1", "2"])
+
+    def test_option_abbreviations(self):
+        """
+        Tests to ensure that abbreviations resolve, or are reported as ambiguous, exactly as `argparse` would
+        """
+        def build_parser(parser_class):
+            argument_parser = parser_class(prog="test", add_help=False)
+
+            for index in range(200):
+                argument_parser.add_argument(f"--flag-{index:03}-value", type=int)
+
+            argument_parser.add_argument("-x")
+            argument_parser.add_argument("--xylophone")
+            argument_parser.add_argument("-n", type=int)
+            return argument_parser
+
+        argument_parser = build_parser(parser.ArgumentParser)
+        expected_parser = build_parser(argparse.ArgumentParser)
+
+        for args in (["--flag-012-v", "1"], ["--flag-199=4"], ["-xvalue"], ["-x=value"], ["--xy", "tune"], ["-n", "-5"]):
+            with self.subTest(args=args):
+                self.assertEqual(
+                    vars(argument_parser.parse_known_args(args)[0]) | {"interactive": None},
+                    vars(expected_parser.parse_known_args(args)[0]) | {"interactive": None}
+                )
+
+        self.assertIn(
+            "ambiguous option: --flag-01 could match --flag-010-value, --flag-011-value",
+            argument_parser.check_arguments(["--flag-01", "1"])
+        )
+
+    def test_interactive_clashes(self):
+        """
+        Tests to ensure that option strings the interactive flag would swallow are reported when they are added
+        """
+        argument_parser = parser.ArgumentParser(prog="test")
+
+        with self.assertRaisesRegex(argparse.ArgumentError, "abbreviation of --interactive"):
+            argument_parser.add_argument("--inter")
+
+        with self.assertRaisesRegex(argparse.ArgumentError, "abbreviation of --interactive"):
+            argument_parser.add_argument_group("group").add_argument("--interact")
+
+        with self.assertRaisesRegex(argparse.ArgumentError, "reserved"):
+            parser.ArgumentParser(prog="test", conflict_handler="resolve").add_argument("-i", "--input")
+
+        subparser = argument_parser.add_subparsers().add_parser("run")
+
+        with self.assertRaisesRegex(argparse.ArgumentError, "abbreviation of --interactive"):
+            subparser.add_argument("--inte")
+
+        # Longer flags and parsers without abbreviations are left alone
+        argument_parser.add_argument("--interactive-theme")
+        parser.ArgumentParser(prog="test", allow_abbrev=False).add_argument("--inter")
+
+        # Subparsers of other classes can only be checked once the tree is built
+        plain_parser = parser.ArgumentParser(prog="test")
+        plain_parser.add_subparsers(parser_class=argparse.ArgumentParser).add_parser("run").add_argument("-i")
+
+        with self.assertRaisesRegex(argparse.ArgumentError, "reserved"):
+            plain_parser.parse_args(["run"])
+
+    def test_non_interactive_imports(self):
+        """
+        Tests to ensure that a non-interactive parse neither loads the TUI nor costs much more than argparse
+        """
+        argparse_time, _ = time_script("argparse")
+        argui_time, loaded_modules = time_script("argui")
+
+        self.assertEqual(loaded_modules, "", "Heavy modules were loaded during a non-interactive parse")
+
+        # Generous limits - this is here to catch the TUI being imported, not a few stray milliseconds
+        self.assertLess(argui_time, argparse_time * 3 + 0.05)
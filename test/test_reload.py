@@ -0,0 +1,75 @@
+"""
+Unit tests for `argui.reload`
+"""
+import os
+import sys
+import pathlib
+import tempfile
+import textwrap
+import unittest
+
+from argui import reload
+
+RELOADED_MODULE: str = textwrap.dedent("""
+    import argui
+
+    def build_parser():
+        parser = argui.ArgumentParser(prog="reloaded")
+        for name in FLAGS:
+            parser.add_argument(f"--{name}")
+        return parser
+""")
+"""A module holding a parser with a flag for each name in `FLAGS`"""
+
+
+class TestParserReloader(unittest.TestCase):
+    """Tests for `argui.reload.ParserReloader`"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+        self.version = 0
+        self.write_module("FLAGS = ['first']\n")
+        sys.path.insert(0, str(self.path))
+
+    def tearDown(self):
+        sys.path.remove(str(self.path))
+        sys.modules.pop("reloaded_cli", None)
+        self.directory.cleanup()
+
+    def write_module(self, header: str):
+        module_path = self.path / "reloaded_cli.py"
+        module_path.write_text(header + RELOADED_MODULE, encoding="utf-8")
+
+        # Make sure a rewrite within the same clock tick still looks like a change
+        self.version += 1
+        status = module_path.stat()
+        os.utime(module_path, ns=(status.st_atime_ns, status.st_mtime_ns + self.version * 1_000_000_000))
+
+    def test_poll(self):
+        """
+        Tests to ensure that parsers are only rebuilt once their files change, and that broken edits are reported once
+        """
+        reloader = reload.ParserReloader("reloaded_cli:build_parser")
+        self.assertEqual(reloader.paths, [str(self.path / "reloaded_cli.py")])
+        self.assertIsNone(reloader.poll())
+
+        self.write_module("FLAGS = ['first', 'second']\n")
+        workflow = reloader.poll()
+        self.assertEqual([field.name for field in workflow.fields], ["first", "second"])
+        self.assertIsNone(reloader.check_arguments(["--second", "value"]))
+        self.assertIsNone(reloader.poll())
+
+        self.write_module("FLAGS = [\n")
+        with self.assertRaises(SyntaxError):
+            reloader.poll()
+        self.assertIsNone(reloader.poll())
+
+        self.write_module("FLAGS = ['third']\n")
+        self.assertEqual([field.name for field in reloader.poll().fields], ["third"])
+
+    def test_unload_package(self):
+        """
+        Tests to ensure that ArgUI never unloads itself
+        """
+        with self.assertRaises(ValueError):
+            reload.unload_package("argui.parser")
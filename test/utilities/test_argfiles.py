@@ -0,0 +1,72 @@
+"""
+Unit tests for `argui.utilities.argfiles`
+"""
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from argui.utilities import argfiles
+from argui.utilities.argfiles import ArgumentFile
+from argui.utilities.argfiles import ArgumentSequence
+
+
+class TestArgumentFile(unittest.TestCase):
+    """Tests for `argui.utilities.argfiles.ArgumentFile`"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name) / "arguments.txt"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lines(self):
+        """
+        Tests to ensure that lines are read across chunks and looked up by position through checkpoints
+        """
+        lines = [f"value-{index}" * (index % 7) for index in range(1000)]
+        self.path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        with mock.patch.object(argfiles, "READ_CHUNK_SIZE", 64), mock.patch.object(argfiles, "CHECKPOINT_INTERVAL", 10):
+            with ArgumentFile(self.path) as argument_file:
+                self.assertEqual(list(argument_file), lines)
+                self.assertEqual(len(argument_file), len(lines))
+                self.assertEqual(argument_file[0], lines[0])
+                self.assertEqual(argument_file[537], lines[537])
+                self.assertEqual(argument_file[-1], lines[-1])
+                self.assertEqual(argument_file[5:8], lines[5:8])
+
+                with self.assertRaises(IndexError):
+                    argument_file[len(lines)]
+
+    def test_empty(self):
+        """
+        Tests to ensure that an empty file has no lines while a lone line break is a single empty argument
+        """
+        self.path.write_bytes(b"")
+        self.assertEqual(list(ArgumentFile(self.path)), [])
+        self.assertFalse(ArgumentFile(self.path))
+
+        self.path.write_bytes(b"\n")
+        self.assertEqual(list(ArgumentFile(self.path)), [""])
+
+
+class TestArgumentSequence(unittest.TestCase):
+    """Tests for `argui.utilities.argfiles.ArgumentSequence`"""
+    def test_chained(self):
+        """
+        Tests to ensure that values entered directly and read from files are chained in order and converted as read
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / "numbers.txt"
+            path.write_text("2\n3\n4", encoding="utf-8")
+
+            with ArgumentFile(path) as argument_file:
+                values = ArgumentSequence(["1", argument_file, "5"], convert=int)
+
+                self.assertEqual(len(values), 5)
+                self.assertEqual(list(values), [1, 2, 3, 4, 5])
+                self.assertEqual(values[3], 4)
+                self.assertEqual(values[-1], 5)
+                self.assertEqual(values, [1, 2, 3, 4, 5])
+                self.assertEqual(list(values.iterate_raw()), ["1", "2", "3", "4", "5"])
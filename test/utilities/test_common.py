@@ -4,6 +4,7 @@ Unit tests for `argui.utilities.common`
 import typing
 import unittest
 import types
+from unittest import mock
 
 from argui.utilities import common
 
@@ -120,3 +121,78 @@ class TestGetElementByName(unittest.TestCase):
 
         with self.assertRaises(KeyError):
             common.get_element_by_name("JeremyBerimy", context)
+
+
+class TestNameResolver(unittest.TestCase):
+    """Tests for `argui.utilities.common.NameResolver`"""
+    def test_remembers_names(self):
+        """
+        Tests to ensure that a name is only traversed once per context
+        """
+        resolver = common.NameResolver()
+        context: typing.Dict[str, typing.Any] = {"ut": unittest}
+
+        with mock.patch.object(common, "get_element_by_name", wraps=common.get_element_by_name) as lookup:
+            for _ in range(5):
+                self.assertIs(resolver.resolve("ut.TestCase", context), unittest.TestCase)
+
+            self.assertEqual(lookup.call_count, 1)
+
+            other_context: typing.Dict[str, typing.Any] = {"ut": unittest}
+            self.assertIs(resolver.resolve("ut.TestCase", other_context), unittest.TestCase)
+            self.assertEqual(lookup.call_count, 2)
+
+    def test_imports_missing_modules(self):
+        """
+        Tests to ensure that dotted names that aren't within the context are imported
+        """
+        resolver = common.NameResolver()
+
+        self.assertIs(resolver.resolve("xml.dom.minidom.Document", {}), __import__("xml.dom.minidom").dom.minidom.Document)
+        self.assertIs(resolver.resolve("builtins.int"), int)
+        self.assertIs(resolver.resolve("int"), int)
+
+        with self.assertRaises(KeyError):
+            resolver.resolve("JeremyBerimy", {})
+
+        with self.assertRaises(KeyError):
+            resolver.resolve("xml.JeremyBerimy", {})
+
+    def test_invalidate(self):
+        """
+        Tests to ensure that remembered names may be forgotten
+        """
+        resolver = common.NameResolver()
+        context: typing.Dict[str, typing.Any] = {"value": 1, "other": 2}
+
+        self.assertEqual(resolver.resolve("value", context), 1)
+        self.assertEqual(resolver.resolve("other", context), 2)
+        context["value"] = 3
+        self.assertEqual(resolver.resolve("value", context), 1)
+
+        resolver.invalidate("value")
+        self.assertEqual(resolver.resolve("value", context), 3)
+        self.assertEqual(len(resolver), 2)
+
+        resolver.invalidate(context=context)
+        self.assertEqual(len(resolver), 0)
+
+    def test_size_limit(self):
+        """
+        Tests to ensure that only the most recently used names are remembered
+        """
+        resolver = common.NameResolver(maximum_size=2)
+        context: typing.Dict[str, typing.Any] = {"one": 1, "two": 2, "three": 3}
+
+        resolver.resolve("one", context)
+        resolver.resolve("two", context)
+        resolver.resolve("one", context)
+        resolver.resolve("three", context)
+
+        self.assertEqual(len(resolver), 2)
+
+        with mock.patch.object(common, "get_element_by_name", wraps=common.get_element_by_name) as lookup:
+            resolver.resolve("one", context)
+            self.assertEqual(lookup.call_count, 0)
+            resolver.resolve("two", context)
+            self.assertEqual(lookup.call_count, 1)
@@ -0,0 +1,112 @@
+"""
+Unit tests for `argui.utilities.conversion`
+"""
+import json
+import asyncio
+import argparse
+import unittest
+import threading
+
+from argui.utilities import conversion
+
+
+def parse_even(text: str) -> int:
+    """A conversion that rejects odd numbers the way argparse types are expected to"""
+    number = int(text)
+
+    if number % 2:
+        raise argparse.ArgumentTypeError(f"{number} is not even")
+
+    return number
+
+
+class TestCheckConversion(unittest.TestCase):
+    """Tests for `argui.utilities.conversion.check_conversion`"""
+    def test_messages(self):
+        """
+        Tests to ensure that failed conversions are described the same way argparse describes them
+        """
+        self.assertIsNone(conversion.check_conversion(int, "3"))
+        self.assertEqual(conversion.check_conversion(int, "three"), "invalid int value: 'three'")
+        self.assertEqual(conversion.check_conversion(parse_even, "3"), "3 is not even")
+        self.assertEqual(conversion.check_conversion(parse_even, ["2", "4", "x"]), "invalid parse_even value: 'x'")
+        self.assertIn("failed", conversion.check_conversion(lambda text: {}[text], "key"))
+
+    def test_cpu_bound(self):
+        """
+        Tests to ensure that conversions may be marked for another process, including builtins
+        """
+        self.assertFalse(conversion.is_cpu_bound(json.loads))
+
+        try:
+            self.assertIs(conversion.cpu_bound(json.loads), json.loads)
+            self.assertTrue(conversion.is_cpu_bound(json.loads))
+            self.assertFalse(conversion.is_cpu_bound(int))
+        finally:
+            conversion._cpu_bound_conversions.discard(json.loads)
+
+
+class TestConversionPool(unittest.IsolatedAsyncioTestCase):
+    """Tests for `argui.utilities.conversion.ConversionPool`"""
+    def setUp(self):
+        self.pool = conversion.ConversionPool(max_workers=2, cache_size=2)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    async def test_cache(self):
+        """
+        Tests to ensure that each field and value is only converted once and that old outcomes are forgotten
+        """
+        calls = []
+
+        def record(text: str) -> int:
+            calls.append((threading.current_thread().name, text))
+            return int(text)
+
+        self.assertIsNone(await self.pool.check("count", record, "1"))
+        self.assertIsNone(await self.pool.check("count", record, "1"))
+        self.assertEqual(await self.pool.check("count", record, "one"), "invalid record value: 'one'")
+        self.assertEqual(self.pool.get_cached("count", "one"), (True, "invalid record value: 'one'"))
+
+        # The same value entered into a different field is checked again
+        self.assertIsNone(await self.pool.check("other", record, "1"))
+        self.assertEqual(self.pool.get_cached("count", "1"), (False, None))
+
+        self.assertEqual(len(calls), 3)
+        self.assertTrue(all(name.startswith("argui-conversion") for name, _ in calls))
+
+    async def test_cancel(self):
+        """
+        Tests to ensure that a cancelled check never records its outcome
+        """
+        started = threading.Event()
+        release = threading.Event()
+
+        def wait(text: str) -> str:
+            started.set()
+            release.wait(5)
+            return text
+
+        check = asyncio.ensure_future(self.pool.check("slow", wait, "value"))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+        check.cancel()
+        release.set()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await check
+
+        self.assertEqual(self.pool.get_cached("slow", "value"), (False, None))
+
+    async def test_process_pool(self):
+        """
+        Tests to ensure that conversions marked as CPU bound are checked in another process
+        """
+        conversion.cpu_bound(parse_even)
+
+        try:
+            self.assertEqual(await self.pool.check("even", parse_even, "3"), "3 is not even")
+            self.assertIsNotNone(self.pool._processes)
+        finally:
+            conversion._cpu_bound_conversions.discard(parse_even)
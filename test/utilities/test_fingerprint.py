@@ -0,0 +1,83 @@
+"""
+Unit tests for `argui.utilities.fingerprint`
+"""
+import pathlib
+import argparse
+import unittest
+
+from argui.utilities import fingerprint
+
+
+def build_parser(**changes) -> argparse.ArgumentParser:
+    """
+    Build a small parser with subcommands, optionally changing one part of it
+
+    Args:
+        changes: Replacement values for the parts of the parser that tests alter
+    """
+    parser = argparse.ArgumentParser(prog="fingerprint")
+    parser.add_argument("--count", type=changes.get("type", int), default=changes.get("default", 3))
+    subparsers = parser.add_subparsers(dest="command")
+
+    copy = subparsers.add_parser("copy", aliases=changes.get("aliases", []))
+    copy.add_argument("source", type=pathlib.Path)
+    copy.add_argument("--mode", choices=changes.get("choices", ["fast", "safe"]))
+    copy.set_defaults(func=changes.get("func", print))
+
+    for flag in changes.get("extra_flags", []):
+        copy.add_argument(flag)
+
+    return parser
+
+
+class TestFingerprintParser(unittest.TestCase):
+    """Tests for `argui.utilities.fingerprint.fingerprint_parser`"""
+    def test_stable(self):
+        """
+        Tests to ensure that identical parsers share a fingerprint
+        """
+        self.assertEqual(
+            fingerprint.fingerprint_parser(build_parser()),
+            fingerprint.fingerprint_parser(build_parser())
+        )
+        self.assertEqual(
+            fingerprint.fingerprint_parser(build_parser(default=object())),
+            fingerprint.fingerprint_parser(build_parser(default=object()))
+        )
+
+    def test_structural_changes(self):
+        """
+        Tests to ensure that changing the structure of any part of the parser tree changes the fingerprint
+        """
+        original: str = fingerprint.fingerprint_parser(build_parser())
+
+        for changes in (
+            {"type": float},
+            {"default": 4},
+            {"choices": ["fast", "safe", "slow"]},
+            {"func": repr},
+            {"extra_flags": ["--verbose"]},
+        ):
+            with self.subTest(changes=changes):
+                self.assertNotEqual(fingerprint.fingerprint_parser(build_parser(**changes)), original)
+
+        self.assertNotEqual(fingerprint.fingerprint_parser(build_parser(), salt="other"), original)
+
+    def test_shallow(self):
+        """
+        Tests to ensure that a shallow fingerprint covers the commands of a parser but not what is within their subparsers
+        """
+        original: str = fingerprint.fingerprint_parser(build_parser(), recursive=False)
+
+        self.assertEqual(fingerprint.fingerprint_parser(build_parser(extra_flags=["--verbose"]), recursive=False), original)
+        self.assertNotEqual(fingerprint.fingerprint_parser(build_parser(default=4), recursive=False), original)
+        self.assertNotEqual(fingerprint.fingerprint_parser(build_parser(aliases=["cp"]), recursive=False), original)
+
+    def test_describe_value(self):
+        """
+        Tests to ensure that values are described without anything that changes between runs
+        """
+        self.assertEqual(fingerprint.describe_value(pathlib.Path), "pathlib.Path")
+        self.assertEqual(fingerprint.describe_value({"b", "a"}), fingerprint.describe_value({"a", "b"}))
+        self.assertNotIn("0x", fingerprint.describe_value(object()))
+        self.assertIsNone(fingerprint.get_qualified_name(lambda value: value))
@@ -0,0 +1,114 @@
+"""
+Unit tests for `argui.utilities.items`
+"""
+import pathlib
+import tempfile
+import unittest
+
+from argui.utilities.items import ItemStore
+from argui.utilities.items import batch_items
+from argui.utilities.items import check_items
+from argui.utilities.items import read_items
+from argui.utilities.items import split_items
+
+
+class CollidingText(str):
+    """Text whose every instance hashes the same, to force items to collide"""
+    def __hash__(self):
+        return 0
+
+
+class TestItemStore(unittest.TestCase):
+    """Tests for `argui.utilities.items.ItemStore`"""
+    def test_unique_items(self):
+        """
+        Tests to ensure that items are kept in order, without repeats, and found in constant time
+        """
+        store = ItemStore(["b", "a", "b", "ünïcode", "\udcff"])
+
+        self.assertEqual(list(store), ["b", "a", "ünïcode", "\udcff"])
+        self.assertEqual(store, ["b", "a", "ünïcode", "\udcff"])
+        self.assertEqual(store[-2], "ünïcode")
+        self.assertEqual(store.find("a"), 1)
+        self.assertIn("\udcff", store)
+        self.assertNotIn("c", store)
+        self.assertFalse(store.add("a"))
+        self.assertTrue(store.add("c", problem="invalid"))
+        self.assertEqual(store.problem, "invalid")
+
+        self.assertEqual(store.delete(1), "a")
+        self.assertEqual(store, ["b", "ünïcode", "\udcff", "c"])
+        self.assertEqual(store.problems, {3: "invalid"})
+        self.assertEqual(store.find("c"), 3)
+        self.assertTrue(store.add("a"))
+
+        store.clear()
+        self.assertEqual(store, [])
+        self.assertIsNone(store.problem)
+
+    def test_removed_items(self):
+        """
+        Tests to ensure that removed items stop taking up memory once they fill most of the buffer
+        """
+        store = ItemStore(f"item {number}" for number in range(100))
+        full_size = store.nbytes
+
+        for _ in range(60):
+            store.delete(10)
+
+        self.assertLess(store.nbytes, full_size / 2)
+        self.assertEqual(store, [f"item {number}" for number in [*range(10), *range(70, 100)]])
+        self.assertEqual(store.find("item 70"), 10)
+        self.assertIsNone(store.find("item 10"))
+        self.assertTrue(store.add("item 10"))
+        self.assertEqual(store[-1], "item 10")
+
+    def test_colliding_hashes(self):
+        """
+        Tests to ensure that different items with the same hash are never mistaken for repeats
+        """
+        store = ItemStore()
+
+        self.assertTrue(store.add(CollidingText("first")))
+        self.assertTrue(store.add(CollidingText("second")))
+        self.assertFalse(store.add(CollidingText("second")))
+        self.assertEqual(store.find(CollidingText("second")), 1)
+        self.assertEqual(store, ["first", "second"])
+
+        # Removing the indexed item leaves the one that shared its hash findable
+        self.assertEqual(store.delete(0), "first")
+        self.assertEqual(store.find(CollidingText("second")), 0)
+        self.assertFalse(store.add(CollidingText("second")))
+        self.assertTrue(store.add(CollidingText("first")))
+        self.assertEqual(store.find(CollidingText("first")), 1)
+
+
+class TestImport(unittest.TestCase):
+    """Tests for splitting, reading, and checking items"""
+    def test_split_items(self):
+        """
+        Tests to ensure that text is split by line and delimiter, dropping blanks and surrounding whitespace
+        """
+        self.assertEqual(split_items(" a \r\n\nb,c\n"), ["a", "b,c"])
+        self.assertEqual(split_items("a, b\nc,,", delimiter=","), ["a", "b", "c"])
+
+    def test_read_items(self):
+        """
+        Tests to ensure that files are read into items the same way that pasted text is split
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / "items.txt"
+            path.write_text("first\n\n second\nthird;fourth", encoding="utf-8")
+
+            self.assertEqual(list(read_items(path, delimiter=";")), ["first", "second", "third", "fourth"])
+
+    def test_check_items(self):
+        """
+        Tests to ensure that items are checked against a type once each and grouped into batches
+        """
+        self.assertEqual(
+            check_items(["1", "x", "1"], int),
+            [("1", None), ("x", "invalid int value: 'x'")]
+        )
+        self.assertEqual(check_items(["x"]), [("x", None)])
+        self.assertEqual(list(batch_items(range(5), size=2)), [[0, 1], [2, 3], [4]])
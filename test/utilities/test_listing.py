@@ -0,0 +1,103 @@
+"""
+Unit tests for `argui.utilities.listing`
+"""
+import os
+import pathlib
+import tempfile
+import unittest
+
+from argui.utilities import listing
+
+
+class TestScanDirectory(unittest.TestCase):
+    """Tests for `argui.utilities.listing.scan_directory`"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+
+        for index in range(7):
+            (self.path / f"file_{index}.txt").touch()
+
+        (self.path / "nested").mkdir()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_chunks(self):
+        """
+        Tests to ensure that every entry is handed over in chunks no larger than asked for
+        """
+        chunks = list(listing.scan_directory(self.path, chunk_size=3))
+        entries = [entry for chunk in chunks for entry in chunk]
+
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 2])
+        self.assertEqual(len({entry.name for entry in entries}), 8)
+        self.assertEqual([entry.name for entry in entries if entry.is_directory], ["nested"])
+
+    def test_cancel(self):
+        """
+        Tests to ensure that a cancelled scan stops reading entries
+        """
+        checks = []
+
+        def is_cancelled() -> bool:
+            checks.append(True)
+            return len(checks) > 4
+
+        chunks = list(listing.scan_directory(self.path, chunk_size=3, is_cancelled=is_cancelled))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [3])
+        self.assertEqual(len(checks), 5)
+
+
+class TestDirectoryListingCache(unittest.TestCase):
+    """Tests for `argui.utilities.listing.DirectoryListingCache`"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = pathlib.Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_invalidation(self):
+        """
+        Tests to ensure that a listing is forgotten once its directory changes
+        """
+        cache = listing.DirectoryListingCache()
+        entries = [listing.DirectoryEntry("a.txt", False)]
+
+        cache.put(self.path, listing.get_modification_time(self.path), entries)
+        self.assertEqual(cache.get(self.path), tuple(entries))
+
+        (self.path / "b.txt").touch()
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertIsNone(cache.get(self.path))
+        self.assertNotIn(self.path, cache)
+
+    def test_eviction(self):
+        """
+        Tests to ensure that the oldest listings are forgotten once too many entries are remembered
+        """
+        cache = listing.DirectoryListingCache(maximum_entries=4)
+        directories = []
+
+        for index in range(3):
+            directory = self.path / str(index)
+            directory.mkdir()
+            directories.append(directory)
+            cache.put(
+                directory,
+                listing.get_modification_time(directory),
+                [listing.DirectoryEntry(f"{index}_{entry}", False) for entry in range(2)]
+            )
+
+        self.assertNotIn(directories[0], cache)
+        self.assertIn(directories[1], cache)
+        self.assertIn(directories[2], cache)
+
+        # Listings larger than the whole cache are never kept
+        cache.put(self.path, listing.get_modification_time(self.path), [listing.DirectoryEntry("x", False)] * 5)
+        self.assertNotIn(self.path, cache)
+        self.assertEqual(len(cache), 2)
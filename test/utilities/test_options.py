@@ -0,0 +1,67 @@
+"""
+Unit tests for `argui.utilities.options`
+"""
+import argparse
+import threading
+import unittest
+
+from argui.utilities import options
+
+
+class TestOptionIndex(unittest.TestCase):
+    """Tests for `argui.utilities.options.OptionIndex`"""
+    def test_candidates(self):
+        """
+        Tests to ensure that candidates are found by prefix, along with attached short flags, in the order they were added
+        """
+        action = argparse.Action(["--zeta"], "zeta")
+        option_index = options.OptionIndex({"--zeta": action, "-z": action})
+        option_index["--alpha"] = action
+        option_index["--zebra"] = action
+        option_index["--ze"] = action
+
+        self.assertEqual(option_index.find_candidates("--ze"), ["--zeta", "--zebra", "--ze"])
+        self.assertEqual(option_index.find_candidates("--zet=1"), ["--zeta"])
+        self.assertEqual(option_index.find_candidates("-zvalue"), ["-z"])
+        self.assertEqual(option_index.find_candidates("--missing"), [])
+
+        option_index.pop("--zeta")
+        del option_index["--ze"]
+        self.assertEqual(option_index.find_candidates("--ze"), ["--zebra"])
+
+    def test_narrowed(self):
+        """
+        Tests to ensure that narrowing only changes what is iterated over, and only on the thread that narrowed it
+        """
+        action = argparse.Action(["--alpha"], "alpha")
+        option_index = options.OptionIndex({"--alpha": action, "--beta": action, "--bravo": action})
+        seen_elsewhere = []
+
+        with option_index.narrowed("--b"):
+            self.assertEqual(list(option_index), ["--beta", "--bravo"])
+            self.assertEqual(len(option_index), 3)
+            self.assertIn("--alpha", option_index)
+
+            thread = threading.Thread(target=lambda: seen_elsewhere.extend(option_index))
+            thread.start()
+            thread.join()
+
+        self.assertEqual(seen_elsewhere, ["--alpha", "--beta", "--bravo"])
+        self.assertEqual(list(option_index), ["--alpha", "--beta", "--bravo"])
+
+    def test_check_option(self):
+        """
+        Tests to ensure that option strings may be rejected as they are added
+        """
+        def reject_short(option_string, action):
+            if len(option_string) == 2:
+                raise ValueError(option_string)
+
+        action = argparse.Action(["--alpha"], "alpha")
+        option_index = options.OptionIndex(check_option=reject_short)
+        option_index["--alpha"] = action
+
+        with self.assertRaises(ValueError):
+            option_index["-a"] = action
+
+        self.assertEqual(list(option_index), ["--alpha"])
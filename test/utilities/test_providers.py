@@ -0,0 +1,112 @@
+"""
+Unit tests for `argui.utilities.providers`
+"""
+import asyncio
+import argparse
+import unittest
+
+from argui.utilities import providers
+
+CALLS = []
+"""The name of each source each time it is called"""
+
+
+def list_tables():
+    CALLS.append("list_tables")
+    return (f"table_{index}" for index in range(10))
+
+
+async def list_hosts():
+    CALLS.append("list_hosts")
+
+    for index in range(5):
+        await asyncio.sleep(0)
+        yield ("Host {}".format(index), f"host-{index}")
+
+
+async def list_regions():
+    CALLS.append("list_regions")
+    await asyncio.sleep(0)
+    return ["north", "south"]
+
+
+async def collect_batches(provider):
+    """
+    Gather every batch that a provider streams
+    """
+    return [batch async for batch in provider.stream()]
+
+
+class TestChoiceProvider(unittest.IsolatedAsyncioTestCase):
+    """Tests for `argui.utilities.providers.ChoiceProvider`"""
+    def setUp(self):
+        CALLS.clear()
+        providers.PROVIDED_CHOICES.clear()
+
+    async def test_stream(self):
+        """
+        Tests to ensure that every kind of source streams batches that double in size and is then cached
+        """
+        tables = providers.ChoiceProvider(list_tables, first_batch_size=2)
+        self.assertEqual([len(batch) for batch in await collect_batches(tables)], [2, 4, 4])
+        self.assertEqual(tables.get_cached(), tuple(f"table_{index}" for index in range(10)))
+        self.assertIn(tables, providers.PROVIDED_CHOICES)
+
+        hosts = providers.ChoiceProvider(list_hosts, first_batch_size=2)
+        batches = await collect_batches(hosts)
+        self.assertEqual(batches[0], [("Host 0", "host-0"), ("Host 1", "host-1")])
+        self.assertEqual(sum(len(batch) for batch in batches), 5)
+
+        regions = providers.ChoiceProvider(list_regions)
+        self.assertEqual(await collect_batches(regions), [["north", "south"]])
+        self.assertEqual(CALLS, ["list_tables", "list_hosts", "list_regions"])
+
+    async def test_cache(self):
+        """
+        Tests to ensure that cached choices are reused until they expire
+        """
+        provider = providers.ChoiceProvider(list_tables)
+
+        # Loading within a running event loop happens on another thread
+        self.assertIn("table_3", provider)
+        self.assertNotIn("table_30", provider)
+        self.assertEqual(list(provider)[:2], ["table_0", "table_1"])
+        self.assertEqual(CALLS, ["list_tables"])
+
+        expiring = providers.ChoiceProvider(list_regions, ttl=0)
+        self.assertEqual(expiring.load(), ("north", "south"))
+        self.assertIsNone(expiring.get_cached())
+        expiring.load()
+        self.assertEqual(CALLS, ["list_tables", "list_regions", "list_regions"])
+
+    def test_parser(self):
+        """
+        Tests to ensure that argparse checks values against provided choices without loading them early
+        """
+        hosts = providers.ChoiceProvider(list_hosts)
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--host", choices=hosts, metavar="HOST")
+
+        self.assertTrue(hosts)
+        self.assertIn("--host HOST", parser.format_usage())
+        self.assertEqual(CALLS, [])
+
+        self.assertEqual(parser.parse_args(["--host", "host-2"]).host, "host-2")
+        self.assertEqual(CALLS, ["list_hosts"])
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--host", "Host 2"])
+
+    def test_data(self):
+        """
+        Tests to ensure that providers may be stored by the name of their source and described consistently
+        """
+        provider = providers.ChoiceProvider(list_tables, ttl=None, first_batch_size=5)
+        data = provider.to_data()
+
+        self.assertEqual(data["source"], f"{__name__}.list_tables")
+        self.assertEqual(providers.ChoiceProvider.from_data(data), provider)
+        self.assertEqual(repr(provider), f"ChoiceProvider({__name__}.list_tables, ttl=None)")
+
+        with self.assertRaises(ValueError):
+            providers.ChoiceProvider(lambda: []).to_data()
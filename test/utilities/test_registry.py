@@ -0,0 +1,209 @@
+"""
+Unit tests for `argui.utilities.registry`
+"""
+import enum
+import argparse
+import pathlib
+import unittest
+import ipaddress
+from unittest import mock
+
+from textual import widgets
+
+from argui.utilities import actions
+from argui.utilities import registry
+from argui.utilities.providers import ChoiceProvider
+
+from test.utilities.test_providers import CALLS
+from test.utilities.test_providers import list_tables
+
+
+class Base:
+    pass
+
+
+class Child(Base):
+    pass
+
+
+class GrandChild(Child):
+    pass
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class TestWidgetRegistry(unittest.TestCase):
+    """Tests for `argui.utilities.registry.WidgetRegistry`"""
+    def test_mro(self):
+        """
+        Tests to ensure that classes resolve to the widget of their closest registered ancestor
+        """
+        widget_registry = registry.WidgetRegistry()
+        widget_registry.register(object, "object widget")
+        widget_registry.register(Base, "base widget")
+
+        self.assertEqual(widget_registry.resolve(GrandChild), "base widget")
+        self.assertEqual(widget_registry.resolve(int), "object widget")
+
+        @widget_registry.register(Child)
+        def child_widget(**kwargs):
+            return kwargs
+
+        self.assertIs(widget_registry.resolve(GrandChild), child_widget)
+        self.assertEqual(widget_registry.resolve(Base), "base widget")
+
+        widget_registry.unregister(Child)
+        self.assertEqual(widget_registry.resolve(GrandChild), "base widget")
+
+    def test_caching(self):
+        """
+        Tests to ensure that the MRO of a class is only walked the first time the class is looked up
+        """
+        widget_registry = registry.WidgetRegistry()
+        factory = mock.Mock(return_value="built")
+        widget_registry.register_factory(Base, factory)
+
+        for _ in range(5):
+            self.assertEqual(widget_registry.resolve(GrandChild), "built")
+
+        factory.assert_called_once_with(GrandChild)
+
+        self.assertIsNone(widget_registry.get(int))
+        self.assertEqual(widget_registry.get(int, "fallback"), "fallback")
+
+        with self.assertRaises(LookupError):
+            widget_registry.resolve(int)
+
+        with self.assertRaises(TypeError):
+            widget_registry.register("Base", "widget")
+
+    def test_entry_points(self):
+        """
+        Tests to ensure that installed packages may register widgets through entry points
+        """
+        def register_widgets(widget_registry: registry.WidgetRegistry):
+            widget_registry.register(Base, "plugin widget")
+
+        entry_point = mock.Mock()
+        entry_point.load.return_value = register_widgets
+        widget_registry = registry.WidgetRegistry(entry_point_group="test.widgets")
+
+        with mock.patch.object(registry.importlib.metadata, "entry_points", return_value=[entry_point]) as entry_points:
+            self.assertEqual(widget_registry.resolve(Child), "plugin widget")
+            self.assertEqual(widget_registry.resolve(GrandChild), "plugin widget")
+
+        entry_points.assert_called_once_with(group="test.widgets")
+
+
+class TestValueWidgets(unittest.TestCase):
+    """Tests for the widgets that `argui.utilities.actions` registers by default"""
+    def test_defaults(self):
+        """
+        Tests to ensure that the built-in types resolve to the widgets they always have
+        """
+        self.assertIs(actions.get_widget_by_value_type(bool), actions.build_switch)
+        self.assertEqual(actions.get_widget_by_value_type(int).keywords, {"type": "integer"})
+        self.assertEqual(actions.get_widget_by_value_type("float").keywords, {"type": "number"})
+        self.assertIs(actions.get_widget_by_value_type(None), widgets.Input)
+        self.assertIs(actions.get_widget_by_value_type(pathlib.Path), actions.build_path_picker)
+        self.assertIs(actions.get_widget_by_value_type(pathlib.PurePosixPath), actions.build_path_picker)
+        self.assertIs(actions.get_widget_by_value_type(lambda value: value), widgets.Input)
+
+    def test_switches(self):
+        """
+        Tests to ensure that flags are shown as switches that may be built like any other input
+        """
+        parser = argparse.ArgumentParser()
+
+        for action in (
+            parser.add_argument("--yes", action="store_true"),
+            parser.add_argument("--no", action="store_false"),
+            parser.add_argument("--color", action=argparse.BooleanOptionalAction),
+        ):
+            self.assertIs(actions.get_widget_by_action(action), actions.build_switch)
+
+        switch = actions.build_switch(value="yes", placeholder="Ignored", id="switch")
+        self.assertIsInstance(switch, widgets.Switch)
+        self.assertTrue(switch.value)
+        self.assertEqual(switch.id, "switch")
+
+    def test_choices(self):
+        """
+        Tests to ensure that small sets of choices are selected from while large ones are searched
+        """
+        parser = argparse.ArgumentParser()
+        few = parser.add_argument("--few", choices=["a", "b"])
+        many = parser.add_argument("--many", nargs="+", choices=[str(index) for index in range(1_000)])
+
+        build_select = actions.get_widget_by_action(few)
+        self.assertIs(build_select.func, actions.build_select)
+        self.assertEqual(build_select.args, (("a", "b"),))
+        self.assertFalse(build_select.keywords["multiple"])
+
+        ids = parser.add_argument("--ids", nargs="*", type=int)
+        build_editor = actions.get_widget_by_action(ids)
+        self.assertIs(build_editor.func, actions.build_item_list_editor)
+        self.assertIs(build_editor.keywords["conversion"], int)
+
+        build_search = actions.get_widget_by_action(many)
+        self.assertIs(build_search.func, actions.build_searchable_select)
+        self.assertEqual(len(build_search.args[0]), 1_000)
+        self.assertTrue(build_search.keywords["multiple"])
+
+    def test_enum(self):
+        """
+        Tests to ensure that enums are represented by a select over their members
+        """
+        build_select = actions.get_widget_by_value_type(Color)
+
+        self.assertIsInstance(build_select(id="color"), widgets.Select)
+
+        with mock.patch.object(actions.widgets, "Select") as select:
+            build_select(value="Color.BLUE", placeholder="A color", id="color")
+
+        select.assert_called_once_with([("RED", "red"), ("BLUE", "blue")], prompt="A color", value="blue", id="color")
+
+    def test_custom_registration(self):
+        """
+        Tests to ensure that projects may add widgets for types without changing ArgUI
+        """
+        self.assertIs(actions.get_widget_by_value_type(ipaddress.IPv4Address), widgets.Input)
+
+        builder = actions.VALUE_WIDGETS.register(ipaddress.IPv4Address, mock.Mock())
+
+        try:
+            self.assertIs(actions.get_widget_by_value_type(ipaddress.IPv4Address), builder)
+        finally:
+            actions.VALUE_WIDGETS.unregister(ipaddress.IPv4Address)
+
+        self.assertIs(actions.get_widget_by_value_type(ipaddress.IPv4Address), widgets.Input)
+
+    def test_provided_choices(self):
+        """
+        Tests to ensure that provided choices are shown by the widget registered for their provider
+        """
+        CALLS.clear()
+        provider = ChoiceProvider(list_tables, ttl=None)
+        parser = argparse.ArgumentParser()
+        table = parser.add_argument("--table", choices=provider, metavar="TABLE")
+
+        build_search = actions.get_widget_by_action(table)
+        self.assertIs(build_search.func, actions.build_provided_select)
+        self.assertEqual(build_search.args, (provider,))
+        self.assertFalse(build_search.keywords["multiple"])
+
+        class TableProvider(ChoiceProvider):
+            """A provider that a project shows its own way"""
+
+        builder = actions.VALUE_WIDGETS.register(TableProvider, mock.Mock())
+        tables = parser.add_argument("--tables", nargs="+", choices=TableProvider(list_tables), metavar="TABLE")
+
+        try:
+            self.assertIs(actions.get_widget_by_action(tables).func, builder)
+        finally:
+            actions.VALUE_WIDGETS.unregister(TableProvider)
+
+        self.assertEqual(CALLS, [])
@@ -0,0 +1,141 @@
+"""
+Unit tests for `argui.utilities.search`
+"""
+import time
+import unittest
+
+from argui.utilities import search
+
+
+def build_labels(count: int):
+    """
+    Create labels shaped like the names of hosts across a handful of regions
+
+    Args:
+        count: The number of labels to create
+
+    Returns:
+        The labels
+    """
+    regions = ("us-east", "us-west", "eu-central", "ap-south")
+    roles = ("web", "db", "cache", "queue", "batch")
+    return [f"{regions[index % 4]}-{roles[index % 5]}-{index:06}.example.com" for index in range(count)]
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Tests for `argui.utilities.search.SearchIndex` and `argui.utilities.search.SearchSession`"""
+    def test_ranking(self):
+        """
+        Tests to ensure that prefixes rank above word starts, which rank above substrings, which rank above loose matches
+        """
+        index = search.SearchIndex(["Alpha Beta", "betamax", "alphabeta", "b.e.t.a", "gamma", "Beta"])
+
+        self.assertEqual(index.search("beta").indices, [5, 1, 0, 2, 3])
+        self.assertEqual(index.search("BETA").indices, [5, 1, 0, 2, 3])
+        self.assertEqual(index.search("zzz").indices, [])
+        self.assertEqual(index.search("").indices, [0, 1, 2, 3, 4, 5])
+        self.assertEqual(index.search("", limit=2).indices, [0, 1])
+
+        self.assertEqual(index.rank(5, "beta"), search.PREFIX_MATCH)
+        self.assertEqual(index.rank(0, "beta"), search.WORD_MATCH)
+        self.assertEqual(index.rank(2, "beta"), search.SUBSTRING_MATCH)
+        self.assertEqual(index.rank(3, "beta"), search.LOOSE_MATCH)
+        self.assertIsNone(index.rank(4, "beta"))
+
+        # Narrowing a set of candidates orders them exactly as a full search would
+        self.assertEqual(index.narrow("beta", range(len(index))).indices, index.search("beta").indices)
+
+    def test_options(self):
+        """
+        Tests to ensure that options paired with labels are searched by label and keep their values
+        """
+        index = search.SearchIndex.from_options([("First [choice]", 1), "second", 3])
+
+        self.assertEqual(index.labels, ["First [choice]", "second", "3"])
+        self.assertEqual(index.values, [1, "second", 3])
+        self.assertEqual(index.search("[ch").indices, [0])
+        self.assertEqual(index.search("3").indices, [2])
+
+    def test_resume(self):
+        """
+        Tests to ensure that a search that runs out of time may be carried on and ends with every match
+        """
+        labels = build_labels(20_000)
+        index = search.SearchIndex(labels)
+        expected = [position for position, label in enumerate(labels) if search.is_loose_match(label, "wq9")]
+
+        result = index.search("wq9", deadline=0)
+        self.assertFalse(result.complete)
+        self.assertIsNotNone(result.resume_at)
+
+        while result.resume_at is not None:
+            result = index.resume("wq9", result, deadline=0)
+
+        self.assertTrue(result.complete)
+        self.assertEqual(sorted(result.matches), expected)
+        self.assertEqual(result.matches, index.search("wq9").matches)
+
+    def test_session(self):
+        """
+        Tests to ensure that a session narrows the last search as the query grows and starts over otherwise
+        """
+        labels = build_labels(10_000)
+        session = search.SearchSession(search.SearchIndex(labels), limit=10)
+
+        for query in ("d", "db", "db-", "db-0001", "eu-c-db", "xyz"):
+            result = session.search(query)
+
+            while session.can_resume:
+                result = session.resume()
+
+            self.assertEqual(result.indices, session.index.search(query, limit=10).indices, query)
+
+    def test_latency(self):
+        """
+        Tests to ensure that searching 100,000 options stays well inside a frame on every keystroke
+        """
+        index = search.SearchIndex(build_labels(100_000))
+        slowest = 0.0
+
+        for query in ("e", "eu", "eu-", "web", "0999", "qu-7", "zzz", "ache-0"):
+            session = search.SearchSession(index)
+
+            for end in range(1, len(query) + 1):
+                started = time.perf_counter()
+                session.search(query[:end])
+
+                while session.can_resume:
+                    slowest = max(slowest, time.perf_counter() - started)
+                    started = time.perf_counter()
+                    session.resume()
+
+                slowest = max(slowest, time.perf_counter() - started)
+
+        # A frame at 60fps is about 16ms - this leaves room for slow machines
+        self.assertLess(slowest, 0.1)
+
+
+class TestSearchIndexCache(unittest.TestCase):
+    """Tests for `argui.utilities.search.SearchIndexCache`"""
+    def test_cache(self):
+        """
+        Tests to ensure that indices are kept for the same set of options and the oldest are forgotten
+        """
+        cache = search.SearchIndexCache(maximum_indices=2)
+        first = ["a", "b"]
+        second = ["c", "d"]
+        third = ["e", "f"]
+
+        index = cache.get(first)
+        self.assertIs(cache.get(first), index)
+        self.assertIn(first, cache)
+        self.assertNotIn(["a", "b"], cache)
+
+        cache.get(second)
+        cache.get(third)
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn(first, cache)
+        self.assertIn(third, cache)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
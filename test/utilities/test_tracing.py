@@ -0,0 +1,104 @@
+"""
+Unit tests for `argui.utilities.tracing`
+"""
+import json
+import pathlib
+import tempfile
+import threading
+import unittest
+
+import argui
+from argui.utilities import tracing
+
+
+class TestTracing(unittest.TestCase):
+    """Tests for `argui.utilities.tracing`"""
+    def setUp(self):
+        self.previous_tracer = tracing.disable()
+
+    def tearDown(self):
+        tracing.disable()
+
+        if self.previous_tracer is not None:
+            tracing.enable(self.previous_tracer.path, report_on_exit=False)
+
+    def test_disabled(self):
+        """
+        Tests to ensure that nothing is recorded while tracing is off
+        """
+        @tracing.traced("stage")
+        def double(number: int) -> int:
+            return number * 2
+
+        self.assertIs(tracing.span("stage"), tracing.DISABLED_SPAN)
+        self.assertEqual(double(2), 4)
+        self.assertIsNone(tracing.get_tracer())
+
+    def test_spans(self):
+        """
+        Tests to ensure that spans from every thread are recorded with their details
+        """
+        tracer = tracing.enable(report_on_exit=False)
+
+        @tracing.traced("double")
+        def double(number: int) -> int:
+            return number * 2
+
+        with tracing.span("outer", field="name"):
+            self.assertEqual(double(2), 4)
+
+        worker = threading.Thread(target=double, args=(3,), name="worker")
+        worker.start()
+        worker.join()
+
+        self.assertEqual([stage for stage, *_ in tracer.spans], ["double", "outer", "double"])
+        self.assertEqual(tracer.spans[1][4], {"field": "name"})
+        self.assertNotEqual(tracer.spans[0][1], tracer.spans[2][1])
+
+        events = tracer.to_trace_events()["traceEvents"]
+        complete_events = [event for event in events if event["ph"] == "X"]
+        self.assertEqual(len(complete_events), 3)
+        self.assertEqual(complete_events[1]["args"], {"field": "name"})
+        self.assertTrue(all(event["dur"] >= 0 for event in complete_events))
+        self.assertEqual(len([event for event in events if event["ph"] == "M"]), 2)
+
+    def test_summary(self):
+        """
+        Tests to ensure that stages are summarized slowest first with nearest rank percentiles
+        """
+        tracer = tracing.Tracer()
+
+        for duration in (1_000_000, 2_000_000, 3_000_000, 4_000_000):
+            tracer.record("build_widget", 0, duration)
+
+        tracer.record("mount", 0, 20_000_000)
+
+        build_widget, = [row for row in tracer.summarize() if row[0] == "build_widget"]
+        self.assertEqual(build_widget, ("build_widget", 4, 10.0, 2.5, [2.0, 4.0], 4.0))
+        self.assertEqual(tracer.summarize()[0][0], "mount")
+
+        table = tracer.format_summary().splitlines()
+        self.assertEqual(table[0].split(), ["stage", "count", "total", "ms", "mean", "ms", "p50", "ms", "p95", "ms", "max", "ms"])
+        self.assertEqual(table[2].split()[:3], ["build_widget", "4", "10.000"])
+
+    def test_write(self):
+        """
+        Tests to ensure that traces are written as Chrome trace events to a file named for the process
+        """
+        tracer = tracing.enable(report_on_exit=False)
+
+        parser = argui.ArgumentParser(prog="traced")
+        parser.add_argument("--count", type=int)
+        parser.check_arguments(["--count", "3"])
+        parser.to_model().fields[0].build_widget()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = tracer.write(str(pathlib.Path(directory) / "trace-{pid}.json"))
+            self.assertNotIn("{pid}", path)
+
+            with open(path, encoding="utf-8") as file:
+                trace = json.load(file)
+
+        stages = {event["name"] for event in trace["traceEvents"] if event["ph"] == "X"}
+        self.assertTrue({"validation", "from_parser", "build_widget", "dispatch"} <= stages)
+        self.assertEqual(trace["displayTimeUnit"], "ms")